@@ -0,0 +1,13 @@
+@echo off
+:: Stand-in for EnergyPlus to test hb_EPBatchRunner without running simulations.
+:: Usage: hb_EPBatchRunner(workingDir, epwFile, executable = "...\resources\fake_energyplus.bat")
+:: It is called with the address of the idf and the epw file and writes runName.err and
+:: runName.csv next to the idf. Idf files that include FakeFatal get a fatal error and no csv file.
+findstr /C:"FakeFatal" "%~1" >nul
+if %errorlevel%==0 (
+    echo    **  Fatal  ** FakeFatal found in the idf file> "%~dpn1.err"
+    exit /b 0
+)
+echo    ************* EnergyPlus Completed Successfully-- 0 Warning; 0 Severe Errors> "%~dpn1.err"
+echo Date/Time,Fake Output [-](Hourly)> "%~dpn1.csv"
+echo  01/01  01:00:00,%~nx2>> "%~dpn1.csv"
@@ -60,11 +60,11 @@ Provided by Honeybee 0.0.60
 """
 ghenv.Component.Name = "Honeybee_ Run Energy Simulation"
 ghenv.Component.NickName = 'runEnergySimulation'
-ghenv.Component.Message = 'VER 0.0.60\nOCT_16_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nSEP_17_2016
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nJUL_24_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "1"
 
@@ -76,14 +76,43 @@ import os
 import System
 import Grasshopper.Kernel as gh
 import math
+import time
 import shutil
 import collections
-import subprocess
 import copy
+import System.Threading.Tasks as tasks
 
 rc.Runtime.HostUtils.DisplayOleAlerts(False)
 
 
+class EPObjectNames(object):
+    """Names of the EnergyPlus objects that should be written to the idf file.
+    
+    Names are compared without case so each object is only written once per idf file.
+    The names can be added while iterating over the collection.
+    """
+    def __init__(self):
+        self.names = []
+        self.keys = set()
+    
+    def append(self, name):
+        if name.upper() not in self.keys:
+            self.keys.add(name.upper())
+            self.names.append(name)
+    
+    def __contains__(self, name):
+        return name.upper() in self.keys
+    
+    def __iter__(self):
+        count = 0
+        while count < len(self.names):
+            yield self.names[count]
+            count += 1
+    
+    def __len__(self):
+        return len(self.names)
+
+
 class WriteIDF(object):
     # Add all HBcontext surfaces from both HBContext_ and HB generator here so that if user connects the same
     # HBcontext surfaces to both HB generator and HBcontext duplicate surfaces will be detected and an error thrown.
@@ -128,6 +157,86 @@ class WriteIDF(object):
         except:
             #older versions
             return zoneStr + '\t1;\t!- Type\n'
+    
+    def EPVertices(self, coordinates):
+        return '\t' + ',\n\t'.join(`pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` for pt in coordinates) + ';\n\n'
+    
+    def EPZoneGeometry(self, zone):
+        """Return the strings for the zone, surfaces and windows of the zone.
+        
+        Strings are only formatted here and no object is added to the idf file so it is
+        safe to call this method for several zones in parallel.
+        """
+        zoneStr = self.EPZone(zone)
+        srfStrs = []
+        fenStrs = []
+        for srf in zone.surfaces:
+            try:
+                if srf.EPConstruction != None:
+                    srf.construction = srf.EPConstruction
+                srfStrs.append(self.EPZoneSurface(srf))
+                
+                if srf.hasChild:
+                    for childSrf in srf.childSrfs:
+                        if childSrf.EPConstruction != None:
+                            childSrf.construction = childSrf.EPConstruction
+                    fenStrs.append(self.EPFenSurface(srf))
+                else:
+                    fenStrs.append(None)
+            except Exception, e:
+                raise Exception("Failed to write surface " + srf.name + " of zone " + \
+                                zone.name + ": " + str(e))
+        
+        return zoneStr, srfStrs, fenStrs
+    
+    def EPZoneGeometries(self, zones, parallel = True):
+        """Return EPZoneGeometry for each zone in the same order as the zones.
+        
+        Errors in the workers are collected and raised together with the names of the
+        surfaces that failed instead of the AggregateException of Parallel.ForEach.
+        """
+        zoneGeometries = [None] * len(zones)
+        errors = [None] * len(zones)
+        
+        def formatZoneGeometry(zoneCount):
+            try:
+                zoneGeometries[zoneCount] = self.EPZoneGeometry(zones[zoneCount])
+            except Exception, e:
+                errors[zoneCount] = str(e)
+        
+        if parallel:
+            try:
+                tasks.Parallel.ForEach(range(len(zones)), formatZoneGeometry)
+            except System.AggregateException, e:
+                # .NET errors that are not caught by the worker
+                for innerException in e.Flatten().InnerExceptions:
+                    errors.append(innerException.Message)
+        else:
+            for zoneCount in range(len(zones)):
+                formatZoneGeometry(zoneCount)
+        
+        errors = [error for error in errors if error != None]
+        if errors:
+            raise Exception("\n".join(errors))
+        
+        return zoneGeometries
+    
+    def benchmarkZoneGeometries(self, zones, repeat = 3):
+        """
+        Format the geometry of the zones in series and in parallel and return a report
+        of the best run times.
+        """
+        report = []
+        for parallel in (False, True):
+            runTimes = []
+            for count in range(repeat):
+                startTime = time.time()
+                self.EPZoneGeometries(zones, parallel)
+                runTimes.append(time.time() - startTime)
+            report.append("%d zones %s: %.2f s"%(len(zones), \
+                          "in parallel" if parallel else "in series", min(runTimes)))
+        
+        return report
             
     def EPZoneSurface (self, surface):
         coordinates = surface.coordinates
@@ -147,15 +256,7 @@ class WriteIDF(object):
                 '\t' + surface.groundViewFactor + ',\t!- View Factor to Ground\n' + \
                 '\t' + `len(coordinates)` + ',\t!- Number of Vertices\n'
         
-            str_2 = '\t';
-            
-            for ptCount, pt in enumerate(coordinates):
-                if ptCount < len (coordinates) - 1:
-                    str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ',\n\t'
-                else:
-                    str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ';\n\n'
-            
-            fullString = str_1 + str_2
+            fullString = str_1 + self.EPVertices(coordinates)
             
             return fullString
         
@@ -177,163 +278,10 @@ class WriteIDF(object):
         ddyfile.close()
         return designDayLines
     
-    def writeDDObjStr(self, ddName, designType, month, day, dbTemp, dbTempRange, wbTemp, enth, humidConditType, pressure, windSpeed, windDir, ashraeSkyClearness):
-        ddStr =  '! ' + ddName + '\n' + \
-            'SizingPeriod:DesignDay,\n' + \
-            '\t' + ddName + ',     !- Name\n' + \
-            '\t' + str(month) + ',      !- Month\n' + \
-            '\t' + str(day) + ',      !- Day of Month\n' + \
-            '\t' + designType + ',!- Day Type\n' + \
-            '\t' + str(dbTemp) + ',      !- Maximum Dry-Bulb Temperature {C}\n' + \
-            '\t' + str(dbTempRange) + ',      !- Daily Dry-Bulb Temperature Range {C}\n' + \
-            '\t' + 'DefaultMultipliers, !- Dry-Bulb Temperature Range Modifier Type\n' + \
-            '\t' + ',      !- Dry-Bulb Temperature Range Modifier Schedule Name\n' + \
-            '\t' + humidConditType + ',      !- Humidity Condition Type\n' + \
-            '\t' + str(wbTemp) + ',      !- Wetbulb or Dewpoint at Maximum Dry-Bulb {C}\n' + \
-            '\t' + ',      !- Humidity Indicating Day Schedule Name\n' + \
-            '\t' + ',      !- Humidity Ratio at Maximum Dry-Bulb {kgWater/kgDryAir}\n' + \
-            '\t' + str(enth) + ',      !- Enthalpy at Maximum Dry-Bulb {J/kg}\n' + \
-            '\t' + ',      !- Daily Wet-Bulb Temperature Range {deltaC}\n' + \
-            '\t' + str(pressure) + ',      !- Barometric Pressure {Pa}\n' + \
-            '\t' + str(windSpeed) + ',      !- Wind Speed {m/s} design conditions vs. traditional 6.71 m/s (15 mph)\n' + \
-            '\t' + str(windDir) + ',      !- Wind Direction {Degrees; N=0, S=180}\n' + \
-            '\t' + 'No,      !- Rain {Yes/No}\n' + \
-            '\t' + 'No,      !- Snow on ground {Yes/No}\n' + \
-            '\t' + 'No,      !- Daylight Savings Time Indicator\n' + \
-            '\t' + 'ASHRAEClearSky' + ', !- Solar Model Indicator\n' + \
-            '\t' + ',      !- Beam Solar Day Schedule Name\n' + \
-            '\t' + ',      !- Diffuse Solar Day Schedule Name\n' + \
-            '\t' + ',      !- ASHRAE Clear Sky Optical Depth for Beam Irradiance (taub)\n' + \
-            '\t' + ',      !- ASHRAE Clear Sky Optical Depth for Diffuse Irradiance (taud)\n' + \
-            '\t' + str(ashraeSkyClearness) + ';      !- Clearness {0.0 to 1.1}\n' + '\n'
-        
-        return ddStr
-    
-    def createDdyFromEPW(self, epwFileAddress, workingDir, lb_preparation, lb_comfortModels):
-        # Extract the relevant data from the EPW.
-        # We need the following: dbTemp, dewPoint, rH, windSpeed, windDir, windDir, wetBulb, enthalpy
-        dbTemp = []
-        dewPoint = []
-        rH = []
-        windSpeed = []
-        windDir = []
-        barPress = []
-        wetBulb = []
-        epwfile = open(epwFileAddress,"r")
-        for count, line in enumerate(epwfile):
-            if count > 7:
-                dbTemp.append(float(line.split(',')[6]))
-                dewPoint.append(float(line.split(',')[7]))
-                rH.append(float(line.split(',')[8]))
-                barPress.append(float(line.split(',')[9]))
-                windSpeed.append(float(line.split(',')[21]))
-                windDir.append(float(line.split(',')[20]))
-        epwfile.close()
-        hR, enthalpy, pP, sP = lb_comfortModels.calcHumidRatio(dbTemp, rH, barPress)
-        for i, tem in enumerate(dbTemp):
-            wetBulb.append(lb_comfortModels.findWetBulb(tem, rH[i], barPress[i]))
-        
-        # Find the conditions for the most extreme hours in the epw.  These are the 7 extreme conditions we need:
-            # 1 - Winnter Design Day - Min Dry Bulb (Sensible Heating)
-            # 2 - Winter Design Day - Min Dew Point (Humidification)
-            # 3 - Winter Design Day = Max Wind Speed when temperature is less than 1 standard deviation of annual mean.
-            # 4 - Summer Design Day - Max Dry Bulb (Sensible Cooling)
-            # 5 - Summer Design Day - Max Wet Bulb (Dehumidification)
-            # 6 - Summer Design Day - Max Dew Point (Dehumidification)
-            # 7 - Summer Design Day - Max Enthalpy (Dehumidification)
-        sortedDB, corrWB = zip(*sorted(zip(dbTemp, wetBulb)))
-        minDB = sortedDB[34] # Design Condition 1
-        WBforMinDB = corrWB[34]
-        maxDB = sortedDB[-35] # Design Condition 4
-        WBforMaxDB = corrWB[-35]
-        sortedDP, corrDB = zip(*sorted(zip(dewPoint, dbTemp)))
-        minDP = sortedDP[34] # Design Condition 2
-        DBforMinDP = corrDB[34]
-        maxDP = sortedDP[-35] # Design Condition 6
-        DBforMaxDP = corrDB[-35]
-        sortedWB, corresDB = zip(*sorted(zip(wetBulb, dbTemp)))
-        maxWB = sortedWB[-35] # Design Condition 5
-        DBforMaxWB = corresDB[-35]
-        sortedEnth, correspondDB = zip(*sorted(zip(enthalpy, dbTemp)))
-        maxEnth = int(sortedEnth[-35] * 1000) # Design Condition 7
-        DBforMaxEnth = correspondDB[-35]
-        
-        coldStdDevTemp = sortedDB[1384]
-        hotStdDevTemp = sortedDB[-1385]
-        winSpBelowTemp = []
-        windDirBelowTemp = []
-        winSpAboveTemp = []
-        windDirAboveTemp = []
-        for i, tem in enumerate(dbTemp):
-            if tem < coldStdDevTemp:
-                winSpBelowTemp.append(windSpeed[i])
-                windDirBelowTemp.append(windDir[i])
-            elif tem > hotStdDevTemp:
-                winSpAboveTemp.append(windSpeed[i])
-                windDirAboveTemp.append(windDir[i])
-        winSpBelowTemp.sort()
-        coldMonWind = winSpBelowTemp[922]
-        coldMonWinDir = int(sum(windDirBelowTemp)/len(windDirBelowTemp))
-        maxWind = winSpBelowTemp[-5] # Design Condition 3
-        winSpAboveTemp.sort()
-        hotMonWind = winSpAboveTemp[922]
-        hotMonWinDir = int(sum(windDirAboveTemp)/len(windDirAboveTemp))
-        
-        # Calculate a few other required values from the epw data.
-        # Like average annual pressure and coldest/hottest month.
-        # and average wind speed/direction during these months.
-        avgEpwParPress = int(sum(barPress)/len(barPress))
-        
-        def binAndAvgByMonth(dataSet):
-            avgMonthData = []
-            binnedMonthData = []
-            for mon in range(12):
-                binnedMonthData.append([])
-            for i, x in enumerate(dataSet):
-                d, m, t = lb_preparation.hour2Date(i, True)
-                binnedMonthData[m].append(x)
-            for dataList in binnedMonthData:
-                avgMonthData.append(sum(dataList)/len(dataList))
-            return avgMonthData, binnedMonthData
-        
-        def partitionList(l, n):
-            for i in range(0, len(l), n):
-                yield l[i:i+n]
-        
-        avgMonTemps, binMonTemps = binAndAvgByMonth(dbTemp)
-        monNums = range(12)
-        avgMonTempsSort, monNumsSort = zip(*sorted(zip(avgMonTemps, monNums)))
-        coldMonth = monNumsSort[0]
-        hotMonth = monNumsSort[-1]
-        allHotMonthTemps = binMonTemps[hotMonth]
-        dayHotMonTemps = partitionList(allHotMonthTemps, 24)
-        dailyTempDiff = []
-        for day in dayHotMonTemps:
-            day.sort()
-            dailyTempDiff.append(day[-1]-day[0])
-        hotDayDBTempRange = (int((sum(dailyTempDiff)/len(dailyTempDiff))*100))/100
-        
-        
-        # Assemble a list of design condition strings to write into the ddy file.
-        ddStrs = []
-        ddStrs.append(self.writeDDObjStr('Ann Htg 99.6% Condns DB', 'WinterDesignDay', coldMonth+1, 21, minDB, 0, minDB, '', 'Wetbulb', avgEpwParPress, coldMonWind, coldMonWinDir, 0))
-        ddStrs.append(self.writeDDObjStr('Ann Hum_n 99.6% Condns DP=>MCDB', 'WinterDesignDay', coldMonth+1, 21, DBforMinDP, 0, minDP, '', 'Dewpoint', avgEpwParPress, coldMonWind, coldMonWinDir, 0))
-        ddStrs.append(self.writeDDObjStr('Ann Htg Wind 99.6% Condns WS=>MCDB', 'WinterDesignDay', coldMonth+1, 21, coldStdDevTemp, 0, coldStdDevTemp, '', 'Wetbulb', avgEpwParPress, maxWind, coldMonWinDir, 0))
-        
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns DB=>MWB', 'SummerDesignDay', hotMonth+1, 21, maxDB, hotDayDBTempRange, WBforMaxDB, '', 'Wetbulb', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns WB=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxWB, hotDayDBTempRange, maxWB, '', 'Wetbulb', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns DP=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxDP, hotDayDBTempRange, maxDP, '', 'Dewpoint', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        ddStrs.append(self.writeDDObjStr('Ann Clg .4% Condns Enth=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxEnth, hotDayDBTempRange, '', maxEnth, 'Enthalpy', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2))
-        
-        # Write the design day objects into a .ddy file.
-        epwFileName = epwFileAddress.split('\\')[-1].split('.')[0]
-        ddyfile = workingDir + '\\' + epwFileName + '.ddy'
-        ddyFile = open(ddyfile, "w")
-        for sizingObj in ddStrs:
-            ddyFile.write(sizingObj)
-        ddyFile.close()
-        
-        return ddyfile
+    def createDdyFromEPW(self, epwFileAddress, workingDir, lb_comfortModels):
+        # design days are derived once for each epw and saved next to it
+        summary = sc.sticky["honeybee_EPWSummary"].fromEPW(epwFileAddress, lb_comfortModels)
+        return summary.writeDDY(workingDir, epwFileAddress)
     
     def checkCoordinates(self, coordinates):
         # check if coordinates are so close or duplicated
@@ -395,14 +343,7 @@ class WriteIDF(object):
                         '\t' + `childSrf.Multiplier`+ ',\t!- Multiplier\n' + \
                         '\t' + `len(glzCoordinates)` + ',\t!- Number of Vertices\n'
                 
-                    str_2 = '\t';
-                    for ptCount, pt in enumerate(glzCoordinates):
-                        if ptCount < len (glzCoordinates) - 1:
-                            str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ',\n\t'
-                        else:
-                            str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ';\n\n'
-                    
-                    glzStr += str_1 + str_2
+                    glzStr += str_1 + self.EPVertices(glzCoordinates)
                 
                 else:
                     glzStr += "\n"
@@ -434,14 +375,7 @@ class WriteIDF(object):
                     '\t' + surface.name + ',\t!- Name\n' + \
                     '\t' + scheduleName + ',\t!- Transmittance Schedule Name\n' + \
                     '\t' + `len(coordinates)` + ',\t!- Number of Vertices\n'    
-            str_2 = '\t';
-            for ptCount, pt in enumerate(coordinates):
-                if ptCount < len (coordinates) - 1:
-                    str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ',\n\t'
-                else:
-                    str_2 = str_2 + `pt.X` + ',\n\t' + `pt.Y` + ',\n\t' + `pt.Z` + ';\n\n'
-            
-            fullString = fullString + str_1 + str_2
+            fullString = fullString + str_1 + self.EPVertices(coordinates)
         return fullString
     
     def EPInternalMass(self, zone, massName, srfArea, constructionName):
@@ -1515,15 +1449,7 @@ class RunIDF(object):
         batchfile.close()
         
         #execute the batch file
-        if runInBackground:		
-            self.runCmd(batchFileAddress)		
-        else:		
-            os.system(batchFileAddress)		
-    
-    def runCmd(self, batchFileAddress, shellKey = True):
-        batchFileAddress.replace("\\", "/")		
-        p = subprocess.Popen(["cmd /c ", batchFileAddress], shell=shellKey, stdout=subprocess.PIPE, stderr=subprocess.PIPE)		
-        out, err = p.communicate()
+        return sc.sticky["honeybee_JobScheduler"].runBatchFile(batchFileAddress, runInBackground)
 
 
 sc.sticky["honeybee_WriteIDF"] = WriteIDF
@@ -1645,7 +1571,7 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
     reEvaluate.evaluateZones()
     
     idfFileFullName = workingDir + "\\" + idfFileName
-    idfFile = open(idfFileFullName, "w")
+    idfFile = open(idfFileFullName, "w", 1048576)
     
     ################## HEADER ###################
     print "[1 of 8] Writing simulation parameters..."
@@ -1705,7 +1631,7 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
     
     if usedDDY == False:
         # If there are no design days, analyze the EPW file and produce design day objects.
-        ddyFile = hb_writeIDF.createDdyFromEPW(epwFileAddress, workingDir, lb_preparation, lb_comfortModels)
+        ddyFile = hb_writeIDF.createDdyFromEPW(epwFileAddress, workingDir, lb_comfortModels)
         designDayLines = hb_writeIDF.extractDDYObjs(ddyFile)
         if designDayLines != ['\n']:
             for line in designDayLines:
@@ -1733,10 +1659,10 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
     # Geometry rules
     idfFile.write(hb_writeIDF.EPGeometryRules())
 
-    EPConstructionsCollection = []
-    EPMaterialCollection = []
-    EPScheduleCollection = []
-    shdCntrlCollection = []
+    EPConstructionsCollection = EPObjectNames()
+    EPMaterialCollection = EPObjectNames()
+    EPScheduleCollection = EPObjectNames()
+    shdCntrlCollection = EPObjectNames()
     
     # Shading Surfaces
     if HBContext and HBContext[0]!=None:
@@ -1784,11 +1710,13 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
     print "[3 of 8] Writing geometry..."
     ZoneCollectionBasedOnSchAndLoads = {} # This will be used to create zoneLists
     
+    # format zone geometries in parallel and write them in order
+    zoneGeometries = hb_writeIDF.EPZoneGeometries(thermalZonesPyClasses)
     
     # write idf file
-    for zone in thermalZonesPyClasses:
+    for zone, (zoneStr, srfStrs, fenStrs) in zip(thermalZonesPyClasses, zoneGeometries):
         # Zone
-        idfFile.write(hb_writeIDF.EPZone(zone))
+        idfFile.write(zoneStr)
         
         # get the schedule and loads for the zone
         schedules = zone.getCurrentSchedules(True)
@@ -1797,42 +1725,27 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
         # create a unique key based on schedules and loads
         # zones with similar keys will be grouped
         key = ",".join(schedules.values() + loads.values())
-        if key not in ZoneCollectionBasedOnSchAndLoads.keys():
-            ZoneCollectionBasedOnSchAndLoads[key] = []
-        
-        ZoneCollectionBasedOnSchAndLoads[key].append(zone)
+        ZoneCollectionBasedOnSchAndLoads.setdefault(key, []).append(zone)
         
         # collect unique schedules
         for schedule in schedules.values():
             if schedule != "" and schedule.upper() not in EPScheduleCollection:
                 EPScheduleCollection.append(schedule.upper())
         
-        for srf in zone.surfaces:
-            # check if there is an energyPlus material
-            
+        for srf, srfStr, fenStr in zip(zone.surfaces, srfStrs, fenStrs):
             # Add surface to a list so that zone surfaces can be checked against honeybee generator PV surfaces
             WriteIDF.zonesurfaces.append(srf.name)
             
-            if srf.EPConstruction != None:
-                srf.construction = srf.EPConstruction
-            # else try to find the material based on bldg type and climate zone
-            # the surface will use the default construction
+            # EPZoneGeometry has already set the construction to the EnergyPlus construction if
+            # there is one. Otherwise the surface uses the default construction
             if not srf.construction.upper() in EPConstructionsCollection:
                 EPConstructionsCollection.append(srf.construction.upper())
             
             # Surfaces
-            idfFile.write(hb_writeIDF.EPZoneSurface(srf))
+            idfFile.write(srfStr)
             
             if srf.hasChild:
-                # check the construction
-                # this should be moved inside the function later
                 for childSrf in srf.childSrfs:
-                    # check if there is an energyPlus material
-                    if childSrf.EPConstruction != None:
-                        childSrf.construction = childSrf.EPConstruction
-                    # else try to find the material based on bldg type and climate zone
-                    # I will apply this later
-                    # the surface will use the default construction
                     if not childSrf.construction.upper() in EPConstructionsCollection:
                             EPConstructionsCollection.append(childSrf.construction.upper())
                     
@@ -1868,7 +1781,7 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
                             except: pass
                 
                 # write the glazing strings
-                idfFile.write(hb_writeIDF.EPFenSurface(srf))
+                idfFile.write(fenStr)
         
         #If there are internal masses assigned to the zone, write them into the IDF.
         if len(zone.internalMassNames) > 0:
@@ -2337,9 +2250,31 @@ def main(north, epwFileAddress, EPParameters, analysisPeriod, HBZones, HBContext
     resultFileFullName = None
     studyFolder = None
     if runEnergyPlus:
-        print "Analysis is running!..."
-        # write the batch file
-        hb_runIDF.writeBatchFile(workingDir, idfFileName, epwFileAddress, sc.sticky["honeybee_folders"]["EPPath"], runEnergyPlus > 1)
+        # check if the same idf is already simulated
+        EPPath = sc.sticky["honeybee_folders"]["EPPath"]
+        simulationCache = sc.sticky["honeybee_SimulationCache"]()
+        inputFiles = [idfFileFullName, epwFileAddress] + hb_writeIDF.fileBasedSchedules.keys()
+        cacheKey = simulationCache.getKey(inputFiles, {"EPPath": EPPath, "idfFileName": idfFileName}, workingDir)
+        
+        if simulationCache.restore(cacheKey, workingDir):
+            print "Results are loaded from the simulation cache."
+        else:
+            print "Analysis is running!..."
+            snapshot = simulationCache.snapshot(workingDir)
+            # write the batch file
+            hb_runIDF.writeBatchFile(workingDir, idfFileName, epwFileAddress, EPPath, runEnergyPlus > 1)
+            
+            # only keep the results of successful runs
+            errorFileFullName = idfFileFullName.replace('.idf', '.err')
+            try:
+                with open(errorFileFullName, "r") as errFile:
+                    failed = "**  Fatal  **" in errFile.read()
+            except:
+                failed = True
+            if not failed:
+                simulationCache.store(cacheKey, workingDir, snapshot)
+        print simulationCache.report()
+        
         resultFileFullName = idfFileFullName.replace('.idf', '.csv')
         studyFolder = originalWorkingDir
         try:
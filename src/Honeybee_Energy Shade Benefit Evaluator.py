@@ -70,11 +70,11 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_Energy Shade Benefit Evaluator"
 ghenv.Component.NickName = 'EnergyShadeBenefit'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_28_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nNOV_20_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "5"
 except: pass
@@ -82,6 +82,7 @@ except: pass
 import rhinoscriptsyntax as rs
 import Rhino as rc
 import collections
+import array
 import System.Threading.Tasks as tasks
 import System
 import scriptcontext as sc
@@ -92,6 +93,8 @@ AddReference('Grasshopper')
 import Grasshopper.Kernel as gh
 
 from System import Object
+from System import Array
+import clr
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
 
@@ -537,72 +540,122 @@ def checkSkyResolution(skyResolution, allDataDict, analysisPeriod, latitude, lon
     return allDataDict, finalSunVecs
 
 
-def nonparallel_projection(analysisMesh, sunLines, windowTestPts):
-    #Intersect the sun lines with the test mesh
-    faceInt = []
-    for face in range(analysisMesh.Faces.Count): faceInt.append([])
-    
-    for ptCount, pt in enumerate(windowTestPts):
-        try:
-            for hour, sunLine in enumerate(sunLines[ptCount]):
-                if sunLine != 0:
-                    intPt, i = rc.Geometry.Intersect.Intersection.MeshLine(analysisMesh, sunLine)
-                    if len(intPt)!=0: faceInt[i[0]].append(hour)
-                else: pass
-        except Exception, e:
-            print `e`
-    
-    return faceInt
-
-
-def parallel_projection(analysisMesh, sunLines, windowTestPts):
-    #Intersect the sun lines with the test mesh using parallel processing
-    faceInt = []
-    for face in range(analysisMesh.Faces.Count): faceInt.append([]) #place holder for result
-    
-    def intersect(i):
+def segmentHitsBox(origin, span, boxMin, boxMax):
+    #Slab test of the segment origin -> origin + span against an axis aligned box.
+    tMin, tMax = 0.0, 1.0
+    for axis in range(3):
+        o = origin[axis]
+        d = span[axis]
+        if abs(d) < 1e-12:
+            if o < boxMin[axis] or o > boxMax[axis]: return False
+        else:
+            t1 = (boxMin[axis] - o) / d
+            t2 = (boxMax[axis] - o) / d
+            if t1 > t2: t1, t2 = t2, t1
+            if t1 > tMin: tMin = t1
+            if t2 < tMax: tMax = t2
+            if tMin > tMax: return False
+    return True
+
+
+def meshRayHasFaceIds(analysisMesh):
+    #Rhino 5 has no MeshRay with face ids. Check it once before the rays are cast in parallel.
+    faceIds = clr.Reference[Array[int]]()
+    try:
+        rc.Geometry.Intersect.Intersection.MeshRay(analysisMesh, rc.Geometry.Ray3d(rc.Geometry.Point3d.Origin, rc.Geometry.Vector3d.ZAxis), faceIds)
+        return True
+    except TypeError:
+        return False
+
+
+def shadeFaceHit(analysisMesh, pt, vec, lineLength, hasFaceIds):
+    #Return the index of the first face of the shade mesh that the sun line hits or None.
+    #MeshRay searches the face tree that Rhino builds for the mesh and returns the ids of the faces that are hit.
+    if not hasFaceIds:
+        intPt, faceIds = rc.Geometry.Intersect.Intersection.MeshLine(analysisMesh, rc.Geometry.Line(pt, lineLength * vec))
+        if len(intPt)!=0: return faceIds[0]
+        return None
+    
+    faceIds = clr.Reference[Array[int]]()
+    rayParam = rc.Geometry.Intersect.Intersection.MeshRay(analysisMesh, rc.Geometry.Ray3d(pt, vec), faceIds)
+    #The sun line ends at lineLength * vec.
+    if rayParam < 0 or rayParam > lineLength or faceIds.Value == None or faceIds.Value.Length == 0: return None
+    #A ray that hits an edge returns the faces on both sides. Use the lowest face index.
+    return min(faceIds.Value)
+
+
+def projectSunRays(analysisMesh, sunVectors, windowTestPts, lineLength, contextMesh, runParallel):
+    #Intersect the sun lines from each window test point with the test mesh.
+    #The bounding box of the mesh is only a quick rejection test. Rays that miss it are skipped before testing the context and the mesh.
+    #Rays that pass it are cast against the face tree of the shade mesh by shadeFaceHit.
+    #Each test point writes to its own list so the parallel run has no shared state and the result is the same as the serial run.
+    boundBox = analysisMesh.GetBoundingBox(True)
+    pad = sc.doc.ModelAbsoluteTolerance + 1e-6 * lineLength
+    boxMin = (boundBox.Min.X - pad, boundBox.Min.Y - pad, boundBox.Min.Z - pad)
+    boxMax = (boundBox.Max.X + pad, boundBox.Max.Y + pad, boundBox.Max.Z + pad)
+    
+    spans = [(lineLength * vec.X, lineLength * vec.Y, lineLength * vec.Z) for vec in sunVectors]
+    pointHits = [None] * len(windowTestPts)
+    hasFaceIds = meshRayHasFaceIds(analysisMesh)
+    
+    def intersect(ptCount):
+        pt = windowTestPts[ptCount]
+        origin = (pt.X, pt.Y, pt.Z)
+        hits = []
         try:
-            for hour, sunLine in enumerate(sunLines[i]):
-                if sunLine != 0:
-                    intPt, indx = rc.Geometry.Intersect.Intersection.MeshLine(analysisMesh, sunLine)
-                    if len(intPt)!=0: faceInt[indx[0]].append(hour)
-                else: pass
+            for hour, vec in enumerate(sunVectors):
+                if not segmentHitsBox(origin, spans[hour], boxMin, boxMax): continue
+                if contextMesh != None and rc.Geometry.Intersect.Intersection.MeshRay(contextMesh, rc.Geometry.Ray3d(pt, vec)) >= 0: continue
+                face = shadeFaceHit(analysisMesh, pt, vec, lineLength, hasFaceIds)
+                if face != None: hits.append((face, hour))
         except Exception, e:
             print `e`
+        pointHits[ptCount] = hits
     
-    tasks.Parallel.ForEach(range(len(windowTestPts)), intersect)
-    
-    return faceInt
-
-
-def valCalc(percentBlocked, ECool, EBeam, cellArea, extraDivisor):
-    #Multiply the Energy by the Percentage Blocked by the Shade
-    ECoolPercent = [a*b for a,b in zip(ECool,percentBlocked)]
-    EBeamPercent = [a*b for a,b in zip(EBeam,percentBlocked)]
-    
-    #Calculate the Thermal Effect of the Shade
-    NegBeam = []
-    for item in EBeamPercent:
-        NegBeam.append(item*(-1))
-    
-    BeamEffectCool = [item1 for item1, item2 in zip(EBeamPercent , ECoolPercent) if item1 < item2]
-    DeltaCool1 = sum(BeamEffectCool)
-    
-    BeamEffectHeat = [item1 for item1, item2 in zip(NegBeam , ECoolPercent) if item1 > item2]
-    DeltaHeat1 = sum(BeamEffectHeat)
-    
-    BeamEffectMid = [item1 for item1, item2, item3 in zip(ECoolPercent , EBeamPercent , NegBeam) if item1 < item2 and item1 > item3]
-    DeltaMidCoolList = []
-    DeltaMidHeatList = []
-    for item in BeamEffectMid:
-        if item > 0: DeltaMidCoolList.append(item)
-        else: DeltaMidHeatList.append(item)
-    
-    DeltaMidCool = sum(DeltaMidCoolList)
-    DeltaMidHeat = sum(DeltaMidHeatList)
-    
-    deltaCooling = DeltaCool1 + DeltaMidCool
-    deltaHeating = DeltaHeat1 + DeltaMidHeat
+    if runParallel:
+        tasks.Parallel.ForEach(range(len(windowTestPts)), intersect)
+    else:
+        for ptCount in range(len(windowTestPts)): intersect(ptCount)
+    
+    #Count the intersections of each mesh face for each hour in a sparse matrix of faces x hours.
+    blockedHours = [collections.defaultdict(int) for face in range(analysisMesh.Faces.Count)]
+    for hits in pointHits:
+        if hits == None: continue
+        for face, hour in hits:
+            blockedHours[face][hour] += 1
+    
+    return blockedHours
+
+
+def hourlyBenefitWeights(ECool, EBeam):
+    #Calculate the cooling and heating effect of blocking all of the sun at each hour.
+    #Scaling ECool and EBeam by the percent blocked doesn't change which of the Shaderade cases each hour falls into so
+    #the effect of a cell is the sum of the percent blocked multiplied by these weights.
+    coolWeights = array.array('d')
+    heatWeights = array.array('d')
+    for eCool, eBeam in zip(ECool, EBeam):
+        coolWeight = 0.0
+        heatWeight = 0.0
+        if eBeam < eCool: coolWeight += eBeam
+        if -eBeam > eCool: heatWeight -= eBeam
+        if eCool < eBeam and eCool > -eBeam:
+            if eCool > 0: coolWeight += eCool
+            else: heatWeight += eCool
+        coolWeights.append(coolWeight)
+        heatWeights.append(heatWeight)
+    
+    return coolWeights, heatWeights
+
+
+def valCalc(blockedHours, coolWeights, heatWeights, testPtsCount, cellArea, extraDivisor):
+    #Multiply the Energy by the Percentage Blocked by the Shade for the hours that the cell blocks the sun.
+    deltaCooling = 0
+    deltaHeating = 0
+    for hour in sorted(blockedHours):
+        #Integer division. A cell only counts for the hours that it blocks all of the test points.
+        percentBlocked = blockedHours[hour] / testPtsCount
+        deltaCooling += coolWeights[hour] * percentBlocked
+        deltaHeating += heatWeights[hour] * percentBlocked
     
     netEffecting = deltaCooling + deltaHeating
     
@@ -633,8 +686,8 @@ def evaluateShade(coolingLoad, heatingLoad, beamGain, analysisMesh, analysisArea
     #Multiply the largest dimension of the bounding box by 2 to ensure that the lines are definitely long enough to intersect the shade.
     lineLength = (max(boundBox.Max - boundBox.Min)) * 2
     
-    #Generate the sun lines for intersection and discount the vector if it intersects a context.
-    sunLines = []
+    #Sun vectors that intersect a context are discounted.
+    contextMesh = None
     if context_:
         contextMeshes = []
         for brep in context_:
@@ -642,51 +695,23 @@ def evaluateShade(coolingLoad, heatingLoad, beamGain, analysisMesh, analysisArea
         contextMesh = joinMesh(contextMeshes)
     else: pass
     
-    for pt in windowTestPts: sunLines.append([]) 
-    
-    for ptCount, pt in enumerate(windowTestPts):
-        for vec in sunVectors:
-            if context_:
-                if rc.Geometry.Intersect.Intersection.MeshRay(contextMesh, rc.Geometry.Ray3d(pt, vec)) < 0:
-                    sunLines[ptCount].append(rc.Geometry.Line(pt, lineLength * vec))
-                else: sunLines[ptCount].append(0)
-            else:
-                sunLines[ptCount].append(rc.Geometry.Line(pt, lineLength * vec))
-            
-    
-    #If parallel is true, then run the intersection through the parallel function.  If not, run it through the normal function.
-    if parallel_ == True:
-        faceInt = parallel_projection(analysisMesh, sunLines, windowTestPts)
-    else:
-        faceInt = nonparallel_projection(analysisMesh, sunLines, windowTestPts)
-    
-    #Convert the Number Of Intersections for Each Mesh Face into a Percent of Sun Blocked by Each Mesh Face for Each Hour of the Year.
-    percentBlocked = []
-    for face in range(analysisMesh.Faces.Count):
-        percentBlocked.append(len(sunVectors) *[0])
-    
-    testPtsCount = len(windowTestPts) 
-    # for each mesh surface,
-    for faceCount, faceData in enumerate(faceInt):
-        # check the number of intersections for each hour
-        counter= collections.Counter(faceData)
-        
-        for hour in counter.keys():
-             # store the result in the new percentBlocked list
-             percentBlocked[faceCount][hour] = counter[hour]/testPtsCount
+    #Count the number of test points that each mesh face blocks for each hour.
+    blockedHours = projectSunRays(analysisMesh, sunVectors, windowTestPts, lineLength, contextMesh, parallel_ == True)
     
     #Calculate ECool and EBeam, which signify the cooling energy at stake and the solar energy at stake respectively.
     ECool = [a-b for a,b in zip(coolingLoad,heatingLoad)]
     EBeam = beamGain
+    coolWeights, heatWeights = hourlyBenefitWeights(ECool, EBeam)
     
     #Compare the percent blocked for each hour with the temperatre at that hour in relation to the balance point in order to determine the net value of shading.
     if skyResolution > 4: extraDivisor = (math.pow(2, (skyResolution-4)))
     else: extraDivisor = 0
+    testPtsCount = len(windowTestPts)
     shadeHelpfulness = []
     shadeHarmfulness = []
     shadeNetEffect = []
-    for cellCount, cell in enumerate(percentBlocked):
-        shadeHelp, shadeHarm, shadeNet = valCalc(cell, ECool, EBeam, analysisAreas[cellCount], extraDivisor)
+    for cellCount, cell in enumerate(blockedHours):
+        shadeHelp, shadeHarm, shadeNet = valCalc(cell, coolWeights, heatWeights, testPtsCount, analysisAreas[cellCount], extraDivisor)
         shadeHelpfulness.append(shadeHelp)
         shadeHarmfulness.append(shadeHarm)
         shadeNetEffect.append(shadeNet)
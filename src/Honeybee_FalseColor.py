@@ -43,11 +43,11 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_FalseColor"
 ghenv.Component.NickName = 'FalseColor'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "3"
 except: pass
@@ -72,7 +72,8 @@ def getHDRSimulationType(HDRImagePath):
         for lineCount, line in enumerate(hdrFile):
             if lineCount<10:
                 if line.strip().lower().startswith("oconv"):
-                    if line.strip().split(" ")[-1].lower().Replace("/", "").Replace("\\", "").startswith(sc.sticky["Honeybee_DefaultFolder"].Replace("\\", "").Replace("/", "")+ "skylib") or line.strip().lower().endswith('.sky'):
+                    # the sky is added to the static scene octree with oconv -i in image-based studies
+                    if line.find(" -i ") == -1 and (line.strip().split(" ")[-1].lower().Replace("/", "").Replace("\\", "").startswith(sc.sticky["Honeybee_DefaultFolder"].Replace("\\", "").Replace("/", "")+ "skylib") or line.strip().lower().endswith('.sky')):
                         return 2.5 #this is a sky
                     # check if the skytype could be radiation based on the sky type
                     elif line.strip().lower().find("cumulativesky")>-1:
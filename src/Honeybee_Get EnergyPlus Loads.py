@@ -39,11 +39,11 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_Get EnergyPlus Loads"
 ghenv.Component.NickName = 'getEPLoads'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "05 | Energy | Building Program"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
@@ -80,9 +80,8 @@ def main(HBZoneProgram):
     
     bldgProgram, zoneProgram = HBZoneProgram.split("::")
     
-    try:
-        schedulesAndLoads = openStudioStandardLib['space_types']['90.1-2007']['ClimateZone 1-8'][bldgProgram][zoneProgram]
-    except:
+    spaceType = openStudioStandardLib.getSpaceType(bldgProgram, zoneProgram)
+    if spaceType == None:
         msg = "Either your input for bldgProgram > [" + str(bldgProgram) + "] or " + \
               "the input for zoneProgram > [" + str(zoneProgram) + "] is not valid; " + \
               "or [" + str(bldgProgram) + "] and [" + str(zoneProgram) + "] is not a valid combination.\n" + \
@@ -90,13 +89,13 @@ def main(HBZoneProgram):
         print msg
         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
         return -1
-    # pprint(schedulesAndLoads)
-    equipmentLoadPerArea = schedulesAndLoads['elec_equip_per_area'] * 10.763961 #Per ft^2 to Per m^2
-    infiltrationRatePerArea = schedulesAndLoads['infiltration_per_area_ext'] * 0.00508001
-    lightingDensityPerArea = schedulesAndLoads['lighting_w_per_area'] * 10.763961 #Per ft^2 to Per m^2
-    numOfPeoplePerArea = schedulesAndLoads[ 'occupancy_per_area'] * 10.763961 /1000 #Per 1000 ft^2 to Per m^2
-    ventilationPerArea = schedulesAndLoads['ventilation_per_area'] * 0.00508001 #1 ft3/min.m2 = 5.08001016E-03 m3/s.m2
-    ventilationPerPerson = schedulesAndLoads[ 'ventilation_per_person'] * 0.0004719  #1 ft3/min.perosn = 4.71944743E-04 m3/s.person
+    # loads are already converted from IP to SI
+    equipmentLoadPerArea = spaceType['equipmentLoadPerArea']
+    infiltrationRatePerArea = spaceType['infiltrationRatePerArea']
+    lightingDensityPerArea = spaceType['lightingDensityPerArea']
+    numOfPeoplePerArea = spaceType['numOfPeoplePerArea']
+    ventilationPerArea = spaceType['ventilationPerArea']
+    ventilationPerPerson = spaceType['ventilationPerPerson']
     
     return equipmentLoadPerArea, infiltrationRatePerArea, lightingDensityPerArea, numOfPeoplePerArea, ventilationPerArea, ventilationPerPerson
     
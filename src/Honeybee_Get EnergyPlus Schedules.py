@@ -39,11 +39,11 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_Get EnergyPlus Schedules"
 ghenv.Component.NickName = 'getEPSchedules'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "05 | Energy | Building Program"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
@@ -78,9 +78,8 @@ def main(HBZoneProgram):
     bldgProgramDict = BuildingPrograms.bldgPrograms
     zonesProgramDict = BuildingPrograms.zonePrograms
     
-    try:
-        schedulesAndLoads = openStudioStandardLib['space_types']['90.1-2007']['ClimateZone 1-8'][bldgProgram][zoneProgram]
-    except:
+    spaceType = openStudioStandardLib.getSpaceType(bldgProgram, zoneProgram)
+    if spaceType == None:
         msg = "Either your input for bldgProgram > [" + str(bldgProgram) + "] or " + \
               "the input for zoneProgram > [" + str(zoneProgram) + "] is not valid; " + \
               "or [" + str(bldgProgram) + "] and [" + str(zoneProgram) + "] is not a valid combination.\n" + \
@@ -89,13 +88,13 @@ def main(HBZoneProgram):
         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
         return -1
         
-    occupancySchedule = schedulesAndLoads['occupancy_sch']
-    occupancyActivitySch = schedulesAndLoads['occupancy_activity_sch'] 
-    heatingSetPtSchedule = schedulesAndLoads['heating_setpoint_sch']
-    coolingSetPtSchedule = schedulesAndLoads['cooling_setpoint_sch']
-    lightingSchedule = schedulesAndLoads['lighting_sch']
-    equipmentSchedule = schedulesAndLoads['elec_equip_sch']
-    infiltrationSchedule = schedulesAndLoads['infiltration_sch']
+    occupancySchedule = spaceType['occupancySchedule']
+    occupancyActivitySch = spaceType['occupancyActivitySch'] 
+    heatingSetPtSchedule = spaceType['heatingSetPtSchedule']
+    coolingSetPtSchedule = spaceType['coolingSetPtSchedule']
+    lightingSchedule = spaceType['lightingSchedule']
+    equipmentSchedule = spaceType['equipmentSchedule']
+    infiltrationSchedule = spaceType['infiltrationSchedule']
     
     return occupancySchedule, occupancyActivitySch, heatingSetPtSchedule, coolingSetPtSchedule, lightingSchedule, equipmentSchedule, infiltrationSchedule
     
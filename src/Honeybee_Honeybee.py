@@ -47,7 +47,7 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_Honeybee"
 ghenv.Component.NickName = 'Honeybee'
-ghenv.Component.Message = 'VER 0.0.60\nNOV_04_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.icon
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "00 | Honeybee"
@@ -81,7 +81,11 @@ import subprocess
 import uuid
 import re
 import random
-from collections import namedtuple
+import array
+import struct
+import threading
+import hashlib
+from collections import namedtuple, OrderedDict, MutableMapping
 
 PI = math.pi
 
@@ -338,6 +342,136 @@ class hb_findFolders():
         self.EPPath, self.EPFile = self.which('EnergyPlus.exe')
         self.DSPath, self.DSFile = self.which('gen_dc.exe')
     
+    def getHoneybeeFolders(self):
+        """Check the folders for RADIANCE, DAYSIM, EnergyPlus and OpenStudio.
+        
+        Returns:
+            honeybeeFolders: A dictionary for sc.sticky["honeybee_folders"].
+            warnings: A list of warnings for the Honeybee component.
+            notes: A list of messages that should only be printed.
+        """
+        honeybeeFolders = {}
+        warnings = []
+        notes = []
+        
+        if self.RADPath == None:
+            if os.path.isdir("c:\\radiance\\bin\\"):
+                self.RADPath = "c:\\radiance\\bin\\"
+            else:
+                msg= "Honeybee cannot find RADIANCE folder on your system.\n" + \
+                     "Make sure you have RADIANCE installed on your system.\n" + \
+                     "You won't be able to run daylighting studies without RADIANCE.\n" + \
+                     "A good place to install RADIANCE is c:\\radiance"
+                warnings.append(msg)
+                self.RADPath = ""
+        
+        if  self.RADPath.find(" ") > -1:
+            msg =  "There is a white space in RADIANCE filepath: " + self.RADPath + "\n" + \
+                   "Please install RADIANCE in a valid address (e.g. c:\\radiance)"
+            warnings.append(msg)
+            self.RADPath = ""
+            
+        # I should replace this with python methods in os library
+        # looks stupid!
+        if self.RADPath.endswith("\\"): segmentNumber = -2
+        else: segmentNumber = -1
+        hb_RADLibPath = "\\".join(self.RADPath.split("\\")[:segmentNumber]) + "\\lib"
+        
+        honeybeeFolders["RADPath"] = self.RADPath
+        honeybeeFolders["RADLibPath"] = hb_RADLibPath
+            
+        if self.DSPath == None:
+            if os.path.isdir("c:\\daysim\\bin\\"):
+                self.DSPath = "c:\\daysim\\bin\\"
+            else:
+                msg= "Honeybee cannot find DAYSIM folder on your system.\n" + \
+                     "Make sure you have DAYISM installed on your system.\n" + \
+                     "You won't be able to run annual climate-based daylighting studies without DAYSIM.\n" + \
+                     "A good place to install DAYSIM is c:\\DAYSIM"
+                warnings.append(msg)
+                self.DSPath = ""
+        
+        if self.DSPath.find(" ") > -1:
+            msg =  "There is a white space in DAYSIM filepath: " + self.DSPath + "\n" + \
+                   "Please install Daysism in a valid address (e.g. c:\\daysim)"
+            warnings.append(msg)
+            self.DSPath = ""
+            
+        if self.DSPath.endswith("\\"): segmentNumber = -2
+        else: segmentNumber = -1
+        hb_DSCore = "\\".join(self.DSPath.split("\\")[:segmentNumber])
+        hb_DSLibPath = "\\".join(self.DSPath.split("\\")[:segmentNumber]) + "\\lib"
+        
+        honeybeeFolders["DSPath"] = self.DSPath
+        honeybeeFolders["DSCorePath"] = hb_DSCore
+        honeybeeFolders["DSLibPath"] = hb_DSLibPath
+        
+        # supported versions for EnergyPlus
+        EPVersions = ["V8-6-0", "V8-5-0", "V8-4-0","V8-3-0", "V8-2-10", "V8-2-9", "V8-2-8", "V8-2-7", "V8-2-6", \
+                      "V8-2-5", "V8-2-4", "V8-2-3", "V8-2-2", "V8-2-1", "V8-2-0", \
+                      "V8-1-5", "V8-1-4", "V8-1-3", "V8-1-2", "V8-1-1", "V8-1-0"]
+        EPVersion = ''
+        if self.EPPath != None:
+            # Honeybee has already found EnergyPlus make sure it's an acceptable version
+            EPVersion = os.path.split(self.EPPath)[-1].split("EnergyPlus")[-1]
+            if EPVersion not in EPVersions:
+                #Not an acceptable version so remove it from the path
+                self.EPPath = None
+        if self.EPPath == None:
+            for EPVers in EPVersions:
+                if os.path.isdir("C:\EnergyPlus" + EPVers + "\\"):
+                    self.EPPath = "C:\EnergyPlus" + EPVers + "\\"
+                    EPVersion = EPVers
+        
+        # check for OpenStudio Folder.
+        openStudioLibFolder = None
+        QtFolder = None
+        installedOPS = [f for f in os.listdir("C:\\Program Files") if f.startswith("OpenStudio")]
+        installedOPS = sorted(installedOPS, key = lambda x: int("".join(x.split(" ")[-1].split("."))), reverse = True)
+        if len(installedOPS) != 0:
+            openStudioLibFolder = "C:/Program Files/%s/CSharp/openstudio/"%installedOPS[0]
+            QtFolder = "C:/Program Files/%s/Ruby/openstudio/"%installedOPS[0]
+            for EPVers in EPVersions:
+                versStr = EPVers.replace('V', '-')
+                if os.path.isdir("C:/Program Files/%s/share/openstudio/"%installedOPS[0] + "EnergyPlus" + versStr + "/"):
+                    self.EPPath = "C:/Program Files/%s/share/openstudio/"%installedOPS[0] + "EnergyPlus" + versStr
+                    EPVersion = EPVers
+            if os.path.isdir(openStudioLibFolder) and os.path.isfile(os.path.join(openStudioLibFolder, "openStudio.dll")):
+                # openstudio is there and we are good to go.
+                self.addOpenStudioToPath(openStudioLibFolder, QtFolder)
+            else:
+                openStudioLibFolder = None
+                QtFolder = None
+        if openStudioLibFolder == None or QtFolder == None:
+            msg1 = "Honeybee cannot find OpenStudio on your system.\n" + \
+                "You wont be able to use the Export to OpenStudio component.\n" + \
+                "Download the latest OpenStudio for Windows from:\n"
+            msg2 = "https://www.openstudio.net/downloads"
+            warnings.append(msg1)
+            warnings.append(msg2)
+        
+        if self.EPPath == None:
+            # give a warning to the user
+            msg= "Honeybee cannot find an EnergyPlus folder on your system.\n" + \
+                 "You wont be able to use the Run Energy Simulation component.\n" + \
+                 "Honeybee supports following versions of EnergyPlus:\n"
+            versions = ", ".join(EPVersions)
+            msg += versions
+            notes.append(msg)
+        
+        honeybeeFolders["OSLibPath"] = openStudioLibFolder
+        honeybeeFolders["OSQtPath"] = QtFolder
+        honeybeeFolders["EPPath"] = self.EPPath  
+        honeybeeFolders["EPVersion"] = EPVersion.replace("-", ".")[1:]
+        
+        return honeybeeFolders, warnings, notes
+    
+    @staticmethod
+    def addOpenStudioToPath(openStudioLibFolder, QtFolder):
+        # add folders to path.
+        if not openStudioLibFolder in os.environ['PATH'] or QtFolder not in os.environ['PATH']:
+            os.environ['PATH'] = ";".join([openStudioLibFolder, QtFolder, os.environ['PATH']])
+    
     def which(self, program):
         """
         Check for path. Modified from this link:
@@ -372,6 +506,109 @@ class hb_findFolders():
         return None, None
 
 
+class hb_StartupSnapshot(object):
+    """
+    Save what Honeybee finds on the system at startup and restore it in the next runs.
+    
+    The snapshot (honeybee_startup.json in the Honeybee folder) keeps the folders for
+    RADIANCE, DAYSIM, EnergyPlus and OpenStudio with their warnings and the results of the
+    last check for updates. It is used for maxAge seconds as long as the version of Honeybee
+    is the same and the folders and library files haven't changed. Delete the file or set
+    sc.sticky["honeybee_useStartupSnapshot"] to False to check everything from scratch.
+    
+    Parsed libraries (RADIANCE materials, THERM materials and the md5 hash of EnergyPlus
+    libraries) are pickled next to the snapshot (honeybee_startup_libraries.pkl) and
+    are restored with it so the library files don't need to be parsed again.
+    
+    It also keeps the time of each phase of the startup to be printed by report.
+    """
+    
+    snapshotVersion = 2
+    maxAge = 24 * 3600
+    
+    def __init__(self, HoneybeeFolder, version, useSnapshot = True):
+        self.startTime = time.time()
+        self.timings = []
+        self.snapshotFile = os.path.join(HoneybeeFolder, "honeybee_startup.json")
+        self.librariesFile = os.path.join(HoneybeeFolder, "honeybee_startup_libraries.pkl")
+        self.version = version
+        
+        self.data = self.load() if useSnapshot and HoneybeeFolder else None
+        self.isRestored = self.data != None
+        if not self.isRestored:
+            self.data = {"snapshotVersion": self.snapshotVersion, "version": version, \
+                         "created": time.time()}
+        self.libraries = self.loadLibraries() if self.isRestored else {}
+    
+    def load(self):
+        try:
+            with open(self.snapshotFile, "r") as inf:
+                data = json.load(inf)
+            
+            if data["snapshotVersion"] != self.snapshotVersion or data["version"] != self.version:
+                return None
+            if time.time() - data["created"] > self.maxAge:
+                return None
+            # make sure nothing is uninstalled since the last time
+            for key in ["RADPath", "DSPath", "EPPath", "OSLibPath"]:
+                folder = data["folders"][key]
+                if folder and not os.path.isdir(folder): return None
+            for filePath, stamp in data["libFiles"].items():
+                if self.getFileStamp(filePath) != stamp: return None
+            return data
+        except:
+            return None
+    
+    def loadLibraries(self):
+        try:
+            with open(self.librariesFile, "rb") as inf:
+                libraries = pickle.load(inf)
+            # libraries should be saved with this snapshot
+            if libraries.pop("created") != self.data["created"]: return {}
+            return libraries
+        except:
+            return {}
+    
+    def getLibrary(self, name):
+        """Return the parsed library from the last startup or None."""
+        return self.libraries.get(name)
+    
+    def setLibrary(self, name, value):
+        self.libraries[name] = value
+    
+    def save(self):
+        try:
+            with open(self.snapshotFile, "w") as outf:
+                json.dump(self.data, outf)
+            libraries = dict(self.libraries)
+            libraries["created"] = self.data["created"]
+            with open(self.librariesFile, "wb") as outf:
+                pickle.dump(libraries, outf, pickle.HIGHEST_PROTOCOL)
+        except Exception, e:
+            print "Failed to save Honeybee startup snapshot: %s"%str(e)
+    
+    @staticmethod
+    def getFileStamp(filePath):
+        if not os.path.isfile(filePath): return None
+        fileStat = os.stat(filePath)
+        return [fileStat.st_size, repr(fileStat.st_mtime)]
+    
+    def setLibFiles(self, libFilePaths):
+        self.data["libFiles"] = dict((path, self.getFileStamp(path)) for path in libFilePaths)
+    
+    def addTiming(self, phase, startTime, note = ""):
+        self.timings.append((phase, time.time() - startTime, note))
+    
+    def report(self):
+        lines = ["Honeybee startup%s:"%(" (restored from snapshot)" if self.isRestored else "")]
+        for phase, seconds, note in self.timings:
+            line = "  %s: %.3f s"%(phase, seconds)
+            if note: line += " (%s)"%note
+            lines.append(line)
+        lines.append("  total: %.3f s"%(time.time() - self.startTime))
+        return "\n".join(lines)
+
+
 class PrepareTemplateEPLibFiles(object):
     """
     Download Template files and check for available libraries for EnergyPlus
@@ -471,10 +708,8 @@ class PrepareTemplateEPLibFiles(object):
             # load the json file
             filepath = os.path.join(workingDir, 'OpenStudio_Standards.json')
             try:
-                with open(filepath) as jsondata:
-                    openStudioStandardLib = json.load(jsondata)
-                
-                sc.sticky ["honeybee_OpenStudioStandardsFile"] = openStudioStandardLib
+                # only the space types are loaded. the rest of the file is loaded on demand
+                sc.sticky ["honeybee_OpenStudioStandardsFile"] = hb_OpenStudioStandards(filepath)
                 print "Standard template file is loaded from %s\n"%filepath
             except:
                 print 'Download failed!!! You need OpenStudio_Standards.json to use honeybee.' + \
@@ -528,6 +763,371 @@ class PrepareTemplateEPLibFiles(object):
         return libFilePaths
 
 
+class hb_OpenStudioStandards(object):
+    """
+    Space type loads and schedules of OpenStudio_Standards.json with lazy access to the rest.
+    
+    Zones only need the schedules and loads of their space type. These are extracted once
+    into OpenStudio_Standards.hbspace next to the json with the loads converted to SI and
+    the md5 of the json. The next sessions read the small file and a space type is a single
+    dictionary hit. The full json is only loaded when another section is requested
+    (e.g. openStudioStandardLib["constructions"]). If the folder is read-only the space
+    types are only kept in memory.
+    
+    Usage:
+        openStudioStandardLib = hb_OpenStudioStandards(filepath)
+        spaceType = openStudioStandardLib.getSpaceType("Office", "OpenOffice")
+        print spaceType["lightingDensityPerArea"]
+    """
+    cacheVersion = 1
+    defaultStandard = "90.1-2007"
+    defaultClimateZone = "ClimateZone 1-8"
+    # key in the json and the name of the EPZone attribute
+    scheduleKeys = (("occupancy_sch", "occupancySchedule"),
+                    ("occupancy_activity_sch", "occupancyActivitySch"),
+                    ("heating_setpoint_sch", "heatingSetPtSchedule"),
+                    ("cooling_setpoint_sch", "coolingSetPtSchedule"),
+                    ("lighting_sch", "lightingSchedule"),
+                    ("elec_equip_sch", "equipmentSchedule"),
+                    ("infiltration_sch", "infiltrationSchedule"))
+    # numbers in OpenStudio standard library are in IP. key, EPZone attribute and IP to SI factor
+    loadKeys = (("elec_equip_per_area", "equipmentLoadPerArea", 10.763961), #Per ft^2 to Per m^2
+                ("infiltration_per_area_ext", "infiltrationRatePerArea", 0.00508001), #1 ft3/min.m2 = 5.08001016E-03 m3/s.m2
+                ("lighting_w_per_area", "lightingDensityPerArea", 10.763961), #Per ft^2 to Per m^2
+                ("occupancy_per_area", "numOfPeoplePerArea", 10.763961 / 1000), #Per 1000 ft^2 to Per m^2
+                ("ventilation_per_area", "ventilationPerArea", 0.00508001), #1 ft3/min.m2 = 5.08001016E-03 m3/s.m2
+                ("ventilation_per_person", "ventilationPerPerson", 0.0004719)) #1 ft3/min.perosn = 4.71944743E-04 m3/s.person
+    
+    def __init__(self, standardsFile):
+        self.standardsFile = standardsFile
+        self._content = None
+        self._lock = threading.Lock()
+        
+        with open(standardsFile, "rb") as inf:
+            self.fileHash = hashlib.md5(inf.read()).hexdigest()
+        
+        self.spaceTypes = self.load()
+        if self.spaceTypes == None:
+            self.spaceTypes = self.extractSpaceTypes(self.content["space_types"])
+            self.save()
+    
+    @property
+    def cacheFile(self):
+        return os.path.splitext(self.standardsFile)[0] + ".hbspace"
+    
+    @property
+    def content(self):
+        """The full json. It is only loaded the first time it is requested."""
+        if self._content == None:
+            with self._lock:
+                if self._content == None:
+                    with open(self.standardsFile) as jsondata:
+                        self._content = json.load(jsondata)
+        return self._content
+    
+    @classmethod
+    def convertSpaceType(cls, schedulesAndLoads):
+        spaceType = {}
+        for key, attr in cls.scheduleKeys:
+            spaceType[attr] = schedulesAndLoads.get(key)
+        for key, attr, factor in cls.loadKeys:
+            value = schedulesAndLoads.get(key)
+            spaceType[attr] = value * factor if value != None else None
+        return spaceType
+    
+    @classmethod
+    def extractSpaceTypes(cls, spaceTypesLib):
+        """Return the space types by (standard, climate zone, bldgProgram, zoneProgram)."""
+        spaceTypes = {}
+        for standard, climateZones in spaceTypesLib.items():
+            for climateZone, bldgPrograms in climateZones.items():
+                for bldgProgram, zonePrograms in bldgPrograms.items():
+                    for zoneProgram, schedulesAndLoads in zonePrograms.items():
+                        spaceTypes[(standard, climateZone, bldgProgram, zoneProgram)] = \
+                            cls.convertSpaceType(schedulesAndLoads)
+        return spaceTypes
+    
+    def load(self):
+        if not os.path.isfile(self.cacheFile): return None
+        try:
+            with open(self.cacheFile, "r") as inf:
+                data = json.load(inf)
+        except Exception:
+            return None
+        if data.get("version") != self.cacheVersion or data.get("hash") != self.fileHash:
+            return None
+        return dict((tuple(key), spaceType) for key, spaceType in data["spaceTypes"])
+    
+    def save(self):
+        data = {"version": self.cacheVersion, "hash": self.fileHash,
+                "spaceTypes": [[list(key), spaceType] for key, spaceType in self.spaceTypes.items()]}
+        try:
+            with open(self.cacheFile, "w") as outf:
+                json.dump(data, outf)
+        except (IOError, OSError):
+            pass
+    
+    def getSpaceType(self, bldgProgram, zoneProgram, standard = None, climateZone = None):
+        """Return a dictionary of schedules and SI loads by EPZone attribute name or None if not found."""
+        if standard == None: standard = self.defaultStandard
+        if climateZone == None: climateZone = self.defaultClimateZone
+        return self.spaceTypes.get((standard, climateZone, bldgProgram, zoneProgram))
+    
+    # dictionary access to the full json for the code that reads the other sections
+    def __getitem__(self, key):
+        return self.content[key]
+    
+    def __contains__(self, key):
+        return key in self.content
+    
+    def get(self, key, default = None):
+        return self.content.get(key, default)
+    
+    def keys(self):
+        return self.content.keys()
+    
+
+class hb_EPLibraryIndex(object):
+    """
+    Index of the EnergyPlus objects in an idf library file.
+    
+    The file is split into objects in a single pass and only the class, the name and the
+    position of each object is stored. The index is saved next to the library file (*.hbidx)
+    and is re-used as long as the md5 hash of the file doesn't change. Fields of the objects
+    are parsed by hb_EPObjectData when they are requested for the first time.
+    
+    If fileHash is known (e.g. from hb_StartupSnapshot which checks the size and the
+    modified time of the file) the file is only read when an object is parsed.
+    
+    Usage:
+        index = hb_EPLibraryIndex("c:/ladybug/OpenStudioMasterTemplate.idf")
+        for key, shortKey, name, start, end in index.objects:
+            print key, name
+    """
+    
+    cacheVersion = 1
+    
+    def __init__(self, EPFile, useCache = True, fileHash = None):
+        self.EPFile = EPFile
+        self.indexFile = EPFile + ".hbidx"
+        self.__content = None
+        
+        if fileHash == None:
+            fileHash = hashlib.md5(self.content).hexdigest()
+        self.fileHash = fileHash
+        
+        self.objects = self.loadIndex() if useCache else None
+        
+        if self.objects == None:
+            self.fileHash = hashlib.md5(self.content).hexdigest()
+            self.objects = self.buildIndex()
+            if useCache: self.saveIndex()
+    
+    @property
+    def content(self):
+        if self.__content == None:
+            with open(self.EPFile, "rb") as inf:
+                self.__content = inf.read()
+        return self.__content
+    
+    def loadIndex(self):
+        try:
+            with open(self.indexFile, "r") as inf:
+                index = json.load(inf)
+            if index["version"] != self.cacheVersion or index["hash"] != self.fileHash:
+                return None
+            return [tuple(obj) for obj in index["objects"]]
+        except:
+            return None
+    
+    def saveIndex(self):
+        try:
+            with open(self.indexFile, "w") as outf:
+                json.dump({"version": self.cacheVersion, "hash": self.fileHash, \
+                           "objects": self.objects}, outf)
+        except Exception, e:
+            # the folder can be read-only. The index will be created again next time
+            print "Failed to save EnergyPlus library index: %s"%str(e)
+    
+    @staticmethod
+    def tokenize(text):
+        """Return start and end of each object in an EnergyPlus string.
+        
+        Objects are everything up to the next semicolon. A new line is skipped at the start
+        of the object the same way as the regex that was used before.
+        """
+        spans = []
+        pos = 0
+        while True:
+            end = text.find(";", pos)
+            if end == -1: break
+            start = pos
+            while start < end and text[start] == "\n": start += 1
+            if start < end: spans.append((start, end + 1))
+            pos = end + 1
+        return spans
+    
+    def buildIndex(self):
+        objects = []
+        for start, end in self.tokenize(self.content):
+            lines = HB_GetEPLibraries.getEPObjectLines(self.getObjectString(start, end))
+            header = HB_GetEPLibraries.parseEPObjectHeader(lines)
+            if header == None: continue
+            key, shortKey, name = header
+            objects.append((key, shortKey, name, start, end))
+        return objects
+    
+    def getObjectString(self, start, end):
+        return self.content[start:end].replace("\r\n", "\n")
+
+
+class hb_EPObjectData(MutableMapping):
+    """
+    Dictionary of the fields of an EnergyPlus object that is parsed on the first use.
+    
+    It works the same as the dictionaries in Honeybee EnergyPlus libraries. key 0 is
+    the EnergyPlus class and the rest are (value, comment) for each field after the name.
+    It has the full mapping interface (update, pop, setdefault, ...) but it is not a
+    dict subclass since dict(obj) would read the empty dict before the object is parsed.
+    Copies and pickles are normal dictionaries.
+    """
+    
+    def __init__(self, library, key, start, end, data = None):
+        self.library = library
+        self.key = key
+        self.start = start
+        self.end = end
+        # data is only set for objects that are already parsed (e.g. loaded from a file)
+        self.__data = data
+    
+    @property
+    def data(self):
+        if self.__data == None:
+            lines = HB_GetEPLibraries.getEPObjectLines(self.library.getObjectString(self.start, self.end))
+            self.__data = HB_GetEPLibraries.parseEPObjectData(lines, self.key)
+            # no need to keep the library for this object anymore
+            self.library = None
+        return self.__data
+    
+    def __getitem__(self, key): return self.data[key]
+    def __setitem__(self, key, value): self.data[key] = value
+    def __delitem__(self, key): del self.data[key]
+    def __contains__(self, key): return key in self.data
+    def __iter__(self): return iter(self.data)
+    def __len__(self): return len(self.data)
+    def __eq__(self, other): return self.data == other
+    def __ne__(self, other): return self.data != other
+    def __repr__(self): return repr(self.data)
+    
+    __hash__ = None
+    
+    def has_key(self, key): return key in self.data
+    def get(self, key, default = None): return self.data.get(key, default)
+    def keys(self): return self.data.keys()
+    def values(self): return self.data.values()
+    def items(self): return self.data.items()
+    def iterkeys(self): return self.data.iterkeys()
+    def itervalues(self): return self.data.itervalues()
+    def iteritems(self): return self.data.iteritems()
+    def update(self, *args, **kwargs): self.data.update(*args, **kwargs)
+    def pop(self, key, *default): return self.data.pop(key, *default)
+    def popitem(self): return self.data.popitem()
+    def setdefault(self, key, default = None): return self.data.setdefault(key, default)
+    def clear(self): self.data.clear()
+    def copy(self): return dict(self.data)
+    
+    def __deepcopy__(self, memo): return copy.deepcopy(self.data, memo)
+    def __reduce__(self): return (dict, (dict(self.data),))
+
+
+class hb_IDFReader(object):
+    """
+    Single pass reader for EnergyPlus idf files.
+    
+    Comments are removed and fields are split by commas and semicolons regardless of the
+    line breaks so objects with several fields in one line, one-line objects and files
+    without a newline at the end are all read the same way. Only the objects of the
+    requested classes are kept.
+    
+    Each object is an IDFObject with the class name as it is written in the file, the
+    name and the list of fields after the class name (field 0 is the name).
+    
+    Usage:
+        reader = hb_IDFReader(["Zone", "BuildingSurface:Detailed"])
+        for idfObject in reader.iterObjects("c:/ladybug/model.idf"):
+            print idfObject.className, idfObject.name, idfObject.fields
+    """
+    IDFObject = namedtuple("IDFObject", "className name fields")
+    
+    def __init__(self, classNames = None):
+        if classNames != None:
+            classNames = set(c.strip().rstrip(",").upper() for c in classNames)
+        self.classNames = classNames
+    
+    def iterObjects(self, idfFilePath):
+        with open(idfFilePath, "r") as idfFile:
+            for idfObject in self.iterObjectsFromLines(idfFile):
+                yield idfObject
+    
+    def iterObjectsFromLines(self, lines):
+        classNames = self.classNames
+        objectParts = []
+        for line in lines:
+            if "!" in line: line = line[:line.index("!")]
+            if ";" not in line:
+                if line.strip(): objectParts.append(line)
+                continue
+            
+            # there can be the end of one object and several other objects in a line
+            parts = line.split(";")
+            for part in parts[:-1]:
+                objectParts.append(part)
+                idfObject = self.createObject(objectParts, classNames)
+                if idfObject != None: yield idfObject
+                objectParts = []
+            if parts[-1].strip(): objectParts.append(parts[-1])
+        
+        # the last object is not closed
+        if objectParts:
+            idfObject = self.createObject(objectParts, classNames)
+            if idfObject != None: yield idfObject
+    
+    @classmethod
+    def createObject(cls, objectParts, classNames):
+        objectStr = "".join(objectParts)
+        comma = objectStr.find(",")
+        className = (objectStr if comma == -1 else objectStr[:comma]).strip()
+        if not className: return None
+        if classNames != None and className.upper() not in classNames: return None
+        
+        fields = [field.strip() for field in objectStr[comma + 1:].split(",")] if comma != -1 else []
+        name = fields[0] if fields else ""
+        return cls.IDFObject(className, name, fields)
+    
+    def readObjects(self, idfFilePath):
+        """Return an OrderedDict of upper case class names and the list of the objects."""
+        idfObjects = OrderedDict()
+        for idfObject in self.iterObjects(idfFilePath):
+            idfObjects.setdefault(idfObject.className.upper(), []).append(idfObject)
+        return idfObjects
+    
+    @staticmethod
+    def getVertices(fields, start):
+        """Return x, y, z values of the vertices that start from fields[start] as an array."""
+        coordinates = array.array("d")
+        for field in fields[start:]:
+            if field == "": continue
+            coordinates.append(float(field))
+        if len(coordinates) % 3 != 0:
+            raise ValueError("Number of coordinates is not a multiple of 3.")
+        return coordinates
+    
+    @staticmethod
+    def getField(fields, index, default = ""):
+        try: return fields[index]
+        except IndexError: return default
+
+
 class HB_GetEPLibraries:
     
     def __init__(self):
@@ -541,6 +1141,10 @@ class HB_GetEPLibraries:
             "WindowProperty": {},
             "MaterialProperty": {}
             }
+        # md5 hash of the loaded idf files. See hb_EPLibraryIndex
+        self.fileHashes = {}
+        # THERM materials of the loaded csv files. See readThermRecords
+        self.thermRecords = {}
     
     def getEPMaterials(self):
         return self.libraries["Material"]
@@ -566,17 +1170,24 @@ class HB_GetEPLibraries:
     def getTHERMMaterials(self):
         return self.libraries["ThermMaterial"]
     
-    def importEPLibrariesFromFile(self, EPfile, isMatFile, cleanCurrentLib = True, report = True):
+    def importEPLibrariesFromFile(self, EPfile, isMatFile, cleanCurrentLib = True, report = True, \
+                                  fileHash = None, thermRecords = None):
+        """Load an EnergyPlus idf library or a THERM csv material library.
+        
+        fileHash and thermRecords are the results of the last load from hb_StartupSnapshot.
+        """
         if not os.path.isfile(EPfile):
             raise Exception("Can't find EP library! at %s"%EPfile)
         
         if isMatFile == False:
             print "Loading EP materials, constructions, schedules and material properties from %s"%EPfile
-            EPObjects = self.getEnergyPlusObjectsFromFile(EPfile)
-            self.loadEPConstructionsMaterialsAndSchedules(EPObjects, cleanCurrentLib)
+            self.loadEPLibraryFile(EPfile, cleanCurrentLib, fileHash)
         else:
             print "Loading THERM materials from %s"%EPfile
-            self.getThermObjectsFromFile(EPfile)
+            if thermRecords == None:
+                thermRecords = self.readThermRecords(EPfile)
+            self.addThermRecords(thermRecords)
+            self.thermRecords[EPfile] = thermRecords
         
         if report:
             self.report()
@@ -593,69 +1204,100 @@ class HB_GetEPLibraries:
             "MaterialProperty": {}
             }
             
+    @staticmethod
+    def getEPObjectLines(EPObjectStr):
+        lines = []
+        for line in EPObjectStr.strip().split("\n"):
+            if line.strip() == '' or line.startswith('!'): continue
+            lines.append(line)
+        return lines
+    
+    @staticmethod
+    def parseEPObjectHeader(lines):
+        """Return EnergyPlus class, short class name and upper case name of an object.
+        
+        Returns None if the object doesn't have a name.
+        """
+        if len(lines) < 2: return None
+        
+        if lines[0].startswith('MaterialProperty:GlazingSpectralData'):
+            key = 'MaterialProperty:GlazingSpectralData'
+            return key, 'MaterialProperty', lines[1].split(",")[0].strip().upper()
+        
+        if lines[0].split(",")[0].strip().isupper():
+            key = lines[0].split(",")[0].strip().title()
+        else:
+            key = lines[0].split(",")[0].strip()
+        shortKey = key.split(":")[0]
+        
+        name = lines[1].split(",")[0].strip().upper()
+        # it's a two line object such as Any Number scheduleTypeLimit
+        if len(lines) == 2:
+            name = lines[1].split(";")[0].strip().upper() # name is the last input
+        
+        return key, shortKey, name
+    
+    @staticmethod
+    def parseEPObjectData(lines, key):
+        """Return the dictionary of an object as it is stored in Honeybee libraries."""
+        data = dict() # create an empty dictonary
+        data[0] = key
+        
+        if key == 'MaterialProperty:GlazingSpectralData':
+            # store the data into the dictionary
+            for lineCount, line in enumerate(lines):
+                objValue = line.split("!")[0].strip()
+                try: objDescription = line.split("!")[1].strip()
+                except:  objDescription = ""
+                if lineCount == 0:
+                    data[lineCount] = objValue[:-1]
+                elif lineCount == 1:
+                    pass # name is already there as the key
+                elif objValue.endswith(","):
+                    data[lineCount-1] = objValue[:-1], objDescription
+                elif objValue.endswith(";"):
+                    data[lineCount-1] = objValue[:-1], objDescription
+            return data
+        
+        values = lines[2:]
+        count = 1
+        delimiter = ","
+        for value in values:
+            if not len(value.strip()): continue #pass empty lines
+            if count==len(values): delimiter = ";"
+            v = value.split(delimiter)[0].strip() # find the  value
+            if value.find("!")!= -1:
+                c = value.split("!")[-1].rstrip() # find the  value
+            else:
+                c = ""
+            data[count] = v, c
+            count += 1
+        
+        return data
+    
     # TODO: Support parsing for files with no next line
-    # TODO: Check if keys can be case insensitive
     # TODO: Create EPObjects and not dictionaries
     def loadEPConstructionsMaterialsAndSchedules(self, EPObjectsString, cleanCurrentLib = True):
         if cleanCurrentLib: self.cleanHBLibs()
         
         for EPObjectStr in EPObjectsString:
-            rawLines = EPObjectStr.strip().split("\n")
-            lines = []
-            for line in rawLines:
-                if line.strip() == '' or line.startswith('!'): continue
-                lines.append(line)
-            
-            if lines[0].startswith('MaterialProperty:GlazingSpectralData'):
-                key = 'MaterialProperty:GlazingSpectralData'
-                shortKey = 'MaterialProperty'
-                name = lines[1].split(",")[0].strip().upper()
-                self.libraries[shortKey][name] = dict() # create an empty dictonary
-                self.libraries[shortKey][name][0] = key
-                # store the data into the dictionary
-                for lineCount, line in enumerate(lines):
-                    objValue = line.split("!")[0].strip()
-                    try: objDescription = line.split("!")[1].strip()
-                    except:  objDescription = ""
-                    if lineCount == 0:
-                        self.libraries[shortKey][name][lineCount] = objValue[:-1]
-                    elif lineCount == 1:
-                        pass # name is already there as the key
-                    elif objValue.endswith(","):
-                        self.libraries[shortKey][name][lineCount-1] = objValue[:-1], objDescription
-                    elif objValue.endswith(";"):
-                        self.libraries[shortKey][name][lineCount-1] = objValue[:-1], objDescription
-            else:
-                if len(lines) < 2: continue
-                
-                if lines[0].split(",")[0].strip().isupper():
-                    key = lines[0].split(",")[0].strip().title()
-                else:
-                    key = lines[0].split(",")[0].strip()
-                shortKey = key.split(":")[0]
-                
-                name = lines[1].split(",")[0].strip().upper()
-                values = lines[2:]
-                # it's a two line object such as Any Number scheduleTypeLimit
-                if values == []:
-                    name = lines[1].split(";")[0].strip().upper() # name is the last input
-                    
-                if shortKey in self.libraries:
-                    self.libraries[shortKey][name] = dict() # create an empty dictonary
-                    self.libraries[shortKey][name][0] = key
-                    
-                    count = 1
-                    delimiter = ","
-                    for value in values:
-                        if not len(value.strip()): continue #pass empty lines
-                        if count==len(values): delimiter = ";"
-                        v = value.split(delimiter)[0].strip() # find the  value
-                        if value.find("!")!= -1:
-                            c = value.split("!")[-1].rstrip() # find the  value
-                        else:
-                            c = ""
-                        self.libraries[shortKey][name][count] = v, c
-                        count += 1
+            lines = self.getEPObjectLines(EPObjectStr)
+            header = self.parseEPObjectHeader(lines)
+            if header == None: continue
+            
+            key, shortKey, name = header
+            if shortKey in self.libraries:
+                self.libraries[shortKey][name] = self.parseEPObjectData(lines, key)
+    
+    def loadEPLibraryFile(self, EPfile, cleanCurrentLib = True, fileHash = None):
+        """Load objects from an idf file using hb_EPLibraryIndex. Fields are parsed on the first use."""
+        if cleanCurrentLib: self.cleanHBLibs()
+        
+        library = hb_EPLibraryIndex(EPfile, fileHash = fileHash)
+        self.fileHashes[EPfile] = library.fileHash
+        for key, shortKey, name, start, end in library.objects:
+            if shortKey in self.libraries:
+                self.libraries[shortKey][name] = hb_EPObjectData(library, key, start, end)
     
     def report(self): 
         # Report findings
@@ -684,10 +1326,7 @@ class HB_GetEPLibraries:
             A list of strings. Each string represents a differnt Rdiance Object
         """
         
-        #rawEPObjects = re.findall(r'(.[^;]*;.[^\n]*)', epFileString + "\n",re.MULTILINE)
-        rawEPObjects = re.findall(r'(.[^;]*;)', epFileString + "\n",re.MULTILINE)
-        
-        return rawEPObjects
+        return [epFileString[start:end] for start, end in hb_EPLibraryIndex.tokenize(epFileString)]
     
     def getEnergyPlusObjectsFromFile(self, epFilePath):
         """
@@ -712,9 +1351,15 @@ class HB_GetEPLibraries:
             return self.getEnergyPlusObjectsFromString("".join(epFile.readlines()))
     
     def getThermObjectsFromFile(self, matFile):
+        self.addThermRecords(self.readThermRecords(matFile))
+    
+    @staticmethod
+    def readThermRecords(matFile):
+        """Return (name, type, conductivity, absorptivity, emissivity, color) for materials in a csv file."""
         if not os.path.isfile(matFile):
             raise ValueError("Can't find %s."%matFile)
         
+        records = []
         with open(matFile, "r") as mFile:
             for rowCount, row in enumerate(mFile):
                 if rowCount > 1:
@@ -722,17 +1367,208 @@ class HB_GetEPLibraries:
                         matPropLine = row.split(',')
                         matNameLine = row.split('"')
                         matName = matNameLine[1].upper()
-                        #Make a sub-dictionary for the material.
-                        self.libraries["ThermMaterial"][matName] = {}
-                        
-                        #Create the material with the values from the file.
-                        self.libraries["ThermMaterial"][matName]["Name"] = matName
-                        self.libraries["ThermMaterial"][matName]["Type"] = int(matPropLine[-1])
-                        self.libraries["ThermMaterial"][matName]["Conductivity"] = float(matPropLine[-5])
-                        self.libraries["ThermMaterial"][matName]["Absorptivity"] = float(matPropLine[-4])
-                        self.libraries["ThermMaterial"][matName]["Emissivity"] = float(matPropLine[-3])
-                        self.libraries["ThermMaterial"][matName]["RGBColor"] = System.Drawing.ColorTranslator.FromHtml("#" + matPropLine[-2])
+                        records.append((matName, int(matPropLine[-1]), float(matPropLine[-5]), \
+                                        float(matPropLine[-4]), float(matPropLine[-3]), "#" + matPropLine[-2]))
                     except: pass
+        return records
+    
+    def addThermRecords(self, records):
+        for matName, matType, conductivity, absorptivity, emissivity, color in records:
+            #Create the material with the values from the file.
+            self.libraries["ThermMaterial"][matName] = {
+                "Name": matName,
+                "Type": matType,
+                "Conductivity": conductivity,
+                "Absorptivity": absorptivity,
+                "Emissivity": emissivity
+                }
+            try: self.libraries["ThermMaterial"][matName]["RGBColor"] = System.Drawing.ColorTranslator.FromHtml(color)
+            except: pass
+
+class hb_LibrarySearchIndex(object):
+    """
+    Inverted index of the names in a Honeybee library for keyword searches.
+    
+    Upper case names are split into tokens by space and each token keeps the set of names
+    that use it. Tokens are also indexed by their 3 character grams so a keyword is only
+    compared with the few tokens that have all of its grams. Multi-keyword searches are set
+    intersections and the results are the same as searching for the keyword in every name.
+    Facets such as standard, surface type or climate zone are calculated when a name is
+    added by facetsFunction(name, value) which should return a list of hashable keys.
+    
+    The index is created on the first search and is kept in sticky by the library name.
+    Honeybee methods that add objects to a library update the index and changes to the
+    library from other places are found by getIndex.
+    
+    Usage:
+        index = hb_LibrarySearchIndex.getIndex("honeybee_constructionLib")
+        names = index.findAll(["EXTWALL", "90.1"]) & index.getFacet(("climateZone", "3"))
+    """
+    gramSize = 3
+    
+    def __init__(self, facetsFunction = None):
+        self.facetsFunction = facetsFunction
+        self.library = None
+        self.upperNames = {} # name: upper case name
+        self.byUpperName = {} # upper case name: set of names
+        self.tokens = {} # token: set of names
+        self.tokenGrams = {} # gram: set of tokens
+        self.facets = {} # facet: set of names
+        self.nameFacets = {} # name: facets of the name
+        self.queries = {} # cached results by keyword
+    
+    @classmethod
+    def getIndex(cls, libName, library = None, facetsFunction = None):
+        """Return the index of a library and update it if the library has changed.
+        
+        Args:
+            libName: Name of the library in sticky (e.g. honeybee_constructionLib).
+            library: The library dictionary. Default is sc.sticky[libName].
+            facetsFunction: Function to calculate the facets when the index is created.
+        """
+        if not sc.sticky.has_key("honeybee_LibrarySearchIndexes"):
+            sc.sticky["honeybee_LibrarySearchIndexes"] = {}
+        indexes = sc.sticky["honeybee_LibrarySearchIndexes"]
+        
+        if library == None: library = sc.sticky[libName]
+        if libName not in indexes:
+            indexes[libName] = cls(facetsFunction)
+        index = indexes[libName]
+        index.sync(library)
+        return index
+    
+    @classmethod
+    def updateIndex(cls, libName, name):
+        """Add a name to the index of a library if the index is already created."""
+        if not sc.sticky.has_key("honeybee_LibrarySearchIndexes"): return
+        index = sc.sticky["honeybee_LibrarySearchIndexes"].get(libName)
+        if index != None and index.library != None and name in index.library:
+            index.add(name, index.library[name])
+    
+    def __contains__(self, name):
+        return name in self.upperNames
+    
+    def __len__(self):
+        return len(self.upperNames)
+    
+    def getGrams(self, text):
+        return set(text[i:i + self.gramSize] for i in xrange(len(text) - self.gramSize + 1))
+    
+    def sync(self, library):
+        """Add the new names of the library and remove the names that are not in it anymore."""
+        # the length is not enough since a name can be removed and another one added in place
+        if library is self.library and len(library) == len(self.upperNames) and \
+            all(name in self.upperNames for name in library): return
+        
+        if library is not self.library:
+            self.__init__(self.facetsFunction)
+            self.library = library
+        
+        for name in [name for name in self.upperNames if name not in library]:
+            self.remove(name)
+        for name, value in library.items():
+            if name not in self.upperNames:
+                self.add(name, value)
+    
+    def add(self, name, value = None):
+        if name in self.upperNames: self.remove(name)
+        self.queries = {}
+        
+        upperName = name.upper()
+        self.upperNames[name] = upperName
+        self.byUpperName.setdefault(upperName, set()).add(name)
+        for token in set(upperName.split(" ")):
+            if token not in self.tokens:
+                self.tokens[token] = set()
+                for gram in self.getGrams(token):
+                    self.tokenGrams.setdefault(gram, set()).add(token)
+            self.tokens[token].add(name)
+        
+        nameFacets = tuple(self.facetsFunction(name, value)) if self.facetsFunction else ()
+        self.nameFacets[name] = nameFacets
+        for facet in nameFacets:
+            self.facets.setdefault(facet, set()).add(name)
+    
+    def remove(self, name):
+        if name not in self.upperNames: return
+        self.queries = {}
+        
+        upperName = self.upperNames.pop(name)
+        self.byUpperName[upperName].discard(name)
+        if not self.byUpperName[upperName]: del self.byUpperName[upperName]
+        for token in set(upperName.split(" ")):
+            self.tokens[token].discard(name)
+            if self.tokens[token]: continue
+            del self.tokens[token]
+            for gram in self.getGrams(token):
+                self.tokenGrams[gram].discard(token)
+                if not self.tokenGrams[gram]: del self.tokenGrams[gram]
+        
+        for facet in self.nameFacets.pop(name):
+            self.facets[facet].discard(name)
+            if not self.facets[facet]: del self.facets[facet]
+    
+    def findInTokens(self, keyword):
+        """Return the set of names with a token that includes the keyword. Keyword has no spaces."""
+        grams = self.getGrams(keyword)
+        if grams:
+            tokenSets = sorted((self.tokenGrams.get(gram, set()) for gram in grams), key = len)
+            candidates = tokenSets[0].intersection(*tokenSets[1:])
+        else:
+            candidates = self.tokens.keys()
+        
+        names = set()
+        for token in candidates:
+            if token.find(keyword) != -1:
+                names.update(self.tokens[token])
+        return names
+    
+    def find(self, keyword):
+        """Return the set of names that include the keyword. Search is not case sensitive."""
+        keyword = keyword.upper()
+        if keyword in self.queries: return self.queries[keyword]
+        
+        # each part of the keyword between spaces should be inside a token of the name
+        parts = [part for part in keyword.split(" ") if part != ""]
+        if len(parts) == 0:
+            candidates = self.upperNames.keys()
+        else:
+            candidates = None
+            for part in sorted(parts, key = len, reverse = True):
+                names = self.findInTokens(part)
+                candidates = names if candidates == None else candidates & names
+                if not candidates: break
+        
+        if parts == [keyword]:
+            result = frozenset(candidates)
+        else:
+            upperNames = self.upperNames
+            result = frozenset(name for name in candidates if upperNames[name].find(keyword) != -1)
+        self.queries[keyword] = result
+        return result
+    
+    def findAll(self, keywords):
+        """Return the set of names that include all the keywords."""
+        result = None
+        for keyword in keywords:
+            matches = self.find(keyword)
+            result = matches if result == None else result & matches
+            if not result: break
+        return result if result != None else frozenset(self.upperNames)
+    
+    def findIn(self, text):
+        """Return the set of names which are part of the text. Search is not case sensitive."""
+        text = text.upper()
+        result = set()
+        for start in xrange(len(text)):
+            for end in xrange(start + 1, len(text) + 1):
+                if text[start:end] in self.byUpperName:
+                    result.update(self.byUpperName[text[start:end]])
+        return result
+    
+    def getFacet(self, facet):
+        return self.facets.get(facet, frozenset())
+    
 
 class RADMaterialAux(object):
 
@@ -782,61 +1618,79 @@ class RADMaterialAux(object):
         def __repr__(self):
             return self.toRadString()
     
-    def __init__(self, reloadRADMaterial = False, materialLibrary = {}, HoneybeeFolder = "c:/ladybug"):
+    def __init__(self, reloadRADMaterial = False, materialLibrary = {}, HoneybeeFolder = "c:/ladybug", \
+                 startupMaterials = None):
         
         self.HoneybeeFolder = HoneybeeFolder
         self.radMaterialLibrary = materialLibrary
         self.radMatTypes = ["plastic", "glass", "trans", "metal", "mirror", "texfunc", "mixedfunc", "dielectric", "transdata", "light", "glow"]
         
         if reloadRADMaterial:
-                        
-            defaultMaterial = {
-                'Context_Material'  : {'type' : 'plastic', 'value': 0.35},
-                'Interior_Ceiling'  : {'type' : 'plastic', 'value': 0.80},
-                'Interior_Floor'    : {'type' : 'plastic', 'value': 0.20},
-                'Exterior_Floor'    : {'type' : 'plastic', 'value': 0.20},
-                'Exterior_Roof'     : {'type' : 'plastic', 'value': 0.80},
-                'Exterior_Wall'     : {'type' : 'plastic', 'value': 0.50},
-                'Interior_Wall'     : {'type' : 'plastic', 'value': 0.50},
-                'Interior_Window'     : {'type' : 'glass'  , 'value': 0.60},
-                'Exterior_Window'     : {'type' : 'glass'  , 'value': 0.60}
-                }
-            
-            for materialName, materialData in defaultMaterial.items():
-                radMaterial = self.RadianceMaterial(materialName, materialData['type'])
-                value = materialData['value']
-                
-                # add values to material
-                # first two lines are empty
-                radMaterial.addValues(0, [])
-                radMaterial.addValues(1, [])
-                if radMaterial.type == 'glass':
-                    value = self.getTransmissivity(value)
-                    radMaterial.addValues(2, 3 * ['%.3f'%value]) # leave roughness specularity to 0
-                else:
-                    radMaterial.addValues(2, 3 * ['%.3f'%value] + ['0', '0']) # leave roughness specularity to 0
-            
-                # add default materials to the library
-                self.addMaterialToDocumentLibrary(radMaterial)
-            
-            # import user defined RAD library
-            RADLibraryFile = self.getUserDefinedRadianceLibraryPath()
-            
-            if os.path.isfile(RADLibraryFile):
-                self.importRADMaterialsFromFile(RADLibraryFile)
-            else:
-                # This is only happening the first time
-                # that user lets the Honeybee fly on their system
-                # or changes the default folder
-                if not os.path.isdir(self.HoneybeeFolder):
-                    os.mkdir(self.HoneybeeFolder)
-                with open(RADLibraryFile, "w") as outf:
-                    outf.write("#Honeybee Radiance Material Library\n")
+            # startupMaterials are the results of the last load from hb_StartupSnapshot
+            if startupMaterials == None:
+                startupMaterials = self.readStartupMaterials()
+            self.startupMaterials = startupMaterials
             
+            for name, type, values, modifier in startupMaterials:
+                values = dict((lineCount, list(v)) for lineCount, v in values.items())
+                self.addMaterialToDocumentLibrary(self.RadianceMaterial(name, type, values, modifier))
             
             print "Loading RAD default materials..." + \
                   `len(self.radMaterialLibrary)` + " RAD materials are loaded\n"
+    
+    def readStartupMaterials(self):
+        """Return (name, type, values, modifier) for default materials and the user defined library."""
+        defaultMaterial = {
+            'Context_Material'  : {'type' : 'plastic', 'value': 0.35},
+            'Interior_Ceiling'  : {'type' : 'plastic', 'value': 0.80},
+            'Interior_Floor'    : {'type' : 'plastic', 'value': 0.20},
+            'Exterior_Floor'    : {'type' : 'plastic', 'value': 0.20},
+            'Exterior_Roof'     : {'type' : 'plastic', 'value': 0.80},
+            'Exterior_Wall'     : {'type' : 'plastic', 'value': 0.50},
+            'Interior_Wall'     : {'type' : 'plastic', 'value': 0.50},
+            'Interior_Window'     : {'type' : 'glass'  , 'value': 0.60},
+            'Exterior_Window'     : {'type' : 'glass'  , 'value': 0.60}
+            }
+        
+        radMaterials = []
+        for materialName, materialData in defaultMaterial.items():
+            radMaterial = self.RadianceMaterial(materialName, materialData['type'])
+            value = materialData['value']
             
+            # add values to material
+            # first two lines are empty
+            radMaterial.addValues(0, [])
+            radMaterial.addValues(1, [])
+            if radMaterial.type == 'glass':
+                value = self.getTransmissivity(value)
+                radMaterial.addValues(2, 3 * ['%.3f'%value]) # leave roughness specularity to 0
+            else:
+                radMaterial.addValues(2, 3 * ['%.3f'%value] + ['0', '0']) # leave roughness specularity to 0
+            radMaterials.append(radMaterial)
+        
+        # import user defined RAD library
+        RADLibraryFile = self.getUserDefinedRadianceLibraryPath()
+        
+        if os.path.isfile(RADLibraryFile):
+            for materialString in self.getRadianceObjectsFromFile(RADLibraryFile):
+                try:
+                    if len(self.cleanRadMaterial(materialString).split(" ")) == 1:
+                        # this is just the name
+                        continue
+                    radMaterials.append(self.createRadMaterialFromString(materialString))
+                except:
+                    raise Exception("Faild to import %s"%materialString)
+        else:
+            # This is only happening the first time
+            # that user lets the Honeybee fly on their system
+            # or changes the default folder
+            if not os.path.isdir(self.HoneybeeFolder):
+                os.mkdir(self.HoneybeeFolder)
+            with open(RADLibraryFile, "w") as outf:
+                outf.write("#Honeybee Radiance Material Library\n")
+        
+        return [(m.name, m.type, m.values, m.modifier) for m in radMaterials]
+    
     def duplicateMaterialWarning(self, materialName, newMaterialString):
         returnYN = {'YES': True, 'NO': False}
         buttons = System.Windows.Forms.MessageBoxButtons.YesNo
@@ -984,6 +1838,7 @@ class RADMaterialAux(object):
         
         # add to library
         self.radMaterialLibrary[radMaterial.name] = radMaterial
+        hb_LibrarySearchIndex.updateIndex("honeybee_RADMaterialLib", radMaterial.name)
     
     def isMatrialExistInLibrary(self, materialName):
         return materialName in self.radMaterialLibrary
@@ -1145,24 +2000,36 @@ class RADMaterialAux(object):
             result[name] = obj
         return result
         
+    @staticmethod
+    def getSearchFacets(materialName, radMaterial):
+        return [("type", radMaterial.type.upper())]
+    
     def searchRadMaterials(self, keywords, materialTypes):
         keywords = [kw.strip().upper() for kw in keywords]
         materialTypes = [mt.strip().upper() for mt in materialTypes]
         
+        index = hb_LibrarySearchIndex.getIndex("honeybee_RADMaterialLib", \
+                                               self.radMaterialLibrary, self.getSearchFacets)
+        
+        if len(materialTypes)!=0:
+            selectedTypes = set()
+            for materialType in materialTypes:
+                selectedTypes.update(index.getFacet(("type", materialType)))
+        
+        # materials that include the keyword or are part of the keyword
+        if len(keywords)!= 0 and not "*" in keywords:
+            keywordMatches = [index.find(keyword).union(index.findIn(keyword)) for keyword in keywords]
+        
         materials = []
         for radMaterial in self.radMaterialLibrary:
-            materialName = radMaterial.upper()
-            materialType = self.getMaterialFromHBLibrary(radMaterial).type.upper()
+            if len(materialTypes)!=0 and radMaterial not in selectedTypes: continue
             
-            if len(materialTypes)==0 or materialType in materialTypes:
-                
-                if len(keywords)!= 0 and not "*" in keywords:
-                    for keyword in keywords:
-                        
-                        if materialName.find(keyword)!= -1 or keyword.find(materialName)!= -1:
-                            materials.append(radMaterial)
-                else:
-                    materials.append(radMaterial)
+            if len(keywords)!= 0 and not "*" in keywords:
+                for matches in keywordMatches:
+                    if radMaterial in matches:
+                        materials.append(radMaterial)
+            else:
+                materials.append(radMaterial)
         
         return materials
     
@@ -1594,7 +2461,1299 @@ class hb_MSHToRAD(object):
             
         time.sleep(.2)
     
-        return matFile, radFile
+        return matFile, radFile
+
+class hb_Job(object):
+    """
+    A command line job for hb_JobScheduler.
+    
+    Args:
+        name: Unique name of the job.
+        command: Command to be executed (e.g. full path to a batch file).
+        dependsOn: List of job names that should finish successfully before this job starts.
+        workingDir: Optional working directory for the job.
+        shell: Set to True to run the command through the shell.
+        retries: Number of times that the job will be re-submitted if it fails.
+        timeout: Optional time limit for each try in seconds.
+        captureOutput: Set to True to collect stdout and stderr of the job.
+    """
+    def __init__(self, name, command, dependsOn = [], workingDir = None, shell = False, \
+                 retries = 0, timeout = None, captureOutput = True):
+        self.name = name
+        self.command = command
+        self.dependsOn = list(dependsOn)
+        self.workingDir = workingDir
+        self.shell = shell
+        self.retries = retries
+        self.timeout = timeout
+        self.captureOutput = captureOutput
+        
+        self.state = "pending"  # pending, running, succeeded, failed, skipped, cancelled
+        self.attempts = 0
+        self.returnCode = None
+        self.stdout = ""
+        self.stderr = ""
+        self.startTime = None
+        self.endTime = None
+        self.timedOut = False
+        self.process = None
+    
+    @property
+    def runTime(self):
+        if self.startTime == None or self.endTime == None: return None
+        return self.endTime - self.startTime
+    
+    def __repr__(self):
+        return "Job: %s [%s]"%(self.name, self.state)
+
+class hb_JobScheduler(object):
+    """
+    Run a graph of command line jobs on a bounded pool of local processes.
+    
+    Each running job is watched by its own thread which notifies the scheduler as soon
+    as the process ends so there is no polling. Jobs only start when all of their
+    dependencies have succeeded and jobs that depend on a failed or cancelled job are skipped.
+    
+    Usage:
+        scheduler = hb_JobScheduler()
+        scheduler.addJob("init", "c:/ladybug/room/room_RADInit.bat")
+        for cpu in range(4):
+            scheduler.addJob("rtrace_%d"%cpu, "c:/ladybug/room/room_%d.bat"%cpu, ["init"])
+        scheduler.addJob("pcomp", "c:/ladybug/room/room_PCOMP.bat", ["rtrace_%d"%cpu for cpu in range(4)])
+        success = scheduler.run()
+        print scheduler.report()
+    """
+    
+    def __init__(self, maxWorkers = None, dryRun = False, onJobComplete = None):
+        if not maxWorkers:
+            maxWorkers = System.Environment.ProcessorCount
+        self.maxWorkers = max(1, int(maxWorkers))
+        self.dryRun = dryRun
+        self.onJobComplete = onJobComplete
+        self.jobs = OrderedDict()
+        self.isCancelled = False
+        self.__condition = threading.Condition()
+        self.__finishedJobs = []
+    
+    def addJob(self, name, command, dependsOn = [], **kwargs):
+        if name in self.jobs:
+            raise ValueError("There is already a job named %s."%name)
+        for dependency in dependsOn:
+            if dependency not in self.jobs:
+                raise ValueError("%s depends on %s which is not added yet."%(name, dependency))
+        job = hb_Job(name, command, dependsOn, **kwargs)
+        self.jobs[name] = job
+        return job
+    
+    def cancel(self):
+        """Stop the running jobs and cancel the ones that are not started yet."""
+        with self.__condition:
+            self.isCancelled = True
+            for job in self.jobs.values():
+                if job.state == "running" and job.process != None:
+                    self.killProcess(job)
+                elif job.state == "pending":
+                    job.state = "cancelled"
+            self.__condition.notify_all()
+    
+    @staticmethod
+    def killProcess(job):
+        # batch files start child processes (e.g. rtrace) so kill the whole tree on Windows
+        try:
+            if os.name == "nt":
+                subprocess.call("taskkill /F /T /PID %d"%job.process.pid, shell = True)
+            else:
+                job.process.kill()
+        except:
+            pass
+    
+    def getReadyJobs(self):
+        readyJobs = []
+        for job in self.jobs.values():
+            if job.state != "pending": continue
+            dependencies = [self.jobs[name] for name in job.dependsOn]
+            if any(dep.state in ("failed", "skipped", "cancelled") for dep in dependencies):
+                job.state = "skipped"
+                self.notifyJobComplete(job)
+                # this can change the state of other jobs
+                return self.getReadyJobs()
+            if all(dep.state == "succeeded" for dep in dependencies):
+                readyJobs.append(job)
+        return readyJobs
+    
+    def notifyJobComplete(self, job):
+        if self.onJobComplete:
+            try: self.onJobComplete(job)
+            except Exception, e: print "Job callback failed for %s: %s"%(job.name, str(e))
+    
+    def startJob(self, job):
+        job.state = "running"
+        job.attempts += 1
+        job.timedOut = False
+        job.startTime = time.time()
+        
+        if self.dryRun:
+            job.returnCode = 0
+            job.stdout = "Dry run: %s"%job.command
+            self.jobFinished(job)
+            return
+        
+        watcher = threading.Thread(target = self.watchJob, args = (job,))
+        watcher.daemon = True
+        watcher.start()
+    
+    def watchJob(self, job):
+        timer = None
+        try:
+            pipe = subprocess.PIPE if job.captureOutput else None
+            job.process = subprocess.Popen(job.command, cwd = job.workingDir, shell = job.shell, \
+                                           stdout = pipe, stderr = pipe)
+            if job.timeout:
+                def timeIsUp():
+                    job.timedOut = True
+                    self.killProcess(job)
+                timer = threading.Timer(job.timeout, timeIsUp)
+                timer.start()
+            stdout, stderr = job.process.communicate()
+            job.stdout = stdout or ""
+            job.stderr = stderr or ""
+            job.returnCode = job.process.returncode
+        except Exception, e:
+            job.returnCode = -1
+            job.stderr = str(e)
+        finally:
+            if timer != None: timer.cancel()
+        
+        self.jobFinished(job)
+    
+    def jobFinished(self, job):
+        with self.__condition:
+            job.endTime = time.time()
+            job.process = None
+            self.__finishedJobs.append(job)
+            self.__condition.notify_all()
+    
+    def run(self):
+        """Run all the jobs and return True if all of them succeeded."""
+        running = 0
+        with self.__condition:
+            while True:
+                # process the jobs that are finished since the last event
+                while self.__finishedJobs:
+                    job = self.__finishedJobs.pop(0)
+                    running -= 1
+                    if self.isCancelled:
+                        job.state = "cancelled"
+                    elif job.returnCode == 0 and not job.timedOut:
+                        job.state = "succeeded"
+                    elif job.attempts <= job.retries:
+                        # re-submit the job
+                        job.state = "pending"
+                        continue
+                    else:
+                        job.state = "failed"
+                    self.notifyJobComplete(job)
+                
+                if not self.isCancelled:
+                    for job in self.getReadyJobs():
+                        if running >= self.maxWorkers: break
+                        running += 1
+                        self.startJob(job)
+                
+                if running == 0 and not self.__finishedJobs:
+                    break
+                
+                # wait for the next job to finish
+                if not self.__finishedJobs:
+                    self.__condition.wait()
+        
+        # anything that is left is either cancelled or blocked by a failed job
+        for job in self.jobs.values():
+            if job.state == "pending":
+                job.state = "cancelled" if self.isCancelled else "skipped"
+        
+        return all(job.state == "succeeded" for job in self.jobs.values())
+    
+    def getFailedJobs(self):
+        return [job for job in self.jobs.values() if job.state != "succeeded"]
+    
+    @classmethod
+    def runBatchFile(cls, batchFileAddress, runInBackground = False):
+        """Run a single batch file and wait for it to end. Returns the job.
+        
+        The batch file opens its own cmd window unless runInBackground is True.
+        """
+        scheduler = cls(maxWorkers = 1)
+        job = scheduler.addJob(os.path.basename(batchFileAddress), batchFileAddress.replace("\\", "/"), \
+                               shell = runInBackground, captureOutput = runInBackground)
+        scheduler.run()
+        return job
+    
+    def report(self):
+        lines = []
+        for job in self.jobs.values():
+            line = "%s: %s"%(job.name, job.state)
+            if job.returnCode not in (None, 0): line += " (exit code %s)"%job.returnCode
+            if job.timedOut: line += " (timed out)"
+            if job.attempts > 1: line += " after %d tries"%job.attempts
+            if job.runTime != None: line += " in %.2f s"%job.runTime
+            if self.dryRun: line += "\n    " + job.command
+            lines.append(line)
+        return "\n".join(lines)
+
+class hb_EPBatchRunner(object):
+    """
+    Run a batch of idf files through EnergyPlus on a bounded pool of local processes.
+    
+    Each run is copied to its own sub-folder of the working directory so the files that
+    EnergyPlus writes to the current folder (eplusout.*, Energy+.ini, ...) never clash between
+    parallel runs. Variants of a parametric study can be written from an idf template in which
+    @@key@@ placeholders are replaced by the values of each parameter set.
+    
+    When the batch is finished an index of all the runs is written to batchIndex.csv in the
+    working directory with the state, exit code, run time, number of errors, result file and
+    parameters of each run.
+    
+    Usage:
+        runner = hb_EPBatchRunner("c:/ladybug/sweep", "c:/ladybug/weather.epw", maxWorkers = 4)
+        runner.addTemplateRuns("c:/ladybug/base.idf", [{"WWR": 0.3}, {"WWR": 0.5}])
+        runner.addIDF("c:/ladybug/other.idf")
+        success = runner.run()
+        print runner.report()
+    
+    Args:
+        workingDir: Folder of the batch. Each run is written to workingDir/runName.
+        epwFileAddress: Address to epw weather file.
+        EPDirectory: EnergyPlus folder. Default is the folder that Honeybee has found.
+        maxWorkers: Maximum number of EnergyPlus processes at the same time. Default is
+            the number of CPUs.
+        executable: Optional executable to be used instead of Epl-run (e.g. a fake energyplus
+            for testing). It will be called from the run folder with the address of the idf
+            and the epw file and should write runName.err and runName.csv next to the idf.
+            resources/fake_energyplus.bat stands in for EnergyPlus in tests.
+        timeout: Optional time limit for each run in seconds.
+        runInBackground: Set to False to open a cmd window for each run. Default is True.
+    """
+    placeholder = re.compile(r"@@([^@\s]+)@@")
+    indexFileName = "batchIndex.csv"
+    
+    def __init__(self, workingDir, epwFileAddress, EPDirectory = None, maxWorkers = None, \
+                 executable = None, timeout = None, runInBackground = True):
+        self.workingDir = os.path.normpath(workingDir)
+        self.epwFileAddress = os.path.normpath(epwFileAddress)
+        if EPDirectory == None and executable == None:
+            EPDirectory = sc.sticky["honeybee_folders"]["EPPath"]
+            if EPDirectory == None:
+                raise ValueError("Honeybee cannot find EnergyPlus on your system.")
+        self.EPDirectory = EPDirectory
+        self.maxWorkers = maxWorkers
+        self.executable = executable
+        self.timeout = timeout
+        self.runInBackground = runInBackground
+        self.runs = OrderedDict()
+        self.scheduler = None
+        self.results = []
+    
+    def uniqueName(self, name):
+        name = re.sub(r"[^\w\-.]", "_", name)
+        if name not in self.runs: return name
+        count = 1
+        while "%s_%d"%(name, count) in self.runs: count += 1
+        return "%s_%d"%(name, count)
+    
+    def addRun(self, name, idfStr, parameters = {}):
+        """Write idf string to its own folder and return the name of the run."""
+        name = self.uniqueName(name)
+        runFolder = os.path.join(self.workingDir, name)
+        if not os.path.isdir(runFolder): os.makedirs(runFolder)
+        idfFilePath = os.path.join(runFolder, name + ".idf")
+        with open(idfFilePath, "w") as outf:
+            outf.write(idfStr)
+        
+        # remove the results of the previous batch
+        for extension in (".csv", ".err"):
+            if os.path.isfile(idfFilePath[:-4] + extension):
+                os.remove(idfFilePath[:-4] + extension)
+        
+        self.runs[name] = {"folder": runFolder, "idf": idfFilePath, "parameters": OrderedDict(parameters)}
+        return name
+    
+    def addIDF(self, idfFilePath, name = None):
+        if not name: name = os.path.splitext(os.path.basename(idfFilePath))[0]
+        with open(idfFilePath, "r") as inf:
+            idfStr = inf.read()
+        return self.addRun(name, idfStr)
+    
+    def addTemplateRuns(self, templateFilePath, parameterSets, names = None):
+        """Write a run for each parameter set by replacing @@key@@ placeholders in the template.
+        
+        Returns the names of the runs.
+        """
+        with open(templateFilePath, "r") as inf:
+            template = inf.read()
+        keys = set(self.placeholder.findall(template))
+        baseName = os.path.splitext(os.path.basename(templateFilePath))[0]
+        
+        runNames = []
+        for count, parameters in enumerate(parameterSets):
+            missingKeys = keys.difference(parameters)
+            if missingKeys:
+                raise ValueError("Parameter set %d has no value for %s."%(count, ", ".join(sorted(missingKeys))))
+            idfStr = self.placeholder.sub(lambda match: str(parameters[match.group(1)]), template)
+            name = names[count] if names else "%s_%03d"%(baseName, count)
+            runNames.append(self.addRun(name, idfStr, parameters))
+        return runNames
+    
+    def command(self, run):
+        fullPath = run["idf"][:-4]
+        if self.executable:
+            return [self.executable, run["idf"], self.epwFileAddress], False
+        
+        # same arguments as RunIDF.writeBatchFile. The run folder is the current directory of the job
+        batchStr = '"' + self.EPDirectory + '\\Epl-run" ' + fullPath + ' ' + fullPath + \
+                   ' idf ' + self.epwFileAddress + ' EP N nolimit N N 0 Y'
+        batchFileAddress = fullPath + ".bat"
+        with open(batchFileAddress, "w") as batchfile:
+            batchfile.write(batchStr)
+        return batchFileAddress.replace("\\", "/"), True
+    
+    def printProgress(self, result):
+        finished = sum(1 for job in self.scheduler.jobs.values() if job.state not in ("pending", "running"))
+        line = "[%d/%d] %s: %s"%(finished, len(self.scheduler.jobs), result["name"], result["state"])
+        if result["runTime"] != None: line += " in %.2f s"%result["runTime"]
+        print line
+    
+    def run(self, onRunComplete = None):
+        """Run all the idf files and return True if all of them ran without fatal errors.
+        
+        onRunComplete is called with the result of each run as soon as it ends. Progress is
+        printed if it is not provided.
+        """
+        if onRunComplete == None: onRunComplete = self.printProgress
+        self.scheduler = hb_JobScheduler(maxWorkers = self.maxWorkers, \
+                                         onJobComplete = lambda job: onRunComplete(self.getRunResult(job.name)))
+        for name, run in self.runs.items():
+            command, shell = self.command(run)
+            # same as hb_JobScheduler.runBatchFile each run opens its own cmd window unless
+            # it runs in the background
+            self.scheduler.addJob(name, command, workingDir = run["folder"], \
+                                  shell = shell and self.runInBackground, \
+                                  captureOutput = self.runInBackground, timeout = self.timeout)
+        
+        try:
+            self.scheduler.run()
+        except KeyboardInterrupt:
+            self.scheduler.cancel()
+            raise
+        finally:
+            self.collectResults()
+            self.writeIndex()
+        
+        return all(result["state"] == "succeeded" for result in self.results)
+    
+    @staticmethod
+    def readErrors(errFilePath):
+        """Return fatal and severe error lines of an EnergyPlus .err file."""
+        fatalErrors, severeErrors = [], []
+        if not os.path.isfile(errFilePath): return fatalErrors, severeErrors
+        with open(errFilePath, "r") as errFile:
+            for line in errFile:
+                if "**  Fatal  **" in line:
+                    fatalErrors.append(line.strip())
+                elif "** Severe  **" in line and 'CheckControllerListOrder' not in line:
+                    severeErrors.append(line.strip())
+        return fatalErrors, severeErrors
+    
+    def getRunResult(self, name):
+        run = self.runs[name]
+        job = self.scheduler.jobs[name]
+        fullPath = run["idf"][:-4]
+        fatalErrors, severeErrors = self.readErrors(fullPath + ".err")
+        resultFile = fullPath + ".csv"
+        if not os.path.isfile(resultFile): resultFile = None
+        
+        state = job.state
+        # Epl-run exits normally even if EnergyPlus fails
+        if state == "succeeded" and (fatalErrors or resultFile == None): state = "failed"
+        
+        result = OrderedDict()
+        result["name"] = name
+        result["state"] = state
+        result["exitCode"] = job.returnCode
+        result["runTime"] = round(job.runTime, 2) if job.runTime != None else None
+        result["fatalErrors"] = len(fatalErrors)
+        result["severeErrors"] = len(severeErrors)
+        result["resultFile"] = resultFile
+        result["errFile"] = fullPath + ".err"
+        result["idf"] = run["idf"]
+        result["parameters"] = run["parameters"]
+        if fatalErrors: result["message"] = fatalErrors[0]
+        elif state != "succeeded": result["message"] = job.stderr.strip()
+        else: result["message"] = ""
+        return result
+    
+    def collectResults(self):
+        self.results = [self.getRunResult(name) for name in self.runs]
+        return self.results
+    
+    def writeIndex(self):
+        """Write the index of the batch to workingDir/batchIndex.csv and return its address."""
+        def csvValue(value):
+            value = "" if value == None else str(value)
+            if any(c in value for c in ',"\n'):
+                value = '"%s"'%value.replace('"', '""').replace("\n", " ")
+            return value
+        
+        parameterKeys = []
+        for run in self.runs.values():
+            for key in run["parameters"]:
+                if key not in parameterKeys: parameterKeys.append(key)
+        
+        columns = ["name", "state", "exitCode", "runTime", "fatalErrors", "severeErrors", \
+                   "resultFile", "errFile", "idf", "message"]
+        indexFilePath = os.path.join(self.workingDir, self.indexFileName)
+        with open(indexFilePath, "w") as outf:
+            outf.write(",".join(columns + parameterKeys) + "\n")
+            for result in self.results:
+                values = [result[column] for column in columns] + \
+                         [result["parameters"].get(key) for key in parameterKeys]
+                outf.write(",".join(csvValue(value) for value in values) + "\n")
+        return indexFilePath
+    
+    def getResultFiles(self):
+        return [result["resultFile"] for result in self.results]
+    
+    def report(self):
+        lines = []
+        for result in self.results:
+            line = "%s: %s"%(result["name"], result["state"])
+            if result["exitCode"] not in (None, 0): line += " (exit code %s)"%result["exitCode"]
+            if result["runTime"] != None: line += " in %.2f s"%result["runTime"]
+            if result["message"]: line += "\n    " + result["message"]
+            lines.append(line)
+        succeeded = sum(1 for result in self.results if result["state"] == "succeeded")
+        lines.append("%d of %d runs succeeded."%(succeeded, len(self.results)))
+        return "\n".join(lines)
+
+class hb_RTracePartition(object):
+    """
+    Split test points of a grid-based study into small chunks for rtrace.
+    
+    Points in the core of a building or in heavily occluded zones trace much faster than
+    perimeter points so instead of one contiguous piece for each CPU the points are split
+    into several chunks that are handed to the next idle CPU by hb_JobScheduler. Chunks can
+    be weighted by the cost of each grid that is measured in the previous runs.
+    
+    Chunks never cross the boundary of the points of a CPU so the results of the chunks are
+    merged back into the same radFileName_#.res files in the order of the .ptn pattern file.
+    
+    Args:
+        subWorkingDir: Study folder.
+        radFileName: Name of the study.
+        pattern: Number of test points in each grid (same as .ptn file).
+        numOfCPUs: Number of CPUs.
+        chunksPerCPU: Target number of chunks for each CPU. Every rtrace process calculates
+            its own ambient values so more chunks means more repeated work.
+        minChunkSize: Minimum number of points in a chunk.
+    """
+    RTraceChunk = namedtuple("RTraceChunk", "index cpu start end cost")
+    
+    def __init__(self, subWorkingDir, radFileName, pattern, numOfCPUs, chunksPerCPU = 4, minChunkSize = 200):
+        self.subWorkingDir = subWorkingDir
+        self.radFileName = radFileName
+        self.pattern = list(pattern)
+        self.numOfPoints = sum(self.pattern)
+        
+        self.numOfCPUs = max(1, min(int(numOfCPUs), self.numOfPoints))
+        if self.numOfCPUs == 1: chunksPerCPU = 1
+        self.chunksPerCPU = chunksPerCPU
+        self.minChunkSize = minChunkSize
+        
+        self.chunkFolder = os.path.join(subWorkingDir, "chunks")
+        # keep the history out of the study folder so it survives overwriting the results
+        self.costFile = os.path.join(os.path.dirname(subWorkingDir.rstrip("\\/")), radFileName + ".hbcost")
+        
+        # equal number of points for each CPU
+        ptsEachCpu, remainder = divmod(self.numOfPoints, self.numOfCPUs)
+        self.lenOfPts = [ptsEachCpu + 1 if cpuCount < remainder else ptsEachCpu \
+                         for cpuCount in range(self.numOfCPUs)]
+        
+        self.gridCosts = self.loadCosts()
+        self.chunks = self.partition()
+    
+    def loadCosts(self):
+        """Return cost of a point for each grid if it is measured in a previous run."""
+        try:
+            with open(self.costFile, "r") as inf:
+                history = json.load(inf)
+            if history["pattern"] != self.pattern: return None
+            costs = [float(c) for c in history["costs"]]
+        except:
+            return None
+        
+        measured = [c for c in costs if c > 0]
+        if not measured: return None
+        average = sum(measured) / len(measured)
+        return [c if c > 0 else average for c in costs]
+    
+    def pointWeights(self):
+        if not self.gridCosts:
+            return [1.0] * self.numOfPoints
+        weights = []
+        for gridLength, cost in zip(self.pattern, self.gridCosts):
+            weights.extend([cost] * gridLength)
+        return weights
+    
+    def partition(self):
+        weights = self.pointWeights()
+        targetCost = sum(weights) / (self.numOfCPUs * self.chunksPerCPU)
+        
+        chunks = []
+        cpuStart = 0
+        for cpuCount, cpuLength in enumerate(self.lenOfPts):
+            cpuEnd = cpuStart + cpuLength
+            start = cpuStart
+            cost = 0
+            for ptCount in xrange(cpuStart, cpuEnd):
+                cost += weights[ptCount]
+                size = ptCount + 1 - start
+                # don't leave a tiny chunk at the end
+                if cost >= targetCost and size >= self.minChunkSize and \
+                    cpuEnd - ptCount - 1 >= self.minChunkSize:
+                    chunks.append(self.RTraceChunk(len(chunks), cpuCount, start, ptCount + 1, cost))
+                    start = ptCount + 1
+                    cost = 0
+            if start < cpuEnd:
+                chunks.append(self.RTraceChunk(len(chunks), cpuCount, start, cpuEnd, cost))
+            cpuStart = cpuEnd
+        
+        return chunks
+    
+    def chunksByCost(self):
+        """Expensive chunks first so the cheap ones fill the gaps at the end."""
+        return sorted(self.chunks, key = lambda chunk: -chunk.cost)
+    
+    def chunkProjectName(self):
+        # relative to subWorkingDir. rtraceLine adds _#.pts and _#.res
+        return "chunks\\" + self.radFileName + "_chunk"
+    
+    def chunkFileName(self, chunk, extension):
+        return os.path.join(self.chunkFolder, "%s_chunk_%d.%s"%(self.radFileName, chunk.index, extension))
+    
+    def cpuFileName(self, cpuCount, extension):
+        return os.path.join(self.subWorkingDir, "%s_%d.%s"%(self.radFileName, cpuCount, extension))
+    
+    def writePtsFiles(self, testPoints, ptsNormals):
+        """Write one .pts file for each CPU and one for each chunk."""
+        ptsLines = ["%.4f\t%.4f\t%.4f\t%.4f\t%.4f\t%.4f\n"%(pt.X, pt.Y, pt.Z, v.X, v.Y, v.Z) \
+                    for pt, v in zip(testPoints, ptsNormals)]
+        
+        if not os.path.isdir(self.chunkFolder): os.mkdir(self.chunkFolder)
+        
+        cpuStart = 0
+        for cpuCount, cpuLength in enumerate(self.lenOfPts):
+            with open(self.cpuFileName(cpuCount, "pts"), "w") as ptsFile:
+                ptsFile.write("".join(ptsLines[cpuStart:cpuStart + cpuLength]))
+            cpuStart += cpuLength
+        
+        for chunk in self.chunks:
+            with open(self.chunkFileName(chunk, "pts"), "w") as ptsFile:
+                ptsFile.write("".join(ptsLines[chunk.start:chunk.end]))
+    
+    def mergeResults(self):
+        """Put the results of the chunks together in radFileName_#.res files.
+        
+        Returns False if the results of any of the chunks are missing.
+        """
+        success = True
+        for cpuCount in range(self.numOfCPUs):
+            with open(self.cpuFileName(cpuCount, "res"), "w") as resFile:
+                for chunk in self.chunks:
+                    if chunk.cpu != cpuCount: continue
+                    chunkResFile = self.chunkFileName(chunk, "res")
+                    if not os.path.isfile(chunkResFile):
+                        print "Can't find the results for %s"%chunkResFile
+                        success = False
+                        continue
+                    with open(chunkResFile, "r") as inf:
+                        shutil.copyfileobj(inf, resFile)
+        return success
+    
+    def updateCosts(self, chunkRunTimes):
+        """Save run time of each point for each grid to be used in the next runs.
+        
+        Args:
+            chunkRunTimes: A dictionary of chunk index and run time in seconds.
+        """
+        gridStarts = [0]
+        for gridLength in self.pattern: gridStarts.append(gridStarts[-1] + gridLength)
+        
+        gridTimes = [0.0] * len(self.pattern)
+        gridPoints = [0] * len(self.pattern)
+        for chunk in self.chunks:
+            runTime = chunkRunTimes.get(chunk.index)
+            if runTime == None: continue
+            timePerPoint = runTime / (chunk.end - chunk.start)
+            for gridCount in range(len(self.pattern)):
+                overlap = min(chunk.end, gridStarts[gridCount + 1]) - max(chunk.start, gridStarts[gridCount])
+                if overlap > 0:
+                    gridTimes[gridCount] += timePerPoint * overlap
+                    gridPoints[gridCount] += overlap
+        
+        costs = [t / p if p else 0 for t, p in zip(gridTimes, gridPoints)]
+        try:
+            with open(self.costFile, "w") as outf:
+                json.dump({"pattern": self.pattern, "costs": costs}, outf)
+        except Exception, e:
+            print "Failed to save the cost of test points: %s"%str(e)
+        
+        return costs
+
+class hb_SimulationCache(object):
+    """
+    Local cache of simulation results keyed by the content of the input files.
+    
+    The key is a hash of the input files that are written for the simulation (e.g. .rad,
+    material, sky, .pts and batch files for Radiance or the .idf and .epw files for EnergyPlus)
+    and the simulation parameters. The path to the study folder is removed from the content
+    before hashing so the same case in two different folders has the same key. On a hit the
+    stored result files are copied to the study folder instead of running the simulation.
+    
+    Result files in the sub-folders of the study folder are stored with their relative path.
+    Octrees are not stored. They are large and are rebuilt from the inputs in a few seconds.
+    
+    The cache is limited by size and the least recently used entries are removed first.
+    Set sc.sticky["honeybee_useSimulationCache"] to False to disable the cache.
+    
+    Usage:
+        cache = hb_SimulationCache()
+        key = cache.getKey(inputFiles, parameters, baseFolder = studyFolder)
+        if not cache.restore(key, studyFolder):
+            snapshot = cache.snapshot(studyFolder)
+            # run the simulation
+            cache.store(key, studyFolder, snapshot)
+        print cache.report()
+    """
+    
+    cacheVersion = 2
+    excludedExtensions = (".oct",)
+    
+    def __init__(self, cacheFolder = None, maxSize = 2 * 1024 ** 3, enabled = None):
+        if enabled == None:
+            enabled = sc.sticky.get("honeybee_useSimulationCache", True)
+        self.enabled = enabled
+        
+        if cacheFolder == None:
+            cacheFolder = os.path.join(sc.sticky["Honeybee_DefaultFolder"], "simulationCache")
+        self.cacheFolder = cacheFolder
+        self.maxSize = maxSize
+        self.indexFile = os.path.join(cacheFolder, "index.json")
+        
+        if self.enabled and not os.path.isdir(cacheFolder):
+            try:
+                os.makedirs(cacheFolder)
+            except Exception, e:
+                print "Failed to create the simulation cache folder: %s"%str(e)
+                self.enabled = False
+        
+        self.index = self.loadIndex()
+    
+    def loadIndex(self):
+        try:
+            with open(self.indexFile, "r") as inf:
+                index = json.load(inf)
+            if index["version"] == self.cacheVersion: return index
+        except:
+            pass
+        return {"version": self.cacheVersion, "entries": {}, "hits": 0, "misses": 0}
+    
+    def saveIndex(self):
+        tempFile = self.indexFile + ".tmp"
+        try:
+            with open(tempFile, "w") as outf:
+                json.dump(self.index, outf)
+            if os.path.isfile(self.indexFile): os.remove(self.indexFile)
+            os.rename(tempFile, self.indexFile)
+        except Exception, e:
+            print "Failed to save the simulation cache index: %s"%str(e)
+    
+    def getKey(self, inputFiles, parameters = None, baseFolder = None):
+        """Return a hash for the content of input files and parameters.
+        
+        Args:
+            inputFiles: List of input files. Missing files and None values are ignored.
+            parameters: A dictionary, list or value. It will be hashed by its repr with sorted keys.
+            baseFolder: Study folder. It will be removed from the content of the files.
+        """
+        hasher = hashlib.sha1()
+        hasher.update("honeybee cache %d\n"%self.cacheVersion)
+        
+        folderStrings = []
+        if baseFolder:
+            baseFolder = os.path.normpath(baseFolder)
+            folderStrings = sorted(set([baseFolder, baseFolder.replace("\\", "/"), \
+                                        baseFolder.replace("/", "\\")]), key = len, reverse = True)
+        
+        inputFiles = [os.path.normpath(f) for f in inputFiles if f and os.path.isfile(f)]
+        # sort by the relative name so the key doesn't change with the order of the files
+        names = [self.relativeName(f, baseFolder) for f in inputFiles]
+        for name, inputFile in sorted(zip(names, inputFiles)):
+            hasher.update("file:%s\n"%name)
+            with open(inputFile, "rb") as inf:
+                while True:
+                    block = inf.read(1024 ** 2)
+                    if not block: break
+                    for folderString in folderStrings:
+                        block = block.replace(folderString, "<studyFolder>")
+                    hasher.update(block)
+        
+        hasher.update("parameters:%s"%self.parametersStr(parameters))
+        return hasher.hexdigest()
+    
+    @staticmethod
+    def relativeName(fileName, baseFolder):
+        if baseFolder and os.path.normpath(fileName).lower().startswith(os.path.normpath(baseFolder).lower()):
+            return os.path.relpath(fileName, baseFolder).replace("\\", "/").lower()
+        return os.path.basename(fileName).lower()
+    
+    def parametersStr(self, parameters):
+        if isinstance(parameters, dict):
+            return "{" + ", ".join("%r: %s"%(key, self.parametersStr(parameters[key])) \
+                                   for key in sorted(parameters.keys())) + "}"
+        elif isinstance(parameters, (list, tuple)):
+            return "[" + ", ".join(self.parametersStr(p) for p in parameters) + "]"
+        return repr(parameters)
+    
+    @staticmethod
+    def snapshot(folder):
+        """Size and modification time of the files in a folder and its sub-folders before
+        running the simulation. Files are keyed by their path relative to the folder.
+        """
+        files = {}
+        for root, dirs, fileNames in os.walk(folder):
+            for fileName in fileNames:
+                fullPath = os.path.join(root, fileName)
+                files[os.path.relpath(fullPath, folder)] = [os.path.getsize(fullPath), os.path.getmtime(fullPath)]
+        return files
+    
+    @staticmethod
+    def copyFile(sourceFile, targetFile):
+        targetFolder = os.path.dirname(targetFile)
+        if not os.path.isdir(targetFolder): os.makedirs(targetFolder)
+        shutil.copyfile(sourceFile, targetFile)
+    
+    def entryFolder(self, key):
+        return os.path.join(self.cacheFolder, key)
+    
+    def restore(self, key, targetFolder):
+        """Copy the cached results to targetFolder. Returns the list of restored files or None."""
+        if not self.enabled: return None
+        
+        entry = self.index["entries"].get(key)
+        entryFolder = self.entryFolder(key)
+        if entry == None or not os.path.isdir(entryFolder):
+            self.index["misses"] += 1
+            if entry != None: del self.index["entries"][key]
+            self.saveIndex()
+            return None
+        
+        restoredFiles = []
+        try:
+            for fileName in entry["files"]:
+                targetFile = os.path.join(targetFolder, fileName)
+                self.copyFile(os.path.join(entryFolder, fileName), targetFile)
+                restoredFiles.append(targetFile)
+        except Exception, e:
+            print "Failed to restore the results from the cache: %s"%str(e)
+            self.removeEntry(key)
+            self.index["misses"] += 1
+            self.saveIndex()
+            return None
+        
+        entry["lastAccess"] = time.time()
+        entry["hits"] = entry.get("hits", 0) + 1
+        self.index["hits"] += 1
+        self.saveIndex()
+        
+        return restoredFiles
+    
+    def store(self, key, resultFolder, snapshot = None, resultFiles = None):
+        """Copy the results to the cache.
+        
+        Args:
+            key: Key from getKey.
+            resultFolder: Study folder.
+            snapshot: Output of snapshot before the simulation. Files that are created or modified
+                since the snapshot will be stored. Octrees are not stored.
+            resultFiles: Optional list of result files to be stored instead of the snapshot.
+        """
+        if not self.enabled: return False
+        
+        if resultFiles == None:
+            snapshot = snapshot or {}
+            resultFiles = []
+            for fileName, fileInfo in self.snapshot(resultFolder).items():
+                if fileName.lower().endswith(self.excludedExtensions): continue
+                if snapshot.get(fileName) != fileInfo:
+                    resultFiles.append(os.path.join(resultFolder, fileName))
+        
+        if not resultFiles: return False
+        
+        entryFolder = self.entryFolder(key)
+        if os.path.isdir(entryFolder): self.removeEntry(key)
+        
+        try:
+            os.mkdir(entryFolder)
+            fileNames = []
+            size = 0
+            for resultFile in resultFiles:
+                # files in the sub-folders keep their relative path
+                fileName = os.path.relpath(resultFile, resultFolder)
+                if fileName.startswith(os.pardir): fileName = os.path.basename(resultFile)
+                self.copyFile(resultFile, os.path.join(entryFolder, fileName))
+                fileNames.append(fileName)
+                size += os.path.getsize(resultFile)
+        except Exception, e:
+            print "Failed to store the results in the cache: %s"%str(e)
+            self.removeEntry(key)
+            self.saveIndex()
+            return False
+        
+        self.index["entries"][key] = {"files": fileNames, "size": size, \
+                                      "created": time.time(), "lastAccess": time.time(), "hits": 0}
+        self.evict()
+        self.saveIndex()
+        return True
+    
+    def removeEntry(self, key):
+        if key in self.index["entries"]: del self.index["entries"][key]
+        shutil.rmtree(self.entryFolder(key), ignore_errors = True)
+    
+    def evict(self):
+        """Remove the least recently used entries until the cache fits in maxSize."""
+        entries = self.index["entries"]
+        totalSize = sum(entry["size"] for entry in entries.values())
+        for key in sorted(entries.keys(), key = lambda k: entries[k]["lastAccess"]):
+            if totalSize <= self.maxSize: break
+            totalSize -= entries[key]["size"]
+            self.removeEntry(key)
+    
+    def clear(self):
+        for key in self.index["entries"].keys():
+            self.removeEntry(key)
+        self.index = {"version": self.cacheVersion, "entries": {}, "hits": 0, "misses": 0}
+        self.saveIndex()
+    
+    def statistics(self):
+        hits, misses = self.index["hits"], self.index["misses"]
+        return {"hits": hits, "misses": misses, \
+                "hitRate": float(hits) / (hits + misses) if hits + misses else 0, \
+                "entries": len(self.index["entries"]), \
+                "size": sum(entry["size"] for entry in self.index["entries"].values())}
+    
+    def report(self):
+        stats = self.statistics()
+        return "Simulation cache: %d hits, %d misses (%.0f%%), %d entries, %.1f MB"%( \
+                stats["hits"], stats["misses"], stats["hitRate"] * 100, \
+                stats["entries"], stats["size"] / 1024.0 ** 2)
+
+class hb_RadianceSceneCache(hb_SimulationCache):
+    """
+    Cache of the static scene octrees and the ambient files of Radiance studies.
+    
+    The octree of the scene without the sky is keyed by the content of the material, geometry
+    and additional rad files so unchanged geometry is only oconv'ed once. The octree is not
+    frozen so each study adds its sky to it with oconv -i. Files in the study folder are
+    referenced by relative names so the octree can be used in other study folders.
+    
+    Ambient files of image-based studies are view independent. They are keyed by the static
+    scene, the sky and the ambient and direct parameters so a study with the same scene, sky
+    and parameters (e.g. a different view) skips the overture pass. The sky is part of the key
+    since the ambient values include the light from the sky. An ambient file that rpict has
+    added values to is stored again after the run.
+    
+    The time that was spent to build an entry is saved with it and reported as the saving
+    when the entry is reused. Set sc.sticky["honeybee_useSimulationCache"] to False to
+    disable the cache.
+    
+    Usage:
+        sceneCache = hb_RadianceSceneCache()
+        key = sceneCache.getKey(staticRadFiles, {"oconv": "-r 2048"}, studyFolder)
+        if not sceneCache.restoreFile(key, staticOctFile):
+            # run oconv
+            sceneCache.storeFile(key, staticOctFile, buildTime)
+        print sceneCache.report()
+    """
+    
+    cacheVersion = 1
+    # the direct settings are included since the ambient values include the direct light
+    # of the surfaces that the ambient rays hit
+    ambientParameters = ("_ab_", "_ad_", "_as_", "_ar_", "_aa_", "_lr_", "_lw_", \
+                         "_dj_", "_ds_", "_dt_", "_dc_", "_dr_", "_dp_", "_st_")
+    
+    def __init__(self, cacheFolder = None, maxSize = 2 * 1024 ** 3, enabled = None):
+        if cacheFolder == None:
+            cacheFolder = os.path.join(sc.sticky["Honeybee_DefaultFolder"], "radianceSceneCache")
+        hb_SimulationCache.__init__(self, cacheFolder, maxSize, enabled)
+        self.index.setdefault("savedTime", 0)
+    
+    @classmethod
+    def getAmbientParameters(cls, radParameters):
+        parameters = dict((key, radParameters.get(key)) for key in cls.ambientParameters)
+        parameters["additional"] = radParameters.get("additional")
+        return parameters
+    
+    @staticmethod
+    def relativePath(fileName, baseFolder):
+        """Path of the file relative to baseFolder if it is inside the folder."""
+        fileName = os.path.normpath(fileName)
+        baseFolder = os.path.normpath(baseFolder)
+        if fileName.lower().startswith(baseFolder.lower() + os.sep):
+            return os.path.relpath(fileName, baseFolder)
+        return fileName
+    
+    def restoreFile(self, key, targetFile):
+        """Copy the cached file to targetFile. Returns True if the file is restored."""
+        if not self.enabled: return False
+        
+        entry = self.index["entries"].get(key)
+        entryFolder = self.entryFolder(key)
+        if entry == None or not os.path.isdir(entryFolder):
+            self.index["misses"] += 1
+            if entry != None: del self.index["entries"][key]
+            self.saveIndex()
+            return False
+        
+        try:
+            shutil.copyfile(os.path.join(entryFolder, entry["files"][0]), targetFile)
+        except Exception, e:
+            print "Failed to restore %s from the Radiance scene cache: %s"%(os.path.basename(targetFile), str(e))
+            self.removeEntry(key)
+            self.index["misses"] += 1
+            self.saveIndex()
+            return False
+        
+        entry["lastAccess"] = time.time()
+        entry["hits"] = entry.get("hits", 0) + 1
+        self.index["hits"] += 1
+        self.index["savedTime"] += entry.get("buildTime", 0)
+        self.saveIndex()
+        return True
+    
+    def getFileSize(self, key):
+        """Size of the cached file in bytes or None if the key is not in the cache."""
+        entry = self.index["entries"].get(key)
+        if entry == None: return None
+        return entry["size"]
+    
+    def storeFile(self, key, filePath, buildTime = None):
+        """Store a file in the cache. The build time of the current entry is kept if buildTime is None."""
+        if not self.enabled: return False
+        
+        currentEntry = self.index["entries"].get(key)
+        if buildTime == None:
+            buildTime = currentEntry.get("buildTime", 0) if currentEntry != None else 0
+        hits = currentEntry.get("hits", 0) if currentEntry != None else 0
+        
+        if not self.store(key, os.path.dirname(filePath), resultFiles = [filePath]): return False
+        
+        self.index["entries"][key]["buildTime"] = buildTime
+        self.index["entries"][key]["hits"] = hits
+        self.saveIndex()
+        return True
+    
+    def statistics(self):
+        stats = hb_SimulationCache.statistics(self)
+        stats["savedTime"] = self.index.get("savedTime", 0)
+        return stats
+    
+    def report(self):
+        stats = self.statistics()
+        return "Radiance scene cache: %d hits, %d misses (%.0f%%), %d entries, %.1f MB, %.1f seconds saved"%( \
+                stats["hits"], stats["misses"], stats["hitRate"] * 100, \
+                stats["entries"], stats["size"] / 1024.0 ** 2, stats["savedTime"])
+
+class hb_EPWSummary(object):
+    """
+    Design days, monthly statistics and ground temperatures of an epw weather file.
+    
+    The epw is parsed once into typed columns and the summary is saved next to it as
+    weatherFileName.hbepw with the md5 of the epw file. The next runs with the same
+    weather file (in this session or the next ones) read the summary instead of parsing
+    the epw and calculating the wet bulb temperature of every hour. If the folder of the
+    epw is read-only the summary is only kept in memory.
+    
+    Usage:
+        summary = hb_EPWSummary.fromEPW(epwFileAddress, lb_comfortModels)
+        ddyFile = summary.writeDDY(workingDir, epwFileAddress)
+        print summary.monthlyStatistics["dbTemp"]["average"]
+        print summary.getGroundTemperatures(0.5)
+    """
+    summaryVersion = 1
+    daysInMonth = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+    # name and index of the epw columns that are used in the summary
+    epwColumns = (("dbTemp", 6), ("dewPoint", 7), ("rH", 8), ("barPress", 9), \
+                  ("windDir", 20), ("windSpeed", 21))
+    # summaries of this session by the hash of the epw file
+    summaries = {}
+    
+    def __init__(self, epwHash, designDays, monthlyStatistics, groundTemperatures):
+        self.epwHash = epwHash
+        self.designDays = designDays
+        self.monthlyStatistics = monthlyStatistics
+        self.groundTemperatures = groundTemperatures
+        self.columns = None
+    
+    @staticmethod
+    def summaryFile(epwFileAddress):
+        return os.path.splitext(epwFileAddress)[0] + ".hbepw"
+    
+    @classmethod
+    def fromEPW(cls, epwFileAddress, lb_comfortModels = None):
+        """Return the summary of the epw file. lb_comfortModels is only used if the epw has changed."""
+        with open(epwFileAddress, "rb") as epwFile:
+            epwContent = epwFile.read()
+        epwHash = hashlib.md5(epwContent).hexdigest()
+        
+        if epwHash in cls.summaries:
+            return cls.summaries[epwHash]
+        
+        summaryFile = cls.summaryFile(epwFileAddress)
+        summary = cls.load(summaryFile, epwHash)
+        if summary == None:
+            if lb_comfortModels == None:
+                lb_comfortModels = sc.sticky["ladybug_ComfortModels"]()
+            summary = cls.fromColumns(epwHash, cls.parseEPW(epwContent), lb_comfortModels)
+            summary.save(summaryFile)
+        
+        cls.summaries[epwHash] = summary
+        return summary
+    
+    @classmethod
+    def parseEPW(cls, epwContent):
+        """Return the columns of the epw that are needed for the summary as arrays of floats.
+        
+        The header lines are kept under "header" so the ground temperatures can be read.
+        """
+        lines = epwContent.splitlines()
+        columns = OrderedDict((name, array.array("d")) for name, index in cls.epwColumns)
+        columnIndexes = [(columns[name], index) for name, index in cls.epwColumns]
+        for line in lines[8:]:
+            if not line.strip(): continue
+            values = line.split(",")
+            for column, index in columnIndexes:
+                column.append(float(values[index]))
+        columns["header"] = lines[:8]
+        return columns
+    
+    @staticmethod
+    def readGroundTemperatures(header):
+        """Read the ground temperatures in the header of an epw.
+        
+        Returns a list of dictionaries with depth and 12 monthly temperatures.
+        """
+        groundTemperatures = []
+        for line in header:
+            if not line.upper().startswith("GROUND TEMPERATURES"): continue
+            values = line.split(",")
+            try:
+                for depthCount in range(int(values[1])):
+                    start = 2 + depthCount * 16
+                    groundTemperatures.append({"depth": float(values[start]), \
+                        "temperatures": [float(v) for v in values[start + 4: start + 16]]})
+            except (ValueError, IndexError):
+                pass
+        return groundTemperatures
+    
+    @classmethod
+    def monthRanges(cls):
+        start = 0
+        for days in cls.daysInMonth:
+            yield start, start + days * 24
+            start += days * 24
+    
+    @classmethod
+    def fromColumns(cls, epwHash, columns, lb_comfortModels):
+        dbTemp = list(columns["dbTemp"])
+        dewPoint = list(columns["dewPoint"])
+        rH = list(columns["rH"])
+        barPress = list(columns["barPress"])
+        windSpeed = columns["windSpeed"]
+        windDir = columns["windDir"]
+        
+        hR, enthalpy, pP, sP = lb_comfortModels.calcHumidRatio(dbTemp, rH, barPress)
+        wetBulb = [lb_comfortModels.findWetBulb(tem, rH[i], barPress[i]) for i, tem in enumerate(dbTemp)]
+        
+        # Find the conditions for the most extreme hours in the epw.  These are the 7 extreme conditions we need:
+            # 1 - Winnter Design Day - Min Dry Bulb (Sensible Heating)
+            # 2 - Winter Design Day - Min Dew Point (Humidification)
+            # 3 - Winter Design Day = Max Wind Speed when temperature is less than 1 standard deviation of annual mean.
+            # 4 - Summer Design Day - Max Dry Bulb (Sensible Cooling)
+            # 5 - Summer Design Day - Max Wet Bulb (Dehumidification)
+            # 6 - Summer Design Day - Max Dew Point (Dehumidification)
+            # 7 - Summer Design Day - Max Enthalpy (Dehumidification)
+        sortedDB, corrWB = zip(*sorted(zip(dbTemp, wetBulb)))
+        minDB = sortedDB[34] # Design Condition 1
+        maxDB = sortedDB[-35] # Design Condition 4
+        WBforMaxDB = corrWB[-35]
+        sortedDP, corrDB = zip(*sorted(zip(dewPoint, dbTemp)))
+        minDP = sortedDP[34] # Design Condition 2
+        DBforMinDP = corrDB[34]
+        maxDP = sortedDP[-35] # Design Condition 6
+        DBforMaxDP = corrDB[-35]
+        sortedWB, corresDB = zip(*sorted(zip(wetBulb, dbTemp)))
+        maxWB = sortedWB[-35] # Design Condition 5
+        DBforMaxWB = corresDB[-35]
+        sortedEnth, correspondDB = zip(*sorted(zip(enthalpy, dbTemp)))
+        maxEnth = int(sortedEnth[-35] * 1000) # Design Condition 7
+        DBforMaxEnth = correspondDB[-35]
+        
+        coldStdDevTemp = sortedDB[1384]
+        hotStdDevTemp = sortedDB[-1385]
+        winSpBelowTemp = []
+        windDirBelowTemp = []
+        winSpAboveTemp = []
+        windDirAboveTemp = []
+        for i, tem in enumerate(dbTemp):
+            if tem < coldStdDevTemp:
+                winSpBelowTemp.append(windSpeed[i])
+                windDirBelowTemp.append(windDir[i])
+            elif tem > hotStdDevTemp:
+                winSpAboveTemp.append(windSpeed[i])
+                windDirAboveTemp.append(windDir[i])
+        winSpBelowTemp.sort()
+        coldMonWind = winSpBelowTemp[922]
+        coldMonWinDir = int(sum(windDirBelowTemp)/len(windDirBelowTemp))
+        maxWind = winSpBelowTemp[-5] # Design Condition 3
+        winSpAboveTemp.sort()
+        hotMonWind = winSpAboveTemp[922]
+        hotMonWinDir = int(sum(windDirAboveTemp)/len(windDirAboveTemp))
+        
+        avgEpwParPress = int(sum(barPress)/len(barPress))
+        
+        monthlyStatistics = cls.calculateMonthlyStatistics(columns)
+        avgMonTemps = monthlyStatistics["dbTemp"]["average"]
+        avgMonTempsSort, monNumsSort = zip(*sorted(zip(avgMonTemps, range(12))))
+        coldMonth = monNumsSort[0]
+        hotMonth = monNumsSort[-1]
+        hotDayDBTempRange = (int(monthlyStatistics["dbTemp"]["dailyRange"][hotMonth]*100))/100
+        
+        # arguments of designDayStr for each design condition
+        designDays = [
+            ['Ann Htg 99.6% Condns DB', 'WinterDesignDay', coldMonth+1, 21, minDB, 0, minDB, '', 'Wetbulb', avgEpwParPress, coldMonWind, coldMonWinDir, 0],
+            ['Ann Hum_n 99.6% Condns DP=>MCDB', 'WinterDesignDay', coldMonth+1, 21, DBforMinDP, 0, minDP, '', 'Dewpoint', avgEpwParPress, coldMonWind, coldMonWinDir, 0],
+            ['Ann Htg Wind 99.6% Condns WS=>MCDB', 'WinterDesignDay', coldMonth+1, 21, coldStdDevTemp, 0, coldStdDevTemp, '', 'Wetbulb', avgEpwParPress, maxWind, coldMonWinDir, 0],
+            ['Ann Clg .4% Condns DB=>MWB', 'SummerDesignDay', hotMonth+1, 21, maxDB, hotDayDBTempRange, WBforMaxDB, '', 'Wetbulb', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2],
+            ['Ann Clg .4% Condns WB=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxWB, hotDayDBTempRange, maxWB, '', 'Wetbulb', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2],
+            ['Ann Clg .4% Condns DP=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxDP, hotDayDBTempRange, maxDP, '', 'Dewpoint', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2],
+            ['Ann Clg .4% Condns Enth=>MDB', 'SummerDesignDay', hotMonth+1, 21, DBforMaxEnth, hotDayDBTempRange, '', maxEnth, 'Enthalpy', avgEpwParPress, hotMonWind, hotMonWinDir, 1.2]]
+        
+        summary = cls(epwHash, designDays, monthlyStatistics, cls.readGroundTemperatures(columns["header"]))
+        summary.columns = columns
+        return summary
+    
+    @classmethod
+    def calculateMonthlyStatistics(cls, columns):
+        """Average, minimum and maximum of each column for each month.
+        
+        dbTemp also has the average daily range of each month.
+        """
+        monthlyStatistics = OrderedDict()
+        for name, index in cls.epwColumns:
+            column = columns[name]
+            statistics = {"average": [], "minimum": [], "maximum": []}
+            for start, end in cls.monthRanges():
+                monthData = column[start:end]
+                statistics["average"].append(sum(monthData)/len(monthData))
+                statistics["minimum"].append(min(monthData))
+                statistics["maximum"].append(max(monthData))
+            monthlyStatistics[name] = statistics
+        
+        dailyRanges = []
+        dbTemp = columns["dbTemp"]
+        for start, end in cls.monthRanges():
+            dailyTempDiff = [max(dbTemp[h:h + 24]) - min(dbTemp[h:h + 24]) for h in xrange(start, end, 24)]
+            dailyRanges.append(sum(dailyTempDiff)/len(dailyTempDiff))
+        monthlyStatistics["dbTemp"]["dailyRange"] = dailyRanges
+        
+        return monthlyStatistics
+    
+    @classmethod
+    def load(cls, summaryFile, epwHash):
+        try:
+            with open(summaryFile, "r") as inf:
+                data = json.load(inf)
+        except:
+            return None
+        if data.get("version") != cls.summaryVersion or data.get("epwHash") != epwHash:
+            return None
+        # json returns unicode strings
+        designDays = [[str(v) if isinstance(v, basestring) else v for v in designDay] \
+                      for designDay in data["designDays"]]
+        return cls(epwHash, designDays, data["monthlyStatistics"], data["groundTemperatures"])
+    
+    def save(self, summaryFile):
+        data = OrderedDict()
+        data["version"] = self.summaryVersion
+        data["epwHash"] = self.epwHash
+        data["designDays"] = self.designDays
+        data["monthlyStatistics"] = self.monthlyStatistics
+        data["groundTemperatures"] = self.groundTemperatures
+        try:
+            with open(summaryFile, "w") as outf:
+                json.dump(data, outf)
+        except (IOError, OSError):
+            # the epw is in a read-only folder. keep the summary in memory
+            pass
+    
+    def getGroundTemperatures(self, depth = None):
+        """Monthly ground temperatures for the closest depth in the epw or the shallowest one."""
+        if not self.groundTemperatures: return []
+        if depth == None:
+            return min(self.groundTemperatures, key = lambda g: g["depth"])["temperatures"]
+        return min(self.groundTemperatures, key = lambda g: abs(g["depth"] - depth))["temperatures"]
+    
+    @staticmethod
+    def designDayStr(ddName, designType, month, day, dbTemp, dbTempRange, wbTemp, enth, humidConditType, pressure, windSpeed, windDir, ashraeSkyClearness):
+        ddStr =  '! ' + ddName + '\n' + \
+            'SizingPeriod:DesignDay,\n' + \
+            '\t' + ddName + ',     !- Name\n' + \
+            '\t' + str(month) + ',      !- Month\n' + \
+            '\t' + str(day) + ',      !- Day of Month\n' + \
+            '\t' + designType + ',!- Day Type\n' + \
+            '\t' + str(dbTemp) + ',      !- Maximum Dry-Bulb Temperature {C}\n' + \
+            '\t' + str(dbTempRange) + ',      !- Daily Dry-Bulb Temperature Range {C}\n' + \
+            '\t' + 'DefaultMultipliers, !- Dry-Bulb Temperature Range Modifier Type\n' + \
+            '\t' + ',      !- Dry-Bulb Temperature Range Modifier Schedule Name\n' + \
+            '\t' + humidConditType + ',      !- Humidity Condition Type\n' + \
+            '\t' + str(wbTemp) + ',      !- Wetbulb or Dewpoint at Maximum Dry-Bulb {C}\n' + \
+            '\t' + ',      !- Humidity Indicating Day Schedule Name\n' + \
+            '\t' + ',      !- Humidity Ratio at Maximum Dry-Bulb {kgWater/kgDryAir}\n' + \
+            '\t' + str(enth) + ',      !- Enthalpy at Maximum Dry-Bulb {J/kg}\n' + \
+            '\t' + ',      !- Daily Wet-Bulb Temperature Range {deltaC}\n' + \
+            '\t' + str(pressure) + ',      !- Barometric Pressure {Pa}\n' + \
+            '\t' + str(windSpeed) + ',      !- Wind Speed {m/s} design conditions vs. traditional 6.71 m/s (15 mph)\n' + \
+            '\t' + str(windDir) + ',      !- Wind Direction {Degrees; N=0, S=180}\n' + \
+            '\t' + 'No,      !- Rain {Yes/No}\n' + \
+            '\t' + 'No,      !- Snow on ground {Yes/No}\n' + \
+            '\t' + 'No,      !- Daylight Savings Time Indicator\n' + \
+            '\t' + 'ASHRAEClearSky' + ', !- Solar Model Indicator\n' + \
+            '\t' + ',      !- Beam Solar Day Schedule Name\n' + \
+            '\t' + ',      !- Diffuse Solar Day Schedule Name\n' + \
+            '\t' + ',      !- ASHRAE Clear Sky Optical Depth for Beam Irradiance (taub)\n' + \
+            '\t' + ',      !- ASHRAE Clear Sky Optical Depth for Diffuse Irradiance (taud)\n' + \
+            '\t' + str(ashraeSkyClearness) + ';      !- Clearness {0.0 to 1.1}\n' + '\n'
+        
+        return ddStr
+    
+    def writeDDY(self, workingDir, epwFileAddress):
+        """Write the design days to a ddy file in workingDir and return its address."""
+        epwFileName = epwFileAddress.split('\\')[-1].split('.')[0]
+        ddyfile = workingDir + '\\' + epwFileName + '.ddy'
+        with open(ddyfile, "w") as ddyFile:
+            for designDay in self.designDays:
+                ddyFile.write(self.designDayStr(*designDay))
+        return ddyfile
 
 class hb_WriteRAD(object):
     
@@ -1616,7 +3775,22 @@ class hb_WriteRAD(object):
         self.hb_DSCore = hb_folders["DSCorePath"]
         self.hb_DSLibPath = hb_folders["DSLibPath"]
         
+        # chunks of test points for grid-based studies. It will be set in writeTestPtFile
+        self.rtracePartition = None
+
+        
+        # files that are written for the study. They are the inputs of the simulation cache key
+        self.inputFiles = []
         
+        # static scene octree and ambient file from hb_RadianceSceneCache. They will be set in writeBatchFiles
+        self.sceneCache = None
+        self.sceneCachePending = []
+        self.sceneCacheRestored = []
+        
+    def addInputFile(self, fileName):
+        fileName = os.path.normpath(fileName)
+        if fileName not in self.inputFiles: self.inputFiles.append(fileName)
+    
     def writeRADAndMaterialFiles(self, originalHBObjects, subWorkingDir, radFileName, \
                                  analysisRecipe, meshParameters, exportInteriorWalls):
         
@@ -1641,6 +3815,7 @@ class hb_WriteRAD(object):
         hb_hive = sc.sticky["honeybee_Hive"]()
         HBObjects = hb_hive.callFromHoneybeeHive(originalHBObjects)
         
+        self.addInputFile(radFileFullName)
         geoRadFile = open(radFileFullName, 'w')
         geoRadFile.write("#GENERATED BY HONEYBEE\n")
         customRADMat = {} # dictionary to collect the custom material names
@@ -1778,6 +3953,7 @@ class hb_WriteRAD(object):
             self.hb_RADMaterialAUX.getRADMaterialString('Interior_Wall') + "\n" + \
             "# end of generic materials definition(s)\n"
     
+        self.addInputFile(materialFileName)
         with open(materialFileName, 'w') as matFile:
             matFile.write(matStr)
             matFile.write("\n# start of material(s) specific to this study (if any)\n")
@@ -1812,6 +3988,7 @@ class hb_WriteRAD(object):
                     
                     # add dat file to folder
                     datFileName = subWorkingDir + "\\" + IESName + '.dat'
+                    self.addInputFile(datFileName)
                     with open(datFileName, "w") as outDat:
                         outDat.write(IESObj.datFile)
                     
@@ -1863,6 +4040,7 @@ class hb_WriteRAD(object):
                             
                             
                             # write the shading file
+                            self.addInputFile(subWorkingDir + "\\" + fileName)
                             with open(subWorkingDir + "\\" + fileName, "w") as radInf:
                                 radInf.write(matStr)
                                 radInf.write("# material(s) specific to this study\n")
@@ -1876,6 +4054,7 @@ class hb_WriteRAD(object):
                         except Exception, e:
                             # print `e`
                             # None object so just create an empty file
+                            self.addInputFile(subWorkingDir + "\\" + fileName)
                             with open(subWorkingDir + "\\" + fileName , "w") as radInf:
                                 radInf.write("#empty shading file")
                             pass    
@@ -1892,6 +4071,7 @@ class hb_WriteRAD(object):
         # write a pattern file which I can use later to re-branch the points
         ptnFileName = os.path.join(subWorkingDir, radFileName + '.ptn')
         
+        self.addInputFile(ptnFileName)
         with open(ptnFileName, "w") as ptnFile:
             for ptList in testPoints:
                 ptnFile.write(str(len(ptList)) + ", ")
@@ -1911,7 +4091,26 @@ class hb_WriteRAD(object):
             for v in flattenPtsNormals: v.Transform(transform)    
     
         numOfPoints = len(flattenTestPoints)
-    
+        
+        if analysisRecipe.type != 2 and numOfPoints != 0:
+            # grid-based study. split the points into chunks that will be
+            # handed to the next available CPU
+            self.rtracePartition = hb_RTracePartition(subWorkingDir, radFileName, \
+                                        [len(ptList) for ptList in testPoints], numOfCPUs)
+            self.rtracePartition.writePtsFiles(flattenTestPoints, flattenPtsNormals)
+            # .pts files of the chunks are the same points split by the cost of the last run
+            for cpuCount in range(len(self.rtracePartition.lenOfPts)):
+                self.addInputFile(self.rtracePartition.cpuFileName(cpuCount, "pts"))
+            
+            lenOfPts = self.rtracePartition.lenOfPts
+            testPtsEachCPU = []
+            cpuStart = 0
+            for cpuLength in lenOfPts:
+                testPtsEachCPU.append(flattenTestPoints[cpuStart:cpuStart + cpuLength])
+                cpuStart += cpuLength
+            
+            return testPtsEachCPU, lenOfPts
+        
         if numOfCPUs > numOfPoints: numOfCPUs = numOfPoints
 
         if numOfCPUs > 1:
@@ -1931,20 +4130,19 @@ class hb_WriteRAD(object):
         
         testPtsEachCPU = []
         
+        cpuStart = 0
         for cpuCount in range(numOfCPUs):
             # write pts file
-            ptsForThisCPU = []
+            cpuEnd = cpuStart + lenOfPts[cpuCount]
             ptsFileName = os.path.join(subWorkingDir, radFileName + '_' + `cpuCount` + '.pts')
             
-            ptsFile = open(ptsFileName, "w")
-
-            for ptCount in range(sum(lenOfPts[:cpuCount]), sum(lenOfPts[:cpuCount+1])):
-                ptsFile.write(self.hb_writeRADAUX.testPtsStr(flattenTestPoints[ptCount], flattenPtsNormals[ptCount]))
-                ptsForThisCPU.append(flattenTestPoints[ptCount])
-
-            ptsFile.close()
+            self.addInputFile(ptsFileName)
+            with open(ptsFileName, "w") as ptsFile:
+                ptsFile.write("".join([self.hb_writeRADAUX.testPtsStr(flattenTestPoints[ptCount], flattenPtsNormals[ptCount]) \
+                                       for ptCount in xrange(cpuStart, cpuEnd)]))
             
-            testPtsEachCPU.append(ptsForThisCPU)        
+            testPtsEachCPU.append(flattenTestPoints[cpuStart:cpuEnd])
+            cpuStart = cpuEnd
             
         return testPtsEachCPU, lenOfPts
     
@@ -1958,6 +4156,10 @@ class hb_WriteRAD(object):
         fileNames = [] # list of only names of the files
         pcompFileName = ""
         
+        self.sceneCache = None
+        self.sceneCachePending = []
+        self.sceneCacheRestored = []
+        
         # initiate RAD Parameters
         if analysisRecipe.radParameters==None:
             quality = 0
@@ -1991,6 +4193,7 @@ class hb_WriteRAD(object):
             newLocName = newLocName.replace("/", "_")
             
             # copy .epw file to sub-directory
+            self.addInputFile(subWorkingDir + "\\" + newLocName + '.epw')
             self.lb_preparation.copyFile(epwFileAddress, subWorkingDir + "\\" + newLocName + '.epw')
             
             pathStr = "SET RAYPATH=.;" + self.hb_RADLibPath + ";" + self.hb_DSPath + ";" + \
@@ -2001,6 +4204,7 @@ class hb_WriteRAD(object):
             
             initBatchFileName = os.path.join(subWorkingDir, radFileName + '_InitDS.bat')
             
+            self.addInputFile(initBatchFileName)
             initBatchFile = open(initBatchFileName, "w")
             initBatchFile.write(pathStr)
             initBatchStr =  os.path.splitdrive(self.hb_DSPath)[0] + '\n' + \
@@ -2030,6 +4234,7 @@ class hb_WriteRAD(object):
             # write the rest of the files
             for cpuCount in range(numOfCPUs):
                 heaFileName = os.path.join(subWorkingDir, radFileName + '_' + `cpuCount` + '.hea')
+                self.addInputFile(heaFileName)
                 heaFile = open(heaFileName, "w")
                 projectName =  radFileName
                 
@@ -2045,6 +4250,7 @@ class hb_WriteRAD(object):
                 
                 # write view for annual glare if any
                 glareViewFileName = subWorkingDir + '\\' + projectName + '_' + 'annualGlareView.vf'
+                self.addInputFile(glareViewFileName)
                 vfFile = open(glareViewFileName, "w")
                 vfFile.write('')
                 for view in annualGlareViews:
@@ -2072,6 +4278,7 @@ class hb_WriteRAD(object):
                     DSResultFilesAddress.append(os.path.join(subWorkingDir, radFileName + '_' + `cpuCount` + '.ill'))
                     # 3.  write the batch file
                     DSBatchFileName = os.path.join(subWorkingDir, radFileName + '_' + `cpuCount` + '_DS.bat')
+                    self.addInputFile(DSBatchFileName)
                     DSBatchFile = open(DSBatchFileName, "w")
                     
                     fileNames.append(DSBatchFileName.split("\\")[-1])
@@ -2119,6 +4326,9 @@ class hb_WriteRAD(object):
             
         
         # create the batch file that initiate the simulation
+        self.addInputFile(radSkyFileName)
+        if readyOCTFile != None: self.addInputFile(readyOCTFile)
+        self.addInputFile(initBatchFileName)
         with open(initBatchFileName, "w") as batchFile:
             # write the path string (I should check radiance to be installed on the system
             pathStr = "SET RAYPATH=.;" + self.hb_RADLibPath + "\nPATH=" + self.hb_RADPath + ";$PATH\n"
@@ -2135,11 +4345,23 @@ class hb_WriteRAD(object):
                 for additionalFile in additionalRadFiles:
                     if additionalFile!=None:
                         sceneRadFiles.append(additionalFile)
-                
-            OCTLine = self.hb_writeRADAUX.oconvLine(OCTFileName, sceneRadFiles)
-            if readyOCTFile ==None: batchFile.write(OCTLine)
             
-            if analysisRecipe.type == 0:
+            if readyOCTFile ==None:
+                self.sceneCache = hb_RadianceSceneCache()
+                if not self.sceneCache.enabled: self.sceneCache = None
+            
+            if readyOCTFile !=None:
+                pass
+            elif self.sceneCache == None:
+                OCTLine = self.hb_writeRADAUX.oconvLine(OCTFileName, sceneRadFiles)
+                batchFile.write(OCTLine)
+            else:
+                # static scene is only oconv'ed if it is not in the cache and the sky is added to it
+                staticRadFiles = [radFile for radFile in sceneRadFiles if radFile != radSkyFileName]
+                batchFile.write(self.sceneOconvLines(subWorkingDir, radFileName, OCTFileName, \
+                                                     staticRadFiles, radSkyFileName))
+            
+            if analysisRecipe.type == 0 and runOverture:
                 # add overture line in case it is an image-based analysis
                 view = sc.doc.Views.ActiveView.ActiveViewport.Name
                 
@@ -2147,7 +4369,12 @@ class hb_WriteRAD(object):
                         
                 # write rpict lines
                 overtureLine = self.hb_writeRADAUX.overtureLine(viewLine, OCTFileName, view, analysisRecipe.radParameters, int(analysisRecipe.type))
-                if runOverture: batchFile.write(overtureLine)
+                
+                if self.sceneCache == None:
+                    batchFile.write(overtureLine)
+                else:
+                    batchFile.write(self.sceneOvertureLines(subWorkingDir, OCTFileName, radSkyFileName, \
+                                                            analysisRecipe.radParameters, overtureLine))
             
         if analysisRecipe.type == 0:
             # write view files
@@ -2170,6 +4397,7 @@ class hb_WriteRAD(object):
                 batchFiles.append(batchFileName)
                 
                 fileNames.append(batchFileName.split("\\")[-1])
+                self.addInputFile(batchFileName)
                 batchFile = open(batchFileName, "w")
                 # write path files
                 batchFile.write(pathStr)
@@ -2208,6 +4436,7 @@ class hb_WriteRAD(object):
                 # PCOMP to merge images into a single HDR
                 pcompFileName = os.path.join(subWorkingDir, radFileName + '_PCOMP.bat')
                                 
+                self.addInputFile(pcompFileName)
                 with open(pcompFileName, "w") as pcompFile:
                     
                     # write path files
@@ -2227,6 +4456,33 @@ class hb_WriteRAD(object):
             
             return initBatchFileName, batchFiles, fileNames, pcompFileName, HDRFileAddress
                         
+        elif self.rtracePartition != None:
+            # one batch file for each chunk of the test points. results will be merged
+            # into one .res file for each CPU after the analysis
+            fileNames = []
+            RADResultFilesAddress = [self.rtracePartition.cpuFileName(cpuCount, "res") \
+                                     for cpuCount in range(self.rtracePartition.numOfCPUs)]
+            
+            # chunk batch files are not inputs of the cache key. They change with the measured
+            # cost of the points and the rtrace parameters are in the key already.
+            for chunk in self.rtracePartition.chunksByCost():
+                batchFileName = self.rtracePartition.chunkFileName(chunk, "bat")
+                batchFiles.append(batchFileName)
+                fileNames.append(os.path.basename(batchFileName))
+                
+                with open(batchFileName, "w") as batchFile:
+                    # write path files
+                    batchFile.write(pathStr)
+                    batchFile.write(os.path.splitdrive(subWorkingDir)[0] + "\n")
+                    batchFile.write("cd " + subWorkingDir + "\n")
+                    
+                    RTRACELine = self.hb_writeRADAUX.rtraceLine(self.rtracePartition.chunkProjectName(), \
+                                        OCTFileName, analysisRecipe.radParameters, \
+                                        int(analysisRecipe.simulationType), chunk.index)
+                    batchFile.write(RTRACELine)
+            
+            return initBatchFileName, batchFiles, fileNames, pcompFileName, RADResultFilesAddress
+            
         else:
             fileNames = []
             RADResultFilesAddress = []
@@ -2238,6 +4494,7 @@ class hb_WriteRAD(object):
                 RADResultFilesAddress.append(os.path.join(subWorkingDir, radFileName + '_' + `cpuCount` + '.res'))
                 
                 fileNames.append(batchFileName.split("\\")[-1])
+                self.addInputFile(batchFileName)
                 batchFile = open(batchFileName, "w")
                 # write path files
                 batchFile.write(pathStr)
@@ -2254,67 +4511,192 @@ class hb_WriteRAD(object):
             
             return initBatchFileName, batchFiles, fileNames, pcompFileName, RADResultFilesAddress
         
-    def executeBatchFiles(self, batchFileNames, maxPRuns = None, shell = False, waitingTime = 0.5):
+    def sceneOconvLines(self, subWorkingDir, radFileName, OCTFileName, staticRadFiles, radSkyFileName):
+        """oconv lines to build the static scene octree and add the sky to it.
+        
+        The static octree is restored from the Radiance scene cache if the materials and the
+        geometry haven't changed. The lines are the same in both cases and oconv only runs if
+        the octree is not in the study folder.
+        """
+        staticOCTFileName = radFileName + "_scene"
+        staticOCTFile = os.path.join(subWorkingDir, staticOCTFileName + ".oct")
+        
+        self.sceneKey = self.sceneCache.getKey(staticRadFiles, {"oconv": "-r 2048"}, subWorkingDir)
+        if self.sceneCache.restoreFile(self.sceneKey, staticOCTFile):
+            print "Static scene octree is loaded from the Radiance scene cache."
+            self.sceneCacheRestored.append(staticOCTFile)
+        else:
+            self.sceneCachePending.append((self.sceneKey, staticOCTFile, "init"))
+        
+        # scene files are referenced by relative names so the octree can be used in other folders
+        relativeRadFiles = [self.sceneCache.relativePath(radFile, subWorkingDir) for radFile in staticRadFiles]
+        staticLine = self.hb_writeRADAUX.oconvLine(staticOCTFileName, relativeRadFiles, frozen = False)
+        skyLine = self.hb_writeRADAUX.oconvLine(OCTFileName, \
+                        [self.sceneCache.relativePath(radSkyFileName, subWorkingDir)], \
+                        inputOctFileName = staticOCTFileName)
+        
+        return "if not exist " + staticOCTFileName + ".oct " + staticLine + skyLine
+    
+    def sceneOvertureLines(self, subWorkingDir, OCTFileName, radSkyFileName, radParameters, overtureLine):
+        """Overture lines that only run if the ambient file is not restored from the Radiance scene cache.
+        
+        The lines are the same in both cases so the init batch file and the key of the simulation
+        cache don't change with the state of the scene cache.
+        """
+        ambFileName = os.path.join(subWorkingDir, OCTFileName + ".amb")
+        
+        # ambient file is view independent and can be reused by studies with the same scene and sky
+        ambientKey = self.sceneCache.getKey([radSkyFileName], \
+            {"scene": self.sceneKey, \
+             "ambient": self.sceneCache.getAmbientParameters(radParameters)}, \
+            subWorkingDir)
+        if self.sceneCache.restoreFile(ambientKey, ambFileName):
+            print "Ambient file is loaded from the Radiance scene cache."
+            self.sceneCacheRestored.append(ambFileName)
+        elif os.path.isfile(ambFileName):
+            # ambient file of a previous run with a different scene, sky or parameters
+            os.remove(ambFileName)
+        self.sceneCachePending.append((ambientKey, ambFileName, "init"))
+        
+        return "if not exist " + os.path.basename(ambFileName) + " (\n" + overtureLine + ")\n"
+    
+    def updateSceneCache(self, scheduler):
+        """Store the static scene octree and the ambient file of the study after a successful run."""
+        if self.sceneCache == None or not self.sceneCachePending: return
+        if scheduler.getFailedJobs(): return
+        
+        # the init job can build both the octree and the ambient file. its run time is
+        # shared between the files that it has built in this run
+        builtFiles = {}
+        for key, fileName, buildJobName in self.sceneCachePending:
+            if fileName not in self.sceneCacheRestored:
+                builtFiles[buildJobName] = builtFiles.get(buildJobName, 0) + 1
+        
+        for key, fileName, buildJobName in self.sceneCachePending:
+            if not os.path.isfile(fileName): continue
+            
+            if fileName in self.sceneCacheRestored:
+                # restored octrees don't change. rpict adds values to a restored ambient file
+                # so it is only stored again if it has grown since it was cached
+                cachedSize = self.sceneCache.getFileSize(key)
+                if cachedSize != None and os.path.getsize(fileName) <= cachedSize: continue
+                buildTime = None
+            elif buildJobName in scheduler.jobs and scheduler.jobs[buildJobName].runTime != None:
+                buildTime = scheduler.jobs[buildJobName].runTime / builtFiles[buildJobName]
+            else:
+                buildTime = None
+            self.sceneCache.storeFile(key, fileName, buildTime)
+        
+        print self.sceneCache.report()
+    
+    def getCacheKey(self, simulationCache, subWorkingDir, numOfCPUs, analysisRecipe, additionalFiles = []):
+        """Key of the study in hb_SimulationCache. Call it after writing the batch files.
+        
+        Only the files that are written for the study (rad, material, sky, pts, batch, ...) and
+        the additional files are hashed. Results of the previous runs in the folder don't change the key.
+        """
+        inputFiles = list(self.inputFiles)
+        if additionalFiles: inputFiles.extend(additionalFiles)
+        
+        parameters = {"type": analysisRecipe.type,
+                      "simulationType": getattr(analysisRecipe, "simulationType", None),
+                      "radParameters": analysisRecipe.radParameters,
+                      "numOfCPUs": numOfCPUs}
+        
+        return simulationCache.getKey(inputFiles, parameters, subWorkingDir)
+    
+    @staticmethod
+    def checkDeprecatedArguments(methodName, kwargs):
+        # waitingTime was the polling interval of the old batch runner
+        for argument in kwargs:
+            if argument == "waitingTime":
+                print "%s: waitingTime is deprecated and will be removed. "%methodName + \
+                      "Jobs start as soon as the jobs that they depend on end."
+            else:
+                raise TypeError("%s() got an unexpected keyword argument '%s'"%(methodName, argument))
+    
+    def executeBatchFiles(self, batchFileNames, maxPRuns = None, shell = False, **kwargs):
     
         """Run a number of batch files in parallel and
             wait to end of the analysis.
     
             Args:
                 batchFileNames: List of batch files
-                maxPRuns: max number of files to be ran in parallel (default = 0)
+                maxPRuns: max number of files to be ran in parallel (default = 1)
                 shell: set to True if you do NOT want to see the cmd window while the analysis is runnig
+            Returns:
+                True if all the batch files ran successfully.
         """
-    
+        self.checkDeprecatedArguments("executeBatchFiles", kwargs)
         if not maxPRuns : maxPRuns = 1
-        maxPRuns = int(maxPRuns)
-        total = len(batchFileNames)
-        
-        if maxPRuns < 1: maxPRuns = 1
-        if maxPRuns > total: maxPRuns = total
-        
-        running = 0
-        done = False
-        jobs = []
-        pid = 0
+        scheduler = hb_JobScheduler(maxWorkers = maxPRuns)
+        for count, batchFileName in enumerate(batchFileNames):
+            scheduler.addJob(str(count), batchFileName.replace("\\", "/"), shell = shell, \
+                             captureOutput = shell)
         
+        return self.runJobs(scheduler)
+    
+    def runJobs(self, scheduler):
         try:
-            while not done:
-                if running < maxPRuns and pid < total:
-                    # execute the files
-                    jobs.append(subprocess.Popen(batchFileNames[pid].replace("\\", "/") , shell = shell))
-                    pid+=1
-                    time.sleep(waitingTime)
-                
-                # count how many jobs are running and how many are done
-                running = 0
-                finished = 0
-                for job in jobs:
-                    if job.poll() is None:
-                        #one job is still running
-                        running += 1
-                    else:
-                        finished += 1
-        
-                if running == maxPRuns:
-                    # wait for half a second
-                    #print "waiting..."
-                    time.sleep(waitingTime)
+            success = scheduler.run()
+        except Exception, e:
+            print "Something went wrong: %s"%str(e)
+            return False
         
-                if finished ==  total:
-                    done = True
+        if not success:
+            msg = "Some of the Radiance jobs failed:\n" + \
+                  "\n".join("%s: %s"%(job.name, job.stderr.strip() or job.state) \
+                            for job in scheduler.getFailedJobs())
+            print msg
+            self.component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
         
-        except Exception, e:
-            print "Something went wrong: %s"%str(e) 
+        return success
     
     def runBatchFiles(self, initBatchFileName, batchFileNames, fileNames, \
-                      pcompBatchFile, waitingTime, runInBackground = False):
+                      pcompBatchFile, runInBackground = False, dryRun = False, **kwargs):
+        """Run init batch file, batch files for each CPU and the final pcomp/merge batch file.
         
-        self.executeBatchFiles([initBatchFileName], maxPRuns = 1, shell = runInBackground, waitingTime = waitingTime)
-        self.executeBatchFiles(batchFileNames, maxPRuns = len(batchFileNames), shell = runInBackground, waitingTime = waitingTime)
+        Returns the scheduler so the caller can check the state, run time and output of each job.
+        """
+        self.checkDeprecatedArguments("runBatchFiles", kwargs)
+        if self.rtracePartition != None:
+            # chunks of test points are handed to the next available CPU
+            maxWorkers = self.rtracePartition.numOfCPUs
+        else:
+            maxWorkers = max(1, len(batchFileNames))
+        
+        scheduler = hb_JobScheduler(maxWorkers = maxWorkers, dryRun = dryRun)
+        
+        # init -> one job for each cpu (or chunk) -> pcomp
+        scheduler.addJob("init", initBatchFileName.replace("\\", "/"), \
+                         shell = runInBackground, captureOutput = runInBackground)
+        cpuJobs = []
+        for count, batchFileName in enumerate(batchFileNames):
+            job = scheduler.addJob("cpu_%d"%count, batchFileName.replace("\\", "/"), ["init"], \
+                                   shell = runInBackground, captureOutput = runInBackground)
+            cpuJobs.append(job.name)
         
         if pcompBatchFile!="":
-            os.system(pcompBatchFile) # put all the files together
+            # put all the files together
+            scheduler.addJob("pcomp", pcompBatchFile, cpuJobs, shell = True)
+        
+        self.runJobs(scheduler)
+        
+        if not dryRun:
+            self.updateSceneCache(scheduler)
+        
+        if self.rtracePartition != None and not dryRun:
+            self.rtracePartition.mergeResults()
+            
+            # measure the cost of each grid for the next run
+            chunkRunTimes = {}
+            for chunk, jobName in zip(self.rtracePartition.chunksByCost(), cpuJobs):
+                job = scheduler.jobs[jobName]
+                if job.state == "succeeded": chunkRunTimes[chunk.index] = job.runTime
+            self.rtracePartition.updateCosts(chunkRunTimes)
         
+        return scheduler
+    
     def collectResults(self, subWorkingDir, radFileName, numOfCPUs, analysisRecipe, expectedResultFiles):
         
         if analysisRecipe.type == 2:
@@ -3004,13 +5386,18 @@ class hb_WriteRADAUX(object):
             
         return view + " "
     
-    def oconvLine(self, octFileName, radFilesList):
+    def oconvLine(self, octFileName, radFilesList, frozen = True, inputOctFileName = None):
         # sence files
         r = 1024 * 2
         senceFiles = ""
         for address in radFilesList: senceFiles = senceFiles + address.replace("\\" , "/") + " "
         
-        line = "oconv -r " + str(r) + " -f " +  senceFiles + " > " + octFileName + ".oct\n"
+        frozenFlag = " -f " if frozen else " "
+        if inputOctFileName == None:
+            line = "oconv -r " + str(r) + frozenFlag +  senceFiles + " > " + octFileName + ".oct\n"
+        else:
+            # add the files to an existing octree. resolution of the input octree is used
+            line = "oconv" + frozenFlag + "-i " + inputOctFileName + ".oct " + senceFiles + " > " + octFileName + ".oct\n"
         
         return line
     
@@ -3547,6 +5934,406 @@ class hb_ReadAnnualResultsAux(object):
                     illFiles.AddRange(fileList, p)
         
         return illFiles
+    
+    @staticmethod
+    def getCPUCount(illFile):
+        """Return the CPU count from .ill file name (e.g. name_1.ill or name_1_down.ill)."""
+        nameSegments = os.path.basename(illFile).split(".")[-2].split("_")
+        if nameSegments[-1] in ("up", "down"):
+            return int(nameSegments[-2])
+        return int(nameSegments[-1])
+    
+    def convertIllFileDaraTreeIntoSortedDictionary(self, illFilesAddress):
+        """
+        Convert a data tree of .ill files to a dictionary.
+        The structure of the dictionary is illFileSets[shadingGroupNumber][[state 1], [state 2],..., [state n]]
+        where each state is a list of .ill files sorted by the CPU count.
+        """
+        illFileSets = {}
+        for branch in range(illFilesAddress.BranchCount):
+            # sort files inside each branch if they are not sorted
+            fileNames = list(illFilesAddress.Branch(branch))
+            try:
+                fileNames = sorted(fileNames, key=self.getCPUCount)
+            except:
+                tmpmsg = "Can't sort .ill files based on the file names. Make sure the branches are sorted correctly."
+                w = gh.GH_RuntimeMessageLevel.Warning
+                ghenv.Component.AddRuntimeMessage(w, tmpmsg)
+            
+            #convert data tree to a useful dictionary
+            shadingGroupNumber = illFilesAddress.Path(branch).Indices[0]
+            if shadingGroupNumber not in illFileSets.keys():
+                illFileSets[shadingGroupNumber] = []
+            
+            # create a separate list for each state
+            illFileSets[shadingGroupNumber].append(fileNames)
+        
+        return illFileSets
+    
+    def getIllMatrix(self, illFiles):
+        """Return a hb_IllMatrix for a list of .ill files for one shading state."""
+        return hb_IllMatrix(illFiles)
+
+class hb_IllMatrix(object):
+    """
+    Binary hours x points matrix for a set of Daysim .ill files.
+    
+    The .ill files for a shading state (one file per CPU, sorted by CPU count) are
+    converted once to a float32 matrix next to the first file (*.hbmtx). Rows are
+    hours and columns are the test points of all the files in order. Every hour can
+    then be read with a single seek. A transposed copy (*.hbmtxT) is written the first
+    time that the results of a single test point are requested so reading the annual
+    values for a point is also a single seek. Both files are invalidated when any of
+    the source .ill files is changed.
+    
+    Usage:
+        illMatrix = hb_IllMatrix(illFiles)
+        noonValues = illMatrix.getHour(12)
+        annualValues = illMatrix.getPoint(0)
+    """
+    cacheVersion = 2
+    pointBlockSize = 1024
+    
+    def __init__(self, illFiles):
+        self.illFiles = list(illFiles)
+        self.matrixFile = self.illFiles[0] + ".hbmtx"
+        self.transposedFile = self.illFiles[0] + ".hbmtxT"
+        self.indexFile = self.illFiles[0] + ".hbidx"
+        self.hourCount = 0
+        self.pointCount = 0
+        self.pointsInEachFile = []
+        
+        if not self.loadIndex():
+            self.convertIllFiles()
+    
+    def getSourceStamps(self):
+        stamps = []
+        for illFile in self.illFiles:
+            fileStat = os.stat(illFile)
+            # full precision of the modification time. A file that is re-written in the same
+            # second with the same size is still a different file
+            stamps.append([fileStat.st_size, repr(fileStat.st_mtime)])
+        return stamps
+    
+    def loadIndex(self):
+        if not os.path.isfile(self.indexFile) or not os.path.isfile(self.matrixFile):
+            return False
+        try:
+            with open(self.indexFile, "r") as inf:
+                index = json.load(inf)
+            if index["version"] != self.cacheVersion or \
+               index["stamps"] != self.getSourceStamps():
+                return False
+            self.hourCount = index["hourCount"]
+            self.pointsInEachFile = index["pointsInEachFile"]
+            self.pointCount = sum(self.pointsInEachFile)
+            return True
+        except:
+            return False
+    
+    def writeIndex(self, stamps):
+        index = {"version": self.cacheVersion, "stamps": stamps,
+                 "hourCount": self.hourCount,
+                 "pointsInEachFile": self.pointsInEachFile}
+        with open(self.indexFile, "w") as outf:
+            json.dump(index, outf)
+    
+    @staticmethod
+    def parseIllLine(line):
+        # month day hour value1 value2 ... valueN
+        return [float(v) for v in line.split()[3:]]
+    
+    def convertIllFiles(self):
+        stamps = self.getSourceStamps()
+        illFiles = [open(illFile, "r") for illFile in self.illFiles]
+        self.pointsInEachFile = [None] * len(illFiles)
+        self.hourCount = 0
+        
+        if os.path.isfile(self.transposedFile): os.remove(self.transposedFile)
+        try:
+            with open(self.matrixFile, "wb") as outf:
+                while True:
+                    hourValues = array.array("f")
+                    for fileCount, illFile in enumerate(illFiles):
+                        line = illFile.readline()
+                        while line.startswith("#"): line = illFile.readline()
+                        if not line.strip(): break
+                        values = self.parseIllLine(line)
+                        if self.pointsInEachFile[fileCount] == None:
+                            self.pointsInEachFile[fileCount] = len(values)
+                        hourValues.extend(values)
+                    else:
+                        hourValues.tofile(outf)
+                        self.hourCount += 1
+                        continue
+                    break
+        finally:
+            for illFile in illFiles: illFile.close()
+        
+        self.pointsInEachFile = [count or 0 for count in self.pointsInEachFile]
+        self.pointCount = sum(self.pointsInEachFile)
+        self.writeIndex(stamps)
+    
+    def getHour(self, hour):
+        """Return values for all the points for an hour. hour is the index of the line (0-8759)."""
+        if hour < 0 or hour >= self.hourCount:
+            raise IndexError("Hour %d is out of range [0, %d)."%(hour, self.hourCount))
+        values = array.array("f")
+        with open(self.matrixFile, "rb") as inf:
+            inf.seek(hour * self.pointCount * 4)
+            values.fromfile(inf, self.pointCount)
+        return values.tolist()
+    
+    def iterHours(self):
+        """Yield the values for all the points hour by hour."""
+        with open(self.matrixFile, "rb") as inf:
+            for hour in xrange(self.hourCount):
+                values = array.array("f")
+                values.fromfile(inf, self.pointCount)
+                yield values.tolist()
+    
+    def writeTransposedMatrix(self):
+        # transpose in blocks of points to keep the memory usage bounded
+        tempFile = self.transposedFile + ".tmp"
+        rowSize = self.pointCount * 4
+        with open(self.matrixFile, "rb") as inf:
+            with open(tempFile, "wb") as outf:
+                for blockStart in range(0, self.pointCount, self.pointBlockSize):
+                    blockSize = min(self.pointBlockSize, self.pointCount - blockStart)
+                    block = [array.array("f") for i in range(blockSize)]
+                    for hour in xrange(self.hourCount):
+                        inf.seek(hour * rowSize + blockStart * 4)
+                        values = array.array("f")
+                        values.fromfile(inf, blockSize)
+                        for count, value in enumerate(values):
+                            block[count].append(value)
+                    for pointValues in block:
+                        pointValues.tofile(outf)
+        if os.path.isfile(self.transposedFile): os.remove(self.transposedFile)
+        os.rename(tempFile, self.transposedFile)
+    
+    def getPoint(self, pointIndex):
+        """Return annual values for a test point. pointIndex is the index of the point in all the files."""
+        if pointIndex < 0 or pointIndex >= self.pointCount:
+            raise IndexError("Point %d is out of range [0, %d)."%(pointIndex, self.pointCount))
+        if not os.path.isfile(self.transposedFile):
+            self.writeTransposedMatrix()
+        values = array.array("f")
+        with open(self.transposedFile, "rb") as inf:
+            inf.seek(pointIndex * self.hourCount * 4)
+            values.fromfile(inf, self.hourCount)
+        return values.tolist()
+    
+    def getPoints(self, start, end):
+        """Return annual values for the test points from start to end with a single read.
+        
+        Values of each point are returned as an array of floats.
+        """
+        if start < 0 or end > self.pointCount or start > end:
+            raise IndexError("Points %d to %d are out of range [0, %d)."%(start, end, self.pointCount))
+        if not os.path.isfile(self.transposedFile):
+            self.writeTransposedMatrix()
+        values = array.array("f")
+        with open(self.transposedFile, "rb") as inf:
+            inf.seek(start * self.hourCount * 4)
+            values.fromfile(inf, (end - start) * self.hourCount)
+        hourCount = self.hourCount
+        return [values[count * hourCount:(count + 1) * hourCount] for count in xrange(end - start)]
+
+class hb_AnnualDaylightMetrics(object):
+    """
+    Calculate annual daylight metrics for a whole grid of sensors in one batch.
+    
+    Sensors are split into blocks. Each block reads the annual values of its sensors at
+    once (from the shading state that is in effect for each hour) and calculates the
+    metrics over all the occupied hours. Blocks are calculated in parallel and each block
+    owns its own slice of the results so there is no need to lock them.
+    
+    Metrics follow Daysim's definitions:
+        DA: Percentage of occupied hours that illuminance >= DLAIllumThreshold.
+        CDA: Same as DA but hours under the threshold get partial credit (E / threshold).
+        UDI: Percentage of occupied hours under UDILow, between UDILow and UDIHigh and over UDIHigh.
+        sDA: Percentage of sensors with DA >= sDAThreshold.
+        ASE: Percentage of sensors that receive more than ASEIllumThreshold direct sunlight
+             for more than ASEHours occupied hours. Only calculated if direct illuminance is provided.
+    
+    Usage:
+        metrics = hb_AnnualDaylightMetrics(DLAIllumThreshold = 300)
+        results = metrics.calculate([illMatrix], occupancy)
+        print results["sDA"]
+    """
+    
+    metrics = ("DA", "CDA", "UDILess100", "UDI100_2000", "UDIMore2000")
+    
+    def __init__(self, DLAIllumThreshold = 300, UDILow = 100, UDIHigh = 2000, sDAThreshold = 50, \
+                 ASEIllumThreshold = 1000, ASEHours = 250, blockSize = 256):
+        self.DLAIllumThreshold = float(DLAIllumThreshold)
+        self.UDILow = float(UDILow)
+        self.UDIHigh = float(UDIHigh)
+        self.sDAThreshold = float(sDAThreshold)
+        self.ASEIllumThreshold = float(ASEIllumThreshold)
+        self.ASEHours = ASEHours
+        self.blockSize = blockSize
+    
+    @staticmethod
+    def getSensorCount(illMatrix):
+        # illMatrix can be a hb_IllMatrix or a list of lists of hourly values
+        try: return illMatrix.pointCount
+        except AttributeError: return len(illMatrix[0])
+    
+    @staticmethod
+    def getSensorValues(illMatrix, start, end, hours):
+        """Return the values of the hours for sensors from start to end."""
+        try:
+            annualValues = illMatrix.getPoints(start, end)
+        except AttributeError:
+            if not hours: return [()] * (end - start)
+            return zip(*[illMatrix[hour][start:end] for hour in hours])
+        return [[values[hour] for hour in hours] for values in annualValues]
+    
+    @staticmethod
+    def isOccupied(occupancyValue):
+        # continuous values larger than .2 are considered as occupied
+        return occupancyValue > .2
+    
+    def getSensorBlocks(self, sensorCount):
+        return [(st, min(st + self.blockSize, sensorCount)) \
+                for st in range(0, sensorCount, self.blockSize)]
+    
+    def calculate(self, illMatrices, occupancy, blindStates = None, directIllMatrix = None):
+        """
+        Args:
+            illMatrices: A list of hours x sensors matrices, one for each shading state.
+                The first matrix should be the results with no dynamic blinds.
+            occupancy: A list of 8760 occupancy values.
+            blindStates: An optional list of 8760 integers. Each value is the index of the
+                matrix that is in effect for that hour. Default is 0 for all the hours.
+            directIllMatrix: An optional hours x sensors matrix of direct sunlight illuminance
+                for ASE calculation.
+        Returns:
+            A dictionary with the lists of DA, CDA, UDILess100, UDI100_2000, UDIMore2000
+            for each sensor and the values of sDA and ASE for the grid.
+        """
+        occupiedHours = [hour for hour, occ in enumerate(occupancy) if self.isOccupied(occ)]
+        # metrics don't depend on the order of the hours so the occupied hours are grouped
+        # by the shading state and each matrix is only read for its own hours
+        hoursByState = OrderedDict()
+        for hour in occupiedHours:
+            hoursByState.setdefault(blindStates[hour] if blindStates else 0, []).append(hour)
+        
+        # hb_IllMatrix writes its transposed copy on the first read. Write it before
+        # the blocks read it in parallel.
+        for illMatrix in [illMatrices[state] for state in hoursByState] + [directIllMatrix]:
+            if hasattr(illMatrix, "writeTransposedMatrix") and not os.path.isfile(illMatrix.transposedFile):
+                illMatrix.writeTransposedMatrix()
+        
+        sensorCount = self.getSensorCount(illMatrices[0])
+        DA = [0] * sensorCount
+        CDA = [0.0] * sensorCount
+        UDILess = [0] * sensorCount
+        UDIMore = [0] * sensorCount
+        ASECount = [0] * sensorCount
+        
+        threshold = self.DLAIllumThreshold
+        UDILow = self.UDILow
+        UDIHigh = self.UDIHigh
+        ASEThreshold = self.ASEIllumThreshold
+        blocks = self.getSensorBlocks(sensorCount)
+        
+        def calculateBlock(blockCount):
+            st, end = blocks[blockCount]
+            stateValues = [self.getSensorValues(illMatrices[state], st, end, hours) \
+                           for state, hours in hoursByState.items()]
+            if directIllMatrix:
+                directValues = self.getSensorValues(directIllMatrix, st, end, occupiedHours)
+            
+            for count in xrange(end - st):
+                values = list(chain.from_iterable(sensorValues[count] for sensorValues in stateValues))
+                
+                sensor = st + count
+                underThreshold = [value for value in values if value < threshold]
+                DA[sensor] = len(values) - len(underThreshold)
+                CDA[sensor] = DA[sensor] + sum(underThreshold) / threshold
+                UDILess[sensor] = len([value for value in values if value < UDILow])
+                UDIMore[sensor] = len([value for value in values if value > UDIHigh])
+                if directIllMatrix:
+                    ASECount[sensor] = len([value for value in directValues[count] if value > ASEThreshold])
+        
+        if len(blocks) > 1:
+            tasks.Parallel.ForEach(range(len(blocks)), calculateBlock)
+        elif blocks:
+            calculateBlock(0)
+        
+        occupiedCount = float(len(occupiedHours)) or 1.0
+        toPercent = lambda count: round(100 * count / occupiedCount, 2)
+        results = {
+            "DA": [toPercent(c) for c in DA],
+            "CDA": [toPercent(c) for c in CDA],
+            "UDILess100": [toPercent(c) for c in UDILess],
+            "UDI100_2000": [toPercent(len(occupiedHours) - l - m) for l, m in zip(UDILess, UDIMore)],
+            "UDIMore2000": [toPercent(c) for c in UDIMore],
+            "occupiedHours": len(occupiedHours)
+            }
+        results["sDA"] = self.spatialDaylightAutonomy(results["DA"])
+        if directIllMatrix:
+            results["ASE"] = self.annualSunlightExposure(ASECount)
+        else:
+            results["ASE"] = None
+        
+        return results
+    
+    def spatialDaylightAutonomy(self, DAValues):
+        """Percentage of sensors with DA larger than or equal to sDAThreshold."""
+        if not DAValues: return 0.0
+        moreThan = len([DA for DA in DAValues if DA >= self.sDAThreshold])
+        return round(100.0 * moreThan / len(DAValues), 2)
+    
+    def annualSunlightExposure(self, ASECount):
+        """Percentage of sensors with more than ASEHours of direct sunlight."""
+        if not ASECount: return 0.0
+        moreThan = len([count for count in ASECount if count > self.ASEHours])
+        return round(100.0 * moreThan / len(ASECount), 2)
+    
+    @classmethod
+    def compare(cls, results, referenceResults):
+        """Return the largest difference between the results and a reference for each metric.
+        
+        referenceResults is a dictionary of metric name: list of values for each sensor
+        (e.g. the results that are written by Daysim). Metrics that are not in both inputs
+        or have a different number of sensors are skipped.
+        """
+        differences = {}
+        for metric in cls.metrics:
+            values, referenceValues = results.get(metric), referenceResults.get(metric)
+            if not values or not referenceValues or len(values) != len(referenceValues): continue
+            differences[metric] = max(abs(v - r) for v, r in zip(values, referenceValues))
+        return differences
+    
+    @classmethod
+    def benchmark(cls, sensorCounts = (1000, 10000, 100000), occupancy = None):
+        """
+        Run the calculation for synthetic grids and return a report of the run times.
+        Hourly values are generated from a daily profile so the benchmark only measures
+        the metrics calculation.
+        """
+        if occupancy == None:
+            # 8 to 18 every day of the year
+            occupancy = [1 if 8 <= hour % 24 < 18 else 0 for hour in range(8760)]
+        
+        report = []
+        randomGenerator = random.Random(0)
+        for sensorCount in sensorCounts:
+            dailyValues = [[randomGenerator.random() * 3000 * math.sin(math.pi * (hour % 24) / 24) \
+                            for sensor in range(sensorCount)] for hour in range(24)]
+            illMatrix = [dailyValues[hour % 24] for hour in range(8760)]
+            
+            startTime = time.time()
+            results = cls().calculate([illMatrix], occupancy)
+            runTime = time.time() - startTime
+            report.append("%d sensors x %d occupied hours: %.2f s (sDA = %.2f%%)"% \
+                          (sensorCount, results["occupiedHours"], runTime, results["sDA"]))
+        
+        return report
 
 class hb_EnergySimulatioParameters(object):
     
@@ -3580,6 +6367,201 @@ class hb_EnergySimulatioParameters(object):
         
         return timestep, shadowPar, solarDistribution, simulationControl, ddyFile, terrain, grndTemps, holidays, startDay, heatSizing, coolSizing
 
+class hb_EPResultReader(object):
+    """
+    Read EnergyPlus result csv files column by column.
+    
+    The header of the csv file is parsed once into a column index (key, variable,
+    units and timestep for each column) that can be searched by key and variable.
+    Only the requested columns are read from the csv file and their values are
+    appended to a binary cache next to the csv file (*.hbcol) the first time that
+    they are requested. Each cached column is stored as one array so the next readers
+    can seek directly to it instead of re-parsing the whole file. Columns that are
+    never requested are never converted.
+    Cache files are invalidated by the size and the modification time of the csv file.
+    The full precision of the modification time is used so a rewrite within the same
+    second is detected.
+    
+    Usage:
+        reader = hb_EPResultReader(resultFileAddress)
+        columnId = reader.findColumn("ZONE1", "Zone Mean Air Temperature")
+        for rowCount, row in reader.iterRows([columnId]):
+            print row[columnId]
+    """
+    
+    EPResultColumn = namedtuple('EPResultColumn', 'index key variable units timestep')
+    cacheVersion = 3
+    
+    def __init__(self, resultFile, useCache = True):
+        self.resultFile = resultFile
+        self.useCache = useCache
+        self.indexFile = resultFile + ".hbidx"
+        self.dataFile = resultFile + ".hbcol"
+        self.header = []
+        self.columns = []
+        self.columnIndex = {}
+        self.rowCount = None
+        # column index: offset of the column in the cache file
+        self.cachedColumns = {}
+        self.__fileStamp = self.getFileStamp(resultFile)
+        
+        if not self.loadIndex():
+            self.readHeader()
+    
+    @staticmethod
+    def getFileStamp(filePath):
+        fileStat = os.stat(filePath)
+        return [fileStat.st_size, repr(fileStat.st_mtime)]
+    
+    @classmethod
+    def parseColumnHeader(cls, index, column):
+        """Parse KEY:Variable Name [units](Timestep) into an EPResultColumn."""
+        column = column.strip()
+        if ":" in column and "[" in column:
+            key, variable = column.split(" [")[0].split(":", 1)
+        else:
+            key, variable = "", column.split(" [")[0]
+        units = column.split("[")[-1].split("]")[0] if "[" in column else ""
+        timestep = column.split("(")[-1].split(")")[0] if "(" in column else ""
+        return cls.EPResultColumn(index, key.strip(), variable.strip(), units, timestep)
+    
+    def setColumns(self):
+        self.columns = [self.parseColumnHeader(count, column) \
+                        for count, column in enumerate(self.header)]
+        self.columnIndex = {}
+        for column in self.columns:
+            self.columnIndex.setdefault((column.key.upper(), column.variable.upper()), []).append(column.index)
+    
+    def readHeader(self):
+        with open(self.resultFile, "r") as result:
+            self.header = result.readline().split(",")
+        self.setColumns()
+    
+    def loadIndex(self):
+        if not self.useCache or not os.path.isfile(self.indexFile): return False
+        try:
+            with open(self.indexFile, "r") as indexFile:
+                index = json.load(indexFile)
+            if index["version"] != self.cacheVersion or index["stamp"] != self.__fileStamp:
+                return False
+            self.header = [str(column) for column in index["header"]]
+            cachedColumns = dict((int(columnId), offset) for columnId, offset in index["columns"].iteritems())
+        except:
+            return False
+        
+        self.setColumns()
+        if cachedColumns and os.path.isfile(self.dataFile):
+            self.rowCount = index["rowCount"]
+            self.cachedColumns = cachedColumns
+        return True
+    
+    def writeIndex(self):
+        index = {"version": self.cacheVersion, "stamp": self.__fileStamp,
+                 "header": self.header, "rowCount": self.rowCount,
+                 "columns": self.cachedColumns}
+        with open(self.indexFile, "w") as indexFile:
+            json.dump(index, indexFile)
+    
+    def findColumns(self, variable = None, key = None, timestep = None):
+        """Return index of columns that match the input. Matching is not case sensitive."""
+        columnIds = []
+        for column in self.columns:
+            if variable != None and column.variable.upper() != variable.upper(): continue
+            if key != None and column.key.upper() != key.upper(): continue
+            if timestep != None and column.timestep.upper() != timestep.upper(): continue
+            columnIds.append(column.index)
+        return columnIds
+    
+    def findColumn(self, key, variable, timestep = None):
+        """Return index of the column for key and variable or None if it is not in the file.
+        
+        Matching is not case sensitive.
+        """
+        for columnId in self.columnIndex.get((key.upper(), variable.upper()), []):
+            if timestep == None or self.columns[columnId].timestep.upper() == timestep.upper():
+                return columnId
+        return None
+    
+    def writeDataCache(self, columns):
+        """Append the values of the columns to the binary cache and update the index."""
+        rowCount = len(columns.values()[0])
+        if self.cachedColumns and rowCount != self.rowCount: return
+        
+        cachedColumns = {}
+        with open(self.dataFile, "ab" if self.cachedColumns else "wb") as outf:
+            outf.seek(0, 2)
+            offset = outf.tell()
+            for columnId in sorted(columns):
+                values = array.array("d", [float("nan") if v == None else v for v in columns[columnId]])
+                values.tofile(outf)
+                cachedColumns[columnId] = offset
+                offset += 8 * rowCount
+        
+        self.rowCount = rowCount
+        self.cachedColumns.update(cachedColumns)
+        self.writeIndex()
+    
+    def getColumns(self, columnIds):
+        """Return a dictionary of column index: list of values.
+        
+        Cells that are not numbers (e.g. empty cells for monthly values in an hourly file)
+        are returned as None.
+        """
+        columnIds = sorted(set(columnIds))
+        if not columnIds: return {}
+        
+        cachedIds = [columnId for columnId in columnIds if columnId in self.cachedColumns]
+        columns = {}
+        if cachedIds:
+            try:
+                columns = self.readColumnsFromCache(cachedIds)
+            except:
+                # cache file is removed or locked. Read these columns from the csv file.
+                self.cachedColumns = {}
+        
+        newIds = [columnId for columnId in columnIds if columnId not in columns]
+        if newIds:
+            newColumns = self.readColumnsFromFile(newIds)
+            if self.useCache:
+                try: self.writeDataCache(newColumns)
+                except:
+                    # folder is read-only or file is locked. The values are still returned.
+                    pass
+            columns.update(newColumns)
+        
+        return columns
+    
+    def readColumnsFromCache(self, columnIds):
+        columns = {}
+        with open(self.dataFile, "rb") as inf:
+            for columnId in columnIds:
+                inf.seek(self.cachedColumns[columnId])
+                values = array.array("d")
+                values.fromfile(inf, self.rowCount)
+                columns[columnId] = [v if v == v else None for v in values]
+        return columns
+    
+    def readColumnsFromFile(self, columnIds):
+        columns = dict((columnId, []) for columnId in columnIds)
+        maxSplit = columnIds[-1] + 1
+        with open(self.resultFile, "r") as result:
+            result.readline()
+            for line in result:
+                values = line.split(",", maxSplit)
+                for columnId in columnIds:
+                    try: value = float(values[columnId])
+                    except: value = None
+                    columns[columnId].append(value)
+        return columns
+    
+    def iterRows(self, columnIds):
+        """Yield (rowCount, {columnIndex: value}) for requested columns in the order of the file."""
+        columns = self.getColumns(columnIds)
+        if not columns: return
+        rowCount = len(columns.values()[0])
+        for count in xrange(rowCount):
+            yield count, dict((columnId, values[count]) for columnId, values in columns.iteritems())
+
 class EPMaterialAux(object):
     
     def __init__(self):
@@ -3595,6 +6577,7 @@ class EPMaterialAux(object):
                                         "ASHRAE1891" : "ASHRAE 189.1",
                                         "CBECS19802004" : "CBECS 1980-2004",
                                         "CBECSBEFORE1980" : "CBECS Before-1980"}
+        self.searchStandards = set(std.upper() for std in self.energyModelingStandards.values())
     
     def calcEPMaterialUValue(self, materialObj, GHComponent = None):
         # Dictionary of typical U-Values for different gases.
@@ -3780,8 +6763,53 @@ class EPMaterialAux(object):
             print "Failed to find " + cnstrName + " in the Honeybee construction library."
             return -1
        
+    # libraries that are searched by searchListByKeyword
+    searchLibraries = ("honeybee_constructionLib", "honeybee_materialLib", "honeybee_windowMaterialLib", \
+                       "honeybee_thermMaterialLib", "honeybee_ScheduleLib", "honeybee_ScheduleTypeLimitsLib")
+    surfaceTypes = ("WALL", "ROOF", "FLOOR", "CEILING", "WINDOW")
+    
+    @staticmethod
+    def getClimateZones(cnstrName):
+        """Return climate zones of a construction from the zone code at the end of the name (e.g. 3-5)."""
+        clmZones = []
+        # split by space " "
+        possibleAlt, zoneCode = cnstrName.split(" ")[-2:]
+        clmZoneList = zoneCode.split("-")
+        if len(clmZoneList) != 1:
+            try:
+                clmZoneRange = range(int(clmZoneList[0]), int(clmZoneList[1]) + 1)
+                for clmZone in clmZoneRange: clmZones.append(str(clmZone))
+            except:
+                clmZones = [clmZoneList[0], clmZoneList[1]]
+        else:
+            clmZones = clmZoneList
+        return clmZones
+    
+    def getSearchFacets(self, name, value = None):
+        """Standards, surface types and climate zones of an object for hb_LibrarySearchIndex."""
+        upperName = name.upper()
+        facets = []
+        for standard in self.searchStandards:
+            if upperName.find(standard)!=-1:
+                facets.append(("standard", standard))
+        for surfaceType in self.surfaceTypes:
+            if upperName.find(surfaceType)!=-1:
+                facets.append(("surfaceType", surfaceType))
+        if name.find(" ")!=-1:
+            for clmZone in self.getClimateZones(name):
+                facets.append(("climateZone", clmZone))
+        return facets
+    
+    def getSearchIndexes(self):
+        return [hb_LibrarySearchIndex.getIndex(libName, facetsFunction = self.getSearchFacets) \
+                for libName in self.searchLibraries if sc.sticky.has_key(libName)]
+    
     def searchListByKeyword(self, inputList, keywords):
-        """ search inside a list of strings for keywords """
+        """ search inside a list of strings for keywords
+        
+        Names of Honeybee libraries are looked up in the search indexes and the other
+        strings (e.g. simulation outputs) are searched one by one.
+        """
         
         def checkMultipleKeywords(name, keywordlist):
             for kw in keywordlist:
@@ -3792,22 +6820,53 @@ class EPMaterialAux(object):
         kWords = []
         for kw in keywords:
             kWords.append(kw.strip().upper().split(" "))
-            
+        
+        if len(kWords) == 0 or "*" in keywords:
+            return list(inputList)
+        
+        # names that include all the keywords of each keyword line
+        indexes = self.getSearchIndexes()
+        keywordMatches = []
+        for keyword in kWords:
+            matches = set()
+            for index in indexes:
+                matches.update(index.findAll(keyword))
+            keywordMatches.append(matches)
+        
         selectedItems = []
-        alternateOptions = []
         
         for item in inputList:
-            if len(kWords)!= 0 and not "*" in keywords:
-                for keyword in kWords:
-                    if len(keyword) > 1 and checkMultipleKeywords(item.ToUpper(), keyword):
-                        selectedItems.append(item)
-                    elif len(keyword) == 1 and item.ToUpper().find(keyword[0])!= -1:
+            isIndexed = False
+            for index in indexes:
+                if item in index:
+                    isIndexed = True
+                    break
+            
+            if isIndexed:
+                for matches in keywordMatches:
+                    if item in matches:
                         selectedItems.append(item)
             else:
-                selectedItems.append(item)
+                for keyword in kWords:
+                    if checkMultipleKeywords(item.upper(), keyword):
+                        selectedItems.append(item)
     
         return selectedItems
     
+    def isConstructionInFilter(self, cnstrName, standard, climateZone, surfaceType):
+        if cnstrName.upper().find(standard.upper())!=-1 and cnstrName.upper().find(surfaceType.upper())!=-1:
+            # check for climate zone
+            if climateZone!="":
+                clmZones = self.getClimateZones(cnstrName)
+                if climateZone in clmZones:
+                    return True
+                elif climateZone[0] in clmZones:
+                    # cases like 3a that is included in 3
+                    return True
+            else:
+                return True
+        return False
+    
     def filterMaterials(self, constrList, standard, climateZone, surfaceType, bldgProgram, keywords, sourceComponent):
         hb_EPTypes = EPTypes()
         
@@ -3826,31 +6885,31 @@ class EPMaterialAux(object):
         
         filtConstr =self.searchListByKeyword(constrList, keywords)
         
+        # intersect the facets of the construction library
+        index = hb_LibrarySearchIndex.getIndex("honeybee_constructionLib", facetsFunction = self.getSearchFacets)
+        
+        if standard in self.energyModelingStandards.values():
+            selectedNames = index.getFacet(("standard", standard.upper()))
+        else:
+            selectedNames = index.find(standard)
+        
+        if surfaceType!="":
+            if surfaceType.upper() in self.surfaceTypes:
+                selectedNames = selectedNames & index.getFacet(("surfaceType", surfaceType.upper()))
+            else:
+                selectedNames = selectedNames & index.find(surfaceType)
+        
+        if climateZone!="":
+            # cases like 3a that is included in 3
+            selectedNames = selectedNames & (index.getFacet(("climateZone", climateZone)) | \
+                                             index.getFacet(("climateZone", climateZone[0])))
         
         for cnstrName in filtConstr:
-           if cnstrName.upper().find(standard.upper())!=-1 and cnstrName.upper().find(surfaceType.upper())!=-1:
-                # check for climate zone
-                if climateZone!="":
-                    clmZones = []
-                    # split by space " "
-                    possibleAlt, zoneCode = cnstrName.split(" ")[-2:]
-                    clmZoneList = zoneCode.split("-")
-                    if len(clmZoneList) != 1:
-                        try:
-                            clmZoneRange = range(int(clmZoneList[0]), int(clmZoneList[1]) + 1)
-                            for clmZone in clmZoneRange: clmZones.append(str(clmZone))
-                        except:
-                            clmZones = [clmZoneList[0], clmZoneList[1]]
-                    else:
-                        clmZones = clmZoneList
-                        
-                    if climateZone in clmZones:
-                        selConstr.append(cnstrName)
-                    elif climateZone[0] in clmZones:
-                        # cases like 3a that is included in 3
-                        selConstr.append(cnstrName)
-                else:
+            if cnstrName in index:
+                if cnstrName in selectedNames:
                     selConstr.append(cnstrName)
+            elif self.isConstructionInFilter(cnstrName, standard, climateZone, surfaceType):
+                selConstr.append(cnstrName)
 
         return selConstr
 
@@ -3952,6 +7011,7 @@ class EPMaterialAux(object):
         
         # add name to list
         # sc.sticky [HBLibrarieNames[key]]["List"].append(name)
+        hb_LibrarySearchIndex.updateIndex(HBLibrarieNames[key], name)
         
         return True, name
     
@@ -4183,6 +7243,7 @@ class EPObjectsAux(object):
         
         # add name to list
         #sc.sticky [HBLibrarieNames[key]]["List"].append(name)
+        hb_LibrarySearchIndex.updateIndex(HBLibrarieNames[key], name)
         
         return True, name
     
@@ -4191,20 +7252,13 @@ class EPObjectsAux(object):
         
         objectName = objectName.upper()
         
-        if objectName in sc.sticky ["honeybee_windowMaterialLib"].keys():
-            objectData = sc.sticky ["honeybee_windowMaterialLib"][objectName]
-        elif objectName in sc.sticky ["honeybee_materialLib"].keys():
-            objectData = sc.sticky ["honeybee_materialLib"][objectName]
-        elif objectName in sc.sticky ["honeybee_constructionLib"].keys():
-            objectData = sc.sticky ["honeybee_constructionLib"][objectName]
-        elif objectName in sc.sticky["honeybee_ScheduleLib"].keys():
-            objectData = sc.sticky ["honeybee_ScheduleLib"][objectName]
-        elif objectName in sc.sticky["honeybee_ScheduleTypeLimitsLib"].keys():
-            objectData = sc.sticky ["honeybee_ScheduleTypeLimitsLib"][objectName]
-        elif objectName in sc.sticky["honeybee_WindowPropLib"].keys():
-            objectData = sc.sticky["honeybee_WindowPropLib"][objectName]
-        elif objectName in sc.sticky["honeybee_SpectralDataLib"].keys():
-            objectData = sc.sticky["honeybee_SpectralDataLib"][objectName]
+        for libName in ["honeybee_windowMaterialLib", "honeybee_materialLib", "honeybee_constructionLib", \
+                        "honeybee_ScheduleLib", "honeybee_ScheduleTypeLimitsLib", \
+                        "honeybee_WindowPropLib", "honeybee_SpectralDataLib"]:
+            # dictionary look up. don't create the list of the keys
+            if objectName in sc.sticky[libName]:
+                objectData = sc.sticky[libName][objectName]
+                break
         
         return objectData
     
@@ -4278,25 +7332,270 @@ class EPObjectsAux(object):
             component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warningMsg)
             return
 
+class hb_ScheduleCompiler(object):
+    """
+    Compile EnergyPlus schedules in Honeybee schedule library into annual values.
+    
+    Schedule:Year, Schedule:Week:Daily, Schedule:Day:Interval, Schedule:Day:Hourly,
+    Schedule:Constant and Schedule:Compact are expanded once into a tuple with a value for each
+    timestep of the year (8760 * timestep). Compiled schedules are shared between all the
+    instances and are re-used as long as the library objects that are used in the schedule
+    are not replaced. Until times that don't fall on a timestep are averaged over the timestep
+    except for discrete schedules.
+    
+    Args:
+        timestep: Number of values for each hour.
+        startDayOfTheWeek: Day of the week for January 1st (0: Sunday, 6: Saturday).
+    
+    Usage:
+        compiler = hb_ScheduleCompiler()
+        values = compiler.getValues("Office Occupancy")
+    """
+    
+    CompiledSchedule = namedtuple("CompiledSchedule", "name type typeLimits values dependencies")
+    
+    # shared between all the instances
+    compiledSchedules = {}
+    
+    monthDays = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    weekDays = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
+    
+    def __init__(self, timestep = 1, startDayOfTheWeek = 0):
+        self.timestep = int(timestep)
+        self.startDayOfTheWeek = int(startDayOfTheWeek) % 7
+    
+    @classmethod
+    def getDayOfYear(cls, month, day):
+        return sum(cls.monthDays[:int(month) - 1]) + int(day)
+    
+    @staticmethod
+    def isUpToDate(compiled):
+        # library objects are replaced when they are changed or re-loaded
+        scheduleLib = sc.sticky["honeybee_ScheduleLib"]
+        for name, obj in compiled.dependencies:
+            if scheduleLib.get(name) is not obj: return False
+        return True
+    
+    def getScheduleObject(self, schName, dependencies):
+        """Return type and the list of fields after the name for a schedule in the library."""
+        name = schName.strip().upper()
+        obj = sc.sticky["honeybee_ScheduleLib"].get(name)
+        if obj == None:
+            raise ValueError("Failed to find %s in the Honeybee schedule library."%schName)
+        dependencies.append((name, obj))
+        fields = [obj[count][0] for count in range(1, len(obj))]
+        return obj[0].lower(), fields
+    
+    @staticmethod
+    def getNumericType(typeLimitsName):
+        try:
+            typeLimits = sc.sticky["honeybee_ScheduleTypeLimitsLib"][typeLimitsName.upper()]
+            return typeLimits[3][0].strip().lower()
+        except:
+            return "continuous"
+    
+    def compile(self, schName):
+        """Return CompiledSchedule for a schedule. Values are for each timestep of the year."""
+        key = (schName.strip().upper(), self.timestep, self.startDayOfTheWeek)
+        compiled = self.compiledSchedules.get(key)
+        if compiled != None and self.isUpToDate(compiled):
+            return compiled
+        
+        dependencies = []
+        scheduleType, fields = self.getScheduleObject(schName, dependencies)
+        
+        if scheduleType == "schedule:year":
+            values = self.compileYear(fields, dependencies)
+        elif scheduleType == "schedule:compact":
+            values = self.compileCompact(fields)
+        elif scheduleType == "schedule:constant":
+            values = [float(fields[1])] * (8760 * self.timestep)
+        elif scheduleType == "schedule:week:daily":
+            values = self.expandWeek(self.compileWeek(fields, dependencies, {}), 1, 365)
+        elif scheduleType.startswith("schedule:day"):
+            values = self.compileDay(scheduleType, fields) * 365
+        else:
+            raise ValueError("Honeybee doesn't support %s currently."%scheduleType)
+        
+        typeLimits = fields[0] if scheduleType != "schedule:week:daily" else ""
+        compiled = self.CompiledSchedule(key[0], scheduleType, typeLimits, tuple(values), tuple(dependencies))
+        self.compiledSchedules[key] = compiled
+        return compiled
+    
+    def getValues(self, schName):
+        return self.compile(schName).values
+    
+    def getDayValues(self, schName):
+        """Values for a Schedule:Day object for each timestep of the day."""
+        scheduleType, fields = self.getScheduleObject(schName, [])
+        return self.compileDay(scheduleType, fields)
+    
+    def getWeekValues(self, schName):
+        """Values for a Schedule:Week:Daily object. A list of 7 days starting from Sunday."""
+        scheduleType, fields = self.getScheduleObject(schName, [])
+        return self.compileWeek(fields, [], {})
+    
+    def dayProfile(self, untilValues, numericType = "continuous"):
+        """Convert a list of (until minute, value) to the values of each timestep of the day."""
+        slotLength = 60.0 / self.timestep
+        segments = []
+        segmentStart = 0
+        for until, value in untilValues:
+            segments.append((segmentStart, until, value))
+            segmentStart = until
+        
+        profile = []
+        for slot in xrange(24 * self.timestep):
+            slotStart = slot * slotLength
+            slotEnd = slotStart + slotLength
+            if numericType == "discrete":
+                # use the value at the start of the timestep
+                value = 0
+                for start, end, segmentValue in segments:
+                    if start <= slotStart < end:
+                        value = segmentValue
+                        break
+                profile.append(value)
+            else:
+                total = 0
+                value = None
+                for start, end, segmentValue in segments:
+                    overlap = min(end, slotEnd) - max(start, slotStart)
+                    if overlap >= slotLength:
+                        # keep the exact value if the timestep is in one segment
+                        value = segmentValue
+                        break
+                    elif overlap > 0:
+                        total += overlap * segmentValue
+                if value == None: value = total / slotLength
+                profile.append(value)
+        return profile
+    
+    @staticmethod
+    def getMinutes(timeStr):
+        hour, minute = timeStr.strip().split(":")[-2:]
+        return int(hour) * 60 + int(minute)
+    
+    def compileDay(self, scheduleType, fields):
+        numericType = self.getNumericType(fields[0])
+        if scheduleType == "schedule:day:interval":
+            # type limits, interpolate, time 1, value 1, ...
+            firstField = 1 if ":" in fields[1] else 2
+            untilValues = [(self.getMinutes(fields[count]), float(fields[count + 1])) \
+                           for count in range(firstField, len(fields) - 1, 2)]
+        elif scheduleType == "schedule:day:hourly":
+            untilValues = [((hour + 1) * 60, float(value)) for hour, value in enumerate(fields[1:25])]
+        else:
+            raise ValueError("Honeybee doesn't support %s currently."%scheduleType)
+        
+        return self.dayProfile(untilValues, numericType)
+    
+    def compileWeek(self, fields, dependencies, compiledDays):
+        """Return day profiles from Sunday to Saturday."""
+        week = []
+        for daySchName in fields[:7]:
+            daySchName = daySchName.strip().upper()
+            if daySchName not in compiledDays:
+                scheduleType, dayFields = self.getScheduleObject(daySchName, dependencies)
+                compiledDays[daySchName] = self.compileDay(scheduleType, dayFields)
+            week.append(compiledDays[daySchName])
+        return week
+    
+    def expandWeek(self, week, startDay, endDay, values = None):
+        """Put the days of the week in the year from startDay to endDay (1-365)."""
+        dayLength = 24 * self.timestep
+        if values == None: values = [0] * (365 * dayLength)
+        for day in xrange(startDay - 1, endDay):
+            values[day * dayLength: (day + 1) * dayLength] = week[(self.startDayOfTheWeek + day) % 7]
+        return values
+    
+    def compileYear(self, fields, dependencies):
+        # type limits, week name, start month, start day, end month, end day, ...
+        values = [0] * (8760 * self.timestep)
+        compiledDays = {}
+        for count in range(1, len(fields) - 4, 5):
+            weekSchName = fields[count]
+            startDay = self.getDayOfYear(fields[count + 1], fields[count + 2])
+            endDay = self.getDayOfYear(fields[count + 3], fields[count + 4])
+            
+            scheduleType, weekFields = self.getScheduleObject(weekSchName, dependencies)
+            week = self.compileWeek(weekFields, dependencies, compiledDays)
+            self.expandWeek(week, startDay, endDay, values)
+        
+        return values
+    
+    def getCompactDays(self, dayTypes, assignedDays):
+        days = set()
+        for dayType in dayTypes:
+            if dayType == "alldays": days.update(range(7))
+            elif dayType == "weekdays": days.update(range(1, 6))
+            elif dayType == "weekends": days.update([0, 6])
+            elif dayType == "allotherdays": days.update(set(range(7)) - assignedDays)
+            elif dayType in self.weekDays: days.add(self.weekDays.index(dayType))
+            # holidays, design days and custom days are not part of the annual values
+        return days
+    
+    def compileCompact(self, fields):
+        numericType = self.getNumericType(fields[0])
+        
+        # collect (end day, [(day types, [(until, value)])]) for each Through
+        periods = []
+        untilMinute = None
+        for field in fields[1:]:
+            field = field.strip()
+            fieldLower = field.lower()
+            if fieldLower.startswith("through"):
+                month, day = field.split(":", 1)[1].strip().split("/")
+                periods.append((self.getDayOfYear(month, day), []))
+            elif fieldLower.startswith("for"):
+                dayTypes = fieldLower.split(":", 1)[1].replace(",", " ").split()
+                periods[-1][1].append((dayTypes, []))
+            elif fieldLower.startswith("interpolate"):
+                continue
+            elif fieldLower.startswith("until"):
+                untilMinute = self.getMinutes(field.split(":", 1)[1])
+            elif field:
+                periods[-1][1][-1][1].append((untilMinute, float(field)))
+        
+        values = [0] * (8760 * self.timestep)
+        startDay = 1
+        for endDay, dayBlocks in periods:
+            week = [[0] * (24 * self.timestep)] * 7
+            assignedDays = set()
+            for dayTypes, untilValues in dayBlocks:
+                days = self.getCompactDays(dayTypes, assignedDays) - assignedDays
+                profile = self.dayProfile(untilValues, numericType)
+                for day in days: week[day] = profile
+                assignedDays.update(days)
+            self.expandWeek(week, startDay, endDay, values)
+            startDay = endDay + 1
+        
+        return values
+
+
 class ReadEPSchedules(object):
     
     def __init__(self, schName, startDayOfTheWeek):
         self.hb_EPScheduleAUX = sc.sticky["honeybee_EPScheduleAUX"]()
         self.hb_EPObjectsAUX = sc.sticky["honeybee_EPObjectsAUX"]()
         self.lb_preparation = sc.sticky["ladybug_Preparation"]()
+        self.compiler = hb_ScheduleCompiler(1, startDayOfTheWeek)
         self.schName = schName
         self.startDayOfTheWeek = startDayOfTheWeek
         self.count = 0
         self.startHOY = 1
         self.endHOY = 24
         self.unit = "unknown"
-        self.comapctKeywords = ['Weekdays', 'Weekends', 'Alldays', 'AllOtherDays', 'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
     
     def getScheduleTypeLimitsData(self, schName):
         
         if schName == None: schName = self.schName
             
         schedule, comments = self.hb_EPScheduleAUX.getScheduleTypeLimitsDataByName(schName.upper(), ghenv.Component)
+        # type limits such as "Any Number" have no limits or numeric type
+        if not schedule or len(schedule) < 4:
+            return None, None, "unknown", "unknown"
+        
         try:
             lowerLimit, upperLimit, numericType, unitType = schedule[1:]
         except:
@@ -4316,27 +7615,9 @@ class ReadEPSchedules(object):
             schName = self.schName
             
         values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
-        typeLimitName = values[1]
-        lowerLimit, upperLimit, numericType, unitType = \
-                self.getScheduleTypeLimitsData(typeLimitName)
-                
-        numberOfDaySch = int((len(values) - 3) /2)
-        
-        hourlyValues = range(24)
-        startHour = 0
-        for i in range(numberOfDaySch):
-            value = float(values[2 * i + 4])
-            untilTime = map(int, values[2 * i + 3].split(":"))
-            endHour = int(untilTime[0] +  untilTime[1]/60)
-            for hour in range(startHour, endHour):
-                hourlyValues[hour] = value
-            
-            startHour = endHour
+        self.getScheduleTypeLimitsData(values[1])
         
-        if numericType.strip().lower() == "district":
-            hourlyValues = map(int, hourlyValues)
-            
-        return hourlyValues
+        return self.compiler.getDayValues(schName)
     
     
     def getWeeklyEPScheduleValues(self, schName = None):
@@ -4358,23 +7639,11 @@ class ReadEPSchedules(object):
             # set the last date of the schedule to one week
             self.endHOY = 24 * 7
         
-        sundaySchedule = self.getScheduleValues(values[1])
-        mondaySchedule = self.getScheduleValues(values[2])
-        tuesdaySchedule = self.getScheduleValues(values[3])
-        wednesdaySchedule = self.getScheduleValues(values[4])
-        thursdaySchedule = self.getScheduleValues(values[5])
-        fridaySchedule = self.getScheduleValues(values[6])
-        saturdaySchedule = self.getScheduleValues(values[7])
+        # update the unit based on the day schedule
+        daySchedule, comments = self.hb_EPScheduleAUX.getScheduleDataByName(values[1].upper(), ghenv.Component)
+        self.getScheduleTypeLimitsData(daySchedule[1])
         
-        holidaySchedule = self.getScheduleValues(values[8])
-        summerDesignDaySchedule = self.getScheduleValues(values[9])
-        winterDesignDaySchedule = self.getScheduleValues(values[10])
-        customDay1Schedule = self.getScheduleValues(values[11])
-        customDay2Schedule = self.getScheduleValues(values[12])
-        
-        hourlyValues = [sundaySchedule, mondaySchedule, tuesdaySchedule, \
-                       wednesdaySchedule, thursdaySchedule, fridaySchedule, \
-                       saturdaySchedule]
+        hourlyValues = self.compiler.getWeekValues(schName)
         
         hourlyValues = hourlyValues[self.startDayOfTheWeek:] + \
                        hourlyValues[:self.startDayOfTheWeek]
@@ -4382,7 +7651,7 @@ class ReadEPSchedules(object):
         return hourlyValues
     
     
-    def getConstantEPScheduleValues(self, schName):
+    def getConstantEPScheduleValues(self, schName = None):
         """
         'Schedule:Constant'
         ['Schedule Type', 'Schedule Type Limits Name', 'Hourly Value']
@@ -4392,105 +7661,26 @@ class ReadEPSchedules(object):
             schName = self.schName
             
         values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
-        typeLimitName = values[1]
-        lowerLimit, upperLimit, numericType, unitType = \
-                self.getScheduleTypeLimitsData(typeLimitName)
+        self.getScheduleTypeLimitsData(values[1])
         
-        hourlyValues = [float(values[2])]
+        self.endHOY = 8760
         
-        if numericType.strip().lower() == "district":
-            hourlyValues = map(int, hourlyValues)
-        return scheduleConstant
+        return list(self.compiler.getValues(schName))
     
     
-    def getCompactEPScheduleValues(self, schName):
+    def getCompactEPScheduleValues(self, schName = None):
         
         if schName == None: schName = self.schName
         
         values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
-        typeLimitName = values[1]
-        lowerLimit, upperLimit, numericType, unitType = \
-                self.getScheduleTypeLimitsData(typeLimitName)
-        
-        #Separate out the different periods.
-        totalValues = []
-        periodValues = []
-        headerDone = False
-        for val in values:
-            newPeriod = False
-            for word in self.comapctKeywords:
-                if word in val: newPeriod = True
-            if newPeriod == True:
-                if headerDone == True:
-                    totalValues.append(periodValues)
-                periodValues = [val]
-                headerDone = True
-            elif headerDone == True:
-                periodValues.append(val)
-        totalValues.append(periodValues)
-        
-        #For each day period, construct a day schedule.
-        dayType = []
-        dayValues = []
-        for dayVals in totalValues:
-            dayType.append(dayVals[0].title().split('For: ')[-1])
-            numberOfDaySch = int((len(dayVals) - 1) /2)
-            
-            hourlyValues = range(24)
-            startHour = 0
-            for i in range(numberOfDaySch):
-                value = float(dayVals[2 * i + 2])
-                untilTime = map(int, dayVals[2 * i + 1].split(":")[1:])
-                endHour = int(untilTime[0] +  untilTime[1]/60)
-                for hour in range(startHour, endHour):
-                    hourlyValues[hour] = value
-                
-                startHour = endHour
-            dayValues.append(hourlyValues)
-        
-        #Construct a week schedule from the day schedules.
-        #Map the dayTypes to the days of the week.
-        ['Weekdays', 'Weekends', 'Alldays', 'AllOtherDays', 'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-        weekVals = [-1, -1, -1, -1, -1, -1, -1]
-        for typeCount, type in enumerate(dayType):
-            if type == 'Alldays':
-                for count, val in enumerate(weekVals):
-                    weekVals[count] = typeCount
-            elif type == 'Weekdays':
-                for count, val in enumerate(weekVals):
-                    if count < 6 and count != 0: weekVals[count] = typeCount
-            elif type == 'Weekends':
-                weekVals[0] = typeCount
-                weekVals[-1] = typeCount
-            elif type == 'Sunday': weekVals[0] = typeCount
-            elif type == 'Monday': weekVals[1] = typeCount
-            elif type == 'Tuesday': weekVals[2] = typeCount
-            elif type == 'Wednesday': weekVals[3] = typeCount
-            elif type == 'Thursday': weekVals[4] = typeCount
-            elif type == 'Friday': weekVals[5] = typeCount
-            elif type == 'Saturday': weekVals[6] = typeCount
-            elif type == 'Allotherdays':
-                for count, val in enumerate(weekVals):
-                    if val == -1: weekVals[count] = typeCount
-        
-        #Turn the week schedule into a year schedule.
-        hourlyValues = []
-        dayVals = []
-        dayofWeek = -1
-        for day in range(365):
-            if dayofWeek == 6: dayofWeek = 0
-            else: dayofWeek += 1
-            dayVals.append(weekVals[dayofWeek])
-        for day in dayVals:
-            hourlyValues.extend(dayValues[day])
-        
-        print hourlyValues
-        return hourlyValues
+        self.getScheduleTypeLimitsData(values[1])
+        
+        self.endHOY = 8760
+        
+        return list(self.compiler.getValues(schName))
     
     
     def getYearlyEPScheduleValues(self, schName = None):
-        # place holder for 365 days
-        hourlyValues = range(365)
         
         # update last day of schedule
         self.endHOY = 8760
@@ -4499,23 +7689,33 @@ class ReadEPSchedules(object):
             schName = self.schName
         
         values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
+        self.getScheduleTypeLimitsData(values[1])
+        
+        annualValues = self.compiler.getValues(schName)
+        
+        # 365 lists of 24 values
+        return [list(annualValues[day * 24: (day + 1) * 24]) for day in xrange(365)]
+    
+    
+    def getAnnualValues(self, schName = None):
+        """Return 8760 hourly values for any type of schedule."""
+        if schName == None:
+            schName = self.schName
+        
+        if not self.hb_EPObjectsAUX.isSchedule(schName): return []
+        
+        values, comments = self.hb_EPScheduleAUX.getScheduleDataByName(schName.upper(), ghenv.Component)
+        if self.count == 0:
+            self.schType = values[0].lower()
+        self.count += 1
         
-        # generate weekly schedules
-        numOfWeeklySchedules = int((len(values)-2)/5)
+        if self.schType != "schedule:week:daily" and values[1].strip():
+            self.getScheduleTypeLimitsData(values[1])
+        
+        self.startHOY = 1
+        self.endHOY = 8760
         
-        for i in range(numOfWeeklySchedules):
-            weekDayScheduleName = values[5 * i + 2]
-            
-            startDay = int(self.lb_preparation.getJD(int(values[5 * i + 3]), int(values[5 * i + 4])))
-            endDay = int(self.lb_preparation.getJD(int(values[5 * i + 5]), int(values[5 * i + 6])))
-            
-            # 7 list for 7 days of the week
-            hourlyValuesForTheWeek = self.getScheduleValues(weekDayScheduleName)
-            
-            for day in range(startDay-1, endDay):
-                hourlyValues[day] = hourlyValuesForTheWeek[day%7]
-            
-        return hourlyValues
+        return list(self.compiler.getValues(schName))
     
     
     def getScheduleValues(self, schName = None):
@@ -4640,9 +7840,18 @@ class materialLibrary(object):
                    3: 'HOTEL_SCH'}
 
 class BuildingProgramsLib(object):
+    # program tables are created for the first instance and are shared with the rest
+    __programs = None
+    
     def __init__(self):
+        if BuildingProgramsLib.__programs == None:
+            BuildingProgramsLib.__programs = self.createPrograms()
+        self.bldgPrograms, self.zonePrograms = BuildingProgramsLib.__programs
+    
+    @staticmethod
+    def createPrograms():
         
-        self.bldgPrograms = {
+        bldgPrograms = {
                 0 : 'Office',
                 1 : 'Retail',
                 2 : 'MidriseApartment',
@@ -4670,7 +7879,7 @@ class BuildingProgramsLib(object):
                 'FullServiceRestaurant' : 'FullServiceRestaurant',
                 'QuickServiceRestaurant' : 'QuickServiceRestaurant'}
         
-        self.zonePrograms = { "MidriseApartment" : {
+        zonePrograms = { "MidriseApartment" : {
                                             0: "Apartment",
                                             1: "Office",
                                             2: "Corridor",
@@ -4818,6 +8027,8 @@ class BuildingProgramsLib(object):
                                     1: "Dining"
                                     }
                     }
+        
+        return bldgPrograms, zonePrograms
 
 class EPSurfaceLib(object):
     # I think I can remove this now
@@ -4860,10 +8071,68 @@ class EPSurfaceLib(object):
                   4:'NoWind',
                   5:'WindExposed'}
 
+class hb_LazyAttribute(object):
+    """
+    Class attribute for optional instance attributes that are created on the first use.
+    
+    Most Honeybee objects never use their optional lists (e.g. natural ventilation, air
+    mixing or PV generators) so the value is only created and added to the instance when
+    it is read for the first time. Assigning a value works the same as a normal attribute.
+    
+    Usage:
+        class EPZone(object):
+            natVentType = hb_LazyAttribute(list)
+    """
+    
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = None
+    
+    def findName(self, owner):
+        for cls in owner.__mro__:
+            for name, value in cls.__dict__.iteritems():
+                if value is self: return name
+    
+    def __get__(self, instance, owner):
+        if instance is None: return self
+        if self.name == None: self.name = self.findName(owner)
+        value = self.factory()
+        instance.__dict__[self.name] = value
+        return value
+    
+    @staticmethod
+    def reset(instance, name):
+        """Remove the value so a new one will be created on the next use."""
+        instance.__dict__.pop(name, None)
+
 class EPZone(object):
     """This calss represents a honeybee zone that will be used for energy and daylighting
     simulatios"""
     
+    HVACSystemTuple = namedtuple('HVACSystem', 'GroupID Index airDetails heatingDetails coolingDetails')
+    
+    # optional lists are only created for the zones that use them
+    mixAirZoneList = hb_LazyAttribute(list)
+    mixAirFlowList = hb_LazyAttribute(list)
+    mixAirFlowSched = hb_LazyAttribute(list)
+    natVentType = hb_LazyAttribute(list)
+    natVentMinIndoorTemp = hb_LazyAttribute(list)
+    natVentMaxIndoorTemp = hb_LazyAttribute(list)
+    natVentMinOutdoorTemp = hb_LazyAttribute(list)
+    natVentMaxOutdoorTemp = hb_LazyAttribute(list)
+    windowOpeningArea = hb_LazyAttribute(list)
+    windowHeightDiff = hb_LazyAttribute(list)
+    natVentSchedule = hb_LazyAttribute(list)
+    natVentWindDischarge = hb_LazyAttribute(list)
+    natVentStackDischarge = hb_LazyAttribute(list)
+    windowAngle = hb_LazyAttribute(list)
+    fanFlow = hb_LazyAttribute(list)
+    FanEfficiency = hb_LazyAttribute(list)
+    FanPressure = hb_LazyAttribute(list)
+    internalMassNames = hb_LazyAttribute(list)
+    internalMassSrfAreas = hb_LazyAttribute(list)
+    internalMassConstructions = hb_LazyAttribute(list)
+    
     def __init__(self, zoneBrep, zoneID, zoneName, program = [None, None], isConditioned = True):
         self.north = 0
         self.objectType = "HBZone"
@@ -4878,32 +8147,10 @@ class EPZone(object):
         
         # Air Mixing with Adjacent Zones
         self.mixAir = False
-        self.mixAirZoneList = []
-        self.mixAirFlowList = []
         self.mixAirFlowRate = 0.0963
-        self.mixAirFlowSched = []
         
         # Natural Ventilation Properties
         self.natVent = False
-        self.natVentType = []
-        self.natVentMinIndoorTemp = []
-        self.natVentMaxIndoorTemp = []
-        self.natVentMinOutdoorTemp = []
-        self.natVentMaxOutdoorTemp = []
-        self.windowOpeningArea = []
-        self.windowHeightDiff = []
-        self.natVentSchedule = []
-        self.natVentWindDischarge = []
-        self.natVentStackDischarge = []
-        self.windowAngle = []
-        self.fanFlow = []
-        self.FanEfficiency = []
-        self.FanPressure = []
-        
-        # Zone Internal Masses (or Furniture)
-        self.internalMassNames = []
-        self.internalMassSrfAreas = []
-        self.internalMassConstructions = []
         
         # Zone Surfaces
         self.surfaces = []
@@ -4949,7 +8196,7 @@ class EPZone(object):
         self.assignLoadsBasedOnProgram()
         
         # Assign a default HVAC System.
-        HVACSystem = namedtuple('HVACSystem', 'GroupID Index airDetails heatingDetails coolingDetails')
+        HVACSystem = self.HVACSystemTuple
         if isConditioned: self.HVACSystem = HVACSystem(GroupID="GroupI", Index=0, airDetails=None, heatingDetails=None, coolingDetails=None) # assign ideal loads as default
         else: self.HVACSystem = HVACSystem(GroupID="NoHVAC", Index=-1, airDetails=None, heatingDetails=None, coolingDetails=None)# no system
         
@@ -4977,6 +8224,8 @@ class EPZone(object):
     
     def transform(self, transform, clearSurfacesBC = True, flip = False):
         self.name += "_t"
+        # geometry can be shared with the object in the hive so transform a copy
+        self.geometry = self.geometry.DuplicateBrep()
         self.geometry.Transform(transform)
         self.cenPt.Transform(transform)
         for surface in self.surfaces:
@@ -4989,9 +8238,8 @@ class EPZone(object):
         
         openStudioStandardLib = sc.sticky ["honeybee_OpenStudioStandardsFile"]
         
-        try:
-            schedulesAndLoads = openStudioStandardLib['space_types']['90.1-2007']['ClimateZone 1-8'][self.bldgProgram][self.zoneProgram]
-        except:
+        spaceType = openStudioStandardLib.getSpaceType(self.bldgProgram, self.zoneProgram)
+        if spaceType == None:
             msg = "Either your input for bldgProgram > [" + self.bldgProgram + "] or " + \
                   "the input for zoneProgram > [" + self.zoneProgram + "] is not valid.\n" + \
                   "Use ListSpacePrograms component to find the available programs."
@@ -5000,13 +8248,13 @@ class EPZone(object):
                 component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
             return
         
-        self.occupancySchedule = schedulesAndLoads['occupancy_sch']
-        self.occupancyActivitySch = schedulesAndLoads['occupancy_activity_sch']
-        self.heatingSetPtSchedule = schedulesAndLoads['heating_setpoint_sch']
-        self.coolingSetPtSchedule = schedulesAndLoads['cooling_setpoint_sch']
-        self.lightingSchedule = schedulesAndLoads['lighting_sch']
-        self.equipmentSchedule = schedulesAndLoads['elec_equip_sch']
-        self.infiltrationSchedule = schedulesAndLoads['infiltration_sch']
+        self.occupancySchedule = spaceType['occupancySchedule']
+        self.occupancyActivitySch = spaceType['occupancyActivitySch']
+        self.heatingSetPtSchedule = spaceType['heatingSetPtSchedule']
+        self.coolingSetPtSchedule = spaceType['coolingSetPtSchedule']
+        self.lightingSchedule = spaceType['lightingSchedule']
+        self.equipmentSchedule = spaceType['equipmentSchedule']
+        self.infiltrationSchedule = spaceType['infiltrationSchedule']
         
         # find all the patameters and assign them to 
         self.isSchedulesAssigned = True
@@ -5018,10 +8266,8 @@ class EPZone(object):
         
         openStudioStandardLib = sc.sticky ["honeybee_OpenStudioStandardsFile"]
         
-        try:
-            schedulesAndLoads = openStudioStandardLib['space_types']['90.1-2007']['ClimateZone 1-8'][self.bldgProgram][self.zoneProgram]
-            
-        except:
+        spaceType = openStudioStandardLib.getSpaceType(self.bldgProgram, self.zoneProgram)
+        if spaceType == None:
             msg = "Either your input for bldgProgram > [" + self.bldgProgram + "] or " + \
                   "the input for zoneProgram > [" + self.zoneProgram + "] is not valid.\n" + \
                   "Use ListSpacePrograms component to find the available programs."
@@ -5030,13 +8276,13 @@ class EPZone(object):
                 component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, msg)
             return
             
-        # numbers in OpenStudio standard library are in IP and I have to convert them to SI!
-        self.equipmentLoadPerArea = schedulesAndLoads['elec_equip_per_area'] * 10.763961 #Per ft^2 to Per m^2
-        self.infiltrationRatePerArea = schedulesAndLoads['infiltration_per_area_ext'] * 0.00508001 #1 ft3/min.m2 = 5.08001016E-03 m3/s.m2
-        self.lightingDensityPerArea = schedulesAndLoads['lighting_w_per_area'] * 10.763961 #Per ft^2 to Per m^2
-        self.numOfPeoplePerArea = schedulesAndLoads[ 'occupancy_per_area'] * 10.763961 /1000 #Per 1000 ft^2 to Per m^2
-        self.ventilationPerArea = schedulesAndLoads['ventilation_per_area'] * 0.00508001 #1 ft3/min.m2 = 5.08001016E-03 m3/s.m2
-        self.ventilationPerPerson = schedulesAndLoads['ventilation_per_person'] * 0.0004719  #1 ft3/min.perosn = 4.71944743E-04 m3/s.person
+        # loads are converted from IP to SI when the library is loaded
+        self.equipmentLoadPerArea = spaceType['equipmentLoadPerArea']
+        self.infiltrationRatePerArea = spaceType['infiltrationRatePerArea']
+        self.lightingDensityPerArea = spaceType['lightingDensityPerArea']
+        self.numOfPeoplePerArea = spaceType['numOfPeoplePerArea']
+        self.ventilationPerArea = spaceType['ventilationPerArea']
+        self.ventilationPerPerson = spaceType['ventilationPerPerson']
         
         self.isLoadsAssigned = True
     
@@ -5113,15 +8359,19 @@ class EPZone(object):
                 if cenpt == HBSrf.cenPt:
                     if nVecs[count] != HBSrf.normalVector:
                         print "Normal direction for " + HBSrf.name + " is fixed by Honeybee!"
+                        HBSrf.geometry = HBSrf.geometry.DuplicateBrep()
                         HBSrf.geometry.Flip()
                         HBSrf.normalVector.Reverse()
                         HBSrf.basePlane.Flip()
-                        try: HBSrf.punchedGeometry.Flip()
+                        try:
+                            HBSrf.punchedGeometry = HBSrf.punchedGeometry.DuplicateBrep()
+                            HBSrf.punchedGeometry.Flip()
                         except: pass
                         if HBSrf.hasChild and HBSrf.isPlanar:
                             for childSrf in HBSrf.childSrfs:
                                 if childSrf.normalVector != nVecs[count]:
                                     print "Normal direction for " + childSrf.name + " is fixed by Honeybee!"
+                                    childSrf.geometry = childSrf.geometry.DuplicateBrep()
                                     childSrf.geometry.Flip()
                                     childSrf.normalVector.Reverse()
                                     childSrf.basePlane.Flip()
@@ -5135,6 +8385,7 @@ class EPZone(object):
                                 vecAngleDiff = math.degrees(rc.Geometry.Vector3d.VectorAngle(nVecs[count], childSrf.normalVector))
                                 if vecAngleDiff > 45:
                                     print "Normal direction for " + childSrf.name + " is fixed by Honeybee!"
+                                    childSrf.geometry = childSrf.geometry.DuplicateBrep()
                                     childSrf.geometry.Flip()
                                     childSrf.normalVector.Reverse()
         
@@ -5851,6 +9102,97 @@ class hb_reEvaluateHBZones(object):
 
 class hb_EPSurface(object):
     
+    # 4 represents an Air Wall
+    srfType = {0:'WALL',
+       0.5: 'UndergroundWall',
+       1:'ROOF',
+       1.5: 'UndergroundCeiling',
+       2:'FLOOR',
+       2.25: 'UndergroundSlab',
+       2.5: 'SlabOnGrade',
+       2.75: 'ExposedFloor',
+       3:'CEILING',
+       4:'AIRWALL',
+       5:'WINDOW',
+       6:'SHADING',
+       'WALL': 'WALL',
+       'ROOF':'ROOF',
+       'FLOOR': 'FLOOR',
+       'CEILING': 'CEILING',
+       'WINDOW':'WINDOW',
+       'SHADING': 'SHADING'}
+       
+    cnstrSet = {0:'Exterior Wall',
+            0.5: 'Exterior Wall',
+            1: 'Exterior Roof',
+            1.5: 'Exterior Roof',
+            2:'Interior Floor',
+            2.25: 'Exterior Floor',
+            2.5: 'Exterior Floor',
+            2.75: 'Exterior Floor',
+            3:'Interior Ceiling',
+            4:'Air Wall',
+            5:'Exterior Window',
+            6:'Interior Wall'}
+    
+    intCnstrSet = {
+            0:'Interior Wall',
+            0.5: 'Exterior Wall',
+            1:'Exterior Roof',
+            1.5:'Exterior Roof',
+            2:'Interior Floor',
+            2.25: 'Exterior Floor',
+            2.5: 'Exterior Floor',
+            2.75: 'Exterior Floor',
+            3:'Interior Ceiling',
+            4:'Air Wall',
+            5:'Interior Window',
+            6:'Interior Wall'}
+    
+    srfBC = {0:'Outdoors',
+                 0.5: 'ground',
+                 1:'Outdoors',
+                 1.5: 'ground',
+                 2: 'outdoors', # this will be changed to surface once solveAdjacency is used 
+                 2.25: 'ground',
+                 2.5: 'ground',
+                 2.75: 'outdoors',
+                 3: 'outdoors', # this will be changed to surface once solveAdjacency is used 
+                 4: 'surface',
+                 5: 'Outdoors',
+                 6: 'surface'}
+     
+    srfSunExposure = {0:'SunExposed',
+                 0.5:'NoSun',
+                 1:'SunExposed',
+                 1.5:'NoSun', 
+                 2:'NoSun',
+                 2.25: 'NoSun',
+                 2.5: 'NoSun',
+                 2.75: 'SunExposed',
+                 3:'NoSun',
+                 4:'NoSun',
+                 6: 'NoSun'}
+         
+    srfWindExposure = {0:'WindExposed',
+                 0.5:'NoWind',
+                 1:'WindExposed',
+                 1.5:'NoWind',
+                 2:'NoWind',
+                 2.25:'NoWind',
+                 2.5:'NoWind',
+                 2.75:'WindExposed',
+                 3:'NoWind',
+                 4:'NoWind',
+                 6:'NoWind'}
+    
+    # optional attributes are only created for the surfaces that use them
+    meshedFace = hb_LazyAttribute(rc.Geometry.Mesh)
+    # Special attribute for shading control on inidivdual windows that influences the zone properties
+    shdCntrlZoneInstructs = hb_LazyAttribute(list)
+    # PV - A Honeybee surface can hold one PV generator
+    PVgenlist = hb_LazyAttribute(list)
+    
     def __init__(self, surface, srfNumber, srfID, *arg):
         """EP surface Class
             surface: surface geometry as a Brep
@@ -5869,7 +9211,6 @@ class hb_EPSurface(object):
         
         self.isPlanar = self.checkPlanarity()
         self.hasInternalEdge = self.checkForInternalEdge()
-        self.meshedFace = rc.Geometry.Mesh()
         self.RadMaterial = None
         self.EPConstruction = None # this gets overwritten below
         
@@ -5881,101 +9222,10 @@ class hb_EPSurface(object):
         self.srfTypeByUser = False
         self.srfBCByUser = False
         
-        # Special attribute for shading control on inidivdual windows that influences the zone properties
-        self.shdCntrlZoneInstructs = []
-        
-        # PV - A Honeybee surface can hold one PV generator
-        
-        self.PVgenlist = []
-        
         # Does this Honeybee surface contain a PV generator?
         
         self.containsPVgen = False
         
-        # 4 represents an Air Wall
-        self.srfType = {0:'WALL',
-           0.5: 'UndergroundWall',
-           1:'ROOF',
-           1.5: 'UndergroundCeiling',
-           2:'FLOOR',
-           2.25: 'UndergroundSlab',
-           2.5: 'SlabOnGrade',
-           2.75: 'ExposedFloor',
-           3:'CEILING',
-           4:'AIRWALL',
-           5:'WINDOW',
-           6:'SHADING',
-           'WALL': 'WALL',
-           'ROOF':'ROOF',
-           'FLOOR': 'FLOOR',
-           'CEILING': 'CEILING',
-           'WINDOW':'WINDOW',
-           'SHADING': 'SHADING'}
-           
-        self.cnstrSet = {0:'Exterior Wall',
-                0.5: 'Exterior Wall',
-                1: 'Exterior Roof',
-                1.5: 'Exterior Roof',
-                2:'Interior Floor',
-                2.25: 'Exterior Floor',
-                2.5: 'Exterior Floor',
-                2.75: 'Exterior Floor',
-                3:'Interior Ceiling',
-                4:'Air Wall',
-                5:'Exterior Window',
-                6:'Interior Wall'}
-        
-        self.intCnstrSet = {
-                0:'Interior Wall',
-                0.5: 'Exterior Wall',
-                1:'Exterior Roof',
-                1.5:'Exterior Roof',
-                2:'Interior Floor',
-                2.25: 'Exterior Floor',
-                2.5: 'Exterior Floor',
-                2.75: 'Exterior Floor',
-                3:'Interior Ceiling',
-                4:'Air Wall',
-                5:'Interior Window',
-                6:'Interior Wall'}
-        
-        self.srfBC = {0:'Outdoors',
-                     0.5: 'ground',
-                     1:'Outdoors',
-                     1.5: 'ground',
-                     2: 'outdoors', # this will be changed to surface once solveAdjacency is used 
-                     2.25: 'ground',
-                     2.5: 'ground',
-                     2.75: 'outdoors',
-                     3: 'outdoors', # this will be changed to surface once solveAdjacency is used 
-                     4: 'surface',
-                     5: 'Outdoors',
-                     6: 'surface'}
-         
-        self.srfSunExposure = {0:'SunExposed',
-                     0.5:'NoSun',
-                     1:'SunExposed',
-                     1.5:'NoSun', 
-                     2:'NoSun',
-                     2.25: 'NoSun',
-                     2.5: 'NoSun',
-                     2.75: 'SunExposed',
-                     3:'NoSun',
-                     4:'NoSun',
-                     6: 'NoSun'}
-             
-        self.srfWindExposure = {0:'WindExposed',
-                     0.5:'NoWind',
-                     1:'WindExposed',
-                     1.5:'NoWind',
-                     2:'NoWind',
-                     2.25:'NoWind',
-                     2.5:'NoWind',
-                     2.75:'WindExposed',
-                     3:'NoWind',
-                     4:'NoWind',
-                     6:'NoWind'}
-        
         self.numOfVertices = 'autocalculate'
         
         if len(arg) == 0:
@@ -6304,14 +9554,11 @@ class hb_EPSurface(object):
         #print self.meshedFace.Faces.Count
     
     def disposeCurrentMeshes(self):
-        if self.meshedFace.Faces.Count>0:
-            self.meshedFace.Dispose()
-            self.meshedFace = rc.Geometry.Mesh()
+        # meshes can be shared with the object in the hive so only remove them
+        hb_LazyAttribute.reset(self, "meshedFace")
         if self.hasChild:
             for fenSrf in self.childSrfs:
-                if fenSrf.meshedFace.Faces.Count>0:
-                    fenSrf.meshedFace.Dispose()
-                    fenSrf.meshedFace = rc.Geometry.Mesh()
+                hb_LazyAttribute.reset(fenSrf, "meshedFace")
     
     def getSrfCenPtandNormalAlternate(self):
         brepFace = self.geometry.Faces[0]
@@ -6441,8 +9688,12 @@ class hb_EPSurface(object):
            Transform can be any valid transform object (e.g Translate, Rotate, Mirror)
         """
         self.name += "_t"
+        # geometries can be shared with the object in the hive so transform copies
+        self.geometry = self.geometry.DuplicateBrep()
         self.geometry.Transform(transform)
-        self.meshedFace.Transform(transform)
+        if "meshedFace" in self.__dict__:
+            self.meshedFace = self.meshedFace.DuplicateMesh()
+            self.meshedFace.Transform(transform)
         # move center point and normal
         self.cenPt.Transform(transform)
         self.normalVector.Transform(transform)
@@ -6459,6 +9710,7 @@ class hb_EPSurface(object):
             self.setBCObjectToOutdoors()
             
         if not self.isChild and self.hasChild:
+            self.punchedGeometry = self.punchedGeometry.DuplicateBrep()
             self.punchedGeometry.Transform(transform)
             if flip: self.punchedGeometry.Flip()
             
@@ -6760,6 +10012,12 @@ class hb_EPShdSurface(hb_EPSurface):
 
 class hb_EPFenSurface(hb_EPSurface):
     """..."""
+    
+    # Special inputs for shading control.
+    shadingSchName = hb_LazyAttribute(list)
+    shadingControlName = hb_LazyAttribute(list)
+    shadeMaterialName = hb_LazyAttribute(list)
+    
     def __init__(self, surface, srfNumber, srfName, parentSurface, surafceType, punchedWall = None):
         """This function initiates the class for an EP surface.
             surface: surface geometry as a Brep
@@ -6768,12 +10026,6 @@ class hb_EPFenSurface(hb_EPSurface):
             parentZone: class of the zone that this surface belongs to"""
         hb_EPSurface.__init__(self, surface, srfNumber, srfName, parentSurface, surafceType)
         
-        # Special inputs for shading control.
-        self.shadingSchName = []
-        self.shadingControlName = []
-        self.shadeMaterialName = []
-        
-        
         if not self.isPlanar:
             try:
                 self.parent.parent.hasNonplanarSrf = True
@@ -7252,6 +10504,120 @@ class thermBC(object):
 
 
 
+class hb_AdjacencyIndex(object):
+    """
+    Spatial index to find surfaces that can be adjacent to each other.
+    
+    Surfaces are put in a uniform grid based on their bounding boxes. Candidates for a surface
+    are the surfaces from other groups (e.g. zones) in the same grid cells which have an
+    overlapping bounding box and are coplanar with opposite normal direction. Only the candidates
+    need to go through the exact ray and closest point test.
+    
+    Args:
+        tol: Distance tolerance for adjacency.
+        angleTol: Angle tolerance in radians. Default is Rhino document angle tolerance.
+        cellSize: Size of grid cells. Default is calculated from the average size of the surfaces.
+    
+    Usage:
+        adjacencyIndex = hb_AdjacencyIndex(tol)
+        for zone in zones:
+            for surface in zone.surfaces:
+                adjacencyIndex.add(surface, zone.name, surface.geometry.GetBoundingBox(True),
+                                   surface.normalVector, surface.cenPt)
+        candidates = adjacencyIndex.getCandidates(zone.name, bbox, normal, cenPt)
+    """
+    
+    def __init__(self, tol, angleTol = None, cellSize = None):
+        self.tol = tol
+        if angleTol == None: angleTol = sc.doc.ModelAngleToleranceRadians
+        self.angleTol = angleTol
+        self.cellSize = cellSize
+        self.items = []
+        self.grid = None
+        # benchmark
+        self.possiblePairs = 0
+        self.candidatePairs = 0
+        self.testedPairs = 0
+        self.matchedPairs = 0
+    
+    @staticmethod
+    def getUnitVector(vector):
+        length = math.sqrt(vector.X ** 2 + vector.Y ** 2 + vector.Z ** 2)
+        if length == 0: return (0, 0, 0)
+        return (vector.X / length, vector.Y / length, vector.Z / length)
+    
+    def add(self, item, group, bbox, normal, point):
+        """Add an item (e.g. surface) to index. Items in the same group are never candidates."""
+        # grid will be re-calculated on the next search
+        self.grid = None
+        minPt = (bbox.Min.X - self.tol, bbox.Min.Y - self.tol, bbox.Min.Z - self.tol)
+        maxPt = (bbox.Max.X + self.tol, bbox.Max.Y + self.tol, bbox.Max.Z + self.tol)
+        self.items.append((item, group, minPt, maxPt, self.getUnitVector(normal), (point.X, point.Y, point.Z)))
+    
+    def getCellRange(self, minPt, maxPt):
+        return [(int(math.floor(minPt[i] / self.cellSize)), int(math.floor(maxPt[i] / self.cellSize))) for i in range(3)]
+    
+    def buildGrid(self):
+        if self.cellSize == None:
+            if self.items:
+                sizes = [max(maxPt[i] - minPt[i] for i in range(3)) for item, group, minPt, maxPt, normal, point in self.items]
+                self.cellSize = max(sum(sizes) / len(sizes), self.tol)
+            else:
+                self.cellSize = 1
+        
+        self.grid = {}
+        self.groupSizes = {}
+        for itemCount, (item, group, minPt, maxPt, normal, point) in enumerate(self.items):
+            self.groupSizes[group] = self.groupSizes.get(group, 0) + 1
+            (x0, x1), (y0, y1), (z0, z1) = self.getCellRange(minPt, maxPt)
+            for x in xrange(x0, x1 + 1):
+                for y in xrange(y0, y1 + 1):
+                    for z in xrange(z0, z1 + 1):
+                        self.grid.setdefault((x, y, z), []).append(itemCount)
+    
+    def isCoplanar(self, normal, point, targetNormal, targetPoint, targetSize):
+        dot = sum(normal[i] * targetNormal[i] for i in range(3))
+        # opposite normals or exactly the same normals
+        if dot > -math.cos(self.angleTol) + 1e-6 and dot < 1 - 1e-9: return False
+        distance = abs(sum(normal[i] * (targetPoint[i] - point[i]) for i in range(3)))
+        return distance <= 2 * self.tol + math.sin(self.angleTol) * targetSize
+    
+    def getCandidates(self, group, bbox, normal, point):
+        """Return the items from other groups that can be adjacent to a surface in the order they are added."""
+        if self.grid == None: self.buildGrid()
+        
+        minPt = (bbox.Min.X - self.tol, bbox.Min.Y - self.tol, bbox.Min.Z - self.tol)
+        maxPt = (bbox.Max.X + self.tol, bbox.Max.Y + self.tol, bbox.Max.Z + self.tol)
+        normal = self.getUnitVector(normal)
+        point = (point.X, point.Y, point.Z)
+        
+        itemIds = set()
+        (x0, x1), (y0, y1), (z0, z1) = self.getCellRange(minPt, maxPt)
+        for x in xrange(x0, x1 + 1):
+            for y in xrange(y0, y1 + 1):
+                for z in xrange(z0, z1 + 1):
+                    itemIds.update(self.grid.get((x, y, z), []))
+        
+        candidates = []
+        for itemCount in sorted(itemIds):
+            item, targetGroup, targetMin, targetMax, targetNormal, targetPoint = self.items[itemCount]
+            if targetGroup == group: continue
+            # bounding boxes should overlap
+            if any(targetMin[i] > maxPt[i] or targetMax[i] < minPt[i] for i in range(3)): continue
+            targetSize = max(targetMax[i] - targetMin[i] for i in range(3))
+            if not self.isCoplanar(normal, point, targetNormal, targetPoint, targetSize): continue
+            candidates.append(item)
+        
+        self.possiblePairs += len(self.items) - self.groupSizes.get(group, 0)
+        self.candidatePairs += len(candidates)
+        return candidates
+    
+    def report(self):
+        return "Adjacency index: %d surface pairs out of %d possible pairs passed the prefilter. " \
+               "%d pairs were tested and %d pairs matched." \
+               %(self.candidatePairs, self.possiblePairs, self.testedPairs, self.matchedPairs)
+
+
 class zoneNetworkSolving(object):
     
     
@@ -7273,11 +10639,24 @@ class zoneNetworkSolving(object):
         meshPar = rc.Geometry.MeshingParameters.Default
         adjacentBldgNumList = []
         
+        # index the faces so only the faces that are close to each other are tested
+        adjacencyIndex = hb_AdjacencyIndex(tol)
+        for bldgCount, bldg in enumerate(buildingBreps):
+            for srfCount, srf in enumerate(bldg.Faces):
+                adjacencyIndex.add((bldgCount, srfCount), bldgCount, srf.GetBoundingBox(True), \
+                                   srfNormalVecs[bldgCount][srfCount], srf.PointAt(srf.Domain(0).Mid, srf.Domain(1).Mid))
+        
         for testBldgCount, testBldg in enumerate(buildingBreps):
             allMatchFound = False
             # mesh each surface and test if it will be adjacent to any surface
             # from other zones
             for testSrfCount, srf in enumerate(testBldg.Faces):
+                candidates = adjacencyIndex.getCandidates(testBldgCount, srf.GetBoundingBox(True), \
+                                                          srfNormalVecs[testBldgCount][testSrfCount], \
+                                                          srf.PointAt(srf.Domain(0).Mid, srf.Domain(1).Mid))
+                if len(candidates) == 0: continue
+                candidateBldgs = set([bldgCount for bldgCount, srfCount in candidates])
+                
                 srfFace = rc.Geometry.BrepFace.ToBrep(srf)
                 #Create a mesh of surface to use center points as test points
                 BrepMesh = rc.Geometry.Mesh.CreateFromBrep(srfFace, meshPar)[0]
@@ -7297,10 +10676,11 @@ class zoneNetworkSolving(object):
                     raysDict[meshSrfCen] = rc.Geometry.Ray3d(meshSrfCen, srfNormal)
                 
                 for tarBldgCount, targetBldg in enumerate(buildingBreps):
-                    if notTheSameBldg(targetBldg, testBldg):
+                    if tarBldgCount in candidateBldgs and notTheSameBldg(targetBldg, testBldg):
                         # check ray intersection to see if this zone is next to the surface
                         if shootIt(raysDict.values(), [targetBldg], tol + sc.doc.ModelAbsoluteTolerance):
                             for tarSrfCount, surface in enumerate(targetBldg.Faces):
+                                if (tarBldgCount, tarSrfCount) not in candidates: continue
                                 surfaceBrep = rc.Geometry.BrepFace.ToBrep(surface)
                                 # check distance with the nearest point on each surface
                                 for pt in raysDict.keys():
@@ -7366,7 +10746,206 @@ class zoneNetworkSolving(object):
         return newAjdacenList
 
 
+class hb_ResultMatrix(object):
+    """
+    Binary matrix of hourly results for a grid of test points (hours x points, float64).
+    
+    The first line of the file is a JSON header with the matrix header string, number of
+    hours and points and the analysis period. It is followed by the values of each hour.
+    Since all the hours have the same size any hour can be read without reading the
+    rest of the file. Values are stored as doubles so they are the same as the values in
+    the csv copy. Files that are written as float32 are still readable.
+    
+    Args:
+        filePath: Path to a matrix file.
+    
+    Usage:
+        # matrix = [header, valuesForHour1, valuesForHour2, ...]
+        filePath = hb_ResultMatrix.write(filePath, matrix)
+        resultMtx = hb_ResultMatrix(filePath)
+        matrix = resultMtx.toMatrix()
+        firstDay = resultMtx.getRows(range(1, 25))
+        # rows for hours of the year
+        firstDay = resultMtx.toMatrix(HOYs = range(1, 25))
+    """
+    
+    fileExtension = ".hbmtx"
+    typecode = "d"
+    daysInMonths = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+    
+    def __init__(self, filePath):
+        self.filePath = filePath
+        with open(filePath, "rb") as mtxFile:
+            info = json.loads(mtxFile.readline())
+            self.dataStart = mtxFile.tell()
+        
+        self.header = info["header"]
+        self.hours = info["hours"]
+        self.points = info["points"]
+        self.analysisPeriod = info["analysisPeriod"]
+        self.byteswap = info.get("byteorder", "little") != sys.byteorder
+        # the first version of the files didn't have the typecode and are float32
+        self.typecode = str(info.get("typecode", "f"))
+        self.rowSize = self.points * array.array(self.typecode).itemsize
+    
+    @classmethod
+    def isMatrixFile(cls, filePath):
+        return filePath.lower().endswith(cls.fileExtension)
+    
+    @staticmethod
+    def getAnalysisPeriod(header):
+        """Analysis period from a header like 'key;...;(1, 1, 1);(12, 31, 24)'."""
+        try:
+            return [[int(value) for value in period.strip().strip("()").split(",")] \
+                    for period in header.split(";")[-2:]]
+        except:
+            return []
+    
+    @classmethod
+    def write(cls, filePath, matrix, writeCSV = False):
+        """Write a matrix to a binary file and optionally to a csv file next to it."""
+        header = matrix[0]
+        rows = matrix[1:]
+        if len(rows) > 0: points = len(rows[-1])
+        else: points = 0
+        
+        info = {"header": header, "hours": len(rows), "points": points,
+                "analysisPeriod": cls.getAnalysisPeriod(header), "byteorder": sys.byteorder,
+                "typecode": cls.typecode}
+        
+        with open(filePath, "wb") as mtxFile:
+            mtxFile.write(json.dumps(info) + "\n")
+            for row in rows:
+                mtxFile.write(array.array(cls.typecode, row).tostring())
+        
+        if writeCSV:
+            cls.writeCSV(os.path.splitext(filePath)[0] + ".csv", matrix)
+        
+        return filePath
+    
+    @staticmethod
+    def writeCSV(filePath, matrix):
+        with open(filePath, "wb") as csvFile:
+            csvFile.write(matrix[0] + "\n")
+            for row in matrix[1:]:
+                csvFile.write(",".join(map(str, row)) + "\n")
+        return filePath
+    
+    def readRows(self, mtxFile, start, count):
+        mtxFile.seek(self.dataStart + (start - 1) * self.rowSize)
+        values = array.array(self.typecode)
+        values.fromstring(mtxFile.read(count * self.rowSize))
+        if self.byteswap: values.byteswap()
+        values = values.tolist()
+        return [values[rowCount * self.points: (rowCount + 1) * self.points] \
+                for rowCount in xrange(count)]
+    
+    def getRows(self, rowNumbers):
+        """Return the values for a list of rows. Row numbers start from 1 similar to the matrix."""
+        rows = []
+        with open(self.filePath, "rb") as mtxFile:
+            # read consecutive rows at once
+            runStart = None
+            for count, rowNumber in enumerate(rowNumbers):
+                if runStart == None:
+                    runStart = rowNumber
+                    runLength = 1
+                elif rowNumber == runStart + runLength:
+                    runLength += 1
+                else:
+                    rows.extend(self.readRows(mtxFile, runStart, runLength))
+                    runStart = rowNumber
+                    runLength = 1
+            if runStart != None:
+                rows.extend(self.readRows(mtxFile, runStart, runLength))
+        return rows
+    
+    def getRow(self, rowNumber):
+        return self.getRows([rowNumber])[0]
+    
+    @classmethod
+    def getHOY(cls, month, day, hour):
+        return (sum(cls.daysInMonths[:month - 1]) + day - 1) * 24 + hour
+    
+    @classmethod
+    def getDate(cls, HOY):
+        day, hour = divmod(HOY - 1, 24)
+        month = 0
+        while day >= cls.daysInMonths[month]:
+            day -= cls.daysInMonths[month]
+            month += 1
+        return month + 1, day + 1, hour + 1
+    
+    @classmethod
+    def getPeriodHOYs(cls, analysisPeriod):
+        """Return the hours of an analysis period. Similar to Ladybug each day only has the
+        hours between the start and the end hour."""
+        (stMonth, stDay, stHour), (endMonth, endDay, endHour) = analysisPeriod
+        stDay = cls.getHOY(stMonth, stDay, 1) // 24
+        endDay = cls.getHOY(endMonth, endDay, 1) // 24
+        if stDay <= endDay: days = range(stDay, endDay + 1)
+        else: days = range(stDay, 365) + range(0, endDay + 1)
+        if stHour <= endHour: hours = range(stHour, endHour + 1)
+        else: hours = range(stHour, 25) + range(1, endHour + 1)
+        return [day * 24 + hour for day in days for hour in hours]
+    
+    @classmethod
+    def getRowNumbers(cls, header, rowCount, HOYs):
+        """Return the row numbers of the HOYs and the HOYs that are not in the matrix.
+        
+        Rows are matched to the hours of the analysis period in the header.
+        """
+        try: periodHOYs = cls.getPeriodHOYs(cls.getAnalysisPeriod(header))
+        except: periodHOYs = []
+        if len(periodHOYs) != rowCount:
+            raise ValueError("Failed to find the hours of the matrix from the header: %s"%header)
+        
+        rowByHOY = dict((HOY, count + 1) for count, HOY in enumerate(periodHOYs))
+        rowNumbers = [rowByHOY[HOY] for HOY in HOYs if HOY in rowByHOY]
+        missingHOYs = [HOY for HOY in HOYs if HOY not in rowByHOY]
+        return rowNumbers, missingHOYs
+    
+    @classmethod
+    def getPeriodHeader(cls, header, HOYs):
+        """Return the header with the analysis period from the first to the last HOY."""
+        keys = header.split(";")[:-2]
+        return ";".join(keys + [str(cls.getDate(HOYs[0])), str(cls.getDate(HOYs[-1]))])
+    
+    @classmethod
+    def selectHOYs(cls, matrix, HOYs):
+        """Return the rows of a full matrix for HOYs and the HOYs that are not in the matrix."""
+        rowNumbers, missingHOYs = cls.getRowNumbers(matrix[0], len(matrix) - 1, HOYs)
+        if not rowNumbers: return [], missingHOYs
+        return [cls.getPeriodHeader(matrix[0], [HOY for HOY in HOYs if HOY not in missingHOYs])] + \
+               [matrix[rowNumber] for rowNumber in rowNumbers], missingHOYs
+    
+    def toMatrix(self, HOYs = None):
+        """Return the matrix as [header, valuesForHour1, valuesForHour2, ...].
+        
+        If HOYs is not None only the rows for the hours of the year are read.
+        """
+        if HOYs == None:
+            with open(self.filePath, "rb") as mtxFile:
+                return [self.header] + self.readRows(mtxFile, 1, self.hours)
+        
+        rowNumbers, missingHOYs = self.getRowNumbers(self.header, self.hours, HOYs)
+        if not rowNumbers: return []
+        return [self.getPeriodHeader(self.header, [HOY for HOY in HOYs if HOY not in missingHOYs])] + \
+               self.getRows(rowNumbers)
+
+
 class hb_Hive(object):
+    """Keep Honeybee objects in memory so they can be passed between the components.
+    
+    Objects that are called from the hive are copies of the objects in the hive but
+    zones and surfaces share their Rhino geometries with the original objects. Methods
+    that change the geometry in place (e.g. transform) replace it with a duplicate first.
+    Every time a component adds objects to the hive the version of its objects goes up.
+    Use getVersion to check if the objects connected to a component have changed.
+    """
+    
+    # object types that share their geometries with the copies
+    sharedGeometryTypes = ("HBZone", "HBSurface")
     
     class CopyClass(object):
         pass
@@ -7418,6 +10997,11 @@ class hb_Hive(object):
             if baseKey in sc.sticky['HBHive']:
                 del(sc.sticky['HBHive'][baseKey])
             sc.sticky['HBHive'][baseKey] = {}
+        
+        # objects of this component have changed
+        if not sc.sticky.has_key('HBHiveVersions'):
+            sc.sticky['HBHiveVersions'] = {}
+        sc.sticky['HBHiveVersions'][baseKey] = sc.sticky['HBHiveVersions'].get(baseKey, 0) + 1
     
         # create an empty dictionary for this component
         outGeometry = []
@@ -7455,10 +11039,11 @@ class hb_Hive(object):
                     if zoneHasChildSrf:
                         geometry = rc.Geometry.Brep.JoinBreps(srfs, sc.doc.ModelAbsoluteTolerance)[0]
                     else:
-                        geometry = HBObject.geometry
+                        # the geometry can be shared with other objects in the hive
+                        geometry = HBObject.geometry.Duplicate()
                 else:
-                    # if there is not child object use the geometry as it is
-                    geometry = HBObject.geometry
+                    # if there is not child object use a copy of the geometry
+                    geometry = HBObject.geometry.Duplicate()
                 
                 # assign the key to surface
                 geometry.UserDictionary.Set('HBID', '{}#{}'.format(baseKey, key))
@@ -7470,15 +11055,44 @@ class hb_Hive(object):
         return outGeometry
     
     
+    @staticmethod
+    def splitKey(geometry):
+        hbkey = geometry.UserDictionary['HBID']
+        
+        if '#' not in hbkey:
+            raise Exception('Honeybee version mismatch! Update the input component.')
+            
+        return hbkey.split('#')[0], '#'.join(hbkey.split('#')[1:])
+    
+    def shareGeometries(self, HBObjects, memo):
+        """Add Rhino geometries of zones and surfaces to a deepcopy memo.
+        
+        copy.deepcopy returns the objects that are in the memo instead of copying them.
+        """
+        visited = set()
+        objects = list(HBObjects)
+        while objects:
+            obj = objects.pop()
+            if id(obj) in visited: continue
+            visited.add(id(obj))
+            
+            if isinstance(obj, (list, tuple)):
+                objects.extend(obj)
+            elif isinstance(obj, dict):
+                objects.extend(obj.values())
+            elif getattr(obj, 'objectType', None) in self.sharedGeometryTypes:
+                for value in obj.__dict__.values():
+                    if isinstance(value, rc.Geometry.GeometryBase):
+                        memo[id(value)] = value
+                    else:
+                        objects.append(value)
+        
+        return memo
+    
     def callFromHoneybeeHive(self, geometryList):
-        HBObjects = []
+        hiveObjects = []
         for geometry in geometryList:
-            hbkey = geometry.UserDictionary['HBID']
-            
-            if '#' not in hbkey:
-                raise Exception('Honeybee version mismatch! Update the input component.')
-                
-            baseKey, key = hbkey.split('#')[0], '#'.join(hbkey.split('#')[1:])
+            baseKey, key = self.splitKey(geometry)
             
             if sc.sticky['HBHive'].has_key(baseKey):
                 HBObject = sc.sticky['HBHive'][baseKey][key]
@@ -7486,40 +11100,47 @@ class hb_Hive(object):
                 # make sure Honeybee object is not moved or rotated
                 self.checkifTransformed(geometry, HBObject)
                 
-                try:
-                    # after the first round meshedFace makes copy.deepcopy crash
-                    # so I need to regenerate meshFaces
-                    if HBObject.objectType == "HBZone":
-                        for surface in HBObject.surfaces:
-                            newMesh = rc.Geometry.Mesh()
-                            newMesh.Append(surface.meshedFace)
-                            surface.meshedFace = newMesh
-                    elif HBObject.objectType == "HBSurface": 
-                        newMesh = rc.Geometry.Mesh()
-                        newMesh.Append(HBObject.meshedFace)
-                        HBObject.meshedFace = newMesh
-                    
-                    HBObjects.append(copy.deepcopy(HBObject))
-                    
-                except Exception, e:
-                    print `e`
-                    print "Failed to copy the object. Returning the original objects...\n" +\
-                    "This can cause strange behaviour!"
-                    HBObjects.append(sc.sticky['HBHive'][key])
+                hiveObjects.append(HBObject)
             else:
                 raise Exception('HoneybeeKeyMismatch: Failed to call the object from Honeybee hive.')
+        
+        # copy all the objects with the same memo so objects that are referenced
+        # by more than one object (e.g. adjacent surfaces) are only copied once
+        # and geometries are shared with the objects in the hive
+        memo = self.shareGeometries(hiveObjects, {})
+        HBObjects = []
+        for HBObject in hiveObjects:
+            try:
+                HBObjects.append(copy.deepcopy(HBObject, memo))
+            except Exception, e:
+                print `e`
+                print "Failed to copy the object. Returning the original objects...\n" +\
+                "This can cause strange behaviour!"
+                HBObjects.append(HBObject)
                 
         return HBObjects
     
+    def getVersion(self, geometryList):
+        """Return the version of Honeybee objects that are connected to a component.
+        
+        The version changes every time one of the upstream components updates the objects.
+        Components can compare it with the version from the last solution to skip the work
+        when nothing has changed.
+        """
+        if not sc.sticky.has_key('HBHiveVersions'):
+            sc.sticky['HBHiveVersions'] = {}
+        
+        version = []
+        for geometry in geometryList:
+            baseKey, key = self.splitKey(geometry)
+            version.append((baseKey, key, sc.sticky['HBHiveVersions'].get(baseKey, 0)))
+        
+        return tuple(version)
+    
     def visualizeFromHoneybeeHive(self, geometryList):
         HBObjects = []
         for geometry in geometryList:
-            hbkey = geometry.UserDictionary['HBID']
-            
-            if '#' not in hbkey:
-                raise Exception('Honeybee version mismatch! Update the input component.')
-                
-            baseKey, key = hbkey.split('#')[0], '#'.join(hbkey.split('#')[1:])
+            baseKey, key = self.splitKey(geometry)
             
             if sc.sticky['HBHive'].has_key(baseKey):
                 HBObjects.append(sc.sticky['HBHive'][baseKey][key])
@@ -7667,6 +11288,427 @@ class SerializeObjects(object):
             self.data = pickle.load(inf)
 
 
+class hb_HBObjectsFile(object):
+    """
+    Binary file of Honeybee zones and surfaces that is used by Dump/Load Honeybee Objects.
+    
+    The first line of the file is a JSON header with the version of the format, the schema
+    (attribute names of each class), the EnergyPlus materials, constructions and schedules
+    that are used by the objects and a table of contents. Each record in the table of contents
+    is a zone with all its surfaces or a surface that doesn't belong to a zone. Records have
+    their position in the file so a zone or a floor can be loaded without reading the rest of
+    the file.
+    
+    Vertices of planar polygons are packed as doubles and zone geometries are joined from the
+    surfaces. Other geometries are pickled. Meshes and punched geometries are recalculated.
+    Long values that are repeated for many objects (e.g. the dictionaries of surface types)
+    are stored once in the header.
+    
+    When only some of the zones are loaded, surfaces with a Surface boundary condition whose
+    adjacent surface is not loaded are changed to Adiabatic and listed in downgradedSurfaces.
+    
+    Usage:
+        hb_HBObjectsFile.write(filePath, HBObjects)
+        HBFile = hb_HBObjectsFile(filePath)
+        HBObjects = HBFile.load()
+        groundFloor = HBFile.load(HBFile.getRecords(floorHeight = 0))
+        print HBFile.downgradedSurfaces
+    """
+    
+    formatName = "hbobjects"
+    formatVersion = 2
+    libraries = ("honeybee_materialLib", "honeybee_windowMaterialLib", "honeybee_constructionLib",
+                 "honeybee_ScheduleLib", "honeybee_ScheduleTypeLimitsLib")
+    objectClasses = {"EPZone": EPZone, "hb_EPSurface": hb_EPSurface,
+                     "hb_EPZoneSurface": hb_EPZoneSurface, "hb_EPShdSurface": hb_EPShdSurface,
+                     "hb_EPFenSurface": hb_EPFenSurface}
+    # json length, number of vertex coordinates and size of pickled data for each record
+    recordHeader = struct.Struct("<III")
+    # encoded values longer than this that are used more than once are stored in the header
+    sharedValueLength = 48
+    
+    class Record(object):
+        def __init__(self):
+            self.objects = []
+            self.vertices = array.array("d")
+            self.blobs = []
+            self.blobSize = 0
+        
+        def addVertices(self, points):
+            start = len(self.vertices) // 3
+            for pt in points: self.vertices.extend((pt.X, pt.Y, pt.Z))
+            return [start, len(points)]
+        
+        def addBlob(self, value):
+            data = pickle.dumps(value, 2)
+            self.blobs.append(data)
+            self.blobSize += len(data)
+            return [self.blobSize - len(data), len(data)]
+        
+        def toString(self, info):
+            data = json.dumps(info, separators = (",", ":"))
+            return hb_HBObjectsFile.recordHeader.pack(len(data), len(self.vertices), self.blobSize) + \
+                   data + self.vertices.tostring() + "".join(self.blobs)
+    
+    def __init__(self, filePath):
+        self.filePath = filePath
+        with open(filePath, "rb") as HBFile:
+            info = json.loads(HBFile.readline())
+            self.dataStart = HBFile.tell()
+        
+        if info.get("format") != self.formatName or info["version"] > self.formatVersion:
+            raise Exception("%s is not a valid Honeybee objects file or it is created by a newer "%filePath + \
+                            "version of Honeybee. Update Honeybee and try again.")
+        
+        self.schema = info["schema"]
+        self.names = info["names"]
+        self.sharedValues = info["sharedValues"]
+        self.library = info["library"]
+        self.ids = info["ids"]
+        self.records = info["records"]
+        self.downgradedSurfaces = []
+    
+    @classmethod
+    def isHBObjectsFile(cls, filePath):
+        prefix = '{"format": "%s"'%cls.formatName
+        with open(filePath, "rb") as HBFile:
+            return HBFile.read(len(prefix)) == prefix
+    
+    # write
+    @staticmethod
+    def getPolygon(brep):
+        """Return vertices of a brep if it is a planar polygon without holes."""
+        tol = sc.doc.ModelAbsoluteTolerance
+        if brep.Faces.Count != 1 or brep.Faces[0].Loops.Count != 1 or not brep.Faces[0].IsPlanar(tol):
+            return None
+        
+        for edge in brep.Edges:
+            if not edge.IsLinear(tol): return None
+        
+        success, polyline = brep.Faces[0].OuterLoop.To3dCurve().TryGetPolyline()
+        if not success: return None
+        
+        return list(polyline)[:-1]
+    
+    def addName(self, name):
+        if name not in self.nameIndex:
+            self.nameIndex[name] = len(self.names)
+            self.names.append(name)
+        return {"@n": self.nameIndex[name]}
+    
+    def encodeValue(self, value, record):
+        if value is None or isinstance(value, (bool, int, long, float)):
+            return value
+        elif isinstance(value, basestring):
+            key = value.upper()
+            for libName, lib in self.libs:
+                if key in lib:
+                    if key not in self.library[libName]:
+                        # reserve the key and encode the object after the records
+                        self.library[libName][key] = None
+                        self.libraryQueue.append((libName, key))
+                    return self.addName(value)
+            return value
+        elif isinstance(value, list):
+            return [self.encodeValue(v, record) for v in value]
+        elif isinstance(value, tuple):
+            return {"@t": [self.encodeValue(v, record) for v in value]}
+        elif isinstance(value, hb_EPObjectData):
+            return {"@ep": [[self.encodeValue(k, record), self.encodeValue(v, record)] \
+                            for k, v in value.items()]}
+        elif isinstance(value, dict):
+            return {"@d": [[self.encodeValue(k, record), self.encodeValue(v, record)] \
+                           for k, v in value.items()]}
+        elif isinstance(value, rc.Geometry.Point3d):
+            return {"@p": [value.X, value.Y, value.Z]}
+        elif isinstance(value, rc.Geometry.Vector3d):
+            return {"@v": [value.X, value.Y, value.Z]}
+        elif isinstance(value, rc.Geometry.Plane):
+            return {"@pl": [[pt.X, pt.Y, pt.Z] for pt in (value.Origin, value.XAxis, value.YAxis)]}
+        elif isinstance(value, hb_EPSurface.outdoorBCObject):
+            return {"@o": value.name}
+        elif type(value).__name__ in self.objectClasses:
+            self.references[value.ID] = value.name
+            return {"@r": [value.ID, value.name]}
+        else:
+            return {"@b": record.addBlob(value)}
+    
+    def encodeObject(self, HBObject, record):
+        className = type(HBObject).__name__
+        if className not in self.objectClasses:
+            raise Exception("Unsupported object! Assure all objects are Honeybee objects")
+        
+        fieldNames = self.schema.setdefault(className, [])
+        fields = []
+        for key, value in HBObject.__dict__.iteritems():
+            if key == "meshedFace": continue
+            elif key == "punchedGeometry" and HBObject.hasChild: value = None
+            elif key == "geometry" and HBObject.objectType == "HBSurface":
+                polygon = self.getPolygon(value)
+                if polygon != None: value = {"@poly": record.addVertices(polygon)}
+                else: value = {"@b": record.addBlob(value)}
+            elif key == "geometry":
+                # join zone geometry from the surfaces when they are polygons
+                if all(isinstance(srf.geometry, rc.Geometry.Brep) and self.getPolygon(srf.geometry) != None \
+                       for srf in HBObject.surfaces) and value.Faces.Count == len(HBObject.surfaces):
+                    value = {"@join": 1}
+                else:
+                    value = {"@b": record.addBlob(value)}
+            else:
+                value = self.encodeValue(value, record)
+                valueString = json.dumps(value)
+                if len(valueString) > self.sharedValueLength:
+                    # share the value from the second time that it is used
+                    if valueString in self.sharedIndex:
+                        if self.sharedIndex[valueString] == None:
+                            self.sharedIndex[valueString] = len(self.sharedValues)
+                            self.sharedValues.append(value)
+                        value = {"@s": self.sharedIndex[valueString]}
+                    else:
+                        self.sharedIndex[valueString] = None
+            
+            if key not in fieldNames: fieldNames.append(key)
+            fields.extend((fieldNames.index(key), value))
+        
+        self.written[HBObject.ID] = HBObject.name
+        record.objects.append(HBObject.ID)
+        return {"c": className, "f": fields}
+    
+    def encodeRecord(self, HBObject):
+        record = self.Record()
+        objects = [HBObject]
+        if HBObject.objectType == "HBZone": objects.extend(HBObject.surfaces)
+        for obj in objects[:]:
+            if obj.objectType == "HBSurface" and not obj.isChild and obj.hasChild:
+                objects.extend(obj.childSrfs)
+        
+        data = record.toString({"objects": [self.encodeObject(obj, record) for obj in objects]})
+        
+        bbox = HBObject.geometry.GetBoundingBox(True)
+        return {"id": HBObject.ID, "name": HBObject.name, "objectType": HBObject.objectType,
+                "floorHeight": bbox.Min.Z, "objects": record.objects}, data
+    
+    @classmethod
+    def write(cls, filePath, HBObjects):
+        """Write Honeybee zones and surfaces to a file. Adjacent and parent objects should be included."""
+        writer = cls.__new__(cls)
+        writer.schema = {}
+        writer.names = []
+        writer.nameIndex = {}
+        writer.sharedValues = []
+        writer.sharedIndex = {}
+        writer.libs = [(libName, sc.sticky[libName]) for libName in cls.libraries if sc.sticky.has_key(libName)]
+        writer.library = dict((libName, {}) for libName, lib in writer.libs)
+        writer.libraryQueue = []
+        writer.references = {}
+        writer.written = {}
+        
+        # surfaces are written with their parent zone or parent surface
+        inputIds = set(HBO.ID for HBO in HBObjects)
+        records = []
+        recordsData = []
+        for HBO in HBObjects:
+            parent = getattr(HBO, "parent", None)
+            while parent != None and getattr(parent, "ID", None) not in inputIds:
+                parent = getattr(parent, "parent", None)
+            if parent != None or HBO.ID in writer.written: continue
+            
+            record, data = writer.encodeRecord(HBO)
+            records.append(record)
+            recordsData.append(data)
+        
+        # make sure all the parent objects and boundary condition objects are included in the file
+        for ID, name in writer.references.iteritems():
+            assert ID in writer.written,\
+                " InputError: Parent/Adjacent object %s is not in the list of HBObjects."%name
+        
+        # add library objects that are used by the objects and by the other library objects
+        while writer.libraryQueue:
+            libName, key = writer.libraryQueue.pop(0)
+            writer.library[libName][key] = writer.encodeValue(sc.sticky[libName][key], None)
+        
+        offset = 0
+        for record, data in zip(records, recordsData):
+            record["offset"] = offset
+            record["length"] = len(data)
+            offset += len(data)
+        
+        header = OrderedDict([("format", cls.formatName), ("version", cls.formatVersion),
+                              ("schema", writer.schema), ("names", writer.names),
+                              ("sharedValues", writer.sharedValues),
+                              ("library", writer.library), ("ids", [HBO.ID for HBO in HBObjects]),
+                              ("records", records)])
+        
+        with open(filePath, "wb") as HBFile:
+            HBFile.write(json.dumps(header) + "\n")
+            for data in recordsData: HBFile.write(data)
+        
+        return filePath
+    
+    # read
+    def getRecords(self, names = None, floorHeight = None, tolerance = None):
+        """Return records of the table of contents by zone name and/or the height of the floor."""
+        if tolerance == None: tolerance = sc.doc.ModelAbsoluteTolerance
+        records = []
+        for record in self.records:
+            if names != None and record["name"] not in names: continue
+            if floorHeight != None and abs(record["floorHeight"] - floorHeight) > tolerance: continue
+            records.append(record)
+        return records
+    
+    def readRecord(self, HBFile, record):
+        HBFile.seek(self.dataStart + record["offset"])
+        jsonLength, vertexCount, blobSize = self.recordHeader.unpack(HBFile.read(self.recordHeader.size))
+        info = json.loads(HBFile.read(jsonLength))
+        vertices = array.array("d")
+        vertices.fromstring(HBFile.read(vertexCount * vertices.itemsize))
+        if sys.byteorder != "little": vertices.byteswap()
+        return info, vertices, HBFile.read(blobSize)
+    
+    def decodeValue(self, value, objects, vertices, blob):
+        if isinstance(value, list):
+            return [self.decodeValue(v, objects, vertices, blob) for v in value]
+        elif not isinstance(value, dict):
+            return value
+        
+        tag, value = value.items()[0]
+        if tag == "@n":
+            return self.names[value]
+        elif tag == "@s":
+            # shared values are decoded for each object so they can be changed separately
+            return self.decodeValue(self.sharedValues[value], objects, vertices, blob)
+        elif tag == "@t":
+            return tuple(self.decodeValue(v, objects, vertices, blob) for v in value)
+        elif tag == "@d":
+            return dict((self.decodeValue(k, objects, vertices, blob), self.decodeValue(v, objects, vertices, blob)) \
+                        for k, v in value)
+        elif tag == "@ep":
+            data = dict((self.decodeValue(k, objects, vertices, blob), self.decodeValue(v, objects, vertices, blob)) \
+                        for k, v in value)
+            return hb_EPObjectData(None, data[0], None, None, data)
+        elif tag == "@p":
+            return rc.Geometry.Point3d(*value)
+        elif tag == "@v":
+            return rc.Geometry.Vector3d(*value)
+        elif tag == "@pl":
+            return rc.Geometry.Plane(rc.Geometry.Point3d(*value[0]), rc.Geometry.Vector3d(*value[1]),
+                                     rc.Geometry.Vector3d(*value[2]))
+        elif tag == "@o":
+            return hb_EPSurface.outdoorBCObject(value)
+        elif tag == "@r":
+            # objects that are not loaded are replaced by their name. See downgradeBoundaryConditions
+            if value[0] in objects: return objects[value[0]]
+            else: return hb_EPSurface.outdoorBCObject(value[1])
+        elif tag == "@poly":
+            start, count = value
+            pts = [rc.Geometry.Point3d(*vertices[i * 3: i * 3 + 3]) for i in xrange(start, start + count)]
+            return rc.Geometry.Brep.CreatePlanarBreps(rc.Geometry.PolylineCurve(pts + [pts[0]]))[0]
+        elif tag == "@b":
+            start, length = value
+            return pickle.loads(blob[start: start + length])
+        elif tag == "@join":
+            # zone geometry is joined after the surfaces are loaded
+            return None
+    
+    def addLibrary(self):
+        """Add EnergyPlus objects of the file to the libraries if they are not already there."""
+        for libName, lib in self.library.iteritems():
+            if not sc.sticky.has_key(libName): continue
+            for key, value in lib.iteritems():
+                if key not in sc.sticky[libName]:
+                    sc.sticky[libName][key] = self.decodeValue(value, {}, None, None)
+    
+    def load(self, records = None):
+        """Load Honeybee objects of the records. All the records are loaded by default."""
+        if records == None: records = self.records
+        self.addLibrary()
+        
+        # read the records and create empty objects so references can be resolved
+        recordsData = []
+        objects = {}
+        with open(self.filePath, "rb") as HBFile:
+            for record in records:
+                info, vertices, blob = self.readRecord(HBFile, record)
+                for ID, obj in zip(record["objects"], info["objects"]):
+                    objClass = self.objectClasses[obj["c"]]
+                    objects[ID] = objClass.__new__(objClass)
+                recordsData.append((record, info, vertices, blob))
+        
+        joinedZones = []
+        for record, info, vertices, blob in recordsData:
+            for ID, obj in zip(record["objects"], info["objects"]):
+                HBObject = objects[ID]
+                fieldNames = self.schema[obj["c"]]
+                fields = dict((fieldNames[obj["f"][i]], obj["f"][i + 1]) for i in xrange(0, len(obj["f"]), 2))
+                for key, value in fields.iteritems():
+                    setattr(HBObject, key, self.decodeValue(value, objects, vertices, blob))
+                
+                if HBObject.objectType == "HBZone" and fields["geometry"] == {"@join": 1}:
+                    joinedZones.append(HBObject)
+                elif HBObject.objectType == "HBSurface":
+                    # polygons are rebuilt from vertices. Make sure the normal direction is the same
+                    if "@poly" in fields["geometry"]:
+                        face = HBObject.geometry.Faces[0]
+                        uv = face.ClosestPoint(HBObject.cenPt)
+                        if face.NormalAt(uv[1], uv[2]) * HBObject.normalVector < 0:
+                            HBObject.geometry.Flip()
+        
+        for HBZone in joinedZones:
+            joinedBreps = rc.Geometry.Brep.JoinBreps([srf.geometry for srf in HBZone.surfaces],
+                                                      sc.doc.ModelAbsoluteTolerance)
+            HBZone.geometry = joinedBreps[0]
+            for brep in joinedBreps[1:]: HBZone.geometry.Append(brep)
+        
+        for HBObject in objects.values():
+            if HBObject.objectType == "HBSurface" and not HBObject.isChild and HBObject.hasChild:
+                HBObject.calculatePunchedSurface()
+        
+        self.downgradedSurfaces = self.downgradeBoundaryConditions(objects.values())
+        
+        return [objects[ID] for ID in self.ids if ID in objects]
+    
+    @staticmethod
+    def downgradeBoundaryConditions(HBObjects):
+        """Change Surface boundary conditions to Adiabatic if the adjacent surface is not loaded.
+        
+        Returns the names of the surfaces that are changed.
+        """
+        downgradedSurfaces = []
+        for HBObject in HBObjects:
+            if HBObject.objectType != "HBSurface" or HBObject.type == 6: continue
+            if HBObject.BC.lower() != "surface": continue
+            if not isinstance(HBObject.BCObject, hb_EPSurface.outdoorBCObject): continue
+            HBObject.setBC("Adiabatic")
+            HBObject.setBCObjectToOutdoors()
+            downgradedSurfaces.append(HBObject.name)
+        return downgradedSurfaces
+    
+    @classmethod
+    def benchmark(cls, HBObjects, folder):
+        """
+        Write the objects to this format and to a pickle file and return a report of the
+        file sizes and load times. The pickle file is what the older versions of dump
+        Honeybee objects used.
+        """
+        filePath = cls.write(os.path.join(folder, "benchmark.hbobjects"), HBObjects)
+        pickleFilePath = os.path.join(folder, "benchmark.pickle")
+        with open(pickleFilePath, "wb") as outf:
+            pickle.dump(HBObjects, outf, 2)
+        
+        startTime = time.time()
+        cls(filePath).load()
+        loadTime = time.time() - startTime
+        
+        startTime = time.time()
+        with open(pickleFilePath, "rb") as inf:
+            pickle.load(inf)
+        pickleLoadTime = time.time() - startTime
+        
+        return ["%d objects"%len(HBObjects),
+                "Honeybee objects file: %.1f KB, loaded in %.2f s"%(os.path.getsize(filePath) / 1024.0, loadTime),
+                "pickle: %.1f KB, loaded in %.2f s"%(os.path.getsize(pickleFilePath) / 1024.0, pickleLoadTime)]
+
+
 class hb_hvacProperties(object):
     def __init__(self):
         
@@ -8220,11 +12262,26 @@ def checkGHPythonVersion(target = "0.6.0.3"):
     if targetVersion > currentVersion: return False
     else: return True
 
-try:
-    downloadTemplate = checkIn.checkForUpdates(LB= False, HB= True, OpenStudio = True, template = True, therm = True)
-except:
-    # no internet connection
-    downloadTemplate = False
+startupSnapshot = hb_StartupSnapshot(sc.sticky["Honeybee_DefaultFolder"], ghenv.Component.Message, \
+                                     checkIn.letItFly and sc.sticky.get("honeybee_useStartupSnapshot", True))
+
+phaseStartTime = time.time()
+if startupSnapshot.isRestored:
+    # updates are already checked in the last day
+    downloadTemplate = startupSnapshot.data["downloadTemplate"]
+    sc.sticky["isNewerOSAvailable"] = startupSnapshot.data["isNewerOSAvailable"]
+    sc.sticky["isNewerTHERMAvailable"] = startupSnapshot.data["isNewerTHERMAvailable"]
+    startupSnapshot.addTiming("check for updates", phaseStartTime, "skipped")
+else:
+    try:
+        downloadTemplate = checkIn.checkForUpdates(LB= False, HB= True, OpenStudio = True, template = True, therm = True)
+    except:
+        # no internet connection
+        downloadTemplate = False
+    startupSnapshot.data["downloadTemplate"] = downloadTemplate
+    startupSnapshot.data["isNewerOSAvailable"] = sc.sticky.get("isNewerOSAvailable", False)
+    startupSnapshot.data["isNewerTHERMAvailable"] = sc.sticky.get("isNewerTHERMAvailable", False)
+    startupSnapshot.addTiming("check for updates", phaseStartTime)
 
 GHPythonTargetVersion = "0.6.0.3"
 
@@ -8244,123 +12301,27 @@ if checkIn.letItFly:
     if not sc.sticky.has_key("honeybee_release") or True:
         w = gh.GH_RuntimeMessageLevel.Warning
         sc.sticky["honeybee_release"] = versionCheck()
-        folders = hb_findFolders()
-        
-        sc.sticky["honeybee_folders"] = {}
-        
-        if folders.RADPath == None:
-            if os.path.isdir("c:\\radiance\\bin\\"):
-                folders.RADPath = "c:\\radiance\\bin\\"
-            else:
-                msg= "Honeybee cannot find RADIANCE folder on your system.\n" + \
-                     "Make sure you have RADIANCE installed on your system.\n" + \
-                     "You won't be able to run daylighting studies without RADIANCE.\n" + \
-                     "A good place to install RADIANCE is c:\\radiance"
-                ghenv.Component.AddRuntimeMessage(w, msg)
-                folders.RADPath = ""
-        
-        if  folders.RADPath.find(" ") > -1:
-            msg =  "There is a white space in RADIANCE filepath: " + folders.RADPath + "\n" + \
-                   "Please install RADIANCE in a valid address (e.g. c:\\radiance)"
-            ghenv.Component.AddRuntimeMessage(w, msg)
-            folders.RADPath = ""
-            
-        # I should replace this with python methods in os library
-        # looks stupid!
-        if folders.RADPath.endswith("\\"): segmentNumber = -2
-        else: segmentNumber = -1
-        hb_RADLibPath = "\\".join(folders.RADPath.split("\\")[:segmentNumber]) + "\\lib"
-        
-        sc.sticky["honeybee_folders"]["RADPath"] = folders.RADPath
-        sc.sticky["honeybee_folders"]["RADLibPath"] = hb_RADLibPath
-            
-        if folders.DSPath == None:
-            if os.path.isdir("c:\\daysim\\bin\\"):
-                folders.DSPath = "c:\\daysim\\bin\\"
-            else:
-                msg= "Honeybee cannot find DAYSIM folder on your system.\n" + \
-                     "Make sure you have DAYISM installed on your system.\n" + \
-                     "You won't be able to run annual climate-based daylighting studies without DAYSIM.\n" + \
-                     "A good place to install DAYSIM is c:\\DAYSIM"
-                ghenv.Component.AddRuntimeMessage(w, msg)
-                folders.DSPath = ""
+        phaseStartTime = time.time()
+        if startupSnapshot.isRestored:
+            honeybeeFolders = startupSnapshot.data["folders"]
+            folderWarnings = startupSnapshot.data["folderWarnings"]
+            folderNotes = startupSnapshot.data["folderNotes"]
+            if honeybeeFolders["OSLibPath"] != None:
+                hb_findFolders.addOpenStudioToPath(honeybeeFolders["OSLibPath"], honeybeeFolders["OSQtPath"])
+        else:
+            honeybeeFolders, folderWarnings, folderNotes = hb_findFolders().getHoneybeeFolders()
+            startupSnapshot.data["folders"] = honeybeeFolders
+            startupSnapshot.data["folderWarnings"] = folderWarnings
+            startupSnapshot.data["folderNotes"] = folderNotes
         
-        if folders.DSPath.find(" ") > -1:
-            msg =  "There is a white space in DAYSIM filepath: " + folders.DSPath + "\n" + \
-                   "Please install Daysism in a valid address (e.g. c:\\daysim)"
+        for msg in folderWarnings:
+            print msg
             ghenv.Component.AddRuntimeMessage(w, msg)
-            folders.DSPath = ""
-            
-        if folders.DSPath.endswith("\\"): segmentNumber = -2
-        else: segmentNumber = -1
-        hb_DSCore = "\\".join(folders.DSPath.split("\\")[:segmentNumber])
-        hb_DSLibPath = "\\".join(folders.DSPath.split("\\")[:segmentNumber]) + "\\lib"
-        
-        sc.sticky["honeybee_folders"]["DSPath"] = folders.DSPath
-        sc.sticky["honeybee_folders"]["DSCorePath"] = hb_DSCore
-        sc.sticky["honeybee_folders"]["DSLibPath"] = hb_DSLibPath
-        
-        # supported versions for EnergyPlus
-        EPVersions = ["V8-6-0", "V8-5-0", "V8-4-0","V8-3-0", "V8-2-10", "V8-2-9", "V8-2-8", "V8-2-7", "V8-2-6", \
-                      "V8-2-5", "V8-2-4", "V8-2-3", "V8-2-2", "V8-2-1", "V8-2-0", \
-                      "V8-1-5", "V8-1-4", "V8-1-3", "V8-1-2", "V8-1-1", "V8-1-0"]
-        EPVersion = ''
-        if folders.EPPath != None:
-            # Honeybee has already found EnergyPlus make sure it's an acceptable version
-            EPVersion = os.path.split(folders.EPPath)[-1].split("EnergyPlus")[-1]
-            if EPVersion not in EPVersions:
-                #Not an acceptable version so remove it from the path
-                folders.EPPath = None
-        if folders.EPPath == None:
-            for EPVers in EPVersions:
-                if os.path.isdir("C:\EnergyPlus" + EPVers + "\\"):
-                    folders.EPPath = "C:\EnergyPlus" + EPVers + "\\"
-                    EPVersion = EPVers
-        
-        # check for OpenStudio Folder.
-        openStudioLibFolder = None
-        QtFolder = None
-        installedOPS = [f for f in os.listdir("C:\\Program Files") if f.startswith("OpenStudio")]
-        installedOPS = sorted(installedOPS, key = lambda x: int("".join(x.split(" ")[-1].split("."))), reverse = True)
-        if len(installedOPS) != 0:
-            openStudioLibFolder = "C:/Program Files/%s/CSharp/openstudio/"%installedOPS[0]
-            QtFolder = "C:/Program Files/%s/Ruby/openstudio/"%installedOPS[0]
-            for EPVers in EPVersions:
-                versStr = EPVers.replace('V', '-')
-                if os.path.isdir("C:/Program Files/%s/share/openstudio/"%installedOPS[0] + "EnergyPlus" + versStr + "/"):
-                    folders.EPPath = "C:/Program Files/%s/share/openstudio/"%installedOPS[0] + "EnergyPlus" + versStr
-                    EPVersion = EPVers
-            if os.path.isdir(openStudioLibFolder) and os.path.isfile(os.path.join(openStudioLibFolder, "openStudio.dll")):
-                # openstudio is there and we are good to go.
-                # add folders to path.
-                if not openStudioLibFolder in os.environ['PATH'] or QtFolder not in os.environ['PATH']:
-                    os.environ['PATH'] = ";".join([openStudioLibFolder, QtFolder, os.environ['PATH']])
-            else:
-                openStudioLibFolder = None
-                QtFolder = None
-        if openStudioLibFolder == None or QtFolder == None:
-            msg1 = "Honeybee cannot find OpenStudio on your system.\n" + \
-                "You wont be able to use the Export to OpenStudio component.\n" + \
-                "Download the latest OpenStudio for Windows from:\n"
-            msg2 = "https://www.openstudio.net/downloads"
-            print msg1
-            print msg2
-            ghenv.Component.AddRuntimeMessage(w, msg1)
-            ghenv.Component.AddRuntimeMessage(w, msg2)
-        
-        if folders.EPPath == None:
-            # give a warning to the user
-            msg= "Honeybee cannot find an EnergyPlus folder on your system.\n" + \
-                 "You wont be able to use the Run Energy Simulation component.\n" + \
-                 "Honeybee supports following versions of EnergyPlus:\n"
-            versions = ", ".join(EPVersions)
-            msg += versions
+        for msg in folderNotes:
             print msg
         
-        sc.sticky["honeybee_folders"]["OSLibPath"] = openStudioLibFolder
-        sc.sticky["honeybee_folders"]["OSQtPath"] = QtFolder
-        sc.sticky["honeybee_folders"]["EPPath"] = folders.EPPath  
-        sc.sticky["honeybee_folders"]["EPVersion"] = EPVersion.replace("-", ".")[1:]
+        sc.sticky["honeybee_folders"] = dict(honeybeeFolders)
+        startupSnapshot.addTiming("find folders", phaseStartTime)
         
         
         # initiate an empty library in case this is the first time honeybee is flying in this document
@@ -8369,17 +12330,33 @@ if checkIn.letItFly:
             sc.sticky["honeybee_RADMaterialLib"] = dict()
         
         # set up radiance materials
-        RADMaterialAux = RADMaterialAux(True, sc.sticky["honeybee_RADMaterialLib"], sc.sticky["Honeybee_DefaultFolder"])
+        phaseStartTime = time.time()
+        startupMaterials = startupSnapshot.getLibrary("RADMaterials")
+        RADMaterialAux = RADMaterialAux(True, sc.sticky["honeybee_RADMaterialLib"], sc.sticky["Honeybee_DefaultFolder"], \
+                                        startupMaterials)
+        startupSnapshot.setLibrary("RADMaterials", RADMaterialAux.startupMaterials)
         sc.sticky["honeybee_RADMaterialAUX"] = RADMaterialAux
+        startupSnapshot.addTiming("RADIANCE materials", phaseStartTime, \
+                                  "restored" if startupMaterials != None else "")
         
         # Download EP libraries
+        phaseStartTime = time.time()
         templateFilesPrep = PrepareTemplateEPLibFiles(downloadTemplate)
         libFilePaths = templateFilesPrep.downloadTemplates()
+        startupSnapshot.addTiming("template files", phaseStartTime)
         msg = "Failed to load EP constructions! You won't be able to run analysis with Honeybee!\n" + \
                   "Download the files from address below and copy them to: " + sc.sticky["Honeybee_DefaultFolder"] + \
                   "\nhttps://github.com/mostaphaRoudsari/Honeybee/tree/master/resources\n"
+        phaseStartTime = time.time()
         if libFilePaths != -1:
+            # files are downloaded if they were not up to date
+            startupSnapshot.data["downloadTemplate"] = False
+            startupSnapshot.data["isNewerTHERMAvailable"] = False
+            startupSnapshot.setLibFiles(libFilePaths + [RADMaterialAux.getUserDefinedRadianceLibraryPath()])
+            
             EPLibs = HB_GetEPLibraries()
+            fileHashes = startupSnapshot.getLibrary("EPFileHashes") or {}
+            thermRecords = startupSnapshot.getLibrary("THERMMaterials") or {}
             
             try:
                 for pathCount, path in enumerate(libFilePaths):
@@ -8391,8 +12368,11 @@ if checkIn.letItFly:
                     if path.endswith('.csv'): isMatFile = True
                     else: isMatFile = False
                     
-                    EPLibs.importEPLibrariesFromFile(path, isMatFile, cleanLibs, False)                
+                    EPLibs.importEPLibrariesFromFile(path, isMatFile, cleanLibs, False, \
+                                                     fileHashes.get(path), thermRecords.get(path))
                 
+                startupSnapshot.setLibrary("EPFileHashes", EPLibs.fileHashes)
+                startupSnapshot.setLibrary("THERMMaterials", EPLibs.thermRecords)
                 EPLibs.report()
                 sc.sticky["honeybee_materialLib"].update(EPLibs.getEPMaterials())
                 sc.sticky["honeybee_windowMaterialLib"].update(EPLibs.getEPWindowMaterial())
@@ -8408,17 +12388,24 @@ if checkIn.letItFly:
         else:
             print msg
             ghenv.Component.AddRuntimeMessage(w, msg)
+        startupSnapshot.addTiming("EnergyPlus and THERM libraries", phaseStartTime)
         
+        if not startupSnapshot.isRestored and libFilePaths != -1:
+            startupSnapshot.save()
         
         sc.sticky["honeybee_Hive"] = hb_Hive
         sc.sticky["honeybee_generationHive"] = generationhb_hive
         sc.sticky["honeybee_GetEPLibs"] = HB_GetEPLibraries
+        sc.sticky["honeybee_IDFReader"] = hb_IDFReader
         sc.sticky["honeybee_DefaultMaterialLib"] = materialLibrary
         sc.sticky["honeybee_DefaultSurfaceLib"] = EPSurfaceLib
         sc.sticky["honeybee_EPMaterialAUX"] = EPMaterialAux
         sc.sticky["honeybee_EPScheduleAUX"] = EPScheduleAux
         sc.sticky["honeybee_EPObjectsAUX"] = EPObjectsAux
         sc.sticky["honeybee_ReadSchedules"] = ReadEPSchedules
+        sc.sticky["honeybee_ScheduleCompiler"] = hb_ScheduleCompiler
+        sc.sticky["honeybee_AdjacencyIndex"] = hb_AdjacencyIndex
+        sc.sticky["honeybee_ResultMatrix"] = hb_ResultMatrix
         sc.sticky["honeybee_BuildingProgramsLib"] = BuildingProgramsLib
         sc.sticky["honeybee_EPTypes"] = EPTypes()
         sc.sticky["honeybee_EPZone"] = EPZone
@@ -8444,13 +12431,24 @@ if checkIn.letItFly:
         sc.sticky["honeybee_DLAnalysisRecipe"] = DLAnalysisRecipe
         sc.sticky["honeybee_MeshToRAD"] = hb_MSHToRAD
         sc.sticky["honeybee_WriteRAD"] = hb_WriteRAD
+        sc.sticky["honeybee_JobScheduler"] = hb_JobScheduler
+        sc.sticky["honeybee_EPBatchRunner"] = hb_EPBatchRunner
+        sc.sticky["honeybee_RTracePartition"] = hb_RTracePartition
+        sc.sticky["honeybee_SimulationCache"] = hb_SimulationCache
+        sc.sticky["honeybee_RadianceSceneCache"] = hb_RadianceSceneCache
+        sc.sticky["honeybee_EPWSummary"] = hb_EPWSummary
         sc.sticky["honeybee_WriteRADAUX"] = hb_WriteRADAUX
         sc.sticky["honeybee_WriteDS"] = hb_WriteDS
         sc.sticky["honeybee_RADParameters"] = hb_RADParameters
         sc.sticky["honeybee_DSParameters"] = hb_DSParameters
         sc.sticky["honeybee_ReadAnnualResultsAux"] = hb_ReadAnnualResultsAux
+        sc.sticky["honeybee_IllMatrix"] = hb_IllMatrix
+        sc.sticky["honeybee_AnnualDaylightMetrics"] = hb_AnnualDaylightMetrics
         sc.sticky["honeybee_EPParameters"] = hb_EnergySimulatioParameters
+        sc.sticky["honeybee_EPResultReader"] = hb_EPResultReader
+        sc.sticky["honeybee_StartupSnapshot"] = hb_StartupSnapshot
         sc.sticky["honeybee_SerializeObjects"] = SerializeObjects
+        sc.sticky["honeybee_HBObjectsFile"] = hb_HBObjectsFile
         sc.sticky["honeybee_GridBasedDLResults"] = CalculateGridBasedDLAnalysisResults
         sc.sticky["honeybee_DLAnalaysisTypes"] = {0: ["0: illuminance" , "lux"],
                                                   1: ["1: radiation" , "wh/m2"],
@@ -8460,6 +12458,8 @@ if checkIn.letItFly:
                                                   4: ["4: VSC", "%"],
                                                   5: ["5: annual analysis", "var"]}
                                                  
+        print startupSnapshot.report()
+        
         # done! sharing the happiness.
         print "Hooohooho...Flying!!\nVviiiiiiizzz..."
         
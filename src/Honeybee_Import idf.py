@@ -12,11 +12,11 @@ Constructions, schedules and systems will be neglected
 """
 ghenv.Component.Name = "Honeybee_Import idf"
 ghenv.Component.NickName = 'importIdf'
-ghenv.Component.Message = 'VER 0.0.60\nNOV_04_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "13 | WIP"
-#compatibleHBVersion = VER 0.0.56\nNOV_04_2016
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "4"
 
@@ -29,106 +29,38 @@ import sys
 import System
 import uuid
 import Grasshopper.Kernel as gh
+import System.Threading.Tasks as tasks
 
 tolerance = sc.doc.ModelAbsoluteTolerance
 import math
 
 
-def createEPObject(idfFile, resultDict, key, type = None):
-    if key=="Zone,": key = "EPZONES"
-    
-    # This function creates a dictionary from EPObjects
-    if key not in resultDict.keys():
-        # create an empty dictionary for the key
-        resultDict[key] = {}
-    
-    # store the data into the dictionary
-    inLine = 0
-    recounter = 0
-    for lineCount, line in enumerate(idfFile):
-        if line.strip().startswith("!"):
-            recounter -= 1
-            continue
-        elif lineCount == 0:
-            # first line is the name of the object
-            nameKey = line.split("!")[0].strip()[:-1].strip()
-            if nameKey in resultDict[key].keys():
-                # this means the object is already in the library
-                warning = "The " + key + ": " + nameKey + " already exists in the libaray.\n" + \
-                          "You need to rename the " + key + "."
-                print warning
-                break
-            else:
-                # add the material to the library
-                resultDict[key][nameKey] = {}
-                if type!=None:
-                    resultDict[key][nameKey][0] = type
-                
-        else:
-            objValues = line.split("!")[0].strip().split(",")
-            
-            try: objDescription = line.split("!")[1].strip()
-            except:  objDescription = ""
-            objKey = lineCount + recounter #+ '_' + line.split("!-")[1].strip()
-            for objCount, objValue in enumerate(objValues):
-                if not objValue.endswith(";"):
-                    if objCount == 0 or len(objValue.strip())!=0: # get rid of empty items
-                        #print objValue
-                        if objCount!=0:inLine+=1
-                        resultDict[key][nameKey][objKey + inLine] = objValue, objDescription
-                elif objValue.endswith(";"):
-                    if objCount!=0: inLine+=1
-                    resultDict[key][nameKey][objKey + inLine] = objValue[:-1], objDescription
-                    
-                    return resultDict
+def toFloat(value, default = 0):
+    try: return float(value)
+    except ValueError: return default
 
-def createEPObjectDB(idfFile, resultDict, key, type = None, nameKey = None):
-    if key=="Zone,": key = "EPZONES"
+
+def createPlanarBreps(vertexArrays, movingVectors):
+    """Create a planar brep for each array of vertices in parallel.
     
-    # This function creates a dictionary from EPObjects
-    if key not in resultDict.keys():
-        # create an empty dictionary for the key
-        resultDict[key] = {}
+    The result is None for the vertices that don't make a valid surface.
+    """
+    geometries = [None] * len(vertexArrays)
     
-    if nameKey in resultDict[key].keys():
-        # this means the object is already in the library
-        warning = "The " + key + ": " + nameKey + " is already existed in the libaray.\n" + \
-                  "You need to rename the " + key + "."
-        print warning
-    else:
-        # add the material to the library
-        resultDict[key][nameKey] = {}
-        if type!=None: resultDict[key][nameKey][0] = type
+    def createBrep(count):
+        coordinates = vertexArrays[count]
+        movingVector = movingVectors[count]
+        try:
+            pts = [rc.Geometry.Point3d(coordinates[i], coordinates[i + 1], coordinates[i + 2]) + movingVector \
+                   for i in xrange(0, len(coordinates), 3)]
+            pts.append(pts[0])
+            polyline = rc.Geometry.Polyline(pts).ToNurbsCurve()
+            geometries[count] = rc.Geometry.Brep.CreatePlanarBreps(polyline)[0]
+        except:
+            pass
     
-    # store the data into the dictionary
-    inLine = 0
-    recounter = 0
-    for lineCount, line in enumerate(idfFile):
-        if line.strip().startswith("!"):
-            recounter -= 1
-            continue
-        else:
-            objValues = line.split("!")[0].strip().split(",")
-            
-            try: objDescription = line.split("!")[1].strip()
-            except:  objDescription = ""
-            objKey = lineCount + recounter #+ '_' + line.split("!-")[1].strip()
-            if objKey == 0:
-                recounter += 1
-                objKey += 1
-            for objCount, objValue in enumerate(objValues):
-                if not objValue.endswith(";"):
-                    if objCount == 0 or len(objValue.strip())!=0: # get rid of empty items
-                        #print objValue
-                        if objCount!=0:
-                            inLine+=1
-                            if lineCount == 1: recounter +=1
-                        resultDict[key][nameKey][objKey + inLine] = objValue, objDescription
-                elif objValue.endswith(";"):
-                    if objCount!=0: inLine+=1
-                    resultDict[key][nameKey][objKey + inLine] = objValue[:-1], objDescription
-                    
-                    return resultDict
+    tasks.Parallel.ForEach(xrange(len(vertexArrays)), createBrep)
+    return geometries
 
 
 # 4 represents an Air Wall
@@ -209,39 +141,17 @@ def main(idfFile, importEPObjects = False):
         sc.sticky["honeybee_ScheduleLib"].update(EPLibs.getEPSchedule())
         sc.sticky["honeybee_ScheduleTypeLimitsLib"].update(EPLibs.getEPScheduleTypeLimits())
     
-    EPKeys = ["Zone,", "BuildingSurface:Detailed", "FenestrationSurface:Detailed", \
-              "Shading:Site:Detailed", "Shading:Building:Detailed", "Shading:Zone:Detailed", \
-              "Window,", "WindowMaterial:Blind", "WindowMaterial:Shade", "WindowProperty:ShadingControl"]
-    EPKeys.extend(["Material,", "WindowMaterial,", "Construction,"])
-    idfFileDict = {}
-    
-    with open(idfFile, 'r') as inf:
-        for line in inf:
-            for key in EPKeys:
-                if line.strip().ToUpper().startswith(key.ToUpper()):
-                    objTypeInit = line.strip()[:-1].split(',')
-                    objType = objTypeInit[0] + ','
-                    if (len(objTypeInit) == 2 and '!' in objTypeInit[1]) or (len(objTypeInit) == 1):
-                        idfFileDict = createEPObject(inf, idfFileDict, key, objType)
-                    else:
-                        objName = objTypeInit[1].strip()
-                        idfFileDict = createEPObjectDB(inf, idfFileDict, key, objType, objName)
-    
-    outputs = {"Material" : [],
-            "WindowMaterial" : [],
-            "Construction" : []}
+    EPKeys = ["Zone", "BuildingSurface:Detailed", "FenestrationSurface:Detailed", \
+              "Shading:Site:Detailed", "Shading:Building:Detailed", "Window"]
+    hb_IDFReader = sc.sticky["honeybee_IDFReader"]
+    idfFileDict = hb_IDFReader(EPKeys).readObjects(idfFile)
+    getField = hb_IDFReader.getField
     
     HBZones = {}
     # create HBZones
-    # print idfFileDict.keys()
-    for EPZoneName in idfFileDict["EPZONES"]:
-        zoneData = idfFileDict["EPZONES"][EPZoneName]
-        try: x = float(zoneData[2][0])
-        except: x = 0
-        try: y = float(zoneData[3][0])
-        except: y = 0
-        try: z = float(zoneData[4][0])
-        except: z = 0
+    for zoneObject in idfFileDict.get("ZONE", []):
+        EPZoneName = zoneObject.name
+        x, y, z = [toFloat(getField(zoneObject.fields, i)) for i in (2, 3, 4)]
         
         movingVector = rc.Geometry.Vector3d(x, y, z)
         
@@ -250,160 +160,74 @@ def main(idfFile, importEPObjects = False):
         thisZone = hb_EPZone(None, zoneID, EPZoneName, program = [None, None], isConditioned = True)
         # I can also set the zone origin here
         HBZones[EPZoneName.lower()] = [thisZone, movingVector]
-        pass
     
     HBSurfaces = {}
-    if idfFileDict.has_key("BuildingSurface:Detailed"):
-        for surfaceName in idfFileDict["BuildingSurface:Detailed"]: #["BuildingSurface:Detailed"]:
-            srfType = idfFileDict["BuildingSurface:Detailed"][surfaceName][1][0]
-            EPConstruction = idfFileDict["BuildingSurface:Detailed"][surfaceName][2][0]
-            parentZone = idfFileDict["BuildingSurface:Detailed"][surfaceName][3][0]
-            srfBC = idfFileDict["BuildingSurface:Detailed"][surfaceName][4][0]
-            BCObject = idfFileDict["BuildingSurface:Detailed"][surfaceName][5][0]
-            sunExposure = idfFileDict["BuildingSurface:Detailed"][surfaceName][6][0]
-            windExposure = idfFileDict["BuildingSurface:Detailed"][surfaceName][7][0]
-            viewFactor = idfFileDict["BuildingSurface:Detailed"][surfaceName][8][0]
-            numOfVertices = idfFileDict["BuildingSurface:Detailed"][surfaceName][9][0]
-            numOfKeys = len(idfFileDict["BuildingSurface:Detailed"][surfaceName].keys())
-            pts = []
+    surfaceObjects = idfFileDict.get("BUILDINGSURFACE:DETAILED", [])
+    # create the geometries of all the surfaces at once
+    vertexArrays, movingVectors = [], []
+    for surfaceObject in surfaceObjects:
+        try: vertexArrays.append(hb_IDFReader.getVertices(surfaceObject.fields, 10))
+        except ValueError: vertexArrays.append([])
+        try: movingVectors.append(HBZones[getField(surfaceObject.fields, 3).lower()][1])
+        except KeyError: movingVectors.append(rc.Geometry.Vector3d.Zero)
+    geometries = createPlanarBreps(vertexArrays, movingVectors)
+    
+    for surfaceObject, geometry in zip(surfaceObjects, geometries):
+        surfaceName = surfaceObject.name
+        srfType, EPConstruction, parentZone, srfBC, BCObject, sunExposure, windExposure, \
+            viewFactor, numOfVertices = [getField(surfaceObject.fields, i) for i in range(1, 10)]
+        try:
+            #create the surface
+            thisEPSrf = hb_EPZoneSurface(geometry, 1, surfaceName)
             
-            # find moving vector based on parent zone
+            #assign properties
+            thisEPSrf.parent = HBZones[parentZone.lower()][0]
+            thisEPSrf.type = srfTypeDict[srfType.ToUpper()]
+            thisEPSrf.construction = thisEPSrf.cnstrSet[thisEPSrf.type]
+            thisEPSrf.EPConstruction = EPConstruction
+            thisEPSrf.setBC(srfBC, isUserInput= True)
+            thisEPSrf.BCObject = BCObject
+            thisEPSrf.sunExposure = sunExposure
+            thisEPSrf.windExposure = windExposure
+            thisEPSrf.groundViewFactor = viewFactor
+            thisEPSrf.numOfVertices = numOfVertices
             
-            movingVector = HBZones[parentZone.lower()][1]
-            try:
-                for coordinate in range(10, numOfKeys, 3):
-                    x = idfFileDict["BuildingSurface:Detailed"][surfaceName][coordinate][0]
-                    y = idfFileDict["BuildingSurface:Detailed"][surfaceName][coordinate + 1][0]
-                    z = idfFileDict["BuildingSurface:Detailed"][surfaceName][coordinate + 2][0]
-                    pts.append(rc.Geometry.Point3d.Add(rc.Geometry.Point3d(float(x), float(y), float(z)), movingVector))
-            except:
-                for coordinate in range(9, numOfKeys, 3):
-                    x = idfFileDict["BuildingSurface:Detailed"][surfaceName][coordinate][0]
-                    y = idfFileDict["BuildingSurface:Detailed"][surfaceName][coordinate + 1][0]
-                    z = idfFileDict["BuildingSurface:Detailed"][surfaceName][coordinate + 2][0]
-                    pts.append(rc.Geometry.Point3d.Add(rc.Geometry.Point3d(float(x), float(y), float(z)), movingVector))
-            pts.append(pts[0])
-            polyline = rc.Geometry.Polyline(pts).ToNurbsCurve()
-            try:
-                geometry = rc.Geometry.Brep.CreatePlanarBreps(polyline)[0]
-                #create the surface
-                thisEPSrf = hb_EPZoneSurface(geometry, 1, surfaceName)
-                #, parentZone, srfTypeDict[srfType.ToUpper()])
-                
-                #print parentZone
-                
-                #assign properties
-                thisEPSrf.parent = HBZones[parentZone.lower()][0]
-                thisEPSrf.type = srfTypeDict[srfType.ToUpper()]
-                thisEPSrf.construction = thisEPSrf.cnstrSet[thisEPSrf.type]
-                thisEPSrf.EPConstruction = EPConstruction
-                thisEPSrf.setBC(srfBC, isUserInput= True)
-                thisEPSrf.BCObject = BCObject
-                thisEPSrf.sunExposure = sunExposure
-                thisEPSrf.windExposure = windExposure
-                thisEPSrf.groundViewFactor = viewFactor
-                thisEPSrf.numOfVertices = numOfVertices
-                
-                # change type of surface if BC is set to ground
-                if srfBC.lower()== "ground":
-                    thisEPSrf.setType(int(thisEPSrf.type) + 0.5, isUserInput= True)
-                
-                
-                if srfBC.lower()== "ground" or srfBC.lower()== "adiabatic":
-                    thisEPSrf.setSunExposure('NoSun')
-                    thisEPSrf.setWindExposure('NoWind')
-                
-                if srfBC.lower()== "outdoors" or srfBC.lower()== "ground":
-                    thisEPSrf.setBCObjectToOutdoors()
-                
-                # add surface to the zone
-                HBZones[parentZone.lower()][0].addSrf(thisEPSrf)
-                # add to surfaces dictionary
-                HBSurfaces[surfaceName] = thisEPSrf
-            except:
-                print "failed to build EP Srf"
+            # change type of surface if BC is set to ground
+            if srfBC.lower()== "ground":
+                thisEPSrf.setType(int(thisEPSrf.type) + 0.5, isUserInput= True)
+            
+            
+            if srfBC.lower()== "ground" or srfBC.lower()== "adiabatic":
+                thisEPSrf.setSunExposure('NoSun')
+                thisEPSrf.setWindExposure('NoWind')
+            
+            if srfBC.lower()== "outdoors" or srfBC.lower()== "ground":
+                thisEPSrf.setBCObjectToOutdoors()
+            
+            # add surface to the zone
+            HBZones[parentZone.lower()][0].addSrf(thisEPSrf)
+            # add to surfaces dictionary
+            HBSurfaces[surfaceName] = thisEPSrf
+        except:
+            print "failed to build EP Srf"
     
-    HBFenSurfaces = {}
-    if idfFileDict.has_key("FenestrationSurface:Detailed"):
-        # add child surfaces
-        for surfaceName in idfFileDict["FenestrationSurface:Detailed"]: #["BuildingSurface:Detailed"]:
-            try:
-                srfType = idfFileDict["FenestrationSurface:Detailed"][surfaceName][1][0]
-                EPConstruction = idfFileDict["FenestrationSurface:Detailed"][surfaceName][2][0]
-                parentSrf = idfFileDict["FenestrationSurface:Detailed"][surfaceName][3][0]
-                BCObject = idfFileDict["FenestrationSurface:Detailed"][surfaceName][4][0]
-                viewFactor = idfFileDict["FenestrationSurface:Detailed"][surfaceName][5][0]
-                shadingControlName = idfFileDict["FenestrationSurface:Detailed"][surfaceName][6][0]
-                frameName = idfFileDict["FenestrationSurface:Detailed"][surfaceName][7][0]
-                multiplier = idfFileDict["FenestrationSurface:Detailed"][surfaceName][8][0]
-                numOfVertices = idfFileDict["FenestrationSurface:Detailed"][surfaceName][9][0]
-                numOfKeys = len(idfFileDict["FenestrationSurface:Detailed"][surfaceName].keys())
-                
-                pts = []
-                
-                
-                # let the user know that we don't support shading control right now and we are sorry
-                if shadingControlName.strip()!="":
-                    msg = "Currently Honeybee doesn't support importing shading controls!" +\
-                          "\nSorry and it will be added soon!"
-                    w = gh.GH_RuntimeMessageLevel.Warning
-                    ghenv.Component.AddRuntimeMessage(w, msg)
-                    
-                    shadingControlName = ""
-                
-                
-                # find moving vector based on parent zone
-                movingVector = HBZones[HBSurfaces[parentSrf].parent.name.lower()][1]
-                
-                for coordinate in range(10, numOfKeys, 3):
-                    x = idfFileDict["FenestrationSurface:Detailed"][surfaceName][coordinate][0]
-                    y = idfFileDict["FenestrationSurface:Detailed"][surfaceName][coordinate + 1][0]
-                    z = idfFileDict["FenestrationSurface:Detailed"][surfaceName][coordinate + 2][0]
-                    pts.append(rc.Geometry.Point3d.Add(rc.Geometry.Point3d(float(x), float(y), float(z)), movingVector))
-                    
-                pts.append(pts[0])
-                polyline = rc.Geometry.Polyline(pts).ToNurbsCurve()
-                geometry = rc.Geometry.Brep.CreatePlanarBreps(polyline)[0]
-                
-                #create the surface
-                thisEPFenSrf = hb_EPFenSurface(geometry, 1, surfaceName, HBSurfaces[parentSrf], 5)
-                
-                #assign properties
-                thisEPFenSrf.parent = HBSurfaces[parentSrf]
-                thisEPFenSrf.construction = thisEPFenSrf.cnstrSet[thisEPFenSrf.type]
-                thisEPFenSrf.EPConstruction = EPConstruction
-                thisEPFenSrf.BCObject = BCObject
-                thisEPFenSrf.shadingControlName = shadingControlName
-                thisEPFenSrf.frameName = frameName
-                thisEPFenSrf.multiplier = multiplier
-                thisEPFenSrf.groundViewFactor = viewFactor
-                thisEPFenSrf.numOfVertices = numOfVertices
-                
-                if thisEPFenSrf.parent.BC.lower()== "outdoors":
-                    thisEPFenSrf.setBCObjectToOutdoors()
-                    
-                # add the child surface to the surface
-                HBSurfaces[parentSrf].addChildSrf(thisEPFenSrf)
-            except:
-                print "failed to build fen srf"
+    # add child surfaces
+    fenObjects = idfFileDict.get("FENESTRATIONSURFACE:DETAILED", [])
+    vertexArrays, movingVectors = [], []
+    for fenObject in fenObjects:
+        try: vertexArrays.append(hb_IDFReader.getVertices(fenObject.fields, 10))
+        except ValueError: vertexArrays.append([])
+        # find moving vector based on parent zone
+        try: movingVectors.append(HBZones[HBSurfaces[getField(fenObject.fields, 3)].parent.name.lower()][1])
+        except KeyError: movingVectors.append(rc.Geometry.Vector3d.Zero)
+    geometries = createPlanarBreps(vertexArrays, movingVectors)
     
-    winPts = []
-    if idfFileDict.has_key("Window,"):
-        for windowName in idfFileDict["Window,"].keys():
-            windowObject = idfFileDict["Window,"][windowName]
-            srfType = 5
-            EPConstruction = windowObject[1][0]
-            parentSrfName = windowObject[2][0]
-            viewFactor = windowObject[3][0]
-            shadingControlName = windowObject[4][0]
-            frameName = windowObject[5][0]
-            numOfVertices = 4
-            multiplier = windowObject[7][0]
-            xCoor = float(windowObject[8][0])
-            zCoor = float(windowObject[9][0])
-            length = float(windowObject[10][0])
-            height = float(windowObject[11][0])
-
+    for fenObject, geometry in zip(fenObjects, geometries):
+        surfaceName = fenObject.name
+        try:
+            srfType, EPConstruction, parentSrf, BCObject, viewFactor, shadingControlName, \
+                frameName, multiplier, numOfVertices = [getField(fenObject.fields, i) for i in range(1, 10)]
+            
             # let the user know that we don't support shading control right now and we are sorry
             if shadingControlName.strip()!="":
                 msg = "Currently Honeybee doesn't support importing shading controls!" +\
@@ -412,28 +236,12 @@ def main(idfFile, importEPObjects = False):
                 ghenv.Component.AddRuntimeMessage(w, msg)
                 
                 shadingControlName = ""
-
-            # find surface plane
-            parentSrf = HBSurfaces[parentSrfName]
-            coordinates = parentSrf.extractPoints()
-            SrfPlane = rc.Geometry.Plane(coordinates[0], coordinates[1], coordinates[3])
-            
-            # create four points on XZ Plane
-            pt1 = rc.Geometry.Point3d.Add(rc.Geometry.Point3d.Origin, rc.Geometry.Vector3d(xCoor, zCoor, 0))
-            pt2 = rc.Geometry.Point3d.Add(rc.Geometry.Point3d.Origin, rc.Geometry.Vector3d(xCoor + length, zCoor, 0))
-            pt3 = rc.Geometry.Point3d.Add(rc.Geometry.Point3d.Origin, rc.Geometry.Vector3d(xCoor + length, zCoor + height, 0))
-            pt4 = rc.Geometry.Point3d.Add(rc.Geometry.Point3d.Origin, rc.Geometry.Vector3d(xCoor, zCoor + height, 0))
             
-            transform = rc.Geometry.Transform.PlaneToPlane(rc.Geometry.Plane.WorldXY, SrfPlane)
-            polyline = rc.Geometry.Polyline([pt1, pt2, pt3, pt4, pt1]).ToNurbsCurve()
-            polyline.Transform(transform)
-            
-            geometry = rc.Geometry.Brep.CreatePlanarBreps(polyline)[0]
             #create the surface
-            thisEPFenSrf = hb_EPFenSurface(geometry, 1, windowName, parentSrf, 5)
+            thisEPFenSrf = hb_EPFenSurface(geometry, 1, surfaceName, HBSurfaces[parentSrf], 5)
             
             #assign properties
-            thisEPFenSrf.parent = parentSrf
+            thisEPFenSrf.parent = HBSurfaces[parentSrf]
             thisEPFenSrf.construction = thisEPFenSrf.cnstrSet[thisEPFenSrf.type]
             thisEPFenSrf.EPConstruction = EPConstruction
             thisEPFenSrf.BCObject = BCObject
@@ -447,39 +255,86 @@ def main(idfFile, importEPObjects = False):
                 thisEPFenSrf.setBCObjectToOutdoors()
                 
             # add the child surface to the surface
-            parentSrf.addChildSrf(thisEPFenSrf)
-            
-    shadingList = []
-    if idfFileDict.has_key("Shading:Site:Detailed"):
-        for shadingName in idfFileDict["Shading:Site:Detailed"].keys():
-            shadingObj = idfFileDict["Shading:Site:Detailed"][shadingName]
-            pts = []
-            for coordinate in range(3, len(shadingObj.keys()), 3):
-                x = shadingObj[coordinate][0]
-                y = shadingObj[coordinate + 1][0]
-                z = shadingObj[coordinate + 2][0]
-                pts.append(rc.Geometry.Point3d(float(x), float(y), float(z)))
-            pts.append(pts[0])
-            polyline = rc.Geometry.Polyline(pts).ToNurbsCurve()
-            geometry = rc.Geometry.Brep.CreatePlanarBreps(polyline)[0]
-            thisShading = hb_EPSHDSurface(geometry, 1, shadingName)
+            HBSurfaces[parentSrf].addChildSrf(thisEPFenSrf)
+        except:
+            print "failed to build fen srf"
     
-    if idfFileDict.has_key("Shading:Building:Detailed"):
-        for shadingName in idfFileDict["Shading:Building:Detailed"].keys():
-            shadingObj = idfFileDict["Shading:Building:Detailed"][shadingName]
-            pts = []
-            for coordinate in range(3, len(shadingObj.keys()), 3):
-                x = shadingObj[coordinate][0]
-                y = shadingObj[coordinate + 1][0]
-                z = shadingObj[coordinate + 2][0]
-                pts.append(rc.Geometry.Point3d(float(x), float(y), float(z)))
-            pts.append(pts[0])
-            polyline = rc.Geometry.Polyline(pts).ToNurbsCurve()
-            geometry = rc.Geometry.Brep.CreatePlanarBreps(polyline)[0]
-            thisShading = hb_EPSHDSurface(geometry, 1, shadingName)
+    winPts = []
+    for windowObject in idfFileDict.get("WINDOW", []):
+        windowName = windowObject.name
+        srfType = 5
+        EPConstruction = getField(windowObject.fields, 1)
+        parentSrfName = getField(windowObject.fields, 2)
+        viewFactor = getField(windowObject.fields, 3)
+        shadingControlName = getField(windowObject.fields, 4)
+        frameName = getField(windowObject.fields, 5)
+        numOfVertices = 4
+        multiplier = getField(windowObject.fields, 7)
+        xCoor = float(getField(windowObject.fields, 8))
+        zCoor = float(getField(windowObject.fields, 9))
+        length = float(getField(windowObject.fields, 10))
+        height = float(getField(windowObject.fields, 11))
+
+        # let the user know that we don't support shading control right now and we are sorry
+        if shadingControlName.strip()!="":
+            msg = "Currently Honeybee doesn't support importing shading controls!" +\
+                  "\nSorry and it will be added soon!"
+            w = gh.GH_RuntimeMessageLevel.Warning
+            ghenv.Component.AddRuntimeMessage(w, msg)
             
-    
-            shadingList.append(thisShading)
+            shadingControlName = ""
+
+        # find surface plane
+        parentSrf = HBSurfaces[parentSrfName]
+        coordinates = parentSrf.extractPoints()
+        SrfPlane = rc.Geometry.Plane(coordinates[0], coordinates[1], coordinates[3])
+        
+        # create four points on XZ Plane
+        pt1 = rc.Geometry.Point3d.Add(rc.Geometry.Point3d.Origin, rc.Geometry.Vector3d(xCoor, zCoor, 0))
+        pt2 = rc.Geometry.Point3d.Add(rc.Geometry.Point3d.Origin, rc.Geometry.Vector3d(xCoor + length, zCoor, 0))
+        pt3 = rc.Geometry.Point3d.Add(rc.Geometry.Point3d.Origin, rc.Geometry.Vector3d(xCoor + length, zCoor + height, 0))
+        pt4 = rc.Geometry.Point3d.Add(rc.Geometry.Point3d.Origin, rc.Geometry.Vector3d(xCoor, zCoor + height, 0))
+        
+        transform = rc.Geometry.Transform.PlaneToPlane(rc.Geometry.Plane.WorldXY, SrfPlane)
+        polyline = rc.Geometry.Polyline([pt1, pt2, pt3, pt4, pt1]).ToNurbsCurve()
+        polyline.Transform(transform)
+        
+        geometry = rc.Geometry.Brep.CreatePlanarBreps(polyline)[0]
+        #create the surface
+        thisEPFenSrf = hb_EPFenSurface(geometry, 1, windowName, parentSrf, 5)
+        
+        #assign properties
+        thisEPFenSrf.parent = parentSrf
+        thisEPFenSrf.construction = thisEPFenSrf.cnstrSet[thisEPFenSrf.type]
+        thisEPFenSrf.EPConstruction = EPConstruction
+        thisEPFenSrf.BCObject = BCObject
+        thisEPFenSrf.shadingControlName = shadingControlName
+        thisEPFenSrf.frameName = frameName
+        thisEPFenSrf.multiplier = multiplier
+        thisEPFenSrf.groundViewFactor = viewFactor
+        thisEPFenSrf.numOfVertices = numOfVertices
+        
+        if thisEPFenSrf.parent.BC.lower()== "outdoors":
+            thisEPFenSrf.setBCObjectToOutdoors()
+            
+        # add the child surface to the surface
+        parentSrf.addChildSrf(thisEPFenSrf)
+        
+    shadingList = []
+    for shadingObject in idfFileDict.get("SHADING:SITE:DETAILED", []) + \
+                         idfFileDict.get("SHADING:BUILDING:DETAILED", []):
+        try:
+            coordinates = hb_IDFReader.getVertices(shadingObject.fields, 3)
+        except ValueError:
+            continue
+        pts = [rc.Geometry.Point3d(coordinates[i], coordinates[i + 1], coordinates[i + 2]) \
+               for i in xrange(0, len(coordinates), 3)]
+        pts.append(pts[0])
+        polyline = rc.Geometry.Polyline(pts).ToNurbsCurve()
+        geometry = rc.Geometry.Brep.CreatePlanarBreps(polyline)[0]
+        thisShading = hb_EPSHDSurface(geometry, 1, shadingObject.name)
+        
+        shadingList.append(thisShading)
     
     # recalculate the zone
     zonesList = []
@@ -58,11 +58,11 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_Indoor View Factor Calculator"
 ghenv.Component.NickName = 'IndoorViewFactor'
-ghenv.Component.Message = 'VER 0.0.60\nOCT_08_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nFEB_21_2016
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nJUN_25_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "6"
 except: pass
@@ -70,13 +70,14 @@ except: pass
 
 from System import Object
 from System import Drawing
+from System import Array
+import clr
 import Grasshopper.Kernel as gh
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
 import Rhino as rc
 import rhinoscriptsyntax as rs
 import scriptcontext as sc
-import operator
 import System.Threading.Tasks as tasks
 import time
 
@@ -1199,47 +1200,132 @@ def checkViewResolution(viewResolution, lb_preparation):
     
     return newVecs, skyViewVecs
 
-def allSame(items):
-    return all(x == items[0] for x in items)
+class ZoneRayEngine(object):
+    """Cast bundles of rays against all of the surface meshes of a zone at once.
+    
+    The surface meshes are joined into one mesh so that RhinoCommon builds a single
+    face tree for the zone and every ray is intersected once instead of once per surface.
+    Each face of the joined mesh is tagged with the index of the surface it comes from and
+    the surface of a hit is found from the face ids that MeshRay returns. Rhino 5 doesn't
+    return the face ids and the closest face to the hit point is used instead.
+    
+    RhinoCommon intersects one ray per call so rays are cast in batches of points
+    (batchSize points per parallel task) with all the vectors of each point.
+    """
+    
+    batchSize = 16
+    
+    def __init__(self, srfMeshes):
+        self.mesh = rc.Geometry.Mesh()
+        self.faceSrfIds = []
+        for srfCount, srfMesh in enumerate(srfMeshes):
+            self.mesh.Append(srfMesh)
+            self.faceSrfIds.extend([srfCount] * srfMesh.Faces.Count)
+        self.srfCount = len(srfMeshes)
+        self.tol = sc.doc.ModelAbsoluteTolerance
+        self.hasFaceIds = True
+        
+        # build the face tree before the rays are cast in parallel
+        if len(self.faceSrfIds) != 0:
+            self.mesh.ClosestMeshPoint(rc.Geometry.Point3d(self.mesh.Vertices[0]), 0)
+    
+    def castRay(self, ray):
+        """Return the ray parameter and the index of the nearest surface. (-1, None) if nothing is hit."""
+        if len(self.faceSrfIds) == 0: return -1, None
+        if self.hasFaceIds:
+            faceIds = clr.Reference[Array[int]]()
+            try:
+                rayParam = rc.Geometry.Intersect.Intersection.MeshRay(self.mesh, ray, faceIds)
+            except TypeError:
+                # Rhino 5
+                self.hasFaceIds = False
+        
+        if not self.hasFaceIds:
+            rayParam = rc.Geometry.Intersect.Intersection.MeshRay(self.mesh, ray)
+            if rayParam < 0: return -1, None
+            meshPt = self.mesh.ClosestMeshPoint(ray.PointAt(rayParam), 0)
+            return rayParam, self.faceSrfIds[meshPt.FaceIndex]
+        
+        if rayParam < 0 or faceIds.Value == None or faceIds.Value.Length == 0: return -1, None
+        # a ray that hits an edge returns the faces on both sides. use the lowest surface index.
+        return rayParam, min(self.faceSrfIds[faceId] for faceId in faceIds.Value)
+    
+    def castBundle(self, point, vectors):
+        """Return the index of the nearest surface (or None) for each vector from the point."""
+        castRay = self.castRay
+        Ray3d = rc.Geometry.Ray3d
+        return [castRay(Ray3d(point, vec))[1] for vec in vectors]
+    
+    def getBatches(self, pointCount):
+        """Return ranges of point indices that are cast together in one parallel task."""
+        return [range(start, min(start + self.batchSize, pointCount)) \
+                for start in xrange(0, pointCount, self.batchSize)]
+    
+    def isBlocked(self, ray):
+        return self.castRay(ray)[1] != None
+    
+    def getAllHits(self, ray):
+        """Return sorted indices of all the surfaces that are hit along the ray."""
+        srfIds = set()
+        direction = rc.Geometry.Vector3d(ray.Direction)
+        direction.Unitize()
+        for count in xrange(len(self.faceSrfIds) + 1):
+            rayParam, srfId = self.castRay(ray)
+            if srfId == None: break
+            srfIds.add(srfId)
+            # move the ray past the hit point
+            ray = rc.Geometry.Ray3d(ray.PointAt(rayParam) + direction * self.tol, ray.Direction)
+        return sorted(srfIds)
+
+
+def projectPoint(rayEngine, viewVectors, point):
+    #Count the rays that hit each surface first and divide by the total rays to get the view factor.
+    divisor = len(viewVectors)
+    srfHits = [0] * rayEngine.srfCount
+    for srfId in rayEngine.castBundle(point, viewVectors):
+        if srfId != None: srfHits[srfId] += 1
+    
+    return [hitCount/divisor for hitCount in srfHits]
+
+
+def skyProjectPoint(opaqueEngine, windowEngine, skyViewVecs, point, zoneWindowTransmiss, zoneHasWindows, zoneWindowNames):
+    divisor = len(skyViewVecs)
+    finalViewCount = []
+    finalWindowNameCount = []
+    for vec in skyViewVecs:
+        ray = rc.Geometry.Ray3d(point, vec)
+        if opaqueEngine.isBlocked(ray):
+            #The ray has been blocked by an opaque surface.
+            finalViewCount.append(0)
+            finalWindowNameCount.append(0)
+        elif zoneHasWindows == 2:
+            finalViewCount.append(1) #This is the code to indicate that the point is outside and there is no need to calculate a window transmissivity.
+            finalWindowNameCount.append(0)
+        else:
+            #The ray is not blocked but it is hitting a window and so we need to factor in the window transmissivity.
+            transmiss = 1
+            winNameList = []
+            for winCount in windowEngine.getAllHits(ray):
+                transmiss = transmiss * zoneWindowTransmiss[winCount]
+                winNameList.append(zoneWindowNames[winCount].upper())
+            finalViewCount.append(transmiss)
+            finalWindowNameCount.append(winNameList)
+    
+    return sum(finalViewCount)/divisor, finalViewCount, finalWindowNameCount
+
 
 def parallel_projection(zoneSrfsMesh, viewVectors, pointList):
     #Placeholder for the outcome of the parallel projection.
     pointIntList = []
     for point in pointList: pointIntList.append([])
     
-    #Keep track of the divisor.
-    divisor = len(viewVectors)
+    rayEngine = ZoneRayEngine(zoneSrfsMesh)
     
-    def intersect(i):
-        point = pointList[i]
-        #Create the rays to be projected from each point.
-        pointRays = []
-        for vec in viewVectors: pointRays.append(rc.Geometry.Ray3d(point, vec))
-        
-        #Create a list that will hold the intersection hits of each surface
-        srfHits = []
-        for srf in zoneSrfsMesh: srfHits.append([])
-        
-        #Perform the intersection of the rays with the mesh.
-        pointIntersectList = []
-        for rayCount, ray in enumerate(pointRays):
-            pointIntersectList.append([])
-            for srf in zoneSrfsMesh:
-                intersect = rc.Geometry.Intersect.Intersection.MeshRay(srf, ray)
-                if intersect == -1: intersect = "N"
-                pointIntersectList[rayCount].append(intersect)
-        
-        #Find the intersection that was the closest for each ray.
-        for list in pointIntersectList:
-            if allSame(list) == False:
-                minIndex, minValue = min(enumerate(list), key=operator.itemgetter(1))
-                srfHits[minIndex].append(1)
-        
-        #Sum up the lists and divide by the total rays to get the view factor.
-        for hitList in srfHits:
-            pointIntList[i].append(sum(hitList)/divisor)
+    def intersect(batch):
+        for i in batch:
+            pointIntList[i] = projectPoint(rayEngine, viewVectors, pointList[i])
     
-    tasks.Parallel.ForEach(range(len(pointList)), intersect)
+    tasks.Parallel.ForEach(rayEngine.getBatches(len(pointList)), intersect)
     
     return pointIntList
 
@@ -1254,60 +1340,15 @@ def parallel_skyProjection(zoneOpaqueMesh, skyViewVecs, pointList, zoneWindowMes
         skyBlockedList.append([])
         skyBlockWindowNameCount.append([])
     
-    #Keep track of the divisor.
-    divisor = len(skyViewVecs)
+    opaqueEngine = ZoneRayEngine(zoneOpaqueMesh)
+    windowEngine = ZoneRayEngine(zoneWindowMesh)
     
-    def intersect(i):
-        point = pointList[i]
-        #Create the rays to be projected from each point.
-        pointRays = []
-        for vec in skyViewVecs: pointRays.append(rc.Geometry.Ray3d(point, vec))
-        
-        #Perform the intersection of the rays with the opaque mesh.
-        pointIntersectList = []
-        for rayCount, ray in enumerate(pointRays):
-            pointIntersectList.append([])
-            for srf in zoneOpaqueMesh:
-                intersect = rc.Geometry.Intersect.Intersection.MeshRay(srf, ray)
-                if intersect == -1: pass
-                else: pointIntersectList[rayCount].append(1)
-        
-        #See if the ray passed all of the context meshes.
-        finalIntersectList = []
-        for ray in pointRays:
-            finalIntersectList.append([])
-        for listCt, rayList in enumerate(pointIntersectList):
-            for intersect in rayList:
-                finalIntersectList[listCt].append(intersect)
-        
-        finalViewCount = []
-        finalWindowNameCount = []
-        for rayListCount, rayList in enumerate(finalIntersectList):
-            if sum(rayList) == 0:
-                if zoneHasWindows == 2:
-                    finalViewCount.append(1)
-                    finalWindowNameCount.append(0)
-                else:
-                    transmiss = 1
-                    winNameList = []
-                    for winCount, winMesh in enumerate(zoneWindowMesh):
-                        intersect = rc.Geometry.Intersect.Intersection.MeshRay(winMesh, pointRays[rayListCount])
-                        if intersect == -1: pass
-                        else:
-                            transmiss = transmiss * zoneWindowTransmiss[winCount]
-                            winNameList.append(zoneWindowNames[winCount].upper())
-                    finalViewCount.append(transmiss)
-                    finalWindowNameCount.append(winNameList)
-            else:
-                finalViewCount.append(0)
-                finalWindowNameCount.append(0)
-        
-        #Sum up the lists and divide by the total rays to get the view factor.
-        skyBlockedList[i] = finalViewCount
-        skyBlockWindowNameCount[i] = finalWindowNameCount
-        pointIntList[i] = sum(finalViewCount)/divisor
+    def intersect(batch):
+        for i in batch:
+            pointIntList[i], skyBlockedList[i], skyBlockWindowNameCount[i] = \
+                skyProjectPoint(opaqueEngine, windowEngine, skyViewVecs, pointList[i], zoneWindowTransmiss, zoneHasWindows, zoneWindowNames)
     
-    tasks.Parallel.ForEach(range(len(pointList)), intersect)
+    tasks.Parallel.ForEach(opaqueEngine.getBatches(len(pointList)), intersect)
     
     return pointIntList, skyBlockedList, skyBlockWindowNameCount
 
@@ -1334,58 +1375,12 @@ def skyViewCalc(testPts, zoneOpaqueMesh, skyViewVecs, zoneHasWindows, zoneWindow
                 testPtSkyView.append([])
                 testPtSkyBlockedList.append([])
                 testPtBlockName.append([])
+                opaqueEngine = ZoneRayEngine(zoneOpaqueMesh[zoneCount])
+                windowEngine = ZoneRayEngine(zoneWindowMesh[zoneCount])
                 for pointCount, point in enumerate(pointList):
-                    #Make the list that will eventually hold the view factors of each surface.
-                    divisor = len(skyViewVecs)
-                    
-                    #Create the rays to be projected from each point.
-                    pointRays = []
-                    for vec in skyViewVecs: pointRays.append(rc.Geometry.Ray3d(point, vec))
-                    
-                    #Perform the intersection of the rays with the opaque mesh.
-                    pointIntersectList = []
-                    for rayCount, ray in enumerate(pointRays):
-                        pointIntersectList.append([])
-                        for srf in zoneOpaqueMesh[zoneCount]:
-                            intersect = rc.Geometry.Intersect.Intersection.MeshRay(srf, ray)
-                            if intersect == -1: pointIntersectList[rayCount].append(0)
-                            else: pointIntersectList[rayCount].append(1)
-                    
-                    #See if the ray passed all of the context meshes.
-                    finalIntersectList = []
-                    for ray in pointRays:
-                        finalIntersectList.append([])
-                    for listCt, rayList in enumerate(pointIntersectList):
-                        for intersect in rayList:
-                            finalIntersectList[listCt].append(intersect)
-                    
-                    finalViewCount = []
-                    finalWindowNameCount = []
-                    for rayListCount, rayList in enumerate(finalIntersectList):
-                        if sum(rayList) == 0:
-                            if zoneHasWindows[zoneCount] == 2:
-                                finalViewCount.append(1) #This is the code to indicate that the point is outside and there is no need to calculate a window transmissivity.
-                                finalWindowNameCount.append(0)
-                            else:
-                                #The ray is not blocked but it is hitting a window and so we need to factor in the window transmissivity.
-                                transmiss = 1
-                                winNameList = []
-                                for winCount, winMesh in enumerate(zoneWindowMesh[zoneCount]):
-                                    intersect = rc.Geometry.Intersect.Intersection.MeshRay(winMesh, pointRays[rayListCount])
-                                    if intersect == -1: pass
-                                    else:
-                                        transmiss = transmiss * zoneWindowTransmiss[zoneCount][winCount]
-                                        winNameList.append(zoneWindowNames[zoneCount][winCount].upper())
-                                finalViewCount.append(transmiss)
-                                finalWindowNameCount.append(winNameList)
-                        else:
-                            #The ray has been blocked by an opaque surface.
-                            finalViewCount.append(0)
-                            finalWindowNameCount.append(0)
-                    
-                    #Sum up the lists and divide by the total rays to get the view factor.
+                    skyViewFactor, finalViewCount, finalWindowNameCount = skyProjectPoint(opaqueEngine, windowEngine, skyViewVecs, point, zoneWindowTransmiss[zoneCount], zoneHasWindows[zoneCount], zoneWindowNames[zoneCount])
                     testPtSkyBlockedList[zoneCount].append(finalViewCount)
-                    testPtSkyView[zoneCount].append(sum(finalViewCount)/divisor)
+                    testPtSkyView[zoneCount].append(skyViewFactor)
                     testPtBlockName[zoneCount].append(finalWindowNameCount)
         else:
             testPtSkyView.append(0)
@@ -1404,39 +1399,9 @@ def main(testPts, zoneSrfsMesh, viewVectors, includeOutdoor):
             testPtViewFactor.append(viewFactors)
         else:
             testPtViewFactor.append([])
+            rayEngine = ZoneRayEngine(zoneSrfsMesh[zoneCount])
             for pointCount, point in enumerate(pointList):
-                #Make the list that will eventually hold the view factors of each surface.
-                testPtViewFactor[zoneCount].append([])
-                divisor = len(viewVectors)
-                
-                #Create the rays to be projected from each point.
-                pointRays = []
-                for vec in viewVectors: pointRays.append(rc.Geometry.Ray3d(point, vec))
-                
-                #Create a list that will hold the intersection hits of each surface
-                srfHits = []
-                for srf in zoneSrfsMesh[zoneCount]: srfHits.append([])
-                
-                #Perform the intersection of the rays with the mesh.
-                pointIntersectList = []
-                for rayCount, ray in enumerate(pointRays):
-                    pointIntersectList.append([])
-                    for srf in zoneSrfsMesh[zoneCount]:
-                        intersect = rc.Geometry.Intersect.Intersection.MeshRay(srf, ray)
-                        if intersect == -1: intersect = "N"
-                        pointIntersectList[rayCount].append(intersect)
-                
-                #Find the intersection that was the closest for each ray.
-                for list in pointIntersectList:
-                    try:
-                        if allSame(list) == False:
-                            minIndex, minValue = min(enumerate(list), key=operator.itemgetter(1))
-                            srfHits[minIndex].append(1)
-                    except: pass
-                
-                #Sum up the lists and divide by the total rays to get the view factor.
-                for hitList in srfHits:
-                    testPtViewFactor[zoneCount][pointCount].append(sum(hitList)/divisor)
+                testPtViewFactor[zoneCount].append(projectPoint(rayEngine, viewVectors, point))
     
     
     return testPtViewFactor
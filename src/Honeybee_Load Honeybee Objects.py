@@ -25,12 +25,15 @@ Load Honeybee Objects
 
 Use this component to load Honeybee objects from a file on your system.
 The valid files are created by dump Honeybee objects component.
+Materials, constructions and schedules in the file are added to the libraries if they are not already loaded.
 -
 Provided by Honeybee 0.0.60
 
     Args:
         _HBObjects: A list of Honeybee objects
         _filePath: A valid path to a file on your drive (e.g. c:\ladybug\20ZonesExample.HB)
+        zoneNames_: Optional list of zone names to only load these zones (and surfaces with these names) from the file. Only the requested objects are read from the file.
+        floorHeight_: Optional height of the floor of the zones to load one floor from the file. It can be used together with zoneNames_.
         _load: Set to True to load the objects from the file
     Returns:
         readMe!: ...
@@ -38,11 +41,11 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_Load Honeybee Objects"
 ghenv.Component.NickName = 'loadHBObjects'
-ghenv.Component.Message = 'VER 0.0.60\nNOV_04_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "13 | WIP"
-#compatibleHBVersion = VER 0.0.59\nNOV_04_2016
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "1"
 except: pass
@@ -51,9 +54,16 @@ import cPickle as pickle
 import scriptcontext as sc
 import Grasshopper.Kernel as gh
 import os
+import time
 import uuid
 from Rhino.Geometry import *
 
+#zoneNames_ and floorHeight_ are not available in the older versions of the component.
+try: zoneNames_
+except NameError: zoneNames_ = []
+try: floorHeight_
+except NameError: floorHeight_ = None
+
 class outdoorBCObject(object):
     """
     BCObject for surfaces with outdoor BC
@@ -62,7 +72,8 @@ class outdoorBCObject(object):
         self.name = name
 
 
-def loadHBObjects(HBData):
+def loadPickledHBObjects(HBData):
+    """Load Honeybee objects from files that are created by the older versions of dump Honeybee objects."""
     
     hb_EPZone = sc.sticky["honeybee_EPZone"]
     hb_EPSrf = sc.sticky["honeybee_EPSurface"]
@@ -70,8 +81,6 @@ def loadHBObjects(HBData):
     hb_EPSHDSurface = sc.sticky["honeybee_EPShdSurface"]
     hb_EPFenSurface = sc.sticky["honeybee_EPFenSurface"]
     
-    hb_hive = sc.sticky["honeybee_Hive"]()
-    
     # a global dictonary to collect data
     ids = HBData["ids"]
     objs = HBData["objs"]
@@ -155,10 +164,10 @@ def loadHBObjects(HBData):
     updateHoneybeeObjects()
     
     # return new Honeybee objects
-    return hb_hive.addToHoneybeeHive([HBObjects[id] for id in HBData["ids"]], ghenv.Component.InstanceGuid)
+    return [HBObjects[id] for id in HBData["ids"]]
 
 
-def main(filePath, load):
+def main(filePath, zoneNames, floorHeight, load):
     if not sc.sticky.has_key('honeybee_release'):
         print "You should first let Honeybee to fly..."
         w = gh.GH_RuntimeMessageLevel.Warning
@@ -172,10 +181,42 @@ def main(filePath, load):
     if not os.path.isfile(filePath):
         raise ValueError("Can't find %s"%filePath)
     
-    with open(filePath, "rb") as inf:
-        return loadHBObjects(pickle.load(inf))
+    isPartialLoad = len(zoneNames) != 0 or floorHeight != None
+    startTime = time.time()
+    hb_HBObjectsFile = sc.sticky["honeybee_HBObjectsFile"]
+    if hb_HBObjectsFile.isHBObjectsFile(filePath):
+        HBFile = hb_HBObjectsFile(filePath)
+        if isPartialLoad:
+            records = HBFile.getRecords(zoneNames if len(zoneNames) != 0 else None, floorHeight)
+            if len(records) == 0:
+                warning = "None of the objects in the file matches zoneNames_ and floorHeight_."
+                print warning
+                ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+                return -1
+            HBObjects = HBFile.load(records)
+        else:
+            HBObjects = HBFile.load()
+        
+        if len(HBFile.downgradedSurfaces) != 0:
+            warning = "%d surfaces are adjacent to zones that are not loaded. "%len(HBFile.downgradedSurfaces) + \
+                      "Their boundary condition is changed from Surface to Adiabatic:\n" + \
+                      "\n".join(HBFile.downgradedSurfaces)
+            print warning
+            ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+    else:
+        if isPartialLoad:
+            warning = "zoneNames_ and floorHeight_ are only supported for files that are created by the " + \
+                      "current version of dump Honeybee objects. All the objects are loaded."
+            print warning
+            ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+        with open(filePath, "rb") as inf:
+            HBObjects = loadPickledHBObjects(pickle.load(inf))
+    print "Loaded %d objects in %.2f seconds"%(len(HBObjects), time.time() - startTime)
+    
+    hb_hive = sc.sticky["honeybee_Hive"]()
+    return hb_hive.addToHoneybeeHive(HBObjects, ghenv.Component)
     
 
-results = main(_filePath, _load)
+results = main(_filePath, zoneNames_, floorHeight_, _load)
 
 HBObjects = results if results!= -1 else None
@@ -35,7 +35,7 @@ Provided by Honeybee 0.0.60
         =============: ...
         analysisPeriodOrHOY_: An analysis period from the 'Ladybug Analysis Period' component or an hour of the analysis between 1 and 8760 for which you want to conduct the analysis. If no value is connected here, the component will run for only noon on the winter solstice.  A single HOY is used by default as longer analysis periods can take a very long time.
         =============: ...
-        writeResultFile_: Set to 1 or 'True' to have the component write all results into CSV result files and set to 0 or 'False' to not have the component write these files.  The default is set to 'True' as these simulations can be long and you usually want a copy of your results.  You may want to set it to 'False' if you are just scrolling through key hours and want the fastest run possible.  Set to 2 if you want the component to only write the results of the last two matrices (comfort results and degFromTarget).
+        writeResultFile_: Set to 1 or 'True' to have the component write all results into binary matrix files that can be read with the 'Honeybee_Read Microclimate Matrix' component and set to 0 or 'False' to not have the component write these files.  The default is set to 'True' as these simulations can be long and you usually want a copy of your results.  You may want to set it to 'False' if you are just scrolling through key hours and want the fastest run possible.  Set to 2 if you want the component to only write the results of the last two matrices (comfort results and degFromTarget).
         parallel_: Set to "True" to run the component using multiple CPUs.  This can dramatically decrease calculation time but can interfere with other intense computational processes that might be running on your machine.  For this reason, the default is set to 'False.'
         _runIt: Set boolean to "True" to run the component and generate files for an annual indoor comfort assessment.
     Returns:
@@ -47,21 +47,21 @@ Provided by Honeybee 0.0.60
         adaptComfMtx: A python matrix containing adaptive comfort data for every hour of the analysis to be plugged into the 'Honeybee_Visualize Annual Comfort Results' component.
         degFromTargetMtx: A python matrix containing degrees from tartget temperature data for every hour of the analysis to be plugged into the 'Honeybee_Visualize Annual Comfort Results' component.
         ===============: ...
-        radTempResult: A csv file address containing the radiant temperature resultsfor each point for every hour of the analysis.
-        airTempResult: A csv file address containing the air temperature results for each point for every hour of the analysis.
-        operativeTempResult: A csv file address containing the operative temperature results for each point for every hour of the analysis.
-        adaptComfResult: A csv file address containing the a series of 0's and 1's indicating whether a certain point is comfortable for every hour of the analysis.
-        degFromTargetResult: A csv file address containing the a series of numbers indicating the degrees that a certain point is from the neutral temperature for every hour of the analysis.
+        radTempResult: A matrix file address containing the radiant temperature resultsfor each point for every hour of the analysis.
+        airTempResult: A matrix file address containing the air temperature results for each point for every hour of the analysis.
+        operativeTempResult: A matrix file address containing the operative temperature results for each point for every hour of the analysis.
+        adaptComfResult: A matrix file address containing the a series of 0's and 1's indicating whether a certain point is comfortable for every hour of the analysis.
+        degFromTargetResult: A matrix file address containing the a series of numbers indicating the degrees that a certain point is from the neutral temperature for every hour of the analysis.
 
 """
 
 ghenv.Component.Name = "Honeybee_Microclimate Map Analysis"
 ghenv.Component.NickName = 'MicroclimateMap'
-ghenv.Component.Message = 'VER 0.0.60\nOCT_23_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nJUN_07_2016
 try: ghenv.Component.AdditionalHelpFromDocStrings = "6"
 except: pass
@@ -69,7 +69,9 @@ except: pass
 
 from System import Object
 from System import Drawing
+from System import Array
 import System
+import clr
 import Grasshopper.Kernel as gh
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
@@ -94,11 +96,11 @@ outputsDictAdapt = {
 5: ["adaptComfMtx", "A python matrix containing adaptive comfort data for every hour of the analysis to be plugged into the 'Honeybee_Visualize Annual Comfort Results' component."],
 6: ["degFromTargetMtx", "A python matrix containing degrees from tartget temperature data for every hour of the analysis to be plugged into the 'Honeybee_Visualize Annual Comfort Results' component."],
 7: ["===============", "..."],
-8: ["radTempResult", "A csv file address containing the radiant temperature resultsfor each point for every hour of the analysis."],
-9: ["airTempResult", "A csv file address containing the air temperature results for each point for every hour of the analysis."],
-10: ["operativeTempResult", "A csv file address containing the operative temperature results for each point for every hour of the analysis."],
-11: ["adaptComfResult", "A csv file address containing the a series of 0's and 1's indicating whether a certain point is comfortable for every hour of the analysis."],
-12: ["degFromTargetResult", "A csv file address containing the a series of numbers indicating the degrees that a certain point is from the neutral temperature for every hour of the analysis."]
+8: ["radTempResult", "A matrix file address containing the radiant temperature resultsfor each point for every hour of the analysis."],
+9: ["airTempResult", "A matrix file address containing the air temperature results for each point for every hour of the analysis."],
+10: ["operativeTempResult", "A matrix file address containing the operative temperature results for each point for every hour of the analysis."],
+11: ["adaptComfResult", "A matrix file address containing the a series of 0's and 1's indicating whether a certain point is comfortable for every hour of the analysis."],
+12: ["degFromTargetResult", "A matrix file address containing the a series of numbers indicating the degrees that a certain point is from the neutral temperature for every hour of the analysis."]
 }
 
 outputsDictPMV = {
@@ -111,11 +113,11 @@ outputsDictPMV = {
 5: ["PMVComfMtx", "A python matrix containing PMV comfort data for every hour of the analysis to be plugged into the 'Honeybee_Visualize Annual Comfort Results' component."],
 6: ["PMV_Mtx", "A python matrix containing predicted mean vote (PMV) data for every hour of the analysis to be plugged into the 'Honeybee_Visualize Annual Comfort Results' component."],
 7: ["===============", "..."],
-8: ["radTempResult", "A csv file address containing the radiant temperature resultsfor each point for every hour of the analysis."],
-9: ["airTempResult", "A csv file address containing the air temperature results for each point for every hour of the analysis."],
-10: ["SET_Result", "A csv file address containing the standard effective temperature (SET) results for each point for every hour of the analysis."],
-11: ["PMVComfResult", "A csv file address containing the a series of 0's and 1's indicating whether a certain point is comfortable for every hour of the analysis."],
-12: ["PMV_Result", "A csv file address containing predicted mean vote (PMV) results indicating the distance that a certain point is from the neutral temperature for every hour of the analysis."]
+8: ["radTempResult", "A matrix file address containing the radiant temperature resultsfor each point for every hour of the analysis."],
+9: ["airTempResult", "A matrix file address containing the air temperature results for each point for every hour of the analysis."],
+10: ["SET_Result", "A matrix file address containing the standard effective temperature (SET) results for each point for every hour of the analysis."],
+11: ["PMVComfResult", "A matrix file address containing the a series of 0's and 1's indicating whether a certain point is comfortable for every hour of the analysis."],
+12: ["PMV_Result", "A matrix file address containing predicted mean vote (PMV) results indicating the distance that a certain point is from the neutral temperature for every hour of the analysis."]
 }
 
 outputsDictUTCI = {
@@ -128,11 +130,11 @@ outputsDictUTCI = {
 5: ["OutdoorComfMtx", "A python matrix containing outdoor (UTCI) comfort data for every hour of the analysis to be plugged into the 'Honeybee_Visualize Annual Comfort Results' component."],
 6: ["DegFromNeutralMtx", "A python matrix containing the degrees from the neutral UTCI value of 20 C for every hour of the analysis to be plugged into the 'Honeybee_Visualize Annual Comfort Results' component."],
 7: ["===============", "..."],
-8: ["radTempResult", "A csv file address containing the radiant temperature resultsfor each point for every hour of the analysis."],
-9: ["airTempResult", "A csv file address containing the air temperature results for each point for every hour of the analysis."],
-10: ["UTCI_Result", "A csv file address containing universal thermal climate index (UTCI) results for each point for every hour of the analysis."],
-11: ["OutdoorComfResult", "A csv file address containing the a series of 0's and 1's indicating whether a certain point is comfortable for every hour of the analysis."],
-12: ["DegFromNeutralResult", "A csv file address containing the degrees from the neutral UTCI value of 20 C indicating the distance that a certain point is from the neutral temperature for every hour of the analysis."]
+8: ["radTempResult", "A matrix file address containing the radiant temperature resultsfor each point for every hour of the analysis."],
+9: ["airTempResult", "A matrix file address containing the air temperature results for each point for every hour of the analysis."],
+10: ["UTCI_Result", "A matrix file address containing universal thermal climate index (UTCI) results for each point for every hour of the analysis."],
+11: ["OutdoorComfResult", "A matrix file address containing the a series of 0's and 1's indicating whether a certain point is comfortable for every hour of the analysis."],
+12: ["DegFromNeutralResult", "A matrix file address containing the degrees from the neutral UTCI value of 20 C indicating the distance that a certain point is from the neutral temperature for every hour of the analysis."]
 }
 
 outputsDictPET = {
@@ -145,11 +147,11 @@ outputsDictPET = {
 5: ["PET_ComfMtx", "A python matrix containing PET comfort data for every hour of the analysis to be plugged into the 'Honeybee_Visualize Annual Comfort Results' component."],
 6: ["PET_CategoryMtx", "A python matrix containing the categories of PET. These are either: -4 = Very Cold, -3 = Cold, -2 = Cool, -1 = Slightly Cool, 0 = Comfortable, 1 = Slightly Warm, 2 = Warm, 3 = Hot, 4 = Very Hot"],
 7: ["===============", "..."],
-8: ["radTempResult", "A csv file address containing the radiant temperature resultsfor each point for every hour of the analysis."],
-9: ["airTempResult", "A csv file address containing the air temperature results for each point for every hour of the analysis."],
-10: ["PET_Result", "A csv file address containing physiological equivalent temperature (PET) results for each point for every hour of the analysis."],
-11: ["PETComfResult", "A csv file address containing the a series of 0's and 1's indicating whether a certain point is comfortable for every hour of the analysis."],
-12: ["PETCategoryResult", "A csv file address containing the categories of PET.   These are either: -4 = Very Cold, -3 = Cold, -2 = Cool, -1 = Slightly Cool, 0 = Comfortable, 1 = Slightly Warm, 2 = Warm, 3 = Hot, 4 = Very Hot"]
+8: ["radTempResult", "A matrix file address containing the radiant temperature resultsfor each point for every hour of the analysis."],
+9: ["airTempResult", "A matrix file address containing the air temperature results for each point for every hour of the analysis."],
+10: ["PET_Result", "A matrix file address containing physiological equivalent temperature (PET) results for each point for every hour of the analysis."],
+11: ["PETComfResult", "A matrix file address containing the a series of 0's and 1's indicating whether a certain point is comfortable for every hour of the analysis."],
+12: ["PETCategoryResult", "A matrix file address containing the categories of PET.   These are either: -4 = Very Cold, -3 = Cold, -2 = Cool, -1 = Slightly Cool, 0 = Comfortable, 1 = Slightly Warm, 2 = Warm, 3 = Hot, 4 = Very Hot"]
 }
 
 
@@ -282,35 +284,131 @@ def processPrevailOutdoorTemp(prevailingOutdoorTemp, avgMonthOrRunMean):
     return prevailTemp, coldTimes
 
 
-def calculatePointMRT(srfTempDict, testPtsViewFactor, hour, originalHour, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, prevailingOutdoorTemp):
-    #Calculate the MRT for each point.
-    pointMRTValues = []
+def iterMRTMatrix(srfTempDict, testPtsViewFactor, HOYs, originalHOYs, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, prevailingOutdoorTemp, chunkSize = 720):
+    #Calculate the MRT for each point and every hour of the analysis.
+    #View factors are stored as a sparse points x surfaces matrix for each zone and surface temperatures as a surfaces x hours matrix.
+    #The MRT is the product of the two, which is computed for chunkSize hours at a time.
+    #Each chunk is yielded as a dictionary of the hour count and the MRT of the points before the next one is computed so only one chunk is in the memory.
+    #Build the sparse view factor matrix and the list of surfaces that are seen by the points.
+    zoneMatrices = []
     for zoneCount, pointList in enumerate(testPtsViewFactor):
-        if outdoorClac == False or zoneCount != len(testPtsViewFactor)-1:
-            pointMRTValues.append([])
-            for pointViewFactor in pointList:
-                pointMRT = 0
-                for srfCount, srfView in enumerate(pointViewFactor):
-                    path  = str([zoneCount,srfCount])
-                    weightedSrfTemp = srfView*(srfTempDict[path]["srfTemp"][hour])
-                    pointMRT = pointMRT+weightedSrfTemp
-                pointMRTValues[zoneCount].append(round(pointMRT, 3))
-        else:
-            pointMRTValues.append([])
-            for ptCount, pointViewFactor in enumerate(pointList):
-                pointMRT = 0
-                for srfCount, srfView in enumerate(pointViewFactor):
-                    path  = str([zoneCount,srfCount])
-                    weightedSrfTemp = srfView*(outSrfTempDict[path]["srfTemp"][hour])
-                    pointMRT = pointMRT+weightedSrfTemp
-                weightedSrfTemp = outdoorNonSrfViewFac[ptCount]*prevailingOutdoorTemp[originalHour]
-                pointMRT = pointMRT+weightedSrfTemp
-                pointMRT = pointMRT / (sum(pointViewFactor) + outdoorNonSrfViewFac[ptCount])
-                pointMRTValues[zoneCount].append(round(pointMRT, 3))
-    
-    return pointMRTValues
+        isOutdoor = outdoorClac == True and zoneCount == len(testPtsViewFactor)-1
+        if isOutdoor: tempDict = outSrfTempDict
+        else: tempDict = srfTempDict
+        
+        zoneSrfRows = {}
+        srfTemps = []
+        viewFactorMtx = []
+        for pointViewFactor in pointList:
+            pointRow = []
+            for srfCount, srfView in enumerate(pointViewFactor):
+                if srfView == 0: continue
+                if not zoneSrfRows.has_key(srfCount):
+                    zoneSrfRows[srfCount] = len(srfTemps)
+                    srfTemps.append(tempDict[str([zoneCount,srfCount])]["srfTemp"])
+                pointRow.append((zoneSrfRows[srfCount], srfView))
+            viewFactorMtx.append(pointRow)
+        zoneMatrices.append((isOutdoor, srfTemps, viewFactorMtx))
+    
+    for chunkStart in range(0, len(HOYs), chunkSize):
+        #Ability to cancel with Esc
+        if gh.GH_Document.IsEscapeKeyDown(): assert False
+        
+        chunk = range(chunkStart, min(chunkStart + chunkSize, len(HOYs)))
+        hours = [HOYs[count]-1 for count in chunk]
+        mrtByHour = dict((count, [[] for pointList in testPtsViewFactor]) for count in chunk)
+        
+        for zoneCount, (isOutdoor, srfTemps, viewFactorMtx) in enumerate(zoneMatrices):
+            srfTempMtx = [[srfTemp[hour] for hour in hours] for srfTemp in srfTemps]
+            if isOutdoor: outdoorTemps = [prevailingOutdoorTemp[originalHOYs[count]-1] for count in chunk]
+            
+            for ptCount, pointRow in enumerate(viewFactorMtx):
+                pointMRT = [0] * len(chunk)
+                for srfRow, srfView in pointRow:
+                    pointMRT = [mrt + srfView*srfTemp for mrt, srfTemp in zip(pointMRT, srfTempMtx[srfRow])]
+                
+                if isOutdoor:
+                    nonSrfViewFac = outdoorNonSrfViewFac[ptCount]
+                    totalViewFac = sum(testPtsViewFactor[zoneCount][ptCount]) + nonSrfViewFac
+                    pointMRT = [(mrt + nonSrfViewFac*outTemp) / totalViewFac for mrt, outTemp in zip(pointMRT, outdoorTemps)]
+                
+                for hourCount, count in enumerate(chunk):
+                    mrtByHour[count][zoneCount].append(round(pointMRT[hourCount], 3))
+        
+        yield mrtByHour
+
+def computeSunSkyPatches(sunVecs, skyPatchMeshes):
+    #Find the sky patch that each sun vector falls in once for all of the hours of the analysis.
+    #The patch meshes are joined so that each sun vector is intersected with a single mesh.
+    skyMesh = rc.Geometry.Mesh()
+    facePatchIds = []
+    for patchCount, patch in enumerate(skyPatchMeshes):
+        skyMesh.Append(patch)
+        facePatchIds.extend([patchCount] * patch.Faces.Count)
+    
+    #The patch is found from the face ids of the hit. Sun vectors on the edge of two patches use the patch with the lower index.
+    #Rhino 5 doesn't return the face ids and the closest face to the hit point is used instead.
+    hasFaceIds = True
+    sunPatches = []
+    for sunVec in sunVecs:
+        sunPatch = None
+        if sunVec != None:
+            ray = rc.Geometry.Ray3d(rc.Geometry.Point3d.Origin, sunVec)
+            if hasFaceIds:
+                faceIds = clr.Reference[Array[int]]()
+                try:
+                    rayParam = rc.Geometry.Intersect.Intersection.MeshRay(skyMesh, ray, faceIds)
+                    if rayParam >= 0 and faceIds.Value != None and faceIds.Value.Length != 0:
+                        sunPatch = min(facePatchIds[faceId] for faceId in faceIds.Value)
+                except TypeError:
+                    hasFaceIds = False
+            if not hasFaceIds:
+                rayParam = rc.Geometry.Intersect.Intersection.MeshRay(skyMesh, ray)
+                if rayParam >= 0:
+                    meshPt = skyMesh.ClosestMeshPoint(ray.PointAt(rayParam), 0)
+                    sunPatch = facePatchIds[meshPt.FaceIndex]
+        sunPatches.append(sunPatch)
+    
+    return sunPatches
+
+class ShadeStateCache(object):
+    #Results of computeHourShadeDrawing for the hours that have the same transmissivity for the windows that the points see.
+    #The key only includes the windows that are hit by the sky view rays so hours with different states for the other windows share the result.
+    #The number of states is limited by the number of values that are kept (maxValues) and not by a fixed number of entries.
+    
+    def __init__(self, winShdDict, testPtBlockName, maxValues = 10000000):
+        seenWindows = set()
+        valueCount = 0
+        for zone in testPtBlockName:
+            for vecList in zone:
+                valueCount += len(vecList) + 1
+                for winNames in vecList:
+                    if isinstance(winNames, list): seenWindows.update(winNames)
+        self.windows = [window for window in sorted(winShdDict.keys()) if window in seenWindows]
+        self.winShdDict = winShdDict
+        self.maxStates = max(1, maxValues / max(1, valueCount))
+        self.states = {}
+    
+    def getKey(self, hour):
+        try: return tuple([self.winShdDict[window][hour-1] for window in self.windows])
+        except: return None
+    
+    def get(self, stateKey):
+        if stateKey == None: return None
+        return self.states.get(stateKey)
+    
+    def add(self, stateKey, state):
+        if stateKey != None and len(self.states) < self.maxStates:
+            self.states[stateKey] = state
 
-def computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac):
+def computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac, shadeStateCache = None):
+    #Hours that have the same transmissivity for the windows that the points see share the same result so each shade state is only computed once.
+    stateKey = None
+    if shadeStateCache != None:
+        stateKey = shadeStateCache.getKey(hour)
+        cachedState = shadeStateCache.get(stateKey)
+        if cachedState != None: return cachedState
+    
     #Build a new testPtBlockedVec that checks with the window transmissivity status.
     newTestPtBlockedVec = []
     newTestPtSkyView = []
@@ -332,6 +430,9 @@ def computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, t
             newTestPtBlockedVec[zoneCount].append(newVecList)
             newTestPtSkyView[zoneCount].append(sum(newVecList)/len(newVecList))
     
+    if shadeStateCache != None:
+        shadeStateCache.add(stateKey, (newTestPtSkyView, newTestPtBlockedVec))
+    
     return newTestPtSkyView, newTestPtBlockedVec
 
 def computeSkyTemp(La):
@@ -340,27 +441,14 @@ def computeSkyTemp(La):
     
     return skyTemp
 
-def calculateSolarAdjustedMRT(pointMRTValues, stepOfSimulation, originalHour, diffSolarRad, directSolarRad, globHorizRadList, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, outHorizInfrared, lb_comfortModels):
+def calculateSolarAdjustedMRT(pointMRTValues, stepOfSimulation, originalHour, diffSolarRad, directSolarRad, globHorizRadList, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, zoneHasWindows, outdoorClac, outHorizInfrared, lb_comfortModels):
     #Pull out the correct sun vector.
     sunVec = sunVecInfo[0][count]
     altitude = sunVecInfo[1][count]
     azimuth = sunVecInfo[2][count]
     
-    #Assign the sun vector to a sky patch that aligns with the testPtBlockedVec list.
-    vectorskyPatches = []
-    
-    if sunVec != None:
-        intersected = False
-        ray = rc.Geometry.Ray3d(rc.Geometry.Point3d.Origin, sunVec)
-        for patchCount, patch in enumerate(skyPatchMeshes):
-            if rc.Geometry.Intersect.Intersection.MeshRay(patch, ray) >= 0:
-                vectorskyPatches.append(patchCount)
-                intersected = True
-        if intersected == False:
-            vectorskyPatches.append(None)
-    else:
-        vectorskyPatches.append(None)
-    
+    #The sky patch that the sun is in has been found for all of the hours before the calculation.
+    sunPatch = sunVecInfo[3][count]
     
     ##Calculate the diffuse, direct, and global horizontal components of the solar radiation at the hour.
     diffRad = diffSolarRad[originalHour-1]
@@ -393,42 +481,37 @@ def calculateSolarAdjustedMRT(pointMRTValues, stepOfSimulation, originalHour, di
     if outdoorClac == True:
         skyTemp = computeSkyTemp(outdoorHorizInfrared)
     
-    #Compute the solar adjusted temperature for each point.
+    #Compute the solar adjusted temperature for all of the points of each zone.
     solarAdjustedPointMRTValues = []
     if sunVec != None:
         for zoneCount, zonePtsList in enumerate(pointMRTValues):
             if zoneHasWindows[zoneCount] != 0:
-                solarAdjustedPointMRTValues.append([])
-                for pointCount, pointMRT in enumerate(zonePtsList):
-                    #Check if the sunray is blocked.
-                    if vectorskyPatches[0] != None:
-                        if testPtBlockedVec[zoneCount][pointCount][vectorskyPatches[0]] == 0: sunBlocked = True
-                        else: sunBlocked = False
-                    else: sunBlocked = True
-                    
-                    #If the ray was not blocked, then adjust then get rid of direct solar radiation.
-                    #Note that, while the direct radiation is multiplied by the specific window transmissivity here, the diffuse window transmissivity is already accounted for in the sky view.
-                    if sunBlocked == True:
-                        dirRadFinal = 0.0
-                        globHorizRadFinal = diffRad
-                    else:
-                        dirRadFinal = dirNormRad*(testPtBlockedVec[zoneCount][pointCount][vectorskyPatches[0]])
-                        globHorizRadFinal = globHorizRad
-                    
-                    if outdoorClac == False or zoneCount != len(pointMRTValues)-1:
-                        hourERF = ((0.5*fracEff*testPtSkyView[zoneCount][pointCount]*(diffRad + (globHorizRadFinal*floorR[zoneCount][pointCount]))+ (fracEff*ProjAreaFac*dirRadFinal))*winTrans[originalHour-1])*(cloA/0.95)
-                        mrtDelt = (hourERF/(fracEff*radTransCoeff))
-                        hourMRT = mrtDelt + pointMRT
-                    else:
-                        hourERF = ((0.5*fracEff*testPtSkyView[zoneCount][pointCount]*(diffRad + (globHorizRadFinal*floorR[zoneCount][pointCount]))+ (fracEff*ProjAreaFac*dirRadFinal)))*(cloA/0.95)
-                        mrtDelt = (hourERF/(fracEff*radTransCoeff))
-                        hourMRT = mrtDelt + (skyTemp*(testPtSkyView[zoneCount][pointCount]/2) + pointMRT*(1-(testPtSkyView[zoneCount][pointCount]/2)))
-                    
-                    solarAdjustedPointMRTValues[zoneCount].append(round(hourMRT, 3))
+                skyViews = testPtSkyView[zoneCount]
+                floorRefs = floorR[zoneCount]
+                
+                #Check if the sunray is blocked for each point.
+                if sunPatch != None: sunTransmiss = [blockedVec[sunPatch] for blockedVec in testPtBlockedVec[zoneCount]]
+                else: sunTransmiss = [0] * len(zonePtsList)
+                
+                #If the ray was not blocked, then adjust then get rid of direct solar radiation.
+                #Note that, while the direct radiation is multiplied by the specific window transmissivity here, the diffuse window transmissivity is already accounted for in the sky view.
+                dirRadFinals = [dirNormRad*(transmiss) if transmiss != 0 else 0.0 for transmiss in sunTransmiss]
+                globHorizRadFinals = [globHorizRad if transmiss != 0 else diffRad for transmiss in sunTransmiss]
+                
+                if outdoorClac == False or zoneCount != len(pointMRTValues)-1:
+                    hourWinTrans = winTrans[originalHour-1]
+                    hourERFs = [((0.5*fracEff*skyView*(diffRad + (globHorizRadFinal*floorRef))+ (fracEff*ProjAreaFac*dirRadFinal))*hourWinTrans)*(cloA/0.95) \
+                                for skyView, globHorizRadFinal, floorRef, dirRadFinal in zip(skyViews, globHorizRadFinals, floorRefs, dirRadFinals)]
+                    hourMRTs = [(hourERF/(fracEff*radTransCoeff)) + pointMRT for hourERF, pointMRT in zip(hourERFs, zonePtsList)]
+                else:
+                    hourERFs = [((0.5*fracEff*skyView*(diffRad + (globHorizRadFinal*floorRef))+ (fracEff*ProjAreaFac*dirRadFinal)))*(cloA/0.95) \
+                                for skyView, globHorizRadFinal, floorRef, dirRadFinal in zip(skyViews, globHorizRadFinals, floorRefs, dirRadFinals)]
+                    hourMRTs = [(hourERF/(fracEff*radTransCoeff)) + (skyTemp*(skyView/2) + pointMRT*(1-(skyView/2))) \
+                                for hourERF, skyView, pointMRT in zip(hourERFs, skyViews, zonePtsList)]
+                
+                solarAdjustedPointMRTValues.append([round(hourMRT, 3) for hourMRT in hourMRTs])
             else:
-                solarAdjustedPointMRTValues.append([])
-                for pointCount, pointMRT in enumerate(zonePtsList):
-                    solarAdjustedPointMRTValues[zoneCount].append(round(pointMRT, 3))
+                solarAdjustedPointMRTValues.append([round(pointMRT, 3) for pointMRT in zonePtsList])
     else:
         solarAdjustedPointMRTValues = pointMRTValues
     
@@ -815,9 +898,11 @@ def mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataN
         #If there are different hourly window transmissivities for different windows, make a dictionary for the shades and make a neutral winTrans list to cancel out the usual way window transmissivity is factored in.
         neutralWinTransList = []
         winShdDict = {}
+        shadeStateCache = None
         if allWindowShadesSame == False:
             for hr in range(8760): neutralWinTransList.append(1)
             winShdDict = createShdDict(winStatusHeaders, winTrans, zoneWindowTransmiss, zoneWindowNames)
+            shadeStateCache = ShadeStateCache(winShdDict, testPtBlockName)
         
         #Make sure that there are windows in the model and, if so, generate solar outputs.
         if sum(zoneHasWindows) != 0:
@@ -845,7 +930,7 @@ def mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataN
                 sunVecs.append(sunVec)
                 altitudes.append(altitude)
                 azimuths.append(azimuth)
-            sunVecInfo = [sunVecs, altitudes, azimuths]
+            sunVecInfo = [sunVecs, altitudes, azimuths, computeSunSkyPatches(sunVecs, skyPatchMeshes)]
         
         #Make a dictionary that will relate the testPtZoneNames to the air temperatures.
         airTempDict = createZoneDict(testPtZoneNames, "zoneName", "airTemp", airTempDataHeaders, airTempDataNumbers)
@@ -879,13 +964,15 @@ def mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataN
                 for zoneVal in heatGainDataNumbers: heatGainValues.append(zoneVal[hour-1])
                 
                 #Compute the radiant temperature.
-                pointMRTValues = calculatePointMRT(srfTempDict, testPtsViewFactor, hour-1, originalHour-1, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, prevailingOutdoorTemp)
+                pointMRTValues = mrtByHour[count]
                 if sum(zoneHasWindows) != 0:
-                    if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, outHorizInfrared, lb_comfortModels)
+                    if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, zoneHasWindows, outdoorClac, outHorizInfrared, lb_comfortModels)
                     else:
                         #To factor in the effect of blocked sunlight, I have to re-make the testPtSkyView and the testPtBlockedVec to reflect the conditions for the given hour.
-                        hourTestPtSkyView, hourTestPtBlockedVec = computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac)
-                        pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, hourTestPtSkyView, hourTestPtBlockedVec, neutralWinTransList, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, outHorizInfrared, lb_comfortModels)
+                        #The MRT only changes when the sun is up.
+                        if sunVecInfo[0][count] != None:
+                            hourTestPtSkyView, hourTestPtBlockedVec = computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac, shadeStateCache)
+                            pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, hourTestPtSkyView, hourTestPtBlockedVec, neutralWinTransList, cloA, floorR, zoneHasWindows, outdoorClac, outHorizInfrared, lb_comfortModels)
                 pointMRTValues = lb_preparation.flattenList(pointMRTValues)
                 radTempMtx[count+1] = pointMRTValues
                 
@@ -937,13 +1024,15 @@ def mainAdapt(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataN
                 degFromTargetMtx[count+1] = degFromTargetPointValues
             
             #Run through every hour of the analysis to fill up the matrices.
-            if parallel_ == True and len(HOYs) != 1:
-                tasks.Parallel.ForEach(range(len(HOYs)), climateMap)
-            else:
-                for hour in range(len(HOYs)):
-                    #Ability to cancel with Esc
-                    #if gh.GH_Document.IsEscapeKeyDown(): assert False
-                    climateMap(hour)
+            #The radiant temperature of the points is computed for a chunk of hours before the chunk is run.
+            for mrtByHour in iterMRTMatrix(srfTempDict, testPtsViewFactor, HOYs, originalHOYs, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, prevailingOutdoorTemp):
+                if parallel_ == True and len(HOYs) != 1:
+                    tasks.Parallel.ForEach(sorted(mrtByHour), climateMap)
+                else:
+                    for hour in sorted(mrtByHour):
+                        #Ability to cancel with Esc
+                        #if gh.GH_Document.IsEscapeKeyDown(): assert False
+                        climateMap(hour)
         except:
             print "The calculation has been terminated by the user!"
             e = gh.GH_RuntimeMessageLevel.Warning
@@ -1010,9 +1099,11 @@ def mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
         #If there are different shade statuses for the different windows, make a neutral winTrans list for this case.
         neutralWinTransList = []
         winShdDict = {}
+        shadeStateCache = None
         if allWindowShadesSame == False:
             for hr in range(8760): neutralWinTransList.append(1)
             winShdDict = createShdDict(winStatusHeaders, winTrans, zoneWindowTransmiss, zoneWindowNames)
+            shadeStateCache = ShadeStateCache(winShdDict, testPtBlockName)
         
         #Make sure that there are windows in the model and a good reason to generate solar outputs.
         if sum(zoneHasWindows) != 0:
@@ -1040,7 +1131,7 @@ def mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
                 sunVecs.append(sunVec)
                 altitudes.append(altitude)
                 azimuths.append(azimuth)
-            sunVecInfo = [sunVecs, altitudes, azimuths]
+            sunVecInfo = [sunVecs, altitudes, azimuths, computeSunSkyPatches(sunVecs, skyPatchMeshes)]
         
         #Make a dictionary that will relate the testPtZoneNames to the air temperatures.
         airTempDict = createZoneDict(testPtZoneNames, "zoneName", "airTemp", airTempDataHeaders, airTempDataNumbers)
@@ -1075,13 +1166,15 @@ def mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
                 for zoneVal in heatGainDataNumbers: heatGainValues.append(zoneVal[hour-1])
                 
                 #Compute the radiant temperature.
-                pointMRTValues = calculatePointMRT(srfTempDict, testPtsViewFactor, hour-1, originalHour-1, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, outDryBulbTemp)
+                pointMRTValues = mrtByHour[count]
                 if sum(zoneHasWindows) != 0:
-                    if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
+                    if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
                     else:
                         #To factor in the effect of blocked sunlight, I have to re-make the testPtSkyView and the testPtBlockedVec to reflect the conditions for the given hour.
-                        hourTestPtSkyView, hourTestPtBlockedVec = computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac)
-                        pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, hourTestPtSkyView, hourTestPtBlockedVec, neutralWinTransList, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
+                        #The MRT only changes when the sun is up.
+                        if sunVecInfo[0][count] != None:
+                            hourTestPtSkyView, hourTestPtBlockedVec = computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac, shadeStateCache)
+                            pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, hourTestPtSkyView, hourTestPtBlockedVec, neutralWinTransList, cloA, floorR, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
                 pointMRTValues = lb_preparation.flattenList(pointMRTValues)
                 radTempMtx[count+1] = pointMRTValues
                 
@@ -1144,13 +1237,15 @@ def mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
                 PMV_Mtx[count+1] = pmvPointValues
             
             #Run through every hour of the analysis to fill up the matrices.
-            if parallel_ == True and len(HOYs) != 1:
-                tasks.Parallel.ForEach(range(len(HOYs)), climateMapPMV)
-            else:
-                for hour in range(len(HOYs)):
-                    #Ability to cancel with Esc
-                    if gh.GH_Document.IsEscapeKeyDown(): assert False
-                    climateMapPMV(hour)
+            #The radiant temperature of the points is computed for a chunk of hours before the chunk is run.
+            for mrtByHour in iterMRTMatrix(srfTempDict, testPtsViewFactor, HOYs, originalHOYs, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, outDryBulbTemp):
+                if parallel_ == True and len(HOYs) != 1:
+                    tasks.Parallel.ForEach(sorted(mrtByHour), climateMapPMV)
+                else:
+                    for hour in sorted(mrtByHour):
+                        #Ability to cancel with Esc
+                        if gh.GH_Document.IsEscapeKeyDown(): assert False
+                        climateMapPMV(hour)
         except:
             print "The calculation has been terminated by the user!"
             e = gh.GH_RuntimeMessageLevel.Warning
@@ -1217,9 +1312,11 @@ def mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNu
         #If there are different shade statuses for the different windows, make a neutral winTrans list for this case.
         neutralWinTransList = []
         winShdDict = {}
+        shadeStateCache = None
         if allWindowShadesSame == False:
             for hr in range(8760): neutralWinTransList.append(1)
             winShdDict = createShdDict(winStatusHeaders, winTrans, zoneWindowTransmiss, zoneWindowNames)
+            shadeStateCache = ShadeStateCache(winShdDict, testPtBlockName)
         
         #Make sure that there are windows in the model and a good reason to generate solar outputs.
         if sum(zoneHasWindows) != 0:
@@ -1247,7 +1344,7 @@ def mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNu
                 sunVecs.append(sunVec)
                 altitudes.append(altitude)
                 azimuths.append(azimuth)
-            sunVecInfo = [sunVecs, altitudes, azimuths]
+            sunVecInfo = [sunVecs, altitudes, azimuths, computeSunSkyPatches(sunVecs, skyPatchMeshes)]
         
         #Make a dictionary that will relate the testPtZoneNames to the air temperatures.
         try: airTempDict = createZoneDict(testPtZoneNames, "zoneName", "airTemp", airTempDataHeaders, airTempDataNumbers)
@@ -1284,13 +1381,15 @@ def mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNu
                 for zoneVal in heatGainDataNumbers: heatGainValues.append(zoneVal[hour-1])
                 
                 #Compute the radiant temperature.
-                pointMRTValues = calculatePointMRT(srfTempDict, testPtsViewFactor, hour-1, originalHour-1, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, outDryBulbTemp)
+                pointMRTValues = mrtByHour[count]
                 if sum(zoneHasWindows) != 0:
-                    if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
+                    if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
                     else:
                         #To factor in the effect of blocked sunlight, I have to re-make the testPtSkyView and the testPtBlockedVec to reflect the conditions for the given hour.
-                        hourTestPtSkyView, hourTestPtBlockedVec = computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac)
-                        pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, hourTestPtSkyView, hourTestPtBlockedVec, neutralWinTransList, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
+                        #The MRT only changes when the sun is up.
+                        if sunVecInfo[0][count] != None:
+                            hourTestPtSkyView, hourTestPtBlockedVec = computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac, shadeStateCache)
+                            pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, hourTestPtSkyView, hourTestPtBlockedVec, neutralWinTransList, cloA, floorR, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
                 pointMRTValues = lb_preparation.flattenList(pointMRTValues)
                 radTempMtx[count+1] = pointMRTValues
                 
@@ -1349,13 +1448,15 @@ def mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNu
                 DegFromNeutralMtx[count+1] = degNeutralPointValues
             
             #Run through every hour of the analysis to fill up the matrices.
-            if parallel_ == True and len(HOYs) != 1:
-                tasks.Parallel.ForEach(range(len(HOYs)), climateMapUTCI)
-            else:
-                for hour in range(len(HOYs)):
-                    #Ability to cancel with Esc
-                    if gh.GH_Document.IsEscapeKeyDown(): assert False
-                    climateMapUTCI(hour)
+            #The radiant temperature of the points is computed for a chunk of hours before the chunk is run.
+            for mrtByHour in iterMRTMatrix(srfTempDict, testPtsViewFactor, HOYs, originalHOYs, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, outDryBulbTemp):
+                if parallel_ == True and len(HOYs) != 1:
+                    tasks.Parallel.ForEach(sorted(mrtByHour), climateMapUTCI)
+                else:
+                    for hour in sorted(mrtByHour):
+                        #Ability to cancel with Esc
+                        if gh.GH_Document.IsEscapeKeyDown(): assert False
+                        climateMapUTCI(hour)
         except:
             print "The calculation has been terminated by the user!"
             e = gh.GH_RuntimeMessageLevel.Warning
@@ -1422,9 +1523,11 @@ def mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
         #If there are different shade statuses for the different windows, make a neutral winTrans list for this case.
         neutralWinTransList = []
         winShdDict = {}
+        shadeStateCache = None
         if allWindowShadesSame == False:
             for hr in range(8760): neutralWinTransList.append(1)
             winShdDict = createShdDict(winStatusHeaders, winTrans, zoneWindowTransmiss, zoneWindowNames)
+            shadeStateCache = ShadeStateCache(winShdDict, testPtBlockName)
         
         #Make sure that there are windows in the model and a good reason to generate solar outputs.
         if sum(zoneHasWindows) != 0:
@@ -1452,7 +1555,7 @@ def mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
                 sunVecs.append(sunVec)
                 altitudes.append(altitude)
                 azimuths.append(azimuth)
-            sunVecInfo = [sunVecs, altitudes, azimuths]
+            sunVecInfo = [sunVecs, altitudes, azimuths, computeSunSkyPatches(sunVecs, skyPatchMeshes)]
         
         #Make a dictionary that will relate the testPtZoneNames to the air temperatures.
         try: airTempDict = createZoneDict(testPtZoneNames, "zoneName", "airTemp", airTempDataHeaders, airTempDataNumbers)
@@ -1489,13 +1592,15 @@ def mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
                 for zoneVal in heatGainDataNumbers: heatGainValues.append(zoneVal[hour-1])
                 
                 #Compute the radiant temperature.
-                pointMRTValues = calculatePointMRT(srfTempDict, testPtsViewFactor, hour-1, originalHour-1, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, outDryBulbTemp)
+                pointMRTValues = mrtByHour[count]
                 if sum(zoneHasWindows) != 0:
-                    if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
+                    if allWindowShadesSame == True: pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, testPtSkyView, testPtBlockedVec, winTrans, cloA, floorR, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
                     else:
                         #To factor in the effect of blocked sunlight, I have to re-make the testPtSkyView and the testPtBlockedVec to reflect the conditions for the given hour.
-                        hourTestPtSkyView, hourTestPtBlockedVec = computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac)
-                        pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, hourTestPtSkyView, hourTestPtBlockedVec, neutralWinTransList, cloA, floorR, skyPatchMeshes, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
+                        #The MRT only changes when the sun is up.
+                        if sunVecInfo[0][count] != None:
+                            hourTestPtSkyView, hourTestPtBlockedVec = computeHourShadeDrawing(hour, testPtSkyView, testPtBlockedVec, winShdDict, testPtBlockName, outdoorClac, shadeStateCache)
+                            pointMRTValues = calculateSolarAdjustedMRT(pointMRTValues, hour, originalHour, diffSolarRad, directSolarRad, globHorizRad, count, sunVecInfo, hourTestPtSkyView, hourTestPtBlockedVec, neutralWinTransList, cloA, floorR, zoneHasWindows, outdoorClac, horizInfraredRadiation, lb_comfortModels)
                 pointMRTValues = lb_preparation.flattenList(pointMRTValues)
                 radTempMtx[count+1] = pointMRTValues
                 
@@ -1553,13 +1658,15 @@ def mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
                 PET_CategoryMtx[count+1] = petCategoryValues
             
             #Run through every hour of the analysis to fill up the matrices.
-            if parallel_ == True and len(HOYs) != 1:
-                tasks.Parallel.ForEach(range(len(HOYs)), climateMapPET)
-            else:
-                for hour in range(len(HOYs)):
-                    #Ability to cancel with Esc
-                    if gh.GH_Document.IsEscapeKeyDown(): assert False
-                    climateMapPET(hour)
+            #The radiant temperature of the points is computed for a chunk of hours before the chunk is run.
+            for mrtByHour in iterMRTMatrix(srfTempDict, testPtsViewFactor, HOYs, originalHOYs, outdoorClac, outSrfTempDict, outdoorNonSrfViewFac, outDryBulbTemp):
+                if parallel_ == True and len(HOYs) != 1:
+                    tasks.Parallel.ForEach(sorted(mrtByHour), climateMapPET)
+                else:
+                    for hour in sorted(mrtByHour):
+                        #Ability to cancel with Esc
+                        if gh.GH_Document.IsEscapeKeyDown(): assert False
+                        climateMapPET(hour)
         except:
             print "The calculation has been terminated by the user!"
             e = gh.GH_RuntimeMessageLevel.Warning
@@ -1573,370 +1680,60 @@ def mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNum
             return -1
 
 
-def writeCSVAdapt(lb_preparation, directory, fileName, radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx):
-    #Find out the number of values in each hour.
-    valLen = len(radTempMtx[-1])-1
+def writeResultMatrices(lb_preparation, directory, resultMatrices):
+    #Write each result matrix to a binary matrix file that can be read with the 'Honeybee_Read Microclimate Matrix' component.
+    #Set sc.sticky["honeybee_writeMatrixCSV"] to True to also write a csv copy of each matrix next to it.
+    hb_resultMatrix = sc.sticky["honeybee_ResultMatrix"]
+    csvCopy = sc.sticky.has_key("honeybee_writeMatrixCSV") and sc.sticky["honeybee_writeMatrixCSV"] == True
     
     #Set up a working directory.
     workingDir = lb_preparation.makeWorkingDir(os.path.join(directory)) 
     
-    #Create a csv Files.
-    radTempFile = fileName + "RadiantTemp.csv"
-    airTempFile = fileName + "AirTemp.csv"
-    opTempFile = fileName + "OperativeTemp.csv"
-    adaptComfFile = fileName + "AdaptComf.csv"
-    degFromTargetFile = fileName + "DegFromTarget.csv"
-    
-    #Write the radiant temperature result file.
-    if writeResultFile_ != 2:
-        radTempResult = os.path.join(workingDir, radTempFile)
-        radCSVfile = open(radTempResult, 'wb')
-        for lineCount, line in enumerate(radTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                radCSVfile.write(lineStr)
-            else: radCSVfile.write(line + "\n")
-        radCSVfile.close()
-    else:
-        radTempResult = None
-    
-    #Write the air temperature result file.
-    if writeResultFile_ != 2:
-        airTempResult = os.path.join(workingDir, airTempFile)
-        airCSVfile = open(airTempResult, 'wb')
-        for lineCount, line in enumerate(airTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                airCSVfile.write(lineStr)
-            else: airCSVfile.write(line + "\n")
-        airCSVfile.close()
-    else:
-        airTempResult = None
-    
-    #Write the operative temperature result file.
-    if writeResultFile_ != 2:
-        operativeTempResult = os.path.join(workingDir, opTempFile)
-        opCSVfile = open(operativeTempResult, 'wb')
-        for lineCount, line in enumerate(operativeTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                opCSVfile.write(lineStr)
-            else: opCSVfile.write(line + "\n")
-        opCSVfile.close()
-    else:
-        operativeTempResult = None
-    
-    #Write the adaptive comfort result file.
-    adaptComfResult = os.path.join(workingDir, adaptComfFile)
-    comfCSVfile = open(adaptComfResult, 'wb')
-    for lineCount, line in enumerate(adaptComfMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            comfCSVfile.write(lineStr)
-        else: comfCSVfile.write(line + "\n")
-    comfCSVfile.close()
-    
-    #Write the deg from target result file.
-    degFromTargetResult = os.path.join(workingDir, degFromTargetFile)
-    degCSVfile = open(degFromTargetResult, 'wb')
-    for lineCount, line in enumerate(degFromTargetMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            degCSVfile.write(lineStr)
-        else: degCSVfile.write(line + "\n")
-    degCSVfile.close()
-    
+    resultFiles = []
+    for resultFileName, resultMtx, writeAlways in resultMatrices:
+        if writeAlways == True or writeResultFile_ != 2:
+            resultFile = os.path.join(workingDir, resultFileName + hb_resultMatrix.fileExtension)
+            resultFiles.append(hb_resultMatrix.write(resultFile, resultMtx, csvCopy))
+        else:
+            resultFiles.append(None)
     
-    return radTempResult, airTempResult, operativeTempResult, adaptComfResult, degFromTargetResult
+    return resultFiles
 
 
-def writeCSVPMV(lb_preparation, directory, fileName, radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx):
-    #Find out the number of values in each hour.
-    valLen = len(radTempMtx[-1])-1
-    
-    #Set up a working directory.
-    workingDir = lb_preparation.makeWorkingDir(os.path.join(directory)) 
-    
-    #Create a csv Files.
-    radTempFile = fileName + "RadiantTemp.csv"
-    airTempFile = fileName + "AirTemp.csv"
-    SETFile = fileName + "SET.csv"
-    PPDFile = fileName + "PPD.csv"
-    PMVFile = fileName + "PMV.csv"
-    
-    #Write the radiant temperature result file.
-    if writeResultFile_ != 2:
-        radTempResult = os.path.join(workingDir, radTempFile)
-        radCSVfile = open(radTempResult, 'wb')
-        for lineCount, line in enumerate(radTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                radCSVfile.write(lineStr)
-            else: radCSVfile.write(line + "\n")
-        radCSVfile.close()
-    else:
-        radTempResult = None
-    
-    #Write the air temperature result file.
-    if writeResultFile_ != 2:
-        airTempResult = os.path.join(workingDir, airTempFile)
-        airCSVfile = open(airTempResult, 'wb')
-        for lineCount, line in enumerate(airTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                airCSVfile.write(lineStr)
-            else: airCSVfile.write(line + "\n")
-        airCSVfile.close()
-    else:
-        airTempResult = None
-    
-    #Write the operative temperature result file.
-    if writeResultFile_ != 2:
-        SET_Result = os.path.join(workingDir, SETFile)
-        opCSVfile = open(SET_Result, 'wb')
-        for lineCount, line in enumerate(SET_Mtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                opCSVfile.write(lineStr)
-            else: opCSVfile.write(line + "\n")
-        opCSVfile.close()
-    else:
-        SET_Result = None
-    
-    #Write the adaptive comfort result file.
-    PPD_Result = os.path.join(workingDir, PPDFile)
-    comfCSVfile = open(PPD_Result, 'wb')
-    for lineCount, line in enumerate(PMVComfMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            comfCSVfile.write(lineStr)
-        else: comfCSVfile.write(line + "\n")
-    comfCSVfile.close()
-    
-    #Write the deg from target result file.
-    PMV_Result = os.path.join(workingDir, PMVFile)
-    degCSVfile = open(PMV_Result, 'wb')
-    for lineCount, line in enumerate(PMV_Mtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            degCSVfile.write(lineStr)
-        else: degCSVfile.write(line + "\n")
-    degCSVfile.close()
-    
-    
-    return radTempResult, airTempResult, SET_Result, PPD_Result, PMV_Result
+def writeResultsAdapt(lb_preparation, directory, fileName, radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx):
+    return writeResultMatrices(lb_preparation, directory, [
+        (fileName + "RadiantTemp", radTempMtx, False),
+        (fileName + "AirTemp", airTempMtx, False),
+        (fileName + "OperativeTemp", operativeTempMtx, False),
+        (fileName + "AdaptComf", adaptComfMtx, True),
+        (fileName + "DegFromTarget", degFromTargetMtx, True)])
 
-def writeCSVUTCI(lb_preparation, directory, fileName, radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx):
-    #Find out the number of values in each hour.
-    valLen = len(radTempMtx[-1])-1
-    
-    #Set up a working directory.
-    workingDir = lb_preparation.makeWorkingDir(os.path.join(directory)) 
-    
-    #Create a csv Files.
-    radTempFile = fileName + "RadiantTemp.csv"
-    airTempFile = fileName + "AirTemp.csv"
-    UTCIFile = fileName + "UTCI.csv"
-    OutdoorComfFile = fileName + "OutdoorComf.csv"
-    DegFromNeutralFile = fileName + "DegFromTarget.csv"
-    
-    #Write the radiant temperature result file.
-    if writeResultFile_ != 2:
-        radTempResult = os.path.join(workingDir, radTempFile)
-        radCSVfile = open(radTempResult, 'wb')
-        for lineCount, line in enumerate(radTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                radCSVfile.write(lineStr)
-            else: radCSVfile.write(line + "\n")
-        radCSVfile.close()
-    else:
-        radTempResult = None
-    
-    #Write the air temperature result file.
-    if writeResultFile_ != 2:
-        airTempResult = os.path.join(workingDir, airTempFile)
-        airCSVfile = open(airTempResult, 'wb')
-        for lineCount, line in enumerate(airTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                airCSVfile.write(lineStr)
-            else: airCSVfile.write(line + "\n")
-        airCSVfile.close()
-    else:
-        airTempResult = None
-    
-    #Write the operative temperature result file.
-    if writeResultFile_ != 2:
-        UTCI_Result = os.path.join(workingDir, UTCIFile)
-        opCSVfile = open(UTCI_Result, 'wb')
-        for lineCount, line in enumerate(UTCI_Mtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                opCSVfile.write(lineStr)
-            else: opCSVfile.write(line + "\n")
-        opCSVfile.close()
-    else:
-        UTCI_Result = None
-    
-    #Write the adaptive comfort result file.
-    OutdoorComfResult = os.path.join(workingDir, OutdoorComfFile)
-    comfCSVfile = open(OutdoorComfResult, 'wb')
-    for lineCount, line in enumerate(OutdoorComfMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            comfCSVfile.write(lineStr)
-        else: comfCSVfile.write(line + "\n")
-    comfCSVfile.close()
-    
-    #Write the deg from target result file.
-    DegFromNeutralResult = os.path.join(workingDir, DegFromNeutralFile)
-    degCSVfile = open(DegFromNeutralResult, 'wb')
-    for lineCount, line in enumerate(DegFromNeutralMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            degCSVfile.write(lineStr)
-        else: degCSVfile.write(line + "\n")
-    degCSVfile.close()
-    
-    
-    return radTempResult, airTempResult, UTCI_Result, OutdoorComfResult, DegFromNeutralResult
 
-def writeCSVPET(lb_preparation, directory, fileName, radTempMtx, airTempMtx, PET_Mtx, PET_ComfMtx, PET_CategoryMtx):
-    #Find out the number of values in each hour.
-    valLen = len(radTempMtx[-1])-1
-    
-    #Set up a working directory.
-    workingDir = lb_preparation.makeWorkingDir(os.path.join(directory)) 
-    
-    #Create a csv Files.
-    radTempFile = fileName + "RadiantTemp.csv"
-    airTempFile = fileName + "AirTemp.csv"
-    PETFile = fileName + "PET.csv"
-    PETComfFile = fileName + "PETComf.csv"
-    PETCategoryFile = fileName + "PETCategory.csv"
-    
-    #Write the radiant temperature result file.
-    if writeResultFile_ != 2:
-        radTempResult = os.path.join(workingDir, radTempFile)
-        radCSVfile = open(radTempResult, 'wb')
-        for lineCount, line in enumerate(radTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                radCSVfile.write(lineStr)
-            else: radCSVfile.write(line + "\n")
-        radCSVfile.close()
-    else:
-        radTempResult = None
-    
-    #Write the air temperature result file.
-    if writeResultFile_ != 2:
-        airTempResult = os.path.join(workingDir, airTempFile)
-        airCSVfile = open(airTempResult, 'wb')
-        for lineCount, line in enumerate(airTempMtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                airCSVfile.write(lineStr)
-            else: airCSVfile.write(line + "\n")
-        airCSVfile.close()
-    else:
-        airTempResult = None
-    
-    #Write the operative temperature result file.
-    if writeResultFile_ != 2:
-        PET_Result = os.path.join(workingDir, PETFile)
-        opCSVfile = open(PET_Result, 'wb')
-        for lineCount, line in enumerate(PET_Mtx):
-            lineStr = ''
-            if lineCount != 0:
-                for valCt, val in enumerate(line):
-                    if valCt != valLen: lineStr = lineStr + str(val) + ','
-                    else: lineStr = lineStr + str(val) + "\n"
-                opCSVfile.write(lineStr)
-            else: opCSVfile.write(line + "\n")
-        opCSVfile.close()
-    else:
-        PET_Result = None
-    
-    #Write the adaptive comfort result file.
-    PET_ComfResult = os.path.join(workingDir, PETComfFile)
-    comfCSVfile = open(PET_ComfResult, 'wb')
-    for lineCount, line in enumerate(PETComfMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            comfCSVfile.write(lineStr)
-        else: comfCSVfile.write(line + "\n")
-    comfCSVfile.close()
-    
-    #Write the deg from target result file.
-    PET_CategoryResult = os.path.join(workingDir, PETCategoryFile)
-    degCSVfile = open(PET_CategoryResult, 'wb')
-    for lineCount, line in enumerate(PETCategoryMtx):
-        lineStr = ''
-        if lineCount != 0:
-            for valCt, val in enumerate(line):
-                if valCt != valLen: lineStr = lineStr + str(val) + ','
-                else: lineStr = lineStr + str(val) + "\n"
-            degCSVfile.write(lineStr)
-        else: degCSVfile.write(line + "\n")
-    degCSVfile.close()
-    
-    
-    return radTempResult, airTempResult, PET_Result, PET_ComfResult, PET_CategoryResult
+def writeResultsPMV(lb_preparation, directory, fileName, radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx):
+    return writeResultMatrices(lb_preparation, directory, [
+        (fileName + "RadiantTemp", radTempMtx, False),
+        (fileName + "AirTemp", airTempMtx, False),
+        (fileName + "SET", SET_Mtx, False),
+        (fileName + "PPD", PMVComfMtx, True),
+        (fileName + "PMV", PMV_Mtx, True)])
+
+
+def writeResultsUTCI(lb_preparation, directory, fileName, radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx):
+    return writeResultMatrices(lb_preparation, directory, [
+        (fileName + "RadiantTemp", radTempMtx, False),
+        (fileName + "AirTemp", airTempMtx, False),
+        (fileName + "UTCI", UTCI_Mtx, False),
+        (fileName + "OutdoorComf", OutdoorComfMtx, True),
+        (fileName + "DegFromTarget", DegFromNeutralMtx, True)])
+
+
+def writeResultsPET(lb_preparation, directory, fileName, radTempMtx, airTempMtx, PET_Mtx, PET_ComfMtx, PET_CategoryMtx):
+    return writeResultMatrices(lb_preparation, directory, [
+        (fileName + "RadiantTemp", radTempMtx, False),
+        (fileName + "AirTemp", airTempMtx, False),
+        (fileName + "PET", PET_Mtx, False),
+        (fileName + "PETComf", PET_ComfMtx, True),
+        (fileName + "PETCategory", PET_CategoryMtx, True)])
 
 
 #Import the classes, check the inputs, and generate default values for grid size if the user has given none.
@@ -1990,22 +1787,22 @@ if checkData == True and _runIt == True:
         if result != -1:
             radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx = result
             if writeResultFile_ != 0:
-                radTempResult, airTempResult, operativeTempResult, adaptComfResult, degFromTargetResult = writeCSVAdapt(lb_preparation, directory, fileName, radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx)
+                radTempResult, airTempResult, operativeTempResult, adaptComfResult, degFromTargetResult = writeResultsAdapt(lb_preparation, directory, fileName, radTempMtx, airTempMtx, operativeTempMtx, adaptComfMtx, degFromTargetMtx)
     elif comfortModel == "PMV":
         result = mainPMV(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, clothingLevel, metabolicRate, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, PPDComfortThresh, humidRatioUp, humidRatioLow, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind)
         if result != -1:
             radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx = result
             if writeResultFile_ != 0:
-                radTempResult, airTempResult, SET_Result, PMVComfResult, PMV_Result = writeCSVPMV(lb_preparation, directory, fileName, radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx)
+                radTempResult, airTempResult, SET_Result, PMVComfResult, PMV_Result = writeResultsPMV(lb_preparation, directory, fileName, radTempMtx, airTempMtx, SET_Mtx, PMVComfMtx, PMV_Mtx)
     elif comfortModel == "UTCI":
         result = mainUTCI(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind)
         if result != -1:
             radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx = result
             if writeResultFile_ != 0:
-                radTempResult, airTempResult, UTCI_Result, OutdoorComfResult, DegFromNeutralResult = writeCSVUTCI(lb_preparation, directory, fileName, radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx)
+                radTempResult, airTempResult, UTCI_Result, OutdoorComfResult, DegFromNeutralResult = writeResultsUTCI(lb_preparation, directory, fileName, radTempMtx, airTempMtx, UTCI_Mtx, OutdoorComfMtx, DegFromNeutralMtx)
     elif comfortModel == "PET":
         result = mainPET(HOYs, analysisPeriod, srfTempNumbers, srfTempHeaders, airTempDataNumbers, airTempDataHeaders, flowVolDataHeaders, flowVolDataNumbers, heatGainDataHeaders, heatGainDataNumbers, relHumidDataHeaders, relHumidDataNumbers, zoneSrfNames, testPtViewFactor, viewFactorMesh, latitude, longitude, timeZone, diffSolarRad, directSolarRad, globHorizRad, testPtSkyView, testPtBlockedVec, numSkyPatchDivs, winTrans, cloA, floorR, testPtZoneNames, testPtZoneWeights, ptHeightWeights, zoneInletInfo, inletHeightOverride, mixedAirOverride, zoneHasWindows, outdoorClac, outSrfTempHeaders, outSrfTempNumbers, outdoorNonSrfViewFac, outDryBulbTemp, outRelHumid, outWindSpeed, d, a, outdoorPtHeightWeights, allWindowShadesSame, winStatusHeaders, testPtBlockName, zoneWindowTransmiss, zoneWindowNames, allWindSpeedsSame, winSpeedNumbers, dataAnalysisPeriod, northAngle, bodyCharacteristics, climate, horizInfraredRadiation, lb_preparation, lb_sunpath, lb_comfortModels, lb_wind)
         if result != -1:
             radTempMtx, airTempMtx, PET_Mtx, PET_ComfMtx, PET_CategoryMtx = result
             if writeResultFile_ != 0:
-                radTempResult, airTempResult, PET_Result, PET_ComfResult, PET_CategoryResult = writeCSVPET(lb_preparation, directory, fileName, radTempMtx, airTempMtx, PET_Mtx, PET_ComfMtx, PET_CategoryMtx)
+                radTempResult, airTempResult, PET_Result, PET_ComfResult, PET_CategoryResult = writeResultsPET(lb_preparation, directory, fileName, radTempMtx, airTempMtx, PET_Mtx, PET_ComfMtx, PET_CategoryMtx)
@@ -23,26 +23,27 @@
 
 """
 This is a component for running a previoulsy-generated .idf file through EnergyPlus.
+You can also connect a folder to run all the .idf files in the folder in parallel. Each file runs in its own sub-folder of folder\batch and an index of all the runs is written to folder\batch\batchIndex.csv.
 
 -
 Provided by Ladybug 0.0.45
     
     Args:
-        _idfFilePath: Name of the idf file (e.g. sample1.idf).
+        _idfFilePath: Name of the idf file (e.g. sample1.idf) or a folder with several idf files.
         _epwFileAddress: Address to epw weather file.
         runIt_: Set to 'True' to run the simulation.  You can also connect a 2 to run the simulation in the background.
     Returns:
         report: Report!
-        resultFileAddress: The address of the EnergyPlus result file.
+        resultFileAddress: The address of the EnergyPlus result file (one address for each idf file in the folder).
 """
 
 ghenv.Component.Name = "Honeybee_Re-run IDF"
 ghenv.Component.NickName = 'Re-Run IDF'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nJUL_24_2016
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "0"
 
@@ -52,7 +53,6 @@ import os
 import shutil
 import Grasshopper.Kernel as gh
 import time
-import subprocess
 
 def checkTheInputs(idfFileName, epwWeatherFile):
     w = gh.GH_RuntimeMessageLevel.Warning
@@ -67,12 +67,18 @@ def checkTheInputs(idfFileName, epwWeatherFile):
         ghenv.Component.AddRuntimeMessage(w, msg)
         return -1
     
-    if not os.path.isfile(idfFileName):
+    if os.path.isdir(idfFileName):
+        if not any(f.lower().endswith('.idf') for f in os.listdir(idfFileName)):
+            msg = "There is no IDF file in the specified folder!"
+            print msg
+            ghenv.Component.AddRuntimeMessage(w, msg)
+            return -1
+    elif not os.path.isfile(idfFileName):
         msg = "IDF file does not exist in the specified location!"
         print msg
         ghenv.Component.AddRuntimeMessage(w, msg)
         return -1
-    if not idfFileName.lower().endswith('.idf'):
+    elif not idfFileName.lower().endswith('.idf'):
         msg = "IDF file is not a valid IDF!"
         print msg
         ghenv.Component.AddRuntimeMessage(w, msg)
@@ -125,18 +131,34 @@ def writeBatchFile(workingDir, idfFilePath, epwFileAddress, EPDirectory):
     
     return batchFileAddress, newIDFPath, idfFileName
 
-def runCmd(batchFileAddress, shellKey = True):
-    batchFileAddress.replace("\\", "/")		
-    p = subprocess.Popen(["cmd /c ", batchFileAddress], shell=shellKey, stdout=subprocess.PIPE, stderr=subprocess.PIPE)		
-    out, err = p.communicate()
-
 def runBatchFile(batchFileAddress, runInBackground):
     #execute the batch file
-    if runInBackground > 1:		
-        runCmd(batchFileAddress)		
-    else:
-        os.system(batchFileAddress)
+    sc.sticky["honeybee_JobScheduler"].runBatchFile(batchFileAddress, runInBackground > 1)
+
+
 
+def runBatch(idfFolder, epwFileAddress, EPDirectory, runInBackground):
+    """Run all the idf files in the folder on all the CPUs."""
+    idfFiles = sorted(os.path.join(idfFolder, f) for f in os.listdir(idfFolder) \
+                      if f.lower().endswith('.idf'))
+    
+    runner = sc.sticky["honeybee_EPBatchRunner"](os.path.join(idfFolder, 'batch'), \
+                                                 epwFileAddress, EPDirectory, \
+                                                 runInBackground = runInBackground > 1)
+    for idfFile in idfFiles:
+        runner.addIDF(idfFile)
+    
+    print 'RUNNING %d SIMULATIONS'%len(idfFiles)
+    runner.run()
+    print runner.report()
+    print 'The index of the runs is written to %s'%os.path.join(runner.workingDir, runner.indexFileName)
+    
+    for result in runner.results:
+        if result['state'] != 'succeeded':
+            warning = "%s has failed: %s"%(result['name'], result['message'] or result['state'])
+            ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+    
+    return runner.getResultFiles()
 
 
 #Honeybee check.
@@ -165,7 +187,9 @@ else:
 
 if initCheck and _runIt > 0:
     epPath = checkTheInputs(_idfFilePath, _epwFileAddress)
-    if epPath != -1:
+    if epPath != -1 and os.path.isdir(_idfFilePath):
+        resultFileAddress = runBatch(_idfFilePath, _epwFileAddress, epPath, _runIt)
+    elif epPath != -1:
         workingDir = "\\".join(_idfFilePath.split('\\')[:-1])
         batchFileAddress, newIDFPath, idfFileName = writeBatchFile(workingDir, _idfFilePath, _epwFileAddress, epPath)
         print "The file is written to %s"%batchFileAddress 
@@ -43,11 +43,11 @@ Provided by Ladybug 0.0.45
 
 ghenv.Component.Name = "Honeybee_Re-run OSM"
 ghenv.Component.NickName = 'Re-Run OSM'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nJUL_24_2016
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "0"
 
@@ -57,7 +57,6 @@ import scriptcontext as sc
 import shutil
 import Grasshopper.Kernel as gh
 import time
-import subprocess
 
 
 def checkTheInputs(osmFileName, epwWeatherFile):
@@ -104,18 +103,10 @@ def writeBatchFile(workingDir, idfFileName, epwFileAddress, EPDirectory, runInBa
     batchfile.close()
     
     #execute the batch file
-    if runInBackground:		
-        runCmd(batchFileAddress)		
-    else:
-        os.system(batchFileAddress)
+    sc.sticky["honeybee_JobScheduler"].runBatchFile(batchFileAddress, runInBackground)
     
     return fullPath + ".csv"
 
-def runCmd(batchFileAddress, shellKey = True):
-    batchFileAddress.replace("\\", "/")
-    p = subprocess.Popen(["cmd /c ", batchFileAddress], shell=shellKey, stdout=subprocess.PIPE, stderr=subprocess.PIPE)		
-    out, err = p.communicate()
-
 def getEPFolder(osmDirect):
     EPDirect = osmDirect + '/share/openstudio/'
     fList = os.listdir(EPDirect)
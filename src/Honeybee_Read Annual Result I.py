@@ -42,15 +42,16 @@ Provided by Honeybee 0.0.60
         UDLI_More_2000: Useful Daylight illuminance > Percentage of time during the active occupancy hours that the test point receives more than 2000 lux.
         CDA: Continuous Daylight Autonomy > Similar to Daylight Autonomy except that the point receives illuminaceLevel/illuminace threshold for hours that illuminance level is less than the threshold.
         sDA: Spatial Daylight Autonomy > sDA is the percent of analysis points across the analysis area that meet or exceed _DLAIllumThresholds value (set to 300 lux for LEED) for at least 50% of the analysis period. Honeybee doesn't consider the effect of dynamic blinds in calculating sDA.
+        ASE: Annual Sunlight Exposure > ASE is the percent of analysis points across the analysis area that receive more than 1000 lux of direct sunlight for more than 250 occupied hours. It is only calculated if Daysim has written the direct sunlight file of the space and the study has no dynamic blinds.
         annualProfiles: A .csv file generated by Daysim that can be used as lighting schedule for annual energy simulation
 """
 ghenv.Component.Name = "Honeybee_Read Annual Result I"
 ghenv.Component.NickName = 'readAnnualResultsI'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
-#compatibleHBVersion = VER 0.0.57\nNOV_03_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "2"
 except: pass
@@ -64,8 +65,6 @@ from Grasshopper.Kernel.Data import GH_Path
 import Rhino as rc
 import scriptcontext as sc
 import os
-import subprocess
-import time
 import shutil
 
 """
@@ -84,21 +83,6 @@ def getFilelength(fileName):
             pass
     return i + 1
 
-def isTheStudyOver(fileNames):
-    while True:
-        cmd = 'WMIC PROCESS get Commandline' #,Processid'
-        proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE)
-        cmdCount = 0
-        for line in proc.stdout:
-            if line.strip().startswith("cmd") and line.strip().endswith(".bat"):
-                fileName = line.strip().split(" ")[-1].split("\\")[-1]
-                # I should check the file names and make sure they are the right files
-                if fileName in fileNames:
-                    cmdCount += 1
-        time.sleep(0.2)
-        if cmdCount == 0:
-            return
-            
 def convertIllFileDaraTreeIntoSortedDictionary(illFilesAddress):
     
     # I should move this function into Honeybee_Honeybee #BadPractice!
@@ -153,10 +137,7 @@ def convertEPScheduleToDSSchedule(scheduleName, folder):
           "# month,day,time,occupancy (1=present/0=absent)\n"
 
     readSchedules = sc.sticky["honeybee_ReadSchedules"](scheduleName, 0)
-    dailyValues  = readSchedules.getScheduleValues()
-        
-    hourlyValues = []
-    for values in dailyValues: hourlyValues.extend(values)
+    hourlyValues = readSchedules.getAnnualValues()
     
     # create a temp folder inside folder will .ill files
     if not os.path.isdir(folder): os.mkdir(folder)
@@ -758,30 +739,20 @@ def main(illFilesAddress, testPts, testVecs, occFiles, lightingControlGroups, SH
             
             batchInf.write(batchFileStr)
             
-    # write a batch file and run the study
+    # run the batch files on the available CPUs and wait for all of them to finish
     ncpus = int(os.environ["NUMBER_OF_PROCESSORS"])
     if ncpus == 0: ncpus = 1
     
-    #execute the batch files in parallel if there is enough CPUs!
-    fileNames = []
-
-    if ncpus >= numOfSpaces:
-        for fileName in batchFileNames:
-            batchFileName = os.path.join(filePath, fileName)
-            fileNames.append(batchFileName)
-            if runInBackground:
-                p = subprocess.Popen(batchFileName , shell=True)
-            else:
-                p = subprocess.Popen(r'start cmd /c ' + batchFileName , shell=True)
-                
-        isTheStudyOver(batchFileNames)
-    else:
-        for fileName in batchFileNames:
-            batchFileName = os.path.join(filePath, fileName)
-            if runInBackground:
-                p = subprocess.Popen(batchFileName , shell=True)
-            else:
-                p = subprocess.Popen(r'start cmd /c ' + batchFileName , shell=True)
+    scheduler = sc.sticky["honeybee_JobScheduler"](maxWorkers = min(ncpus, len(batchFileNames)))
+    for fileName in batchFileNames:
+        batchFileName = os.path.join(filePath, fileName)
+        scheduler.addJob(fileName, batchFileName.replace("\\", "/"), \
+                         shell = runInBackground, captureOutput = runInBackground)
+    
+    if not scheduler.run():
+        msg = "Daysim failed to calculate the results:\n" + scheduler.report()
+        w = gh.GH_RuntimeMessageLevel.Warning
+        ghenv.Component.AddRuntimeMessage(w, msg)
     
     # calculate sDA    
     
@@ -864,7 +835,49 @@ def main(illFilesAddress, testPts, testVecs, occFiles, lightingControlGroups, SH
     try: overUDLILists = sorted(overUDLILists, key=lambda fileName: int(fileName.split(".")[-2].split("_")[-4]))
     except: pass
     
-    return None, [DLALists, underUDLILists, inRangeUDLILists, overUDLILists, CDALists, EPLSchLists, htmLists]
+    # inputs for calculating the metrics in Honeybee
+    studyInfo = {"illFiles": newIllFileNamesDict[0],
+                 "occFiles": [occFiles[spaceCount] if spaceCount < len(occFiles) else occFiles[0] \
+                              for spaceCount in range(numOfSpaces)],
+                 "dirFiles": [os.path.join(filePath, projectName + "_space_" + str(spaceCount) + ".dir") \
+                              for spaceCount in range(numOfSpaces)],
+                 "thresholds": [DLAIllumThresholds[spaceCount] if spaceCount < len(DLAIllumThresholds) \
+                                else DLAIllumThresholds[0] for spaceCount in range(numOfSpaces)],
+                 "dynamicShading": len(originalIllFilesSorted.keys()) > 1}
+    
+    return None, [DLALists, underUDLILists, inRangeUDLILists, overUDLILists, CDALists, EPLSchLists, htmLists, studyInfo]
+
+def readOccupancyValues(occFile):
+    # Daysim occupancy file: month,day,time,occupancy after the heading lines
+    values = []
+    with open(occFile, "r") as occInf:
+        for line in occInf:
+            if line.startswith("#") or not line.strip(): continue
+            try: values.append(float(line.split(",")[3]))
+            except: continue
+    return values
+
+def calculateDaylightMetrics(studyInfo, spaceCount):
+    """Calculate the metrics for a space from the .ill file of the space.
+    
+    The results are used for sDA and ASE and to check Daysim's DA, CDA and UDI results.
+    Returns None if the metrics can't be calculated. The shading state
+    of dynamic blinds is decided by Daysim's user behavior model in ds_el_lighting and is
+    not written to the results.
+    """
+    if studyInfo["dynamicShading"]: return None
+    
+    occupancy = readOccupancyValues(studyInfo["occFiles"][spaceCount])
+    if len(occupancy) != 8760: return None
+    
+    illMatrix = sc.sticky["honeybee_IllMatrix"]([studyInfo["illFiles"][spaceCount]])
+    
+    # direct sunlight is only written by gen_directsunlight
+    dirFile = studyInfo["dirFiles"][spaceCount]
+    directIllMatrix = sc.sticky["honeybee_IllMatrix"]([dirFile]) if os.path.isfile(dirFile) else None
+    
+    metrics = sc.sticky["honeybee_AnnualDaylightMetrics"](studyInfo["thresholds"][spaceCount])
+    return metrics.calculate([illMatrix], occupancy, directIllMatrix = directIllMatrix)
 
 def isAllNone(dataList):
     for item in dataList.AllData():
@@ -888,7 +901,7 @@ if _runIt and not isAllNone(_illFilesAddress) and not isAllNone(_testPoints):
             ghenv.Component.AddRuntimeMessage(w, msg)
             
         else:
-            DLALists, underUDLILists, inRangeUDLILists, overUDLILists, CDALists, EPLSchLists, htmLists = results
+            DLALists, underUDLILists, inRangeUDLILists, overUDLILists, CDALists, EPLSchLists, htmLists, studyInfo = results
             DLA = DataTree[Object]()
             UDLI_Less_100 = DataTree[Object]()    
             UDLI_100_2000 = DataTree[Object]()
@@ -896,33 +909,76 @@ if _runIt and not isAllNone(_illFilesAddress) and not isAllNone(_testPoints):
             CDA = DataTree[Object]()
             annualProfiles = DataTree[Object]()
             sDA = DataTree[Object]()
+            ASE = DataTree[Object]()
             htmReport = DataTree[Object]()
             
             def readDSStandardResults(filePath):
+                # returns the values and the number of decimals that Daysim has written
                 results = []
+                decimals = 0
                 with open(filePath, "r") as inf:
                     for line in inf:
                         if not line.startswith("#"):
-                            results.append(float(line.split("\t")[-1]))
-                return results
+                            value = line.split("\t")[-1].strip()
+                            if "." in value: decimals = max(decimals, len(value.split(".")[-1]))
+                            results.append(float(value))
+                return results, decimals
             
-            def getsDA(DLARes, threshold = 50):
-                moreThan = 0
-                for res in DLARes:
-                    if res >= threshold:
-                        moreThan += 1
-                return "%.2f"%((moreThan/len(DLARes)) * 100)
+            hb_annualDaylightMetrics = sc.sticky["honeybee_AnnualDaylightMetrics"]()
+            metricOutputs = [("DA", DLA, DLALists),
+                             ("UDILess100", UDLI_Less_100, underUDLILists),
+                             ("UDI100_2000", UDLI_100_2000, inRangeUDLILists),
+                             ("UDIMore2000", UDLI_More_2000, overUDLILists),
+                             ("CDA", CDA, CDALists)]
             
+            def readDaysimResults(branchNum):
+                daysimResults = {}
+                tolerances = {}
+                for metric, output, resultFiles in metricOutputs:
+                    try: daysimResults[metric], decimals = readDSStandardResults(resultFiles[branchNum])
+                    except (IndexError, IOError): continue
+                    # Daysim rounds the values that it writes and Honeybee rounds them to 2 decimals
+                    # so the results can only be different by the rounding of the two
+                    tolerances[metric] = 0.5 * 10 ** -decimals + 0.005 + 1e-9
+                return daysimResults, tolerances
             
+            parityErrors = []
             for branchNum in range(_testPoints.BranchCount):
                 p = GH_Path(branchNum)
-                DLARes = readDSStandardResults(DLALists[branchNum])
-                DLA.AddRange(DLARes, p)
-                UDLI_Less_100.AddRange(readDSStandardResults(underUDLILists[branchNum]), p)
-                UDLI_100_2000.AddRange(readDSStandardResults(inRangeUDLILists[branchNum]), p)
-                UDLI_More_2000.AddRange(readDSStandardResults(overUDLILists[branchNum]), p)
-                CDA.AddRange(readDSStandardResults(CDALists[branchNum]), p)
+                # DA, CDA and UDI are always Daysim's results
+                daysimResults, tolerances = readDaysimResults(branchNum)
+                for metric, output, resultFiles in metricOutputs:
+                    output.AddRange(daysimResults.get(metric, []), p)
+                
+                # sDA and ASE are calculated by Honeybee from the .ill file of the space and the
+                # other metrics are checked against Daysim's results for the same space
+                metricResults = calculateDaylightMetrics(studyInfo, branchNum)
+                if metricResults != None:
+                    differences = hb_annualDaylightMetrics.compare(metricResults, daysimResults)
+                    spaceErrors = ["%s for space %d is different from Daysim's results by up to %.4f%%."% \
+                                   (metric, branchNum, difference) \
+                                   for metric, difference in sorted(differences.items()) \
+                                   if difference > tolerances[metric]]
+                    if spaceErrors:
+                        parityErrors.extend(spaceErrors)
+                        metricResults = None
+                
+                if metricResults == None:
+                    sDAValue = hb_annualDaylightMetrics.spatialDaylightAutonomy(daysimResults.get("DA", []))
+                    ASEValue = None
+                else:
+                    sDAValue = metricResults["sDA"]
+                    ASEValue = metricResults["ASE"]
+                
                 annualProfiles.Add(EPLSchLists[branchNum], p)
-                sDA.Add(getsDA(DLARes), p)
+                sDA.Add("%.2f"%sDAValue, p)
+                if ASEValue != None: ASE.Add("%.2f"%ASEValue, p)
                 htmReport.Add(htmLists[branchNum], p)
-                    
\ No newline at end of file
+            
+            if parityErrors:
+                e = gh.GH_RuntimeMessageLevel.Error
+                msg = "Honeybee's annual metrics don't match Daysim's results. " + \
+                      "sDA is calculated from Daysim's DA values and ASE is not calculated.\n" + \
+                      "\n".join(parityErrors)
+                print msg
+                ghenv.Component.AddRuntimeMessage(e, msg)
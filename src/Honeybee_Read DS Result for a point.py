@@ -39,11 +39,11 @@ Provided by Honeybee 0.0.60
 """
 ghenv.Component.Name = "Honeybee_Read DS Result for a point"
 ghenv.Component.NickName = 'readDSHourlyResults'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
@@ -63,44 +63,25 @@ def isAllNone(dataList):
     return True
 
 
-def convertIllFileDaraTreeIntoSortedDictionary(illFilesAddress):
-    
-    # I should move this function into Honeybee_Honeybee #BadPractice!
-    
-    shadingGroupsCount = 0
-    shadingGroups = []
-    
-    # get number of shading groups
-    for branch in range(illFilesAddress.BranchCount):
-        if illFilesAddress.Path(branch).Indices[0] not in shadingGroups:
-            shadingGroups.append(illFilesAddress.Path(branch).Indices[0])
-            shadingGroupsCount+=1    
-    
-    illFileSets = {}
-    for branch in range(illFilesAddress.BranchCount):
-        # sort files inside each branch if they are not sorted
-        fileNames = list(illFilesAddress.Branch(branch))
-        try:
-            fileNames = sorted(fileNames, key=lambda fileName: int(fileName.split(".")[-2].split("_")[-1]))
-        except:
-            tmpmsg = "Can't sort .ill files based on the file names. Make sure the branches are sorted correctly."
-            w = gh.GH_RuntimeMessageLevel.Warning
-            ghenv.Component.AddRuntimeMessage(w, tmpmsg)
-        
-        #convert data tree to a useful dictionary
-        shadingGroupNumber = illFilesAddress.Path(branch).Indices[0]
-        if shadingGroupNumber not in illFileSets.keys():
-            illFileSets[shadingGroupNumber] = []
-        
-        # create a separate list for each state
-        # the structure now is like llFileSets[shadingGroupNumber][[state 1], [state 2],..., [state n]]
-        illFileSets[shadingGroupNumber].append(fileNames)
-    
-    return illFileSets
-
 def main(illFilesAddress, testPoints, targetPoint, annualProfiles):
     msg = str.Empty
     
+    # make sure Honeybee is flying
+    if not sc.sticky.has_key('honeybee_release'):
+        msg = "You should first let Honeybee fly..."
+        return msg, None, None
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component):
+            msg = "You need a newer version of Honeybee to use this compoent."
+            return msg, None, None
+        hb_readAnnualResultsAux = sc.sticky["honeybee_ReadAnnualResultsAux"]()
+    except:
+        msg = "You need a newer version of Honeybee to use this compoent." + \
+              " Use updateHoneybee component to update userObjects.\n" + \
+              "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+              "into canvas and try again."
+        return msg, None, None
+    
     shadingProfiles = []
     shadingGroupsCount = 0 # assume there in no shading groups
     
@@ -168,7 +149,7 @@ def main(illFilesAddress, testPoints, targetPoint, annualProfiles):
         w = gh.GH_RuntimeMessageLevel.Warning
         ghenv.Component.AddRuntimeMessage(w, tempmsg)
     
-    illFileSets = convertIllFileDaraTreeIntoSortedDictionary(illFilesAddress)
+    illFileSets = hb_readAnnualResultsAux.convertIllFileDaraTreeIntoSortedDictionary(illFilesAddress)
         
     # find the index of the point
     pointFound = False
@@ -181,35 +162,10 @@ def main(illFilesAddress, testPoints, targetPoint, annualProfiles):
             targetPtIndex+=1
         if pointFound ==True: break
     
-    # check number of points in each of the ill files
     # number of points should be the same in all the illfile lists
-    # that's why I just try the first list of the ill files
-    numOfPtsInEachFile = []
-    for illFile in illFileSets[0][0]:
-        with open(illFile, "r") as illInf:
-            for lineCount, line in enumerate(illInf):
-                if not line.startswith("#"):
-                    numOfPtsInEachFile.append(len(line.strip().split(" ")) - 4)
-                    break
-    
-    # find the right ill file(s) to look into and read the results
-    # print targetPtIndex
-    targetListNumber = None
-    targetIndexNumber = None
-    for listCount, numOfPts in enumerate(numOfPtsInEachFile):
-        if sum(numOfPtsInEachFile[:listCount]) >= targetPtIndex + 1:
-            targetListNumber = listCount - 1
-            targetIndexNumber = targetPtIndex - sum(numOfPtsInEachFile[:listCount-1])
-            #print "list number is: ", listCount - 1
-            #print "index number is:", targetPtIndex - sum(numOfPtsInEachFile[:listCount-1])
-            break
-    
-    # Probably this is not the best way but I really want to get it done tonight!
-    if targetListNumber == None:
-        targetListNumber = len(numOfPtsInEachFile)-1
-        targetIndexNumber = targetPtIndex - sum(numOfPtsInEachFile[:targetListNumber])
-    
-    if targetIndexNumber < 0:
+    # that's why I just check the first list of the ill files
+    illMatrix = hb_readAnnualResultsAux.getIllMatrix(illFileSets[0][0])
+    if targetPtIndex >= illMatrix.pointCount:
         msg = "The target point is not inside the point list"
         return msg, None, None
     
@@ -239,12 +195,8 @@ def main(illFilesAddress, testPoints, targetPoint, annualProfiles):
     
     for shadingGroupCount in illFileSets.keys():
         for stateCount, targetIllFiles in enumerate(illFileSets[shadingGroupCount]):
-            targetIllFile = targetIllFiles[targetListNumber]
-            result = open(targetIllFile, 'r')
-            for lineCount, line in enumerate(result):
-                hourLuxValue = line.strip().split(" ")[targetIndexNumber + 4]
-                illuminanceValues[shadingGroupCount][stateCount].append(float(hourLuxValue))
-            result.close()
+            illMatrix = hb_readAnnualResultsAux.getIllMatrix(targetIllFiles)
+            illuminanceValues[shadingGroupCount][stateCount].extend(illMatrix.getPoint(targetPtIndex))
             
                 
     return msg, illuminanceValues, shadingProfiles[branch]
@@ -262,7 +214,7 @@ if _targetPoint!=None and not isAllNone(_illFilesAddress) and not isAllNone(_tes
     
     msg, illuminanceValues, shadingProfile = main(_illFilesAddress, _testPoints, _targetPoint, annualProfiles_)
     
-    if shadingProfile!=[]: shadingProfile = shadingProfile[0]
+    if shadingProfile: shadingProfile = shadingProfile[0]
     
     if msg!=str.Empty:
         w = gh.GH_RuntimeMessageLevel.Warning
@@ -55,11 +55,11 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_Read EP Result"
 ghenv.Component.NickName = 'readEPResult'
-ghenv.Component.Message = 'VER 0.0.60\nOCT_05_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nMAY_02_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nAPR_04_2015
 ghenv.Component.AdditionalHelpFromDocStrings = "4"
 
@@ -72,6 +72,24 @@ import scriptcontext as sc
 import copy
 import os
 
+#Honeybee check.
+hbCheck = True
+w = gh.GH_RuntimeMessageLevel.Warning
+if not sc.sticky.has_key('honeybee_release') == True:
+    hbCheck = False
+    print "You should first let Honeybee fly..."
+    ghenv.Component.AddRuntimeMessage(w, "You should first let Honeybee fly...")
+else:
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component): hbCheck = False
+    except:
+        hbCheck = False
+        warning = "You need a newer version of Honeybee to use this compoent." + \
+        "Use updateHoneybee component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+        "into canvas and try again."
+        ghenv.Component.AddRuntimeMessage(w, warning)
+
 #Check to be sure that the files exist.
 csvExists = True
 if _resultFileAddress and _resultFileAddress != None:
@@ -282,390 +300,392 @@ for name in zoneNameList:
 
 
 # PARSE THE RESULT FILE.
-if _resultFileAddress and gotData == True and csvExists == True:
+if hbCheck and _resultFileAddress and gotData == True and csvExists == True:
     try:
-        result = open(_resultFileAddress, 'r')
+        resultReader = sc.sticky["honeybee_EPResultReader"](_resultFileAddress)
         
-        for lineCount, line in enumerate(result):
-            if lineCount == 0:
-                #ANALYZE THE FILE HEADING
-                key = []; path = []
-                for columnCount, column in enumerate(line.split(',')):
-                    
-                    if 'Zone Ideal Loads Supply Air Total Cooling Energy' in column or 'Chiller Electric Energy' in column or 'Cooling Coil Electric Energy' in column or 'Zone VRF Air Terminal Cooling Electric Energy' in column or 'VRF Heat Pump Cooling Electric Energy' in column:
-                        
-                        if 'Zone Ideal Loads Supply Air Total Cooling Energy' in column and 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                            idealAirTrigger = True
-                        elif 'IDEAL LOADS AIR SYSTEM' in column:
-                            zoneName = checkZone(" " + ":".join(column.split(":")[:-1]).split(' IDEAL LOADS AIR SYSTEM')[0])
-                            idealAirTrigger = True
-                        elif 'COIL COOLING DX SINGLE SPEED' in column:
-                            zoneName = checkSys(" " + ":".join(column.split(":")[:-1]).split('COIL COOLING DX SINGLE SPEED ')[-1], 'DX Cooling Coil')
-                            idealAirTrigger = False
-                        elif 'COIL COOLING DX TWO SPEED' in column:
-                            zoneName = checkSys(" " + ":".join(column.split(":")[:-1]).split('COIL COOLING DX TWO SPEED ')[-1], 'DX Cooling Coil')
-                            idealAirTrigger = False
-                        elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW' in column:
-                            zoneName = checkZoneSys(" " + ":".join(column.split(":")[:-1]).split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1])
-                            idealAirTrigger = False
-                        elif 'VRF HEAT PUMP -' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('VRF HEAT PUMP - ')[-1], 5)
-                            idealAirTrigger = False
-                        elif 'Chiller Electric Energy' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('CHILLER ELECTRIC EIR ')[-1], 0)
-                            idealAirTrigger = False
-                        else:
-                            zoneName = " " +column.split(":")[0]
-                            checkCustomName(customCount)
-                            customCount+=1
-                        
-                        try:
-                            if idealAirTrigger == True:
-                                makeHeader(cooling, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Cooling Load", energyUnit, True)
-                            else:
-                                makeHeader(cooling, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Cooling Electric Energy", energyUnit, True)
-                            dataTypeList[2] = True
-                            key.append(0)
-                        except:
-                            key.append(-1)
-                    
-                    elif 'Zone Ideal Loads Supply Air Total Heating Energy' in column  or 'Boiler Heating Energy' in column or 'Heating Coil Total Heating Energy' in column or 'Heating Coil Gas Energy' in column or 'Heating Coil Electric Energy' in column or 'Humidifier Electric Energy' in column or 'Zone VRF Air Terminal Heating Electric Energy' in column or 'VRF Heat Pump Heating Electric Energy' in column:
-                        notFound = False
-                        if 'Zone Ideal Loads Supply Air Total Heating Energy' in column and 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                            idealAirTrigger = True
-                        elif 'IDEAL LOADS AIR SYSTEM' in column:
-                            zoneName = checkZone(" " + ":".join(column.split(":")[:-1]).split(' IDEAL LOADS AIR SYSTEM')[0])
-                            idealAirTrigger = True
-                        elif 'COIL HEATING DX SINGLE SPEED' in column:
-                            zoneName = checkZoneSys(" " + ":".join(column.split(":")[:-1]).split('COIL HEATING DX SINGLE SPEED ')[-1])
-                            idealAirTrigger = 2
-                        elif 'COIL HEATING GAS' in column and not 'Heating Coil Electric Energy' in column:
-                            zoneName = checkSys(" " + ":".join(column.split(":")[:-1]).split('COIL HEATING GAS ')[-1], 'Gas Coil')
-                            idealAirTrigger = False
-                        elif 'COIL HEATING ELECTRIC' in column:
-                            zoneName = checkSys(" " + ":".join(column.split(":")[:-1]).split('COIL HEATING ELECTRIC ')[-1], 'Electric Coil')
-                            idealAirTrigger = 2
-                        elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW' in column and not 'Heating Coil Total Heating Energy' in column:
-                            zoneName = checkZoneSys(" " + ":".join(column.split(":")[:-1]).split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1])
-                            idealAirTrigger = 2
-                        elif 'VRF HEAT PUMP -' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('VRF HEAT PUMP - ')[-1], 5)
-                            idealAirTrigger = 2
-                        elif 'Boiler Heating Energy' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('BOILER HOT WATER ')[-1], 1)
-                            idealAirTrigger = False
-                        elif 'HUMIDIFIER STEAM ELECTRIC' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('HUMIDIFIER STEAM ELECTRIC ')[-1], 4)
-                            idealAirTrigger = 2
-                        else:
-                            zoneName = " " +column.split(":")[0]
-                            checkCustomName(customCount)
-                            customCount+=1
-                        
-                        try:
-                            if idealAirTrigger == True:
-                                makeHeader(heating, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Heating Load", energyUnit, True)
-                            elif idealAirTrigger == False:
-                                makeHeader(heating, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Heating Fuel Energy", energyUnit, False)
-                            else:
-                                makeHeader(heating, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Heating Electric Energy", energyUnit, False)
-                            dataTypeList[3] = True
-                            key.append(1)
-                        except:
-                            key.append(-1)
-                    
-                    elif 'Zone Lights Electric Energy' in column:
-                        key.append(2)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(electricLight, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Electric Lighting Energy", energyUnit, True)
-                        dataTypeList[4] = True
-                    
-                    elif 'Zone Electric Equipment Electric Energy' in column:
-                        key.append(3)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(electricEquip, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Electric Equipment Energy", energyUnit, True)
-                        dataTypeList[5] = True
-                    
-                    elif 'Fan Electric Energy' in column:
-                        key.append(15)
-                        if 'FAN CONSTANT VOLUME' in column:
-                            centTrigger = True
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('FAN CONSTANT VOLUME ')[-1], 2)
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        elif 'FAN VARIABLE VOLUME' in column:
-                            fanNum = int(":".join(column.split(":")[:-1]).split('FAN VARIABLE VOLUME ')[-1])
-                            if centTrigger == True:
-                                fanNum = fanNum+len(zoneNameList)
-                            zoneName = checkCentralSys(" " + str(fanNum), 2)
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        elif 'FAN ON OFF' in column:
-                            zoneName = checkZoneSys(" " + ":".join(column.split(":")[:-1]).split('FAN ON OFF ')[-1])
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW'  in column:
-                            zoneName = checkZoneSys(" " + ":".join(column.split(" FAN:")[:-1]).split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1])
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        elif 'Zone Ventilation Fan Electric Energy' in column:
-                            zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        elif 'Earth Tube Fan Electric Energy' in column:
-                            zoneName = checkZoneOther(dataIndex, " " + ":".join(column.split(":")[:-1]))
-                            makeHeaderAlt(fanElectric, path[columnCount], zoneName, column.split('(')[-1].split(')')[0], "Earth Tube Fan Electric Energy", energyUnit, False)
-                        else:
-                            zoneName = " " +column.split(":")[0]
-                            checkCustomName(customCount)
-                            customCount+=1
-                            makeHeader(fanElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Fan Electric Energy", energyUnit, False)
-                        dataTypeList[6] = True
-                    
-                    elif 'Pump Electric Energy' in column:
-                        key.append(25)
-                        if 'PUMP CONSTANT SPEED' in column:
-                            zoneName = checkZoneSys(" " + ":".join(column.split(":")[:-1]).split('PUMP CONSTANT SPEED ')[-1])
-                            makeHeader(pumpElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Pump Electric Energy", energyUnit, True)
-                        elif 'PUMP VARIABLE SPEED' in column:
-                            zoneName = checkCentralSys(" " + ":".join(column.split(":")[:-1]).split('PUMP VARIABLE SPEED ')[-1], 3)
-                            makeHeader(pumpElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Pump Electric Energy", energyUnit, True)
-                        else:
-                            zoneName = " " + column.split(":")[0]
-                            checkCustomName(customCount)
-                            customCount+=1
-                            makeHeader(pumpElectric, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Pump Electric Energy", energyUnit, True)
-                        dataTypeList[7] = True
-                    
-                    elif 'Zone People Total Heating Energy' in column:
-                        key.append(4)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(peopleGains, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "People Energy", energyUnit, True)
-                        dataTypeList[8] = True
-                    
-                    elif 'Zone Windows Total Transmitted Solar Radiation Energy' in column:
-                        key.append(5)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(totalSolarGain, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Total Solar Gain", energyUnit, True)
-                        dataTypeList[9] = True
-                    
-                    elif 'Zone Ventilation Sensible Heat Loss Energy ' in column:
-                        key.append(6)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(natVentEnergy, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Natural Ventilation Energy", energyUnit, True)
-                        dataTypeList[12] = True
-                    
-                    elif 'Zone Ventilation Sensible Heat Gain Energy' in column:
-                        key.append(7)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                    
-                    elif 'Zone Ideal Loads Zone Total Heating Energy' in column:
-                        key.append(23)
-                        if 'Zone Ideal Loads Zone Total Heating Energy' in column and 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                        else:
-                            zoneName = checkZone(" " + ":".join(column.split(":")[:-1]).split(' IDEAL LOADS')[0])
-                        zoneHeatingEnergy[int(path[-1])].append(zoneName)
-                        zoneHeatingEnergy[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Ideal Loads Zone Total Cooling Energy' in column:
-                        key.append(24)
-                        if 'Zone Ideal Loads Zone Total Cooling Energy' in column and 'ZONE HVAC' in column:
-                            zoneName = checkZoneSys(" " + (":".join(column.split(":")[:-1])).split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
-                        else:
-                            zoneName = checkZone(" " + ":".join(column.split(":")[:-1]).split(' IDEAL LOADS')[0])
-                        zoneCoolingEnergy[int(path[-1])].append(zoneName)
-                        zoneCoolingEnergy[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Infiltration Total Heat Loss Energy' in column:
-                        key.append(8)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(infiltrationEnergy, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Infiltration Energy", energyUnit, True)
-                        dataTypeList[10] = True
-                    
-                    elif 'Zone Infiltration Total Heat Gain Energy' in column:
-                        key.append(9)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                    
-                    elif 'Zone Operative Temperature' in column:
-                        key.append(10)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(operativeTemperature, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Operative Temperature", "C", False)
-                        dataTypeList[13] = True
-                    
-                    elif 'Zone Mean Air Temperature' in column:
-                        key.append(11)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(airTemperature, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Air Temperature", "C", False)
-                        dataTypeList[14] = True
-                    
-                    elif 'Zone Mean Radiant Temperature' in column:
-                        key.append(12)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(meanRadTemperature, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Radiant Temperature", "C", False)
-                        dataTypeList[15] = True
-                    
-                    elif 'Zone Air Relative Humidity' in column:
-                        key.append(13)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        makeHeader(relativeHumidity, int(path[columnCount]), zoneName, column.split('(')[-1].split(')')[0], "Relative Humidity", "%", False)
-                        dataTypeList[16] = True
-                    
-                    elif 'Zone Ventilation Standard Density Volume Flow Rate' in column:
-                        key.append(16)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        natVentFlow[int(path[-1])].append(zoneName)
-                        natVentFlow[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Infiltration Standard Density Volume Flow Rate' in column:
-                        key.append(17)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        infiltrationFlow[int(path[-1])].append(zoneName)
-                        infiltrationFlow[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Mechanical Ventilation Standard Density Volume Flow Rate' in column:
-                        key.append(22)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        mechSysAirFlow[int(path[-1])].append(zoneName)
-                        mechSysAirFlow[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Earth Tube Air Flow Volume' in column:
-                        key.append(21)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        earthTubeFlow[int(path[-1])].append(zoneName)
-                        earthTubeFlow[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Air Heat Balance Internal Convective Heat Gain Rate' in column:
-                        key.append(18)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        internalAirGain[int(path[-1])].append(zoneName)
-                        internalAirGain[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Air Heat Balance Surface Convection Rate' in column:
-                        key.append(19)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        surfaceAirGain[int(path[-1])].append(zoneName)
-                        surfaceAirGain[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif 'Zone Air Heat Balance System Air Transfer Rate' in column:
-                        key.append(20)
-                        zoneName = checkZone(" " + ":".join(column.split(":")[:-1]))
-                        systemAirGain[int(path[-1])].append(zoneName)
-                        systemAirGain[int(path[-1])].append(column.split('(')[-1].split(')')[0])
-                    
-                    elif ('Zone' in column or 'Site' in column) and not "Setpoint Not Met Time" in column or "Pump Electric Energy" in column:
-                        if "Site" in column:
-                            zoneName = checkOther(column, otherCount)
-                            otherCount += 1
-                        elif not "System" in column and not "SYSTEM" in column and not "ZONEHVAC" in column:
-                            zoneName = checkZoneOther(dataIndex, (" " + ":".join(column.split(":")[:-1])))
-                        elif 'IDEAL LOADS' in column and not "Supply Air Sensible" in column and not "Supply Air Latent" in column:
-                            zoneName = checkZoneOther(dataIndex, (" " + column.split(" IDEAL LOADS")[0]))
-                        else: zoneName = None
-                        
-                        if zoneName != None:
-                            key.append(14)
-                            otherDataName = column.split(':')[-1].split(' [')[0].upper()
-                            if "ENERGY" in otherDataName or "GAIN" in otherDataName or "MASS" in otherDataName or "VOLUME" in otherDataName or "Loss" in otherDataName: normalizble = True
-                            else: normalizble = False
-                            makeHeaderAlt(otherZoneData, path[columnCount], zoneName, column.split('(')[-1].split(')')[0], column.split(':')[-1].split(' [')[0], column.split('[')[-1].split(']')[0], normalizble)
-                            dataTypeList[19] = True
-                        else:
-                            key.append(-1)
-                            path.append(-1)
-                    
+        #ANALYZE THE FILE HEADING
+        key = []; path = []; gainColumns = {}
+        for resultColumn in resultReader.columns:
+            columnCount, zoneKey, variable = resultColumn.index, resultColumn.key, resultColumn.variable
+            
+            if variable in ('Zone Ideal Loads Supply Air Total Cooling Energy', 'Chiller Electric Energy', 'Cooling Coil Electric Energy', 'Zone VRF Air Terminal Cooling Electric Energy', 'VRF Heat Pump Cooling Electric Energy'):
+                
+                if variable == 'Zone Ideal Loads Supply Air Total Cooling Energy' and 'ZONE HVAC' in zoneKey:
+                    zoneName = checkZoneSys(" " + zoneKey.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                    idealAirTrigger = True
+                elif 'IDEAL LOADS AIR SYSTEM' in zoneKey:
+                    zoneName = checkZone(" " + zoneKey.split(' IDEAL LOADS AIR SYSTEM')[0])
+                    idealAirTrigger = True
+                elif 'COIL COOLING DX SINGLE SPEED' in zoneKey:
+                    zoneName = checkSys(" " + zoneKey.split('COIL COOLING DX SINGLE SPEED ')[-1], 'DX Cooling Coil')
+                    idealAirTrigger = False
+                elif 'COIL COOLING DX TWO SPEED' in zoneKey:
+                    zoneName = checkSys(" " + zoneKey.split('COIL COOLING DX TWO SPEED ')[-1], 'DX Cooling Coil')
+                    idealAirTrigger = False
+                elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW' in zoneKey:
+                    zoneName = checkZoneSys(" " + zoneKey.split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1])
+                    idealAirTrigger = False
+                elif 'VRF HEAT PUMP -' in zoneKey:
+                    zoneName = checkCentralSys(" " + zoneKey.split('VRF HEAT PUMP - ')[-1], 5)
+                    idealAirTrigger = False
+                elif variable == 'Chiller Electric Energy':
+                    zoneName = checkCentralSys(" " + zoneKey.split('CHILLER ELECTRIC EIR ')[-1], 0)
+                    idealAirTrigger = False
+                else:
+                    zoneName = " " +zoneKey
+                    checkCustomName(customCount)
+                    customCount+=1
+                
+                try:
+                    if idealAirTrigger == True:
+                        makeHeader(cooling, int(path[columnCount]), zoneName, resultColumn.timestep, "Cooling Load", energyUnit, True)
                     else:
-                        key.append(-1)
-                        path.append(-1)
+                        makeHeader(cooling, int(path[columnCount]), zoneName, resultColumn.timestep, "Cooling Electric Energy", energyUnit, True)
+                    dataTypeList[2] = True
+                    key.append(0)
+                except:
+                    key.append(-1)
             
-            else:
-                for columnCount, column in enumerate(line.split(',')):
-                    if key[columnCount] != 14:
-                        try: p = GH_Path(int(path[columnCount]))
-                        except: p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
+            elif variable in ('Zone Ideal Loads Supply Air Total Heating Energy', 'Boiler Heating Energy', 'Heating Coil Total Heating Energy', 'Heating Coil Gas Energy', 'Heating Coil Electric Energy', 'Humidifier Electric Energy', 'Zone VRF Air Terminal Heating Electric Energy', 'VRF Heat Pump Heating Electric Energy'):
+                notFound = False
+                if variable == 'Zone Ideal Loads Supply Air Total Heating Energy' and 'ZONE HVAC' in zoneKey:
+                    zoneName = checkZoneSys(" " + zoneKey.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                    idealAirTrigger = True
+                elif 'IDEAL LOADS AIR SYSTEM' in zoneKey:
+                    zoneName = checkZone(" " + zoneKey.split(' IDEAL LOADS AIR SYSTEM')[0])
+                    idealAirTrigger = True
+                elif 'COIL HEATING DX SINGLE SPEED' in zoneKey:
+                    zoneName = checkZoneSys(" " + zoneKey.split('COIL HEATING DX SINGLE SPEED ')[-1])
+                    idealAirTrigger = 2
+                elif 'COIL HEATING GAS' in zoneKey and variable != 'Heating Coil Electric Energy':
+                    zoneName = checkSys(" " + zoneKey.split('COIL HEATING GAS ')[-1], 'Gas Coil')
+                    idealAirTrigger = False
+                elif 'COIL HEATING ELECTRIC' in zoneKey:
+                    zoneName = checkSys(" " + zoneKey.split('COIL HEATING ELECTRIC ')[-1], 'Electric Coil')
+                    idealAirTrigger = 2
+                elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW' in zoneKey and variable != 'Heating Coil Total Heating Energy':
+                    zoneName = checkZoneSys(" " + zoneKey.split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1])
+                    idealAirTrigger = 2
+                elif 'VRF HEAT PUMP -' in zoneKey:
+                    zoneName = checkCentralSys(" " + zoneKey.split('VRF HEAT PUMP - ')[-1], 5)
+                    idealAirTrigger = 2
+                elif variable == 'Boiler Heating Energy':
+                    zoneName = checkCentralSys(" " + zoneKey.split('BOILER HOT WATER ')[-1], 1)
+                    idealAirTrigger = False
+                elif 'HUMIDIFIER STEAM ELECTRIC' in zoneKey:
+                    zoneName = checkCentralSys(" " + zoneKey.split('HUMIDIFIER STEAM ELECTRIC ')[-1], 4)
+                    idealAirTrigger = 2
+                else:
+                    zoneName = " " +zoneKey
+                    checkCustomName(customCount)
+                    customCount+=1
+                
+                try:
+                    if idealAirTrigger == True:
+                        makeHeader(heating, int(path[columnCount]), zoneName, resultColumn.timestep, "Heating Load", energyUnit, True)
+                    elif idealAirTrigger == False:
+                        makeHeader(heating, int(path[columnCount]), zoneName, resultColumn.timestep, "Heating Fuel Energy", energyUnit, False)
                     else:
-                        p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
-                    
-                    if key[columnCount] == 0:
-                        try: cooling.Add((float(column)/3600000), p)
-                        except: dataTypeList[2] = False
-                    elif key[columnCount] == 1:
-                        try: heating.Add((float(column)/3600000), p)
-                        except: dataTypeList[3] = False
-                    elif key[columnCount] == 2:
-                        try: electricLight.Add((float(column)/3600000), p)
-                        except: dataTypeList[4] = False
-                    elif key[columnCount] == 3:
-                        try: electricEquip.Add((float(column)/3600000), p)
-                        except: dataTypeList[5] = False
-                    elif key[columnCount] == 4:
-                        try: peopleGains.Add((float(column)/3600000), p)
-                        except: dataTypeList[6] = False
-                    elif key[columnCount] == 5:
-                        try: totalSolarGain.Add((float(column)/3600000), p)
-                        except: dataTypeList[7] = False
-                    elif key[columnCount] == 6:
-                        try: natVentEnergy.Add((((float(column))*(-1)/3600000) + ((float( line.split(',')[columnCount+1] ))/3600000)), p)
-                        except: dataTypeList[11] = False
-                    elif key[columnCount] == 7:
-                        pass
-                    elif key[columnCount] == 23:
-                        try: zoneHeatingEnergy[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 24:
-                        try: zoneCoolingEnergy[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 8:
-                        try: infiltrationEnergy.Add((((float(column))*(-1)/3600000) + ((float( line.split(',')[columnCount+1] ))/3600000)), p)
-                        except: dataTypeList[9] = False
-                    elif key[columnCount] == 9:
-                        pass
-                    elif key[columnCount] == 10:
-                        try: operativeTemperature.Add(float(column), p)
-                        except: dataTypeList[12] = False
-                    elif key[columnCount] == 11:
-                        try: airTemperature.Add(float(column), p)
-                        except: dataTypeList[13] = False
-                    elif key[columnCount] == 12:
-                        try: meanRadTemperature.Add(float(column), p)
-                        except: dataTypeList[14] = False
-                    elif key[columnCount] == 13:
-                        try: relativeHumidity.Add(float(column), p)
-                        except: dataTypeList[15] = False
-                    elif key[columnCount] == 14:
-                        try:
-                            otherZoneData.Add(float(column), p)
-                        except: pass
-                    elif key[columnCount] == 15:
-                        try: fanElectric.Add((float(column)/3600000), p)
-                        except: pass
-                    elif key[columnCount] == 25:
-                        try: pumpElectric.Add((float(column)/3600000), p)
-                        except: pass
-                    elif key[columnCount] == 16:
-                        try: natVentFlow[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 17:
-                        try: infiltrationFlow[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 22:
-                        try: mechSysAirFlow[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 21:
-                        try: earthTubeFlow[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 18:
-                        try: internalAirGain[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 19:
-                        try: surfaceAirGain[int(path[columnCount])].append(float(column))
-                        except: pass
-                    elif key[columnCount] == 20:
-                        try: systemAirGain[int(path[columnCount])].append(float(column))
-                        except: pass
-                    
-        result.close()
+                        makeHeader(heating, int(path[columnCount]), zoneName, resultColumn.timestep, "Heating Electric Energy", energyUnit, False)
+                    dataTypeList[3] = True
+                    key.append(1)
+                except:
+                    key.append(-1)
+            
+            elif variable == 'Zone Lights Electric Energy':
+                key.append(2)
+                zoneName = checkZone(" " + zoneKey)
+                makeHeader(electricLight, int(path[columnCount]), zoneName, resultColumn.timestep, "Electric Lighting Energy", energyUnit, True)
+                dataTypeList[4] = True
+            
+            elif variable == 'Zone Electric Equipment Electric Energy':
+                key.append(3)
+                zoneName = checkZone(" " + zoneKey)
+                makeHeader(electricEquip, int(path[columnCount]), zoneName, resultColumn.timestep, "Electric Equipment Energy", energyUnit, True)
+                dataTypeList[5] = True
+            
+            elif variable.endswith('Fan Electric Energy'):
+                key.append(15)
+                if 'FAN CONSTANT VOLUME' in zoneKey:
+                    centTrigger = True
+                    zoneName = checkCentralSys(" " + zoneKey.split('FAN CONSTANT VOLUME ')[-1], 2)
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, resultColumn.timestep, "Fan Electric Energy", energyUnit, False)
+                elif 'FAN VARIABLE VOLUME' in zoneKey:
+                    fanNum = int(zoneKey.split('FAN VARIABLE VOLUME ')[-1])
+                    if centTrigger == True:
+                        fanNum = fanNum+len(zoneNameList)
+                    zoneName = checkCentralSys(" " + str(fanNum), 2)
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, resultColumn.timestep, "Fan Electric Energy", energyUnit, False)
+                elif 'FAN ON OFF' in zoneKey:
+                    zoneName = checkZoneSys(" " + zoneKey.split('FAN ON OFF ')[-1])
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, resultColumn.timestep, "Fan Electric Energy", energyUnit, False)
+                elif 'ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW' in zoneKey:
+                    zoneName = checkZoneSys(" " + zoneKey.rsplit(" FAN", 1)[0].split('ZONE HVAC TERMINAL UNIT VARIABLE REFRIGERANT FLOW ')[-1])
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, resultColumn.timestep, "Fan Electric Energy", energyUnit, False)
+                elif variable == 'Zone Ventilation Fan Electric Energy':
+                    zoneName = checkZone(" " + zoneKey)
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, resultColumn.timestep, "Fan Electric Energy", energyUnit, False)
+                elif variable == 'Earth Tube Fan Electric Energy':
+                    zoneName = checkZoneOther(dataIndex, " " + zoneKey)
+                    makeHeaderAlt(fanElectric, path[columnCount], zoneName, resultColumn.timestep, "Earth Tube Fan Electric Energy", energyUnit, False)
+                else:
+                    zoneName = " " +zoneKey
+                    checkCustomName(customCount)
+                    customCount+=1
+                    makeHeader(fanElectric, int(path[columnCount]), zoneName, resultColumn.timestep, "Fan Electric Energy", energyUnit, False)
+                dataTypeList[6] = True
+            
+            elif variable == 'Pump Electric Energy':
+                key.append(25)
+                if 'PUMP CONSTANT SPEED' in zoneKey:
+                    zoneName = checkZoneSys(" " + zoneKey.split('PUMP CONSTANT SPEED ')[-1])
+                    makeHeader(pumpElectric, int(path[columnCount]), zoneName, resultColumn.timestep, "Pump Electric Energy", energyUnit, True)
+                elif 'PUMP VARIABLE SPEED' in zoneKey:
+                    zoneName = checkCentralSys(" " + zoneKey.split('PUMP VARIABLE SPEED ')[-1], 3)
+                    makeHeader(pumpElectric, int(path[columnCount]), zoneName, resultColumn.timestep, "Pump Electric Energy", energyUnit, True)
+                else:
+                    zoneName = " " + zoneKey
+                    checkCustomName(customCount)
+                    customCount+=1
+                    makeHeader(pumpElectric, int(path[columnCount]), zoneName, resultColumn.timestep, "Pump Electric Energy", energyUnit, True)
+                dataTypeList[7] = True
+            
+            elif variable == 'Zone People Total Heating Energy':
+                key.append(4)
+                zoneName = checkZone(" " + zoneKey)
+                makeHeader(peopleGains, int(path[columnCount]), zoneName, resultColumn.timestep, "People Energy", energyUnit, True)
+                dataTypeList[8] = True
+            
+            elif variable == 'Zone Windows Total Transmitted Solar Radiation Energy':
+                key.append(5)
+                zoneName = checkZone(" " + zoneKey)
+                makeHeader(totalSolarGain, int(path[columnCount]), zoneName, resultColumn.timestep, "Total Solar Gain", energyUnit, True)
+                dataTypeList[9] = True
+            
+            elif variable == 'Zone Ventilation Sensible Heat Loss Energy':
+                key.append(6)
+                zoneName = checkZone(" " + zoneKey)
+                gainColumns[columnCount] = resultReader.findColumn(zoneKey, 'Zone Ventilation Sensible Heat Gain Energy', resultColumn.timestep)
+                makeHeader(natVentEnergy, int(path[columnCount]), zoneName, resultColumn.timestep, "Natural Ventilation Energy", energyUnit, True)
+                dataTypeList[12] = True
+            
+            elif variable == 'Zone Ventilation Sensible Heat Gain Energy':
+                key.append(7)
+                zoneName = checkZone(" " + zoneKey)
+            
+            elif variable == 'Zone Ideal Loads Zone Total Heating Energy':
+                key.append(23)
+                if 'ZONE HVAC' in zoneKey:
+                    zoneName = checkZoneSys(" " + zoneKey.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                else:
+                    zoneName = checkZone(" " + zoneKey.split(' IDEAL LOADS')[0])
+                zoneHeatingEnergy[int(path[-1])].append(zoneName)
+                zoneHeatingEnergy[int(path[-1])].append(resultColumn.timestep)
+            
+            elif variable == 'Zone Ideal Loads Zone Total Cooling Energy':
+                key.append(24)
+                if 'ZONE HVAC' in zoneKey:
+                    zoneName = checkZoneSys(" " + zoneKey.split('ZONE HVAC IDEAL LOADS AIR SYSTEM ')[-1])
+                else:
+                    zoneName = checkZone(" " + zoneKey.split(' IDEAL LOADS')[0])
+                zoneCoolingEnergy[int(path[-1])].append(zoneName)
+                zoneCoolingEnergy[int(path[-1])].append(resultColumn.timestep)
+            
+            elif variable == 'Zone Infiltration Total Heat Loss Energy':
+                key.append(8)
+                zoneName = checkZone(" " + zoneKey)
+                gainColumns[columnCount] = resultReader.findColumn(zoneKey, 'Zone Infiltration Total Heat Gain Energy', resultColumn.timestep)
+                makeHeader(infiltrationEnergy, int(path[columnCount]), zoneName, resultColumn.timestep, "Infiltration Energy", energyUnit, True)
+                dataTypeList[10] = True
+            
+            elif variable == 'Zone Infiltration Total Heat Gain Energy':
+                key.append(9)
+                zoneName = checkZone(" " + zoneKey)
+            
+            elif variable == 'Zone Operative Temperature':
+                key.append(10)
+                zoneName = checkZone(" " + zoneKey)
+                makeHeader(operativeTemperature, int(path[columnCount]), zoneName, resultColumn.timestep, "Operative Temperature", "C", False)
+                dataTypeList[13] = True
+            
+            elif variable == 'Zone Mean Air Temperature':
+                key.append(11)
+                zoneName = checkZone(" " + zoneKey)
+                makeHeader(airTemperature, int(path[columnCount]), zoneName, resultColumn.timestep, "Air Temperature", "C", False)
+                dataTypeList[14] = True
+            
+            elif variable == 'Zone Mean Radiant Temperature':
+                key.append(12)
+                zoneName = checkZone(" " + zoneKey)
+                makeHeader(meanRadTemperature, int(path[columnCount]), zoneName, resultColumn.timestep, "Radiant Temperature", "C", False)
+                dataTypeList[15] = True
+            
+            elif variable == 'Zone Air Relative Humidity':
+                key.append(13)
+                zoneName = checkZone(" " + zoneKey)
+                makeHeader(relativeHumidity, int(path[columnCount]), zoneName, resultColumn.timestep, "Relative Humidity", "%", False)
+                dataTypeList[16] = True
+            
+            elif variable == 'Zone Ventilation Standard Density Volume Flow Rate':
+                key.append(16)
+                zoneName = checkZone(" " + zoneKey)
+                natVentFlow[int(path[-1])].append(zoneName)
+                natVentFlow[int(path[-1])].append(resultColumn.timestep)
+            
+            elif variable == 'Zone Infiltration Standard Density Volume Flow Rate':
+                key.append(17)
+                zoneName = checkZone(" " + zoneKey)
+                infiltrationFlow[int(path[-1])].append(zoneName)
+                infiltrationFlow[int(path[-1])].append(resultColumn.timestep)
+            
+            elif variable == 'Zone Mechanical Ventilation Standard Density Volume Flow Rate':
+                key.append(22)
+                zoneName = checkZone(" " + zoneKey)
+                mechSysAirFlow[int(path[-1])].append(zoneName)
+                mechSysAirFlow[int(path[-1])].append(resultColumn.timestep)
+            
+            elif variable == 'Earth Tube Air Flow Volume':
+                key.append(21)
+                zoneName = checkZone(" " + zoneKey)
+                earthTubeFlow[int(path[-1])].append(zoneName)
+                earthTubeFlow[int(path[-1])].append(resultColumn.timestep)
+            
+            elif variable == 'Zone Air Heat Balance Internal Convective Heat Gain Rate':
+                key.append(18)
+                zoneName = checkZone(" " + zoneKey)
+                internalAirGain[int(path[-1])].append(zoneName)
+                internalAirGain[int(path[-1])].append(resultColumn.timestep)
+            
+            elif variable == 'Zone Air Heat Balance Surface Convection Rate':
+                key.append(19)
+                zoneName = checkZone(" " + zoneKey)
+                surfaceAirGain[int(path[-1])].append(zoneName)
+                surfaceAirGain[int(path[-1])].append(resultColumn.timestep)
+            
+            elif variable == 'Zone Air Heat Balance System Air Transfer Rate':
+                key.append(20)
+                zoneName = checkZone(" " + zoneKey)
+                systemAirGain[int(path[-1])].append(zoneName)
+                systemAirGain[int(path[-1])].append(resultColumn.timestep)
+            
+            elif ('Zone' in variable or 'Site' in variable) and not "Setpoint Not Met Time" in variable:
+                if "Site" in variable:
+                    zoneName = checkOther(zoneKey, otherCount)
+                    otherCount += 1
+                elif not "System" in variable and not "SYSTEM" in zoneKey and not "ZONEHVAC" in zoneKey:
+                    zoneName = checkZoneOther(dataIndex, (" " + zoneKey))
+                elif 'IDEAL LOADS' in zoneKey and not "Supply Air Sensible" in variable and not "Supply Air Latent" in variable:
+                    zoneName = checkZoneOther(dataIndex, (" " + zoneKey.split(" IDEAL LOADS")[0]))
+                else: zoneName = None
+                
+                if zoneName != None:
+                    key.append(14)
+                    otherDataName = variable.upper()
+                    if "ENERGY" in otherDataName or "GAIN" in otherDataName or "MASS" in otherDataName or "VOLUME" in otherDataName or "Loss" in otherDataName: normalizble = True
+                    else: normalizble = False
+                    makeHeaderAlt(otherZoneData, path[columnCount], zoneName, resultColumn.timestep, variable, resultColumn.units, normalizble)
+                    dataTypeList[19] = True
+                else:
+                    key.append(-1)
+                    path.append(-1)
+            
+            else:
+                key.append(-1)
+                path.append(-1)
+        
+        # only parse the columns that are used by this component
+        dataColumns = [columnCount for columnCount, k in enumerate(key) if k != -1]
+        gainColumnIds = [columnId for columnId in gainColumns.values() if columnId != None]
+        for rowCount, row in resultReader.iterRows(dataColumns + gainColumnIds):
+            for columnCount in dataColumns:
+                column = row[columnCount]
+                if key[columnCount] != 14:
+                    try: p = GH_Path(int(path[columnCount]))
+                    except: p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
+                else:
+                    p = GH_Path(int(path[columnCount][0]), int(path[columnCount][1]))
+                
+                if key[columnCount] == 0:
+                    try: cooling.Add((float(column)/3600000), p)
+                    except: dataTypeList[2] = False
+                elif key[columnCount] == 1:
+                    try: heating.Add((float(column)/3600000), p)
+                    except: dataTypeList[3] = False
+                elif key[columnCount] == 2:
+                    try: electricLight.Add((float(column)/3600000), p)
+                    except: dataTypeList[4] = False
+                elif key[columnCount] == 3:
+                    try: electricEquip.Add((float(column)/3600000), p)
+                    except: dataTypeList[5] = False
+                elif key[columnCount] == 4:
+                    try: peopleGains.Add((float(column)/3600000), p)
+                    except: dataTypeList[6] = False
+                elif key[columnCount] == 5:
+                    try: totalSolarGain.Add((float(column)/3600000), p)
+                    except: dataTypeList[7] = False
+                elif key[columnCount] == 6:
+                    try: natVentEnergy.Add((((float(column))*(-1)/3600000) + ((float( row[gainColumns[columnCount]] ))/3600000)), p)
+                    except: dataTypeList[11] = False
+                elif key[columnCount] == 7:
+                    pass
+                elif key[columnCount] == 23:
+                    try: zoneHeatingEnergy[int(path[columnCount])].append(float(column))
+                    except: pass
+                elif key[columnCount] == 24:
+                    try: zoneCoolingEnergy[int(path[columnCount])].append(float(column))
+                    except: pass
+                elif key[columnCount] == 8:
+                    try: infiltrationEnergy.Add((((float(column))*(-1)/3600000) + ((float( row[gainColumns[columnCount]] ))/3600000)), p)
+                    except: dataTypeList[9] = False
+                elif key[columnCount] == 9:
+                    pass
+                elif key[columnCount] == 10:
+                    try: operativeTemperature.Add(float(column), p)
+                    except: dataTypeList[12] = False
+                elif key[columnCount] == 11:
+                    try: airTemperature.Add(float(column), p)
+                    except: dataTypeList[13] = False
+                elif key[columnCount] == 12:
+                    try: meanRadTemperature.Add(float(column), p)
+                    except: dataTypeList[14] = False
+                elif key[columnCount] == 13:
+                    try: relativeHumidity.Add(float(column), p)
+                    except: dataTypeList[15] = False
+                elif key[columnCount] == 14:
+                    try:
+                        otherZoneData.Add(float(column), p)
+                    except: pass
+                elif key[columnCount] == 15:
+                    try: fanElectric.Add((float(column)/3600000), p)
+                    except: pass
+                elif key[columnCount] == 25:
+                    try: pumpElectric.Add((float(column)/3600000), p)
+                    except: pass
+                elif key[columnCount] == 16:
+                    try: natVentFlow[int(path[columnCount])].append(float(column))
+                    except: pass
+                elif key[columnCount] == 17:
+                    try: infiltrationFlow[int(path[columnCount])].append(float(column))
+                    except: pass
+                elif key[columnCount] == 22:
+                    try: mechSysAirFlow[int(path[columnCount])].append(float(column))
+                    except: pass
+                elif key[columnCount] == 21:
+                    try: earthTubeFlow[int(path[columnCount])].append(float(column))
+                    except: pass
+                elif key[columnCount] == 18:
+                    try: internalAirGain[int(path[columnCount])].append(float(column))
+                    except: pass
+                elif key[columnCount] == 19:
+                    try: surfaceAirGain[int(path[columnCount])].append(float(column))
+                    except: pass
+                elif key[columnCount] == 20:
+                    try: systemAirGain[int(path[columnCount])].append(float(column))
+                    except: pass
+        
         parseSuccess = True
     except:
-        try: result.close()
-        except: pass
         parseSuccess = False
         warn = 'Failed to parse the result file.  Check the folder of the file address you are plugging into this component and make sure that there is a .csv file in the folder. \n'+ \
                   'If there is a file with no data in it (it is 0 kB), your simulation probably did not run correctly. \n' + \
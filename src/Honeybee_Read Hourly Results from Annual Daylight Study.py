@@ -40,11 +40,11 @@ Provided by Honeybee 0.0.60
 """
 ghenv.Component.Name = "Honeybee_Read Hourly Results from Annual Daylight Study"
 ghenv.Component.NickName = 'readDSHourlyResults'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
@@ -52,6 +52,7 @@ except: pass
 
 
 import os
+import scriptcontext as sc
 from System import Object
 import Grasshopper.Kernel as gh
 from Grasshopper import DataTree
@@ -59,44 +60,25 @@ from Grasshopper.Kernel.Data import GH_Path
 from pprint import pprint
 
 
-def convertIllFileDaraTreeIntoSortedDictionary(illFilesAddress):
-    
-    # I should move this function into Honeybee_Honeybee #BadPractice!
-    
-    shadingGroupsCount = 0
-    shadingGroups = []
-    
-    # get number of shading groups
-    for branch in range(illFilesAddress.BranchCount):
-        if illFilesAddress.Path(branch).Indices[0] not in shadingGroups:
-            shadingGroups.append(illFilesAddress.Path(branch).Indices[0])
-            shadingGroupsCount+=1    
-    
-    illFileSets = {}
-    for branch in range(illFilesAddress.BranchCount):
-        # sort files inside each branch if they are not sorted
-        fileNames = list(illFilesAddress.Branch(branch))
-        try:
-            fileNames = sorted(fileNames, key=lambda fileName: int(fileName.split(".")[-2].split("_")[-1]))
-        except:
-            tmpmsg = "Can't sort .ill files based on the file names. Make sure the branches are sorted correctly."
-            w = gh.GH_RuntimeMessageLevel.Warning
-            ghenv.Component.AddRuntimeMessage(w, tmpmsg)
-        
-        #convert data tree to a useful dictionary
-        shadingGroupNumber = illFilesAddress.Path(branch).Indices[0]
-        if shadingGroupNumber not in illFileSets.keys():
-            illFileSets[shadingGroupNumber] = []
-        
-        # create a separate list for each state
-        # the structure now is like llFileSets[shadingGroupNumber][[state 1], [state 2],..., [state n]]
-        illFileSets[shadingGroupNumber].append(fileNames)
-    
-    return illFileSets
-
 def main(illFilesAddress, testPoints, HOY, annualProfiles):
     msg = str.Empty
     
+    # make sure Honeybee is flying
+    if not sc.sticky.has_key('honeybee_release'):
+        msg = "You should first let Honeybee fly..."
+        return msg, None, None
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component):
+            msg = "You need a newer version of Honeybee to use this compoent."
+            return msg, None, None
+        hb_readAnnualResultsAux = sc.sticky["honeybee_ReadAnnualResultsAux"]()
+    except:
+        msg = "You need a newer version of Honeybee to use this compoent." + \
+              " Use updateHoneybee component to update userObjects.\n" + \
+              "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+              "into canvas and try again."
+        return msg, None, None
+    
     shadingProfiles = []
     shadingGroupsCount = 0 # assume there in no shading groups
     
@@ -164,7 +146,7 @@ def main(illFilesAddress, testPoints, HOY, annualProfiles):
         w = gh.GH_RuntimeMessageLevel.Warning
         ghenv.Component.AddRuntimeMessage(w, tempmsg)
     
-    illFileSets = convertIllFileDaraTreeIntoSortedDictionary(illFilesAddress)
+    illFileSets = hb_readAnnualResultsAux.convertIllFileDaraTreeIntoSortedDictionary(illFilesAddress)
         
     # read the data for hour of the year and multiply it with the shading
     numOfPts = testPoints.DataCount
@@ -190,16 +172,9 @@ def main(illFilesAddress, testPoints, HOY, annualProfiles):
         # each file represnts one state of shading
         for stateCount, resultFiles in enumerate(illFileSets[shadingGroupCount]):
             
-            for resultFile in resultFiles:
-                result = open(resultFile, 'r')
-                for lineCount, line in enumerate(result):
-                    if lineCount == int(HOY-1):
-                       line = line.replace('\n', '', 10)
-                       lineSeg = line.Split(' ')
-                       for hourLuxValue in lineSeg[4:]:
-                           illuminanceValues[shadingGroupCount][stateCount].append(float(hourLuxValue))
-                           
-                result.close()
+            # read the line for the hour from the binary copy of the files
+            illMatrix = hb_readAnnualResultsAux.getIllMatrix(resultFiles)
+            illuminanceValues[shadingGroupCount][stateCount].extend(illMatrix.getHour(int(HOY-1)))
     
     return msg, illuminanceValues, shadingProfiles
 
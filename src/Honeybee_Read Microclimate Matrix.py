@@ -26,43 +26,89 @@ This component reads the results of an Adaptive Indoor Comfort Analysis.  Note t
 Provided by Honeybee 0.0.60
     
     Args:
-        _comfResultFileAddress: Any one of the result file addresses that comes out of the 'Honeybee_Microclimate Map Analysis' component or the 'Honeybee_Thermal Comfort Autonomy Analysis' component.
+        _comfResultFileAddress: Any one of the result file addresses that comes out of the 'Honeybee_Microclimate Map Analysis' component (binary .hbmtx matrix or its csv copy) or the 'Honeybee_Thermal Comfort Autonomy Analysis' component.
+        HOY_: An optional list of hours of the year (1-8760) to only read the results of these hours.  For binary .hbmtx files only these hours are read from the file, which is much faster than reading the whole matrix.
+        analysisPeriod_: An optional analysis period from the Ladybug_Analysis Period component to only read the results of this period.  HOY_ will be used if both are connected.
     Returns:
         comfResultsMtx: A matrix of comfort data that can be plugged into the "Visualize Comfort Results" component.
 """
 
 ghenv.Component.Name = "Honeybee_Read Microclimate Matrix"
 ghenv.Component.NickName = 'readMicroclimateMtx'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 ghenv.Component.AdditionalHelpFromDocStrings = "6"
 
 
 import Grasshopper.Kernel as gh
+import scriptcontext as sc
 
+#HOY_ and analysisPeriod_ are not available in the older versions of the component.
+try: HOY_
+except NameError: HOY_ = []
+try: analysisPeriod_
+except NameError: analysisPeriod_ = []
 
-comfResultsMtx = []
 
-if _comfResultFileAddress:
-    try:
-        result = open(_comfResultFileAddress, 'r')
-        
+def readCSVMatrix(resultFileAddress):
+    comfResultsMtx = []
+    with open(resultFileAddress, 'r') as result:
         for lineCount, line in enumerate(result):
             if lineCount == 0: comfResultsMtx.append(line.split('\n')[0])
             else:
                 #Pull out the data.
-                hourData = []
-                for columnCount, column in enumerate(line.split(',')):
-                    hourData.append(float(column))
-                comfResultsMtx.append(hourData)
-        result.close()
+                comfResultsMtx.append(map(float, line.split(',')))
+    return comfResultsMtx
+
+
+def getRequestedHOYs(HOYs, analysisPeriod, hb_resultMatrix):
+    #Return the hours to be read or None for the whole matrix.
+    if len(HOYs) != 0: return [int(HOY) for HOY in HOYs]
+    if len(analysisPeriod) == 2: return hb_resultMatrix.getPeriodHOYs(analysisPeriod)
+    return None
+
+
+comfResultsMtx = []
+
+if _comfResultFileAddress and not sc.sticky.has_key("honeybee_release"):
+    print "You should first let Honeybee fly..."
+    ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, "You should first let Honeybee fly...")
+elif _comfResultFileAddress:
+    try:
+        if not sc.sticky['honeybee_release'].isCompatible(ghenv.Component): _comfResultFileAddress = None
     except:
-        try: result.close()
-        except: pass
+        warning = "You need a newer version of Honeybee to use this compoent." + \
+        " Use updateHoneybee component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Honeybee_Honeybee component " + \
+        "into canvas and try again."
+        ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+        _comfResultFileAddress = None
+
+if _comfResultFileAddress:
+    hb_resultMatrix = sc.sticky["honeybee_ResultMatrix"]
+    missingHOYs = []
+    try:
+        HOYs = getRequestedHOYs(HOY_, analysisPeriod_, hb_resultMatrix)
+        if hb_resultMatrix.isMatrixFile(_comfResultFileAddress):
+            #Binary matrix files from the 'Honeybee_Microclimate Map Analysis' component.
+            resultMtx = hb_resultMatrix(_comfResultFileAddress)
+            if HOYs != None:
+                missingHOYs = resultMtx.getRowNumbers(resultMtx.header, resultMtx.hours, HOYs)[1]
+            comfResultsMtx = resultMtx.toMatrix(HOYs)
+        else:
+            comfResultsMtx = readCSVMatrix(_comfResultFileAddress)
+            if HOYs != None:
+                comfResultsMtx, missingHOYs = hb_resultMatrix.selectHOYs(comfResultsMtx, HOYs)
+    except (IOError, ValueError, KeyError, IndexError):
         warn = 'Failed to parse the result file.  The csv file might not have existed when connected or the simulation did not run correctly.'+ \
                   'Try reconnecting the _resultfileAddress to this component or re-running your simulation.'
         print warn
         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warn)
-
+    
+    if len(missingHOYs) != 0:
+        warn = '%d of the requested hours are not in the analysis period of the result file and are not read.'%len(missingHOYs)
+        print warn
+        ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warn)
@@ -43,11 +43,11 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_Refine Daylight Simulation"
 ghenv.Component.NickName = 'refineDaylightAnalysis'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
@@ -149,12 +149,14 @@ def main(octFile, analysisRecipe, numOfCPUs, thisRunName, runIt):
         newOctFileName = octFile
         
     # copy amb file if any
+    ambFiles = []
     fileNames = os.listdir(workingDir)
     for fileName in fileNames:
         if fileName.lower().endswith(".amb"):
             ambFile = os.path.join(workingDir, fileName)
             newambFile = os.path.join(subWorkingDir, radFileName + ".amb")
             hb_writeRADAUX.copyFile(ambFile, newambFile)
+            ambFiles.append(newambFile)
             break
     
     # export mesh
@@ -182,8 +184,19 @@ def main(octFile, analysisRecipe, numOfCPUs, thisRunName, runIt):
                             [], newOctFileName, runOverture = False)
     
     if runIt:
-        hb_writeRAD.runBatchFiles(initBatchFileName, batchFilesName, \
-                                  fileNames, pcompBatchFile, waitingTime)
+        # check if the same study is already calculated
+        simulationCache = sc.sticky["honeybee_SimulationCache"]()
+        cacheKey = hb_writeRAD.getCacheKey(simulationCache, subWorkingDir, numOfCPUs, analysisRecipe, ambFiles)
+        
+        if simulationCache.restore(cacheKey, subWorkingDir):
+            print "Results are loaded from the simulation cache."
+        else:
+            snapshot = simulationCache.snapshot(subWorkingDir)
+            scheduler = hb_writeRAD.runBatchFiles(initBatchFileName, batchFilesName, \
+                                      fileNames, pcompBatchFile)
+            if not scheduler.getFailedJobs():
+                simulationCache.store(cacheKey, subWorkingDir, snapshot)
+        print simulationCache.report()
         
         results = hb_writeRAD.collectResults(subWorkingDir, radFileName, \
                                 numOfCPUs, analysisRecipe, expectedResultFiles)
@@ -205,7 +218,6 @@ if _runIt == True and _analysisRecipe!=None and _octFile!=None and _thisRunName!
     
     report = ""
     done = False
-    waitingTime = 0.2 # waiting time between batch files in seconds
     try: numOfCPUs = int(_numOfCPUs_)
     except: numOfCPUs = 1
     
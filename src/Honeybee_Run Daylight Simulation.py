@@ -54,11 +54,11 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_Run Daylight Simulation"
 ghenv.Component.NickName = 'runDaylightAnalysis'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "04 | Daylight | Daylight"
-#compatibleHBVersion = VER 0.0.56\nDEC_21_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "1"
 except: pass
@@ -80,7 +80,7 @@ ghenv.Component.Params.Output[3].NickName = "results"
 ghenv.Component.Params.Output[3].Name = "results"
 results = []
 
-def main(north, originalHBObjects, analysisRecipe, runRad, numOfCPUs, workingDir, radFileName, meshParameters, waitingTime, additionalRadFiles, overwriteResults, exportAirWalls):
+def main(north, originalHBObjects, analysisRecipe, runRad, numOfCPUs, workingDir, radFileName, meshParameters, additionalRadFiles, overwriteResults, exportAirWalls):
     # import the classes
     w = gh.GH_RuntimeMessageLevel.Warning
     
@@ -213,8 +213,23 @@ def main(north, originalHBObjects, analysisRecipe, runRad, numOfCPUs, workingDir
                             additionalRadFiles)
     
     if runRad:
-        hb_writeRAD.runBatchFiles(initBatchFileName, batchFilesName, \
-                                  fileNames, pcompBatchFile, waitingTime, runRad > 1)
+        # check if the same study is already calculated
+        simulationCache = sc.sticky["honeybee_SimulationCache"]()
+        cacheKey = hb_writeRAD.getCacheKey(simulationCache, subWorkingDir, numOfCPUs, \
+                                           analysisRecipe, additionalRadFiles)
+        
+        if simulationCache.restore(cacheKey, subWorkingDir):
+            print "Results are loaded from the simulation cache."
+            if analysisRecipe.type != 2:
+                # octrees are not cached. rebuild it for the studies that use this folder (e.g. Refine Daylight Simulation)
+                hb_writeRAD.executeBatchFiles([initBatchFileName], shell = runRad > 1)
+        else:
+            snapshot = simulationCache.snapshot(subWorkingDir)
+            scheduler = hb_writeRAD.runBatchFiles(initBatchFileName, batchFilesName, \
+                                      fileNames, pcompBatchFile, runRad > 1)
+            if not scheduler.getFailedJobs():
+                simulationCache.store(cacheKey, subWorkingDir, snapshot)
+        print simulationCache.report()
         
         results = hb_writeRAD.collectResults(subWorkingDir, radFileName, \
                                 numOfCPUs, analysisRecipe, expectedResultFiles)
@@ -241,7 +256,6 @@ if _writeRad == True and _analysisRecipe!=None and ((len(_HBObjects)!=0 and _HBO
     
     report = ""
     done = False
-    waitingTime = 0.2 # waiting time between batch files in seconds
     try: numOfCPUs = int(_numOfCPUs_)
     except: numOfCPUs = 1
     
@@ -256,7 +270,7 @@ if _writeRad == True and _analysisRecipe!=None and ((len(_HBObjects)!=0 and _HBO
     
     
     result = main(north_, _HBObjects, _analysisRecipe, runRad_, numOfCPUs, \
-                  _workingDir_, _radFileName_, meshSettings_, waitingTime, \
+                  _workingDir_, _radFileName_, meshSettings_, \
                   additionalRadFiles_, overwriteResults_, exportAirWalls_)
     
     if result!= -1:
@@ -38,11 +38,11 @@ Provided by Honeybee 0.0.60
 """
 ghenv.Component.Name = "Honeybee_Solve Adjacencies"
 ghenv.Component.NickName = 'solveAdjc'
-ghenv.Component.Message = 'VER 0.0.60\nNOV_04_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "00 | Honeybee"
-#compatibleHBVersion = VER 0.0.56\nNOV_04_2016
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "3"
 except: pass
@@ -226,13 +226,30 @@ def main(HBZones, altConstruction, altBC, tol, remCurrent):
                     srf.setBC('OUTDOORS')
                     srf.setBCObjectToOutdoors()
     
+    # index the surfaces so only the surfaces that are close to each other and
+    # have opposite normals are tested.
+    adjacencyIndex = sc.sticky["honeybee_AdjacencyIndex"](tol)
+    for zoneCount, testZone in enumerate(HBZoneObjects):
+        for srf in testZone.surfaces:
+            adjacencyIndex.add((zoneCount, srf), zoneCount, srf.geometry.GetBoundingBox(True), \
+                               srf.normalVector, srf.cenPt)
+    
     # solve it zone by zone
-    for testZone in HBZoneObjects:
+    for zoneCount, testZone in enumerate(HBZoneObjects):
         # mesh each surface and test if it will be adjacent to any surface
         # from other zones
         for srf in testZone.surfaces:
             #print srf.type, srf.BC 
             if srf.BC.upper() == 'OUTDOORS' or srf.BC.upper() == 'GROUND' or srf.BC.upper() == 'ADIABATIC':
+                candidates = adjacencyIndex.getCandidates(zoneCount, srf.geometry.GetBoundingBox(True), \
+                                                          srf.normalVector, srf.cenPt)
+                if len(candidates) == 0: continue
+                
+                # group candidate surfaces by zone
+                candidateSrfs = {}
+                for targetZoneCount, surface in candidates:
+                    candidateSrfs.setdefault(targetZoneCount, []).append(surface)
+                
                 #Create a mesh of surface to use center points as test points
                 meshPar = rc.Geometry.MeshingParameters.Default
                 BrepMesh = rc.Geometry.Mesh.CreateFromBrep(srf.geometry, meshPar)[0]
@@ -251,11 +268,13 @@ def main(HBZones, altConstruction, altBC, tol, remCurrent):
                     
                     raysDict[meshSrfCen] = rc.Geometry.Ray3d(meshSrfCen, srfNormal)
                 
-                for targetZone in HBZoneObjects:
+                for targetZoneCount in sorted(candidateSrfs.keys()):
+                    targetZone = HBZoneObjects[targetZoneCount]
                     if notTheSameZone(targetZone, testZone):
                         # check ray intersection to see if this zone is next to the surface
                         if shootIt(raysDict.values(), [targetZone.geometry], tol + sc.doc.ModelAbsoluteTolerance):
-                            for surface in targetZone.surfaces:
+                            for surface in candidateSrfs[targetZoneCount]:
+                                adjacencyIndex.testedPairs += 1
                                 # check if z value of center points matches
                                 #print abs(surface.cenPt.Z - srf.cenPt.Z)
                                 #if abs(surface.cenPt.Z - srf.cenPt.Z) < tol:
@@ -277,7 +296,8 @@ def main(HBZones, altConstruction, altBC, tol, remCurrent):
                                             #    w = gh.GH_RuntimeMessageLevel.Warning
                                             #    ghenv.Component.AddRuntimeMessage(w, msg)
                                             
-                                            updateAdj(srf, surface, altConstruction, altBC, tol)                                        
+                                            updateAdj(srf, surface, altConstruction, altBC, tol)
+                                            adjacencyIndex.matchedPairs += 1
                                             if surface.type == 4:
                                                 flowRate = updateZoneMixing(surface, testZone, targetZone)
                                                 print "Air has been mixed between " + testZone.name + " and " + targetZone.name + " with a flow rate of " + str(flowRate) + " m3/s."
@@ -288,6 +308,8 @@ def main(HBZones, altConstruction, altBC, tol, remCurrent):
                 #        srf.setType(1) # Roof
                 #        srf.setBC(srf.srfBC[srf.type])
     
+    print adjacencyIndex.report()
+    
     # add zones to dictionary
     ModifiedHBZones  = hb_hive.addToHoneybeeHive(HBZoneObjects, ghenv.Component)
     
@@ -49,11 +49,11 @@ Provided by Honeybee 0.0.60
 
 ghenv.Component.Name = "Honeybee_Visualize Microclimate Map"
 ghenv.Component.NickName = 'VisualizeMicroclimate'
-ghenv.Component.Message = 'VER 0.0.60\nAUG_10_2016'
+ghenv.Component.Message = 'VER 0.0.60\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Honeybee"
 ghenv.Component.SubCategory = "10 | Energy | Energy"
-#compatibleHBVersion = VER 0.0.56\nFEB_01_2015
+#compatibleHBVersion = VER 0.0.60\nOCT_18_2026
 #compatibleLBVersion = VER 0.0.59\nNOV_20_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "6"
 except: pass
@@ -68,6 +68,7 @@ from Grasshopper.Kernel.Data import GH_Path
 import Rhino as rc
 import scriptcontext as sc
 import math
+import operator
 
 
 w = gh.GH_RuntimeMessageLevel.Warning
@@ -178,9 +179,31 @@ def restoreInputOutput():
         ghenv.Component.Params.Input[input].Description = inputsDict[input][1]
 
 
+def summarizePoints(hourValues, total, occCounts = None):
+    #Sum up the values of each point over the hours without transposing the matrix.
+    if len(hourValues) == 0: return []
+    pointSums = [0] * len(hourValues[0])
+    for line in hourValues:
+        pointSums = map(operator.add, pointSums, line)
+    
+    if total == True: return pointSums
+    elif occCounts == None: return [pointSum/len(hourValues) for pointSum in pointSums]
+    else: return [pointSum/occCount for pointSum, occCount in zip(pointSums, occCounts)]
+
+
+def getOccupiedCounts(hourValues, pointCount):
+    #Recompute the occupied hours of each point for the analysis period.
+    occCounts = [0] * pointCount
+    for line in hourValues:
+        for ptCt, pointVal in enumerate(line):
+            if isinstance(pointVal, int): occCounts[ptCt] += 1
+    return occCounts
+
+
 def computeComfValues(comfResultsMtx, analysisP, comfMtxAnalysisP, stepOfSimulation, annualData, simStepPossible, occDataType, percentOrTotal, totalAble, lb_preparation):
     #Create a list to be filled with values of comfort.
     comfortFactorVals = []
+    total = percentOrTotal == False and totalAble == True
     
     if stepOfSimulation != None and simStepPossible == True:
         comfortFactorVals = comfResultsMtx[stepOfSimulation]
@@ -188,35 +211,13 @@ def computeComfValues(comfResultsMtx, analysisP, comfMtxAnalysisP, stepOfSimulat
         #Get the HOYs of the analysis period
         HOYS, months, days = lb_preparation.getHOYsBasedOnPeriod(analysisP, 1)
         
-        #Pick out just the hours that are in the analysis period.
-        newcomfResultsMtx = []
-        for lineCount, line in enumerate(comfResultsMtx):
-            if lineCount in HOYS: newcomfResultsMtx.append(line)
-        
-        #Transpose the matrix
-        newcomfResultsMtx2 = zip(*newcomfResultsMtx)
+        #Pick out just the hours that are in the analysis period. Each row of an annual matrix is an hour of the year.
+        newcomfResultsMtx = [comfResultsMtx[hour] for hour in HOYS if 0 < hour < len(comfResultsMtx)]
         
-        if percentOrTotal == False and totalAble == True:
-            for lineCount, line in enumerate(newcomfResultsMtx2):
-                comfortFactorVals.append(sum(line))
+        if occDataType == True and total == False:
+            comfortFactorVals = summarizePoints(newcomfResultsMtx, False, getOccupiedCounts(newcomfResultsMtx, len(comfResultsMtx[1])))
         else:
-            #If the dataType is meant to be divided by occupie hours, recompute the occupied hours for the analysis period.
-            occMtxInit = []
-            for val in comfResultsMtx[1]: occMtxInit.append(0)
-            if occDataType == True:
-                for line in newcomfResultsMtx:
-                    for ptCt, pointVal in enumerate(line):
-                        if isinstance(pointVal, int): occMtxInit[ptCt] += 1
-            occMtx = [occMtxInit]
-            
-            #Compute the total percentage of comfortable hours.
-            if occDataType == False:
-                for lineCount, line in enumerate(newcomfResultsMtx2):
-                    comfortFactorVals.append(sum(line)/len(line))
-            else:
-                occMtx2 = zip(*occMtx)
-                for lineCount, line in enumerate(newcomfResultsMtx2):
-                    comfortFactorVals.append(sum(line)/occMtx2[lineCount][0])
+            comfortFactorVals = summarizePoints(newcomfResultsMtx, total)
     elif len(analysisP) > 0 and analysisP != comfMtxAnalysisP and annualData == False and simStepPossible == True:
         #Check the data anlysis period and subtract the start day from each of the HOYs.
         HOYS, months, days = lb_preparation.getHOYsBasedOnPeriod(analysisP, 1)
@@ -227,65 +228,29 @@ def computeComfValues(comfResultsMtx, analysisP, comfMtxAnalysisP, stepOfSimulat
         #Check to see if the hours of the requested analysis period are in the comfResultsMtx.
         periodsAlign = True
         for hour in HOYS:
-            if hour < 0: periodsAlign = False
-            try: comfResultsMtx[hour]
-            except: periodsAlign = False
+            if hour < 0 or hour >= len(comfResultsMtx): periodsAlign = False
         
         if periodsAlign == False:
             warning = 'The analysis period of the confResultsMtx and that which is plugged into this component do not align.'
             print warning
             ghenv.Component.AddRuntimeMessage(w, warning)
         else:
-            
             #Pick out just the hours that are in the analysis period.
-            newcomfResultsMtx = []
-            for lineCount, line in enumerate(comfResultsMtx):
-                if lineCount in HOYS:
-                    newcomfResultsMtx.append(line)
+            newcomfResultsMtx = [comfResultsMtx[hour] for hour in sorted(set(HOYS)) if hour > 0]
             
-            #Transpose the matrix
-            newcomfResultsMtx2 = zip(*newcomfResultsMtx)
-            
-            if percentOrTotal == False and totalAble == True:
-                for lineCount, line in enumerate(newcomfResultsMtx2):
-                    comfortFactorVals.append(sum(line))
+            if occDataType == True and total == False:
+                comfortFactorVals = summarizePoints(newcomfResultsMtx, False, getOccupiedCounts(newcomfResultsMtx, len(comfResultsMtx[1])))
             else:
-                #If the dataType is meant to be divided by occupie hours, recompute the occupied hours for the analysis period.
-                occMtxInit = []
-                for val in comfResultsMtx[1]: occMtxInit.append(0)
-                if occDataType == True:
-                    for line in newcomfResultsMtx:
-                        for ptCt, pointVal in enumerate(line):
-                            if isinstance(pointVal, int): occMtxInit[ptCt] += 1
-                occMtx = [occMtxInit]
-                
-                #Compute the total percentage of comfortable hours.
-                if occDataType == False:
-                    for lineCount, line in enumerate(newcomfResultsMtx2):
-                        comfortFactorVals.append(sum(line)/len(line))
-                else:
-                    occMtx2 = zip(*occMtx)
-                    for lineCount, line in enumerate(newcomfResultsMtx2):
-                        comfortFactorVals.append(sum(line)/occMtx2[lineCount][0])
+                comfortFactorVals = summarizePoints(newcomfResultsMtx, total)
     else:
-        #Transpose the matrix
-        if occDataType == False: newcomfResultsMtx1 = comfResultsMtx[1:]
-        else: newcomfResultsMtx1 = comfResultsMtx[1:-1]
-        newcomfResultsMtx2 = zip(*newcomfResultsMtx1)
-        
-        if percentOrTotal == False and totalAble == True:
-            for lineCount, line in enumerate(newcomfResultsMtx2):
-                comfortFactorVals.append(sum(line))
+        #Compute the total or the average across the hours.
+        if occDataType == False:
+            comfortFactorVals = summarizePoints(comfResultsMtx[1:], total)
+        elif total == True:
+            comfortFactorVals = summarizePoints(comfResultsMtx[1:-1], total)
         else:
-            #Compute the average across the hours.
-            if occDataType == False:
-                for lineCount, line in enumerate(newcomfResultsMtx2):
-                    comfortFactorVals.append(sum(line)/len(line))
-            else:
-                occMtx = [comfResultsMtx[-1]]
-                occMtx2 = zip(*occMtx)
-                for lineCount, line in enumerate(newcomfResultsMtx2):
-                    comfortFactorVals.append(sum(line)/occMtx2[lineCount][0])
+            #The last row of the matrix is the number of occupied hours for each point.
+            comfortFactorVals = summarizePoints(comfResultsMtx[1:-1], False, comfResultsMtx[-1])
     
     
     return comfortFactorVals